@@ -75,6 +75,7 @@ def apply_line_break(text: str, model_name: str = Model.GROK_4_RES) -> str:
         model_name=model_name,
         system_prompt=system_prompt,
         user_prompt=user_prompt,
+        cache=True,
     )
 
     return result_text
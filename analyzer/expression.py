@@ -74,6 +74,7 @@ You are an expert in marketing content analysis. Your task is to extract useful
         model_name=model,
         system_prompt=system,
         user_prompt=prompt,
+        cache=True,
     )
 
     expressions = parse_expressions_response(text_content)
@@ -74,6 +74,7 @@ You are an expert in Named Entity Recognition and text analysis. Extract key ent
         model_name=model,
         system_prompt=system,
         user_prompt=prompt,
+        cache=True,
     )
 
     parameters = parse_parameter_response(text_content)
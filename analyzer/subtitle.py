@@ -59,6 +59,7 @@ JSON만 반환해.
             model_name=model,
             system_prompt=system,
             user_prompt=prompt,
+            cache=True,
         )
         subtitles = parse_subtitle_response(text_content)
     except Exception:
@@ -1,9 +1,12 @@
 # 외부 라이브러리
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 # 라우터 - 기본
-from routers import ingest
+from routers import ingest, jobs
 from routers.test import test
 
 # 라우터 - 원고 생성
@@ -57,8 +60,52 @@ from utils.llm_concurrency import (
     is_llm_path,
     run_with_llm_concurrency_limit,
 )
-
-app = FastAPI()
+from utils.ai_client.text_registry import aclose_ai_clients, close_ai_clients
+from mongodb_service import close_mongo_client
+from async_mongodb_service import aclose_mongo_client
+from services.autocomplete_index import (
+    keep_autocomplete_index_fresh,
+    register_autocomplete_index,
+)
+from services.browser_pool import aclose_browser_pool
+from services.job_queue import run_job_worker
+from services.manuscript_rollup import register_manuscript_rollup
+from services.manuscript_store import register_manuscript_store
+from services.query_indexes import ensure_query_indexes_on_startup
+from services.search_cache import register_search_cache
+from services.search_index import register_search_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 원고 생성/수정/삭제 시 통합 저장소 이중 쓰기(먼저 반영) +
+    # 검색 색인 + 통계 집계 + 자동완성 증분 갱신, 검색 응답 캐시 무효화
+    register_manuscript_store()
+    register_search_index()
+    register_manuscript_rollup()
+    register_autocomplete_index()
+    register_search_cache()
+    autocomplete_loader = asyncio.create_task(keep_autocomplete_index_fresh())
+    # 핫 쿼리용 인덱스는 시작을 막지 않고 백그라운드로 보장
+    index_builder = asyncio.create_task(ensure_query_indexes_on_startup())
+    # 백그라운드 작업 워커 (이전 프로세스에서 중단된 작업부터 이어서 실행)
+    job_worker = asyncio.create_task(run_job_worker())
+    yield
+    autocomplete_loader.cancel()
+    index_builder.cancel()
+    # 실행 중인 작업은 다음 시작 때 이어지도록 대기열로 되돌린 뒤 종료
+    job_worker.cancel()
+    await asyncio.gather(job_worker, return_exceptions=True)
+    # 발행용 브라우저 풀: 계정 세션 저장 후 종료
+    await aclose_browser_pool()
+    # 종료 시 프로바이더/MongoDB 커넥션 풀 정리
+    await aclose_ai_clients()
+    close_ai_clients()
+    await aclose_mongo_client()
+    close_mongo_client()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 app.add_middleware(
@@ -79,6 +126,7 @@ async def limit_llm_generation_requests(request: Request, call_next):
 
 # 기본
 app.include_router(ingest.router)
+app.include_router(jobs.router)
 app.include_router(test.router)
 
 # 원고 생성
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pymongo import AsyncMongoClient, UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError, ConnectionFailure
+
+from config import MONGO_URI, MONGO_DB_NAME
+from mongodb_service import (
+    INDEX_MAP,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    _indexed_db_names,
+    _to_index_tuple,
+    query_index_name,
+    query_index_specs,
+)
+
+
+# ---------- 이벤트 루프별 공유 클라이언트 ----------
+# AsyncMongoClient는 생성된 이벤트 루프에 묶이므로 루프마다 하나씩 유지
+_async_mongo_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncMongoClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_mongo_client() -> AsyncMongoClient:
+    """현재 이벤트 루프 전용 AsyncMongoClient 반환 (최초 호출 시 생성)"""
+    if not MONGO_URI:
+        raise ValueError("MongoDB URI is not configured in .env")
+
+    loop = asyncio.get_running_loop()
+    client = _async_mongo_clients.get(loop)
+    if client is None:
+        client = AsyncMongoClient(
+            MONGO_URI,
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        )
+        _async_mongo_clients[loop] = client
+    return client
+
+
+async def aclose_mongo_client() -> None:
+    """현재 이벤트 루프의 AsyncMongoClient 종료 (애플리케이션 종료 시 호출)"""
+    loop = asyncio.get_running_loop()
+    client = _async_mongo_clients.pop(loop, None)
+    if client is not None:
+        await client.close()
+
+
+class AsyncMongoDBService:
+    """
+    MongoDBService의 비동기 버전.
+    이벤트 루프를 막지 않고 await로 호출 (run_in_threadpool 불필요).
+    """
+
+    def __init__(self, db_name: Optional[str] = None):
+        if not MONGO_URI or not MONGO_DB_NAME:
+            raise ValueError("MongoDB URI or DB Name is not configured in .env")
+        self.client: AsyncMongoClient = get_async_mongo_client()
+        self.db: AsyncDatabase = self.client[db_name or MONGO_DB_NAME]
+
+    def set_db_name(self, db_name: str) -> None:
+        if not db_name:
+            raise ValueError("새 DB 이름은 비어 있을 수 없습니다.")
+        self.db = self.client[db_name]
+
+    # ---------- 인덱스 ----------
+    async def ensure_unique_indexes(self) -> None:
+        """
+        INDEX_MAP 기준으로 유니크 인덱스, QUERY_INDEX_MAP 기준으로 조회용 인덱스 보장.
+        동기 서비스와 같은 캐시를 공유하므로 DB당 프로세스에서 한 번만 수행.
+        """
+        if self.db.name in _indexed_db_names:
+            return
+
+        for coll_name, keys in query_index_specs(self.db.name):
+            try:
+                await self.db[coll_name].create_index(keys, name=query_index_name(keys))
+            except ConnectionFailure:
+                return
+            except Exception:
+                pass
+
+        for coll_name, spec in INDEX_MAP.items():
+            idx_fields = _to_index_tuple(spec)
+            try:
+                await self.db[coll_name].create_index(
+                    idx_fields,
+                    unique=True,
+                    name="uniq_" + "_".join(k for k, _ in idx_fields),
+                )
+            except ConnectionFailure:
+                # 연결 실패는 캐시하지 않고 다음 사용 시 재시도
+                return
+            except Exception:
+                # 이미 존재/경쟁 생성 등은 조용히 스킵
+                pass
+
+        _indexed_db_names.add(self.db.name)
+
+    # ---------- 쓰기(중복 안전) ----------
+    async def insert_document(self, collection_name: str, document: dict):
+        """
+        단건 삽입 (유니크 인덱스 위반 시 DuplicateKeyError 발생 가능)
+        -> 가급적 upsert_document 사용 권장
+        """
+        await self.ensure_unique_indexes()
+        result = await self.db[collection_name].insert_one(document)
+        if collection_name == "manuscripts":
+            # utils → async_mongodb_service 순환 import 방지
+            from services.manuscript_events import ManuscriptEvent, aemit
+
+            await aemit(
+                ManuscriptEvent("insert", self.db.name, str(result.inserted_id), document)
+            )
+        return result.inserted_id
+
+    async def upsert_document(
+        self, collection_name: str, key: Dict[str, Any], doc: Dict[str, Any]
+    ) -> bool:
+        """
+        key로 존재 여부 판단 후 없으면 삽입. 있으면 그대로 유지 (idempotent).
+        반환: True(새로 생성됨) / False(이미 존재)
+        """
+        await self.ensure_unique_indexes()
+        res = await self.db[collection_name].update_one(
+            key, {"$setOnInsert": doc}, upsert=True
+        )
+        return res.upserted_id is not None
+
+    async def insert_many_documents(self, collection_name: str, documents: List[dict]):
+        """
+        여러 문서를 삽입. 유니크 위반은 무시하고 진행.
+        """
+        if not documents:
+            return []
+
+        await self.ensure_unique_indexes()
+        try:
+            result = await self.db[collection_name].insert_many(documents, ordered=False)
+            return result.inserted_ids
+        except BulkWriteError as e:
+            write_errors = [
+                err
+                for err in e.details.get("writeErrors", [])
+                if err.get("code") != 11000
+            ]
+            if write_errors:
+                raise
+            return e.details.get("nInserted", 0)
+
+    async def upsert_many_documents(
+        self, collection_name: str, documents: List[dict], key_fields: List[str]
+    ) -> Dict[str, int]:
+        """
+        벌크 업서트: key_fields 조합으로 중복 차단.
+        반환 요약: {"upserted": n, "matched": n2}
+        """
+        if not documents:
+            return {"upserted": 0, "matched": 0}
+
+        ops: List[UpdateOne] = []
+        for d in documents:
+            key = {k: d.get(k) for k in key_fields}
+            ops.append(UpdateOne(key, {"$setOnInsert": d}, upsert=True))
+
+        await self.ensure_unique_indexes()
+        res = await self.db[collection_name].bulk_write(ops, ordered=False)
+        return {"upserted": res.upserted_count, "matched": res.matched_count}
+
+    # ---------- 읽기/수정/삭제 ----------
+    async def find_documents(
+        self,
+        collection_name: str,
+        query: Optional[dict] = None,
+        projection: Optional[dict] = None,
+        sort: Optional[Sequence[Tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> List[dict]:
+        cursor = self.db[collection_name].find(query or {}, projection)
+        if sort:
+            cursor = cursor.sort(list(sort))
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list()
+
+    async def find_one(
+        self,
+        collection_name: str,
+        query: dict,
+        projection: Optional[dict] = None,
+    ) -> Optional[dict]:
+        return await self.db[collection_name].find_one(query, projection)
+
+    async def count_documents(self, collection_name: str, query: Optional[dict] = None) -> int:
+        return await self.db[collection_name].count_documents(query or {})
+
+    async def aggregate(self, collection_name: str, pipeline: List[dict]) -> List[dict]:
+        cursor = await self.db[collection_name].aggregate(pipeline)
+        return await cursor.to_list()
+
+    async def update_document(
+        self, collection_name: str, query: dict, new_values: dict
+    ) -> int:
+        result = await self.db[collection_name].update_one(query, {"$set": new_values})
+        return result.modified_count
+
+    async def delete_document(self, collection_name: str, query: dict) -> int:
+        result = await self.db[collection_name].delete_one(query)
+        return result.deleted_count
+
+    def close_connection(self) -> None:
+        """공유 커넥션 풀을 사용하므로 닫지 않음 (동기 서비스와 호출부 호환용)"""
+        return None
+
@@ -16,9 +16,15 @@ UPSTAGE_API_KEY = os.getenv("UPSTAGE_API_KEY")
 
 openai_client = OpenAI(api_key=OPENAI_API_KEY)
 
+# OpenAI 호환/Anthropic 호환 엔드포인트 (sync/async 클라이언트 공용)
+SOLAR_BASE_URL = "https://api.upstage.ai/v1/solar"
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
+MOONSHOT_BASE_URL = "https://api.moonshot.ai/v1"
+MINIMAX_BASE_URL = "https://api.minimax.io/anthropic"
+
 solar_client = OpenAI(
     api_key=UPSTAGE_API_KEY,
-    base_url="https://api.upstage.ai/v1/solar",
+    base_url=SOLAR_BASE_URL,
     default_headers={"Authorization": f"Bearer {UPSTAGE_API_KEY}"},
 )
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -31,7 +37,7 @@ MINIMAX_API_KEY = os.getenv("MINIMAX_API_KEY")
 
 deepseek_client = OpenAI(
     api_key=DEEPSEEK_API_KEY,
-    base_url="https://api.deepseek.com",
+    base_url=DEEPSEEK_BASE_URL,
     # base_url="https://api.deepseek.com/v3.2_speciale_expires_on_20251215",
 )
 
@@ -42,12 +48,12 @@ grok_client = Client(
 
 moonshot_client = OpenAI(
     api_key=MOONSHOT_API_KEY,
-    base_url="https://api.moonshot.ai/v1",
+    base_url=MOONSHOT_BASE_URL,
 )
 
 minimax_client = Anthropic(
     api_key=MINIMAX_API_KEY,
-    base_url="https://api.minimax.io/anthropic",
+    base_url=MINIMAX_BASE_URL,
 ) if MINIMAX_API_KEY else None
 
 # AWS S3
@@ -31,6 +31,7 @@ def generate_comment(
         model_name=MODEL_NAME,
         system_prompt=system_prompt,
         user_prompt=user_prompt,
+        prompt_cache=True,
     )
 
     comment = _clean_output(comment)
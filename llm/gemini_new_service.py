@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 import re
+from dataclasses import dataclass
 
 from _prompts.gemini.new_system import get_gemini_new_system_prompt
 from _prompts.gemini.new_user import get_gemini_new_user_prompt
 from _constants.Model import Model
 from utils.query_parser import parse_query
 from utils.text_cleaner import comprehensive_text_clean
-from utils.ai_client_factory import call_ai
+from utils.ai_client_factory import acall_ai, call_ai
+from utils.category_pipeline import CategoryGenerator
 from utils.logger import log
 
 
 MODEL_NAME: str = Model.GEMINI_3_FLASH_PREVIEW
 
 
-def gemini_new_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
-    """Gemini 3 Flash Preview를 사용한 범용 정보성 원고 생성"""
+@dataclass(frozen=True)
+class GeminiNewPrompt:
+    """카테고리와 무관한 프롬프트 재료 (카테고리 분류와 동시에 준비)"""
+
+    system: str
+    keyword: str
+    note: str
+    ref: str
+
+    def build(self, category: str = "") -> tuple[str, str]:
+        user = get_gemini_new_user_prompt(
+            keyword=self.keyword,
+            category=category,
+            note=self.note,
+            ref=self.ref,
+        )
+        log.info(f"프롬프트 sys={len(self.system)} user={len(user)}")
+        return self.system, user
 
+
+def prepare_gemini_new_prompt(user_instructions: str, ref: str = "") -> GeminiNewPrompt:
+    """쿼리 파싱 + 시스템 프롬프트 (카테고리 불필요)"""
     parsed = parse_query(user_instructions)
     keyword = parsed.get("keyword", "")
     note = parsed.get("note", "") or ""
@@ -25,15 +46,33 @@ def gemini_new_gen(user_instructions: str, ref: str = "", category: str = "") ->
     if not keyword:
         raise ValueError("키워드가 없습니다.")
 
-    system = get_gemini_new_system_prompt()
-    user = get_gemini_new_user_prompt(
+    return GeminiNewPrompt(
+        system=get_gemini_new_system_prompt(),
         keyword=keyword,
-        category=category,
         note=note,
         ref=ref,
     )
 
-    log.info(f"프롬프트 sys={len(system)} user={len(user)}")
+
+def _build_gemini_new_prompts(
+    user_instructions: str,
+    ref: str = "",
+    category: str = "",
+) -> tuple[str, str]:
+    return prepare_gemini_new_prompt(user_instructions, ref).build(category)
+
+
+def _finalize_gemini_new_text(text: str) -> str:
+    log.info(
+        f"응답 len={len(text)}" + (f" | {text[:50]!r}..." if len(text) < 100 else "")
+    )
+    return comprehensive_text_clean(text)
+
+
+def gemini_new_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
+    """Gemini 3 Flash Preview를 사용한 범용 정보성 원고 생성"""
+
+    system, user = _build_gemini_new_prompts(user_instructions, ref, category)
 
     try:
         text = call_ai(
@@ -45,13 +84,43 @@ def gemini_new_gen(user_instructions: str, ref: str = "", category: str = "") ->
         log.error(f"call_ai 에러: {e}")
         raise
 
-    log.info(
-        f"응답 len={len(text)}" + (f" | {text[:50]!r}..." if len(text) < 100 else "")
-    )
+    return _finalize_gemini_new_text(text)
+
+
+async def agemini_new_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
+    """gemini_new_gen의 async 버전 (스레드풀 없이 이벤트 루프에서 대기)"""
+    return await agemini_new_gen_prepared(prepare_gemini_new_prompt(user_instructions, ref), category)
+
+
+async def agemini_new_gen_prepared(prompt: GeminiNewPrompt, category: str = "") -> str:
+    """미리 준비한 프롬프트 재료에 카테고리만 채워 생성"""
+
+    system, user = prompt.build(category)
+
+    try:
+        text = await acall_ai(
+            model_name=MODEL_NAME,
+            system_prompt=system,
+            user_prompt=user,
+        )
+    except Exception as e:
+        log.error(f"acall_ai 에러: {e}")
+        raise
+
+    return _finalize_gemini_new_text(text)
 
-    text = comprehensive_text_clean(text)
 
-    return text
+def gemini_new_generator(user_instructions: str, ref: str = "") -> CategoryGenerator[GeminiNewPrompt, str]:
+    """
+    generate_with_category 용 생성기
+
+    카테고리가 유저 프롬프트에 들어가므로 category_agnostic=False
+    (분류 중에는 프롬프트 준비만 겹치고, 생성은 카테고리가 나온 뒤 시작)
+    """
+    return CategoryGenerator(
+        prepare=lambda: prepare_gemini_new_prompt(user_instructions, ref),
+        generate=agemini_new_gen_prepared,
+    )
 
 
 kago_sys = '''f"""You are a helpful assistant.# Role and Objective
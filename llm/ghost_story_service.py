@@ -37,7 +37,9 @@ def generate_ghost_story(
     log.info(f"프롬프트 sys={len(system)} user={len(user)}")
 
     try:
-        text = call_ai(model_name=MODEL_NAME, system_prompt=system, user_prompt=user)
+        text = call_ai(
+            model_name=MODEL_NAME, system_prompt=system, user_prompt=user, prompt_cache=True
+        )
     except Exception as e:
         log.error(f"call_ai 에러: {e}")
         raise
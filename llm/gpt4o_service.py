@@ -8,24 +8,17 @@ from _prompts.gpt4o.user import get_gpt4o_user_prompt
 from _constants.Model import Model
 from utils.query_parser import parse_query
 from utils.text_cleaner import comprehensive_text_clean
-from utils.ai_client_factory import call_ai
+from utils.ai_client_factory import acall_ai, call_ai
 
 
 MODEL_NAME: str = Model.GPT4_1
 
 
-def gpt4o_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
-    """
-    GPT-4O 기반 블로그 원고 생성
-
-    Args:
-        user_instructions: 키워드 및 추가 요청사항
-        ref: 참조 원고 (선택)
-        category: 카테고리명 (선택)
-
-    Returns:
-        생성된 원고 텍스트
-    """
+def _build_gpt4o_prompts(
+    user_instructions: str,
+    ref: str = "",
+    category: str = "",
+) -> tuple[str, str]:
     parsed = parse_query(user_instructions)
     keyword, note = parsed.get("keyword", ""), parsed.get("note", "") or ""
 
@@ -38,6 +31,22 @@ def gpt4o_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
     )
 
     user = get_gpt4o_user_prompt(keyword=keyword, note=note, ref=ref)
+    return system, user
+
+
+def gpt4o_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
+    """
+    GPT-4O 기반 블로그 원고 생성
+
+    Args:
+        user_instructions: 키워드 및 추가 요청사항
+        ref: 참조 원고 (선택)
+        category: 카테고리명 (선택)
+
+    Returns:
+        생성된 원고 텍스트
+    """
+    system, user = _build_gpt4o_prompts(user_instructions, ref, category)
 
     text = call_ai(
         model_name=MODEL_NAME,
@@ -48,3 +57,16 @@ def gpt4o_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
     text = comprehensive_text_clean(text)
 
     return text
+
+
+async def agpt4o_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
+    """gpt4o_gen의 async 버전 (스레드풀 없이 이벤트 루프에서 대기)"""
+    system, user = _build_gpt4o_prompts(user_instructions, ref, category)
+
+    text = await acall_ai(
+        model_name=MODEL_NAME,
+        system_prompt=system,
+        user_prompt=user,
+    )
+
+    return comprehensive_text_clean(text)
@@ -216,6 +216,7 @@ def keigo_gen(user_instructions: str, ref: str = "", category: str = "") -> str:
             model_name=MODEL_NAME,
             system_prompt=system,
             user_prompt=user,
+            prompt_cache=True,
         )
     except Exception as e:
         log.error(f"call_ai 에러: {e}")
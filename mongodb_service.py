@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import TypedDict, List, Dict, Any, Optional, Tuple, Union
+import os
+import threading
+from typing import TypedDict, List, Dict, Any, Optional, Set, Tuple, Union
 from datetime import datetime
 
-from pymongo import MongoClient, ASCENDING, UpdateOne
+from pymongo import MongoClient, ASCENDING, DESCENDING, UpdateOne
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError
 
 from config import MONGO_URI, MONGO_DB_NAME
 
@@ -68,20 +70,148 @@ def _to_index_tuple(x: UniqueIndex) -> List[Tuple[str, int]]:
     return list(x)
 
 
+IndexKeys = List[Tuple[str, int]]
+
+SEARCH_SYSTEM_DB_NAME = "search_system"
+
+# 조회용(비유니크) 인덱스 정의: 핫 쿼리의 등치 조건 → 정렬 키 순서
+QUERY_INDEX_MAP: Dict[str, List[IndexKeys]] = {
+    # 최신순 목록/keyset 페이지 (deleted/visible 조건은 인덱스 키에서 바로 거름)
+    "manuscripts": [
+        [("createdAt", DESCENDING), ("_id", DESCENDING), ("deleted", ASCENDING), ("visible", ASCENDING)],
+    ],
+    "ref": [[("keyword", ASCENDING)]],
+    "bookmarks": [[("userId", ASCENDING), ("createdAt", DESCENDING)]],
+    "search_history": [[("userId", ASCENDING), ("searchedAt", DESCENDING)]],
+}
+
+# 특정 DB에만 있는 콜렉션 (나머지 콜렉션은 카테고리/기본 DB에서 보장)
+QUERY_INDEX_DBS: Dict[str, str] = {
+    "bookmarks": SEARCH_SYSTEM_DB_NAME,
+    "search_history": SEARCH_SYSTEM_DB_NAME,
+}
+
+
+def query_index_specs(db_name: str) -> List[Tuple[str, IndexKeys]]:
+    """해당 DB에 만들 조회용 인덱스 (콜렉션, 키) 목록"""
+    specs = []
+    for coll_name, index_list in QUERY_INDEX_MAP.items():
+        scope = QUERY_INDEX_DBS.get(coll_name)
+        if scope is not None and scope != db_name:
+            continue
+        if scope is None and db_name == SEARCH_SYSTEM_DB_NAME:
+            continue
+        specs.extend((coll_name, keys) for keys in index_list)
+    return specs
+
+
+def query_index_name(keys: IndexKeys) -> str:
+    return "q_" + "_".join(f"{k}_{direction}" for k, direction in keys)
+
+
+# ---------- 공유 커넥션 풀 ----------
+# 애플리케이션 수명 동안 MongoClient 하나만 유지 (요청마다 디스커버리/핸드셰이크/인증 반복 방지)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "10000"))
+
+_mongo_client: Optional[MongoClient] = None
+_mongo_client_lock = threading.Lock()
+
+# 인덱스 보장이 끝난 DB 이름 (프로세스당 한 번만 create_index 수행)
+_indexed_db_names: Set[str] = set()
+
+
+def get_mongo_client() -> MongoClient:
+    """프로세스 전역 MongoClient 반환 (최초 호출 시 생성)"""
+    global _mongo_client
+
+    if _mongo_client is not None:
+        return _mongo_client
+
+    if not MONGO_URI:
+        raise ValueError("MongoDB URI is not configured in .env")
+
+    with _mongo_client_lock:
+        if _mongo_client is None:
+            _mongo_client = MongoClient(
+                MONGO_URI,
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                minPoolSize=MONGO_MIN_POOL_SIZE,
+                maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+                waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            )
+    return _mongo_client
+
+
+def close_mongo_client() -> None:
+    """공유 MongoClient 종료 (애플리케이션 종료 시 호출)"""
+    global _mongo_client
+
+    with _mongo_client_lock:
+        if _mongo_client is not None:
+            _mongo_client.close()
+            _mongo_client = None
+        _indexed_db_names.clear()
+
+
+def ensure_query_indexes(db: Database) -> bool:
+    """
+    QUERY_INDEX_MAP 기준으로 조회용 인덱스 보장
+
+    Args:
+        db: 대상 DB
+
+    Returns:
+        연결 실패 없이 끝났으면 True (False면 다음 사용 시 재시도)
+    """
+    for coll_name, keys in query_index_specs(db.name):
+        try:
+            db[coll_name].create_index(keys, name=query_index_name(keys))
+        except ConnectionFailure:
+            return False
+        except Exception:
+            # 이미 존재/경쟁 생성 등은 조용히 스킵
+            pass
+    return True
+
+
+def ensure_database_query_indexes(db_names: List[str]) -> int:
+    """
+    여러 DB에 조회용 인덱스 보장 (애플리케이션 시작 시 백그라운드로 호출)
+
+    Returns:
+        인덱스 보장이 끝난 DB 수
+    """
+    client = get_mongo_client()
+    done = 0
+    for db_name in dict.fromkeys(db_names):
+        if ensure_query_indexes(client[db_name]):
+            done += 1
+    return done
+
+
 class MongoDBService:
     def __init__(self):
         if not MONGO_URI or not MONGO_DB_NAME:
             raise ValueError("MongoDB URI or DB Name is not configured in .env")
-        self.client: MongoClient = MongoClient(MONGO_URI)
+        self.client: MongoClient = get_mongo_client()
         self.db: Database = self.client[MONGO_DB_NAME]
         self.ensure_unique_indexes()
 
     # ---------- 인덱스 ----------
     def ensure_unique_indexes(self) -> None:
         """
-        INDEX_MAP 기준으로 유니크 인덱스 보장.
-        이미 있으면 패스.
+        INDEX_MAP 기준으로 유니크 인덱스, QUERY_INDEX_MAP 기준으로 조회용 인덱스 보장.
+        DB당 프로세스에서 한 번만 수행 (이미 확인한 DB는 패스).
         """
+        if self.db.name in _indexed_db_names:
+            return
+
+        if not ensure_query_indexes(self.db):
+            return
+
         for coll_name, spec in INDEX_MAP.items():
             idx_fields = _to_index_tuple(spec)
             try:
@@ -90,17 +220,28 @@ class MongoDBService:
                     unique=True,
                     name="uniq_" + "_".join(k for k, _ in idx_fields),
                 )
+            except ConnectionFailure:
+                # 연결 실패는 캐시하지 않고 다음 사용 시 재시도
+                return
             except Exception:
                 # 이미 존재/경쟁 생성 등은 조용히 스킵
                 pass
 
+        _indexed_db_names.add(self.db.name)
+
     # ---------- 쓰기(중복 안전) ----------
     def insert_document(self, collection_name: str, document: dict):
         """
         단건 삽입 (유니크 인덱스 위반 시 DuplicateKeyError 발생 가능)
         -> 가급적 upsert_document 사용 권장
         """
-        return self.db[collection_name].insert_one(document).inserted_id
+        inserted_id = self.db[collection_name].insert_one(document).inserted_id
+        if collection_name == "manuscripts":
+            # utils → async_mongodb_service → mongodb_service 순환 import 방지
+            from services.manuscript_events import ManuscriptEvent, emit
+
+            emit(ManuscriptEvent("insert", self.db.name, str(inserted_id), document))
+        return inserted_id
 
     def upsert_document(
         self, collection_name: str, key: Dict[str, Any], doc: Dict[str, Any]
@@ -170,7 +311,8 @@ class MongoDBService:
         return result.deleted_count
 
     def close_connection(self):
-        self.client.close()
+        """공유 커넥션 풀을 사용하므로 닫지 않음 (기존 호출부 호환용)"""
+        return None
 
     def set_db_name(self, db_name: str):
         if not db_name:
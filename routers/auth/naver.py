@@ -11,9 +11,10 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 from pathlib import Path
 
+from services.browser_pool import account_key, get_browser_pool
 from utils.logger import log
 
 router = APIRouter(prefix="/auth/naver", tags=["naver-auth"])
@@ -33,8 +34,9 @@ class LogoutRequest(BaseModel):
 
 
 class SessionData:
-    def __init__(self, cookies: list, created_at: datetime):
+    def __init__(self, cookies: list, created_at: datetime, account_id: Optional[str] = None):
         self.cookies = cookies
+        self.account_id = account_id
         self.created_at = created_at
         self.last_used = created_at
 
@@ -69,21 +71,39 @@ def check_rate_limit(client_ip: str) -> bool:
 
 
 async def naver_login_with_playwright(
-    account_id: str, password: str, debug: bool = False
+    account_id: str, password: str, debug: bool = False, reuse_session: bool = True
 ) -> dict:
-    """Playwright로 네이버 로그인 수행"""
+    """
+    Playwright로 네이버 로그인 수행
+
+    로그인은 임시 컨텍스트에서 시도하고, 성공하면 세션이 풀에 저장되어 이후 발행에서 같은 계정 컨텍스트로 재사용된다.
+    reuse_session 이면 저장된 세션 쿠키가 아직 유효하고 비밀번호가 이 프로세스에서 실제 로그인으로
+    확인된 것과 같을 때만 로그인을 생략한다 (외부 공개 /login 은 항상 reuse_session=False).
+    """
+    pool = get_browser_pool()
+    key = account_key(account_id)
+
+    if reuse_session and pool.password_matches(key, password):
+        cookies = pool.saved_cookies(key)
+        if cookies:
+            log.info("저장된 세션 재사용", account=f"{account_id[:3]}***")
+            return {
+                "success": True,
+                "cookies": cookies,
+                "message": "저장된 세션 재사용",
+            }
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=False,  # headless=True면 봇으로 감지됨
-            slow_mo=100 if debug else 0,
-        )
+    result = await _login_in_throwaway_context(pool, account_id, password, debug)
+    if result["success"]:
+        # 성공했을 때만 계정 컨텍스트/세션 파일 교체 (실패한 시도는 기존 세션을 건드리지 않음)
+        await pool.store_session(key, result["cookies"])
+        pool.remember_password(key, password)
+    return result
 
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        page = await context.new_page()
 
+async def _login_in_throwaway_context(pool, account_id: str, password: str, debug: bool) -> dict:
+    async with pool.login_page() as page:
+        context = page.context
         try:
             log.step(1, 6, "로그인 페이지 접속")
             await page.goto(
@@ -100,7 +120,6 @@ async def naver_login_with_playwright(
             captcha = await page.query_selector("#captcha")
             if captcha:
                 log.warning("캡챠 감지됨")
-                await browser.close()
                 return {
                     "success": False,
                     "error": "CAPTCHA_REQUIRED",
@@ -151,7 +170,6 @@ async def naver_login_with_playwright(
             if error_msg:
                 error_text = await error_msg.text_content()
                 log.warning("로그인 실패", error=error_text)
-                await browser.close()
                 return {
                     "success": False,
                     "error": "LOGIN_FAILED",
@@ -164,7 +182,6 @@ async def naver_login_with_playwright(
             )
             if two_factor:
                 log.warning("2차 인증 필요")
-                await browser.close()
                 return {
                     "success": False,
                     "error": "TWO_FACTOR_REQUIRED",
@@ -181,15 +198,12 @@ async def naver_login_with_playwright(
                 current_url = page.url
                 if "nid.naver.com" in current_url:
                     log.warning("로그인 미완료", url=current_url)
-                    await browser.close()
                     return {
                         "success": False,
                         "error": "LOGIN_INCOMPLETE",
                         "message": "로그인이 완료되지 않았습니다.",
                     }
 
-            await browser.close()
-
             return {
                 "success": True,
                 "cookies": cookies,
@@ -200,7 +214,6 @@ async def naver_login_with_playwright(
             log.error("네트워크 타임아웃")
             if debug:
                 await page.screenshot(path=str(DEBUG_DIR / "login_error_timeout.png"))
-            await browser.close()
             return {
                 "success": False,
                 "error": "TIMEOUT",
@@ -211,7 +224,6 @@ async def naver_login_with_playwright(
             log.error("알 수 없는 오류", error=str(e))
             if debug:
                 await page.screenshot(path=str(DEBUG_DIR / "login_error_unknown.png"))
-            await browser.close()
             return {
                 "success": False,
                 "error": "UNKNOWN_ERROR",
@@ -240,6 +252,8 @@ async def login(request: Request, body: LoginRequest):
         account_id=body.id,
         password=body.password,
         debug=True,
+        # 저장된 세션을 돌려주면 비밀번호 확인 없이 쿠키가 나가므로 항상 실제 로그인
+        reuse_session=False,
     )
 
     if result["success"]:
@@ -261,6 +275,7 @@ async def login(request: Request, body: LoginRequest):
     sessions[session_id] = SessionData(
         cookies=result["cookies"],
         created_at=datetime.now(),
+        account_id=body.id,
     )
 
     return JSONResponse(
@@ -282,8 +297,10 @@ async def logout(body: LogoutRequest):
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
 
-    # 세션 삭제
-    del sessions[session_id]
+    # 세션 삭제 (브라우저 풀에 저장된 계정 세션도 폐기)
+    session = sessions.pop(session_id)
+    if session.account_id:
+        await get_browser_pool().revoke(account_key(session.account_id))
 
     return JSONResponse(
         content={
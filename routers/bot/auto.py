@@ -9,11 +9,11 @@ from fastapi.responses import JSONResponse
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from llm.gemini_new_service import gemini_new_gen
+from llm.gemini_new_service import gemini_new_generator
 from routers.auth.naver import naver_login_with_playwright
 from routers.generate.batch import generate_images_parallel, save_to_pending
 from routers.generate.gemini_image import _try_s3_images
-from utils.get_category_db_name import get_category_db_name
+from utils.category_pipeline import generate_with_category
 from utils.logger import log
 
 from .common import (
@@ -69,13 +69,8 @@ async def auto_bot(request: AutoBotRequest):
         log.step(idx + 1, len(request.keywords), keyword[:30])
 
         try:
-            category = await get_category_db_name(keyword=keyword + request.ref)
-
-            content = await run_in_threadpool(
-                gemini_new_gen,
-                user_instructions=keyword,
-                ref=request.ref,
-                category=category,
+            content, category = await generate_with_category(
+                keyword + request.ref, gemini_new_generator(keyword, request.ref)
             )
 
             if not content:
@@ -168,6 +163,7 @@ async def auto_bot(request: AutoBotRequest):
             manuscript_id=manuscript.id,
             schedule_time=schedule_time,
             account_id=account_id,
+            password=password,
         )
         publish_results.append(result)
 
@@ -2,18 +2,22 @@
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, field_validator
 
 from routers.auth.naver import naver_login_with_playwright
+from routers.jobs import job_accepted
+from services.job_queue import JobContext, JobItem, get_job_queue, register_job_handler
 from utils.logger import log
 
 from .common import (
     create_queue,
+    get_queue_dir,
     get_queue_manuscripts,
+    queue_manuscript_position,
     update_queue_status,
     cleanup_empty_queue,
     generate_manuscripts_batch,
@@ -63,6 +67,7 @@ class AutoScheduleRequest(BaseModel):
     # 실행 옵션
     delay_between_posts: int = 10  # 발행 간 딜레이 (초)
     delay_between_queues: int = 60  # 큐 간 딜레이 (초)
+    background: bool = False  # True면 작업 ID만 바로 반환하고 백그라운드 작업으로 처리
 
     @field_validator("queues")
     @classmethod
@@ -164,8 +169,16 @@ async def process_single_queue(
     generate_images: bool,
     image_count: int,
     delay_between_posts: int,
+    progress: Optional[dict] = None,
+    on_progress: Optional[Callable[[dict], Awaitable[None]]] = None,
 ) -> dict:
-    """단일 큐 처리 (원고 생성 → 로그인 → 발행)"""
+    """단일 큐 처리 (원고 생성 → 로그인 → 발행)
+
+    Args:
+        progress: 이전 실행의 진행 기록 (있으면 원고 생성을 건너뛰고 큐에 남은 원고만 발행)
+        on_progress: 큐 생성/원고 1건 발행 때마다 진행 기록을 넘겨받는 코루틴 콜백
+                     ({"queue_id", "generated", "queued", "published"})
+    """
     start_ts = datetime.now()
     account_id = account.get("id")
     password = account.get("password")
@@ -215,86 +228,118 @@ async def process_single_queue(
 
         log.kv("스케줄", f"{total_days}일, {len(schedule)}개")
 
-        # 2단계: 원고 생성
-        log.step(1, 4, "원고 생성")
-        batch_id, generated_ids = await generate_manuscripts_batch(
-            keywords=keywords,
-            ref=ref,
-            generate_images=generate_images,
-            image_count=image_count,
-        )
-
-        if not generated_ids:
-            result["status"] = "failed"
-            result["error"] = "원고 생성에 모두 실패했습니다."
-            return result
-
-        log.success("원고 생성 완료", count=len(generated_ids))
-
-        # 3단계: 큐 생성
-        log.step(2, 4, "큐 생성")
-        queue_id, queue_dir = create_queue(
-            manuscript_ids=[item["id"] for item in generated_ids],
-            account_id=account_id,
-            schedule_date=start_date,
-        )
-
+        checkpoint = dict(progress or {})
+        if checkpoint.get("queue_id"):
+            # 재시작 후 이어하기: 발행된 원고는 이미 큐 폴더에서 빠져 있음
+            queue_id = checkpoint["queue_id"]
+            log.info(
+                "이전 진행 기록으로 이어서 발행",
+                queue_id=queue_id,
+                발행완료=len(checkpoint.get("published", [])),
+            )
+        else:
+            # 2단계: 원고 생성
+            log.step(1, 4, "원고 생성")
+            batch_id, generated_ids = await generate_manuscripts_batch(
+                keywords=keywords,
+                ref=ref,
+                generate_images=generate_images,
+                image_count=image_count,
+            )
+
+            if not generated_ids:
+                result["status"] = "failed"
+                result["error"] = "원고 생성에 모두 실패했습니다."
+                return result
+
+            log.success("원고 생성 완료", count=len(generated_ids))
+
+            # 3단계: 큐 생성
+            log.step(2, 4, "큐 생성")
+            queue_id, _ = create_queue(
+                manuscript_ids=[item["id"] for item in generated_ids],
+                account_id=account_id,
+                schedule_date=start_date,
+            )
+            checkpoint = {
+                "queue_id": queue_id,
+                "generated": generated_ids,
+                "queued": len(get_queue_manuscripts(queue_id)),
+                "published": [],
+            }
+            if on_progress:
+                await on_progress(checkpoint)
+
+        generated_ids = checkpoint["generated"]
+        published: list[dict] = list(checkpoint["published"])
         manuscripts = get_queue_manuscripts(queue_id)
         result["queue_id"] = queue_id
         log.kv("큐 ID", queue_id)
 
-        # 4단계: 로그인
-        log.step(3, 4, "네이버 로그인")
-        update_queue_status(queue_id, "processing")
-
-        login_result = await naver_login_with_playwright(
-            account_id=account_id,
-            password=password,
-            debug=True,
-        )
-
-        if not login_result["success"]:
-            update_queue_status(queue_id, "failed")
-            result["status"] = "failed"
-            result["error"] = f"로그인 실패: {login_result.get('message')}"
-            return result
-
-        cookies = login_result["cookies"]
-        log.success("로그인 성공", cookies=len(cookies))
-
-        # 5단계: 예약발행
-        log.step(4, 4, "예약발행")
-        schedule_times = build_schedule_times(generated_ids, schedule)
-
-        publish_results = await publish_manuscripts_batch(
-            cookies=cookies,
-            queue_dir=queue_dir,
-            manuscripts=manuscripts,
-            schedule_times=schedule_times,
-            account_id=account_id,
-            delay=delay_between_posts,
-        )
-
-        # 결과에 day/slot 정보 추가
-        keyword_to_schedule = {item["keyword"]: item for item in schedule}
-        for idx, pub_result in enumerate(publish_results):
-            gen = generated_ids[idx] if idx < len(generated_ids) else None
-            if gen and gen["keyword"] in keyword_to_schedule:
-                sched = keyword_to_schedule[gen["keyword"]]
-                pub_result["day"] = sched["day"]
-                pub_result["slot"] = sched["slot"]
-                pub_result["scheduled_at"] = sched["schedule_time"].isoformat()
+        if manuscripts:
+            # 4단계: 로그인
+            log.step(3, 4, "네이버 로그인")
+            update_queue_status(queue_id, "processing")
+
+            login_result = await naver_login_with_playwright(
+                account_id=account_id,
+                password=password,
+                debug=True,
+            )
+
+            if not login_result["success"]:
+                update_queue_status(queue_id, "failed")
+                result["status"] = "failed"
+                result["error"] = f"로그인 실패: {login_result.get('message')}"
+                return result
+
+            cookies = login_result["cookies"]
+            log.success("로그인 성공", cookies=len(cookies))
+
+            # 5단계: 예약발행 (큐 원고 ID 앞 순번 = 생성 목록 순번 → 남은 원고만 있어도 스케줄 유지)
+            log.step(4, 4, "예약발행")
+            all_schedule_times = build_schedule_times(generated_ids, schedule)
+            keyword_to_schedule = {item["keyword"]: item for item in schedule}
+            positions = [queue_manuscript_position(manuscript.id) for manuscript in manuscripts]
+
+            async def record(index: int, pub_result: dict) -> None:
+                # 결과에 day/slot 정보 추가
+                position = positions[index]
+                gen = generated_ids[position] if position < len(generated_ids) else None
+                if gen and gen["keyword"] in keyword_to_schedule:
+                    sched = keyword_to_schedule[gen["keyword"]]
+                    pub_result["day"] = sched["day"]
+                    pub_result["slot"] = sched["slot"]
+                    pub_result["scheduled_at"] = sched["schedule_time"].isoformat()
+                published.append(pub_result)
+                if on_progress:
+                    await on_progress({**checkpoint, "published": published})
+
+            await publish_manuscripts_batch(
+                cookies=cookies,
+                queue_dir=get_queue_dir(queue_id),
+                manuscripts=manuscripts,
+                schedule_times=[
+                    all_schedule_times[position] if position < len(all_schedule_times) else None
+                    for position in positions
+                ],
+                account_id=account_id,
+                password=password,
+                delay=delay_between_posts,
+                on_result=record,
+            )
 
         # 결과 집계
-        success_count = sum(1 for r in publish_results if r["success"])
-        failed_count = len(manuscripts) - success_count
+        queued = checkpoint["queued"]
+        success_count = sum(1 for r in published if r["success"])
+        failed_count = queued - success_count
         cleanup_empty_queue(queue_id)
 
         elapsed = (datetime.now() - start_ts).total_seconds()
 
         # 일별 요약
         daily_summary = {}
-        for r in publish_results:
+        for r in published:
             day = r.get("day", 0)
             if day not in daily_summary:
                 daily_summary[day] = {"success": 0, "failed": 0}
@@ -311,11 +356,11 @@ async def process_single_queue(
             "elapsed": round(elapsed, 1),
         }
         result["daily_summary"] = daily_summary
-        result["results"] = publish_results
+        result["results"] = published
 
         log.success(
             f"큐 {queue_index} 완료",
-            성공=f"{success_count}/{len(manuscripts)}",
+            성공=f"{success_count}/{queued}",
             시간=f"{elapsed:.0f}s"
         )
 
@@ -327,6 +372,113 @@ async def process_single_queue(
     return result
 
 
+def summarize_queue_results(total_queues: int, queue_results: list[dict], total_elapsed: float) -> dict:
+    """큐별 결과 → 전체 결과 집계"""
+    total_keywords = sum(r["summary"]["keywords"] for r in queue_results)
+    total_published = sum(r["summary"]["published"] for r in queue_results)
+    total_failed = sum(r["summary"]["failed"] for r in queue_results)
+
+    log.divider()
+    log.header("배치 스케줄 발행 완료", "✅")
+    log.kv("총 큐", f"{total_queues}개")
+    log.kv("총 키워드", f"{total_keywords}개")
+    log.kv("성공", f"{total_published}개")
+    log.kv("실패", f"{total_failed}개")
+    log.kv("소요시간", f"{total_elapsed:.0f}s")
+
+    return {
+        "success": True,
+        "total_queues": total_queues,
+        "summary": {
+            "total_keywords": total_keywords,
+            "total_published": total_published,
+            "total_failed": total_failed,
+            "elapsed": round(total_elapsed, 1),
+        },
+        "queue_results": queue_results,
+    }
+
+
+# ========== 백그라운드 작업 ==========
+
+def submit_auto_schedule_job(request: AutoScheduleRequest) -> str:
+    """큐 1개 = 작업 항목 1개로 등록 (비밀번호는 메모리에만 보관)"""
+    items = []
+    secrets = {}
+    for idx, queue_item in enumerate(request.queues):
+        account_id = queue_item.account.get("id")
+        password = queue_item.account.get("password")
+        if account_id and password:
+            secrets[account_id] = password
+        items.append(JobItem(
+            idx,
+            f"{account_id[:3]}***" if account_id else "unknown",
+            {
+                "account_id": account_id,
+                "keywords": queue_item.keywords,
+                "posts_per_day": queue_item.posts_per_day or request.posts_per_day,
+                "interval_hours": queue_item.interval_hours or request.interval_hours,
+                "service": queue_item.service or request.service,
+                "ref": queue_item.ref if queue_item.ref is not None else request.ref,
+            },
+        ))
+
+    params = request.model_dump(include={
+        "start_date", "start_hour", "generate_images", "image_count",
+        "delay_between_posts", "delay_between_queues",
+    })
+    return get_job_queue().submit("auto_schedule", items, params, secrets)
+
+
+async def run_auto_schedule_job(ctx: JobContext) -> dict:
+    """백그라운드 자동 스케줄 발행: 끝나지 않은 큐부터, 큐 안에서는 남은 원고부터 이어서 처리"""
+    params = ctx.params
+    items = await ctx.get_items()
+    total_queues = len(items)
+    pending = await ctx.pending_items()
+
+    for position, item in enumerate(pending):
+        queue = item.payload
+        password = ctx.secrets.get(queue["account_id"] or "")
+        if not password:
+            await ctx.fail_item(item.index, "계정 비밀번호가 없습니다. 재개할 때 비밀번호를 함께 보내 주세요.")
+            continue
+
+        await ctx.start_item(item.index)
+        result = await process_single_queue(
+            queue_index=item.index + 1,
+            total_queues=total_queues,
+            account={"id": queue["account_id"], "password": password},
+            keywords=queue["keywords"],
+            start_date=params["start_date"],
+            start_hour=params["start_hour"],
+            posts_per_day=queue["posts_per_day"],
+            interval_hours=queue["interval_hours"],
+            service=queue["service"],
+            ref=queue["ref"],
+            generate_images=params["generate_images"],
+            image_count=params["image_count"],
+            delay_between_posts=params["delay_between_posts"],
+            progress=item.result,
+            on_progress=lambda progress, index=item.index: ctx.save_progress(index, progress),
+        )
+        if result["status"] == "failed":
+            await ctx.fail_item(item.index, result["error"] or "실패", result)
+        else:
+            await ctx.finish_item(item.index, result)
+
+        if position < len(pending) - 1:
+            await asyncio.sleep(params["delay_between_queues"])
+
+    queue_results = [
+        item.result for item in await ctx.get_items() if item.result and "summary" in item.result
+    ]
+    return summarize_queue_results(total_queues, queue_results, ctx.elapsed)
+
+
+register_job_handler("auto_schedule", run_auto_schedule_job, requires_secrets=True)
+
+
 # ========== API 엔드포인트 ==========
 
 @router.post("/auto-schedule")
@@ -336,7 +488,13 @@ async def auto_schedule_bot(request: AutoScheduleRequest):
     - queues 배열로 여러 계정/키워드 세트 수신
     - 순차 실행: 큐1 완료 → 큐2 → 큐3 ...
     - 개별 큐 실패 시 다음 큐로 계속 진행
+    - background: True면 작업 ID만 바로 반환(202)하고 백그라운드 작업으로 처리
+      (진행 상황은 /jobs/{job_id}, 재시작 후에는 비밀번호와 함께 /jobs/{job_id}/resume)
     """
+    if request.background:
+        job_id = submit_auto_schedule_job(request)
+        return job_accepted(job_id, items=len(request.queues))
+
     total_start = datetime.now()
     total_queues = len(request.queues)
 
@@ -380,28 +538,5 @@ async def auto_schedule_bot(request: AutoScheduleRequest):
             log.debug(f"{request.delay_between_queues}초 대기 후 다음 큐 시작...")
             await asyncio.sleep(request.delay_between_queues)
 
-    # 전체 결과 집계
-    total_keywords = sum(r["summary"]["keywords"] for r in queue_results)
-    total_published = sum(r["summary"]["published"] for r in queue_results)
-    total_failed = sum(r["summary"]["failed"] for r in queue_results)
     total_elapsed = (datetime.now() - total_start).total_seconds()
-
-    log.divider()
-    log.header("배치 스케줄 발행 완료", "✅")
-    log.kv("총 큐", f"{total_queues}개")
-    log.kv("총 키워드", f"{total_keywords}개")
-    log.kv("성공", f"{total_published}개")
-    log.kv("실패", f"{total_failed}개")
-    log.kv("소요시간", f"{total_elapsed:.0f}s")
-
-    return JSONResponse(content={
-        "success": True,
-        "total_queues": total_queues,
-        "summary": {
-            "total_keywords": total_keywords,
-            "total_published": total_published,
-            "total_failed": total_failed,
-            "elapsed": round(total_elapsed, 1),
-        },
-        "queue_results": queue_results,
-    })
+    return JSONResponse(content=summarize_queue_results(total_queues, queue_results, total_elapsed))
@@ -5,19 +5,28 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Optional
 
 from fastapi.concurrency import run_in_threadpool
 
-from llm.gemini_new_service import gemini_new_gen
+from llm.gemini_new_service import (
+    MODEL_NAME as GEMINI_NEW_MODEL_NAME,
+    GeminiNewPrompt,
+    agemini_new_gen_prepared,
+    prepare_gemini_new_prompt,
+)
 from routers.generate.batch import (
+    BATCH_ESTIMATED_TOKENS,
     generate_batch_id,
-    generate_images_parallel,
+    generate_images_limited,
     save_to_pending,
 )
 from routers.generate.gemini_image import _try_s3_images
-from services.blog_write_service import write_blog_post
-from utils.get_category_db_name import get_category_db_name
+from routers.auth.naver import naver_login_with_playwright
+from services.blog_write_service import SESSION_EXPIRED_ERROR, write_blog_post
+from utils.ai_client_factory import get_ai_service_type
+from utils.batch_engine import gather_batch, get_provider_limiter
+from utils.category_pipeline import CategoryGenerator, generate_with_category
 from utils.logger import log
 
 from .common_models import ManuscriptData, ManuscriptInfo, QueueInfo
@@ -44,18 +53,48 @@ from .common_storage import (
     move_to_completed,
     move_to_failed,
     parse_manuscript_txt,
+    queue_manuscript_position,
     should_publish_immediately,
     update_queue_status,
 )
 
 
+async def _write_with_relogin(
+    cookies: list,
+    account_id: Optional[str],
+    password: Optional[str],
+    **post,
+) -> dict:
+    """
+    글 발행, 세션이 서버에서 끊겼으면 한 번 다시 로그인해서 재시도
+
+    다시 로그인하면 같은 큐의 다음 원고도 새 세션으로 발행되도록 호출자의 cookies 를 갱신한다.
+    """
+    result = await write_blog_post(cookies=cookies, account_id=account_id, **post)
+    if result.get("error") != SESSION_EXPIRED_ERROR or not (account_id and password):
+        return result
+
+    log.warning("세션 만료 → 다시 로그인", account=f"{account_id[:3]}***")
+    login_result = await naver_login_with_playwright(
+        account_id=account_id,
+        password=password,
+        reuse_session=False,
+    )
+    if not login_result["success"]:
+        return {**result, "message": f"재로그인 실패: {login_result.get('message')}"}
+
+    cookies[:] = login_result["cookies"]
+    return await write_blog_post(cookies=cookies, account_id=account_id, **post)
+
+
 async def publish_single_manuscript(
     cookies: list,
     manuscript_id: str,
     schedule_time: Optional[datetime] = None,
     account_id: Optional[str] = None,
+    password: Optional[str] = None,
 ) -> dict:
-    """단일 원고 발행 (공통 로직)"""
+    """단일 원고 발행 (공통 로직, password 가 있으면 세션 만료 시 재로그인)"""
     manuscript_dir = PENDING_DIR / manuscript_id
     data = get_manuscript_data(manuscript_dir)
     if not data:
@@ -83,8 +122,10 @@ async def publish_single_manuscript(
     else:
         log.info(f"발행: {data['title'][:30]}", id=manuscript_id)
 
-    result = await write_blog_post(
-        cookies=cookies,
+    result = await _write_with_relogin(
+        cookies,
+        account_id,
+        password,
         title=data["title"],
         content=data["content"],
         tags=data.get("tags"),
@@ -116,8 +157,9 @@ async def publish_queue_manuscript(
     manuscript_id: str,
     schedule_time: Optional[datetime] = None,
     account_id: Optional[str] = None,
+    password: Optional[str] = None,
 ) -> dict:
-    """큐 내 단일 원고 발행"""
+    """큐 내 단일 원고 발행 (password 가 있으면 세션 만료 시 재로그인)"""
     manuscript_dir = queue_dir / manuscript_id
     data = get_manuscript_data(manuscript_dir)
     if not data:
@@ -145,8 +187,10 @@ async def publish_queue_manuscript(
     else:
         log.info(f"발행: {data['title'][:30]}", id=manuscript_id)
 
-    result = await write_blog_post(
-        cookies=cookies,
+    result = await _write_with_relogin(
+        cookies,
+        account_id,
+        password,
         title=data["title"],
         content=data["content"],
         tags=data.get("tags"),
@@ -184,16 +228,23 @@ async def generate_single_manuscript(
     generate_images: bool = True,
     image_count: int = 5,
     batch_id: Optional[str] = None,
+    sequence: Optional[int] = None,
 ) -> Optional[dict]:
     """단일 원고 생성 (원고 + 이미지 + pending 저장)"""
+
+    async def generate(prompt: GeminiNewPrompt, category: str) -> Optional[str]:
+        async with get_provider_limiter(get_ai_service_type(GEMINI_NEW_MODEL_NAME)).limit(
+            tokens=BATCH_ESTIMATED_TOKENS
+        ):
+            return await agemini_new_gen_prepared(prompt, category)
+
+    generator = CategoryGenerator(
+        prepare=lambda: prepare_gemini_new_prompt(keyword, ref),
+        generate=generate,
+    )
+
     try:
-        category = await get_category_db_name(keyword=keyword + ref)
-        content = await run_in_threadpool(
-            gemini_new_gen,
-            user_instructions=keyword,
-            ref=ref,
-            category=category,
-        )
+        content, category = await generate_with_category(keyword + ref, generator)
         if not content:
             log.error("원고 생성 실패", keyword=keyword[:20])
             return None
@@ -204,15 +255,10 @@ async def generate_single_manuscript(
             if s3_found and s3_images:
                 image_urls = [image["url"] for image in s3_images]
             else:
-                images = await run_in_threadpool(
-                    generate_images_parallel,
-                    keyword,
-                    image_count,
-                    category,
-                )
+                images = await generate_images_limited(keyword, image_count, category)
                 image_urls = [image["url"] for image in images if image.get("url")]
 
-        manuscript_id = await save_to_pending(keyword, content, image_urls, batch_id)
+        manuscript_id = await save_to_pending(keyword, content, image_urls, batch_id, sequence)
         log.success("생성 완료", id=manuscript_id, images=len(image_urls))
         return {
             "id": manuscript_id,
@@ -229,38 +275,38 @@ async def generate_manuscripts_batch(
     ref: str = "",
     generate_images: bool = True,
     image_count: int = 5,
-    delay: float = 1.0,
+    concurrency: Optional[int] = None,
     on_progress: Optional[Callable] = None,
 ) -> tuple[str, list[dict]]:
-    """여러 키워드 원고 일괄 생성"""
+    """
+    여러 키워드 원고 일괄 생성
+
+    키워드를 concurrency개씩 동시에 생성하고(utils.batch_engine), 실패한 키워드만 따로 재시도한다.
+    원고 번호와 반환 목록은 완료 순서와 관계없이 키워드 순서를 따른다.
+    """
     batch_id = generate_batch_id()
-    generated: list[dict] = []
+    targets = [(index, keyword.strip()) for index, keyword in enumerate(keywords) if keyword.strip()]
 
     log.kv("배치 ID", batch_id)
 
-    for index, keyword in enumerate(keywords):
-        keyword = keyword.strip()
-        if not keyword:
-            continue
-
+    async def worker(_: int, target: tuple[int, str]) -> Optional[dict]:
+        index, keyword = target
         if on_progress:
             on_progress(index + 1, len(keywords), keyword)
         else:
             log.step(index + 1, len(keywords), keyword[:30])
 
-        result = await generate_single_manuscript(
+        return await generate_single_manuscript(
             keyword=keyword,
             ref=ref,
             generate_images=generate_images,
             image_count=image_count,
             batch_id=batch_id,
+            sequence=index + 1,
         )
-        if result:
-            generated.append(result)
-
-        if index < len(keywords) - 1:
-            await asyncio.sleep(delay)
 
+    results = await gather_batch(targets, worker, concurrency=concurrency)
+    generated = [result.value for result in results if result.ok]
     return batch_id, generated
 
 
@@ -270,10 +316,12 @@ async def publish_manuscripts_batch(
     manuscripts: list,
     schedule_times: Optional[list[Optional[datetime]]] = None,
     account_id: Optional[str] = None,
+    password: Optional[str] = None,
     delay: float = 10.0,
     on_progress: Optional[Callable] = None,
+    on_result: Optional[Callable[[int, dict], Awaitable[None]]] = None,
 ) -> list[dict]:
-    """여러 원고 일괄 발행"""
+    """여러 원고 일괄 발행 (on_result: 원고 1건 발행이 끝날 때마다 (순번, 결과))"""
     results: list[dict] = []
 
     for index, manuscript in enumerate(manuscripts):
@@ -301,8 +349,11 @@ async def publish_manuscripts_batch(
             manuscript_id=manuscript.id,
             schedule_time=schedule_time,
             account_id=account_id,
+            password=password,
         )
         results.append(result)
+        if on_result:
+            await on_result(index, result)
 
         if index < len(manuscripts) - 1:
             await asyncio.sleep(delay)
@@ -337,6 +388,7 @@ __all__ = [
     "publish_manuscripts_batch",
     "publish_queue_manuscript",
     "publish_single_manuscript",
+    "queue_manuscript_position",
     "should_publish_immediately",
     "update_queue_status",
 ]
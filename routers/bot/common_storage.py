@@ -9,21 +9,22 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from services.manuscript_manifest import (
+    COMPLETED_DIR,
+    FAILED_DIR,
+    IMAGE_EXTENSIONS,
+    MANUSCRIPTS_DIR,
+    PENDING_DIR,
+    get_manifest,
+)
 from utils.logger import log
 
 from .common_models import ManuscriptInfo, QueueInfo
 
 
-MANUSCRIPTS_DIR = Path("manuscripts")
-PENDING_DIR = MANUSCRIPTS_DIR / "pending"
-COMPLETED_DIR = MANUSCRIPTS_DIR / "completed"
-FAILED_DIR = MANUSCRIPTS_DIR / "failed"
-
 for dir_path in [PENDING_DIR, COMPLETED_DIR, FAILED_DIR]:
     dir_path.mkdir(parents=True, exist_ok=True)
 
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
-
 
 def _read_json(path: Path) -> dict | None:
     if not path.exists():
@@ -121,6 +122,7 @@ def move_to_completed(
     if completed_dir.exists():
         shutil.rmtree(completed_dir)
     shutil.move(str(manuscript_dir), str(completed_dir))
+    get_manifest().moved(manuscript_dir, completed_dir)
 
     result_data = {
         "post_url": result.get("post_url"),
@@ -146,6 +148,7 @@ def move_to_failed(
     if failed_dir.exists():
         shutil.rmtree(failed_dir)
     shutil.move(str(manuscript_dir), str(failed_dir))
+    get_manifest().moved(manuscript_dir, failed_dir)
 
     error_data = {
         "error": result.get("message"),
@@ -158,52 +161,25 @@ def move_to_failed(
     _write_json(failed_dir / "error.json", error_data)
 
 
-def _build_manuscript_info(folder: Path, data: dict) -> ManuscriptInfo:
+def _build_manuscript_info(entry: dict) -> ManuscriptInfo:
     return ManuscriptInfo(
-        id=folder.name,
-        title=data.get("title", "제목 없음"),
-        category=data.get("category"),
-        images_count=len(data.get("images", [])),
-        created_at=data.get("created_at", ""),
+        id=entry["name"],
+        title=entry["title"],
+        category=entry["category"],
+        images_count=entry["images_count"],
+        created_at=entry["created_at"],
     )
 
 
 def get_manuscript_list(status: str = "pending") -> list[ManuscriptInfo]:
-    """원고 목록 조회"""
-    dir_map = {"pending": PENDING_DIR, "completed": COMPLETED_DIR, "failed": FAILED_DIR}
-    target_dir = dir_map.get(status, PENDING_DIR)
-    if not target_dir.exists():
-        return []
-
-    manuscripts: list[ManuscriptInfo] = []
-    for folder in sorted(target_dir.iterdir()):
-        if not folder.is_dir():
-            continue
-
-        text_data = parse_manuscript_txt(folder)
-        if text_data:
-            manuscripts.append(_build_manuscript_info(folder, text_data))
-            continue
-
-        json_data = _read_json(folder / "manuscript.json")
-        if not json_data:
-            continue
-
-        images_dir = folder / "images"
-        json_data["images"] = list(images_dir.glob("*")) if images_dir.exists() else []
-        manuscripts.append(_build_manuscript_info(folder, json_data))
-
-    return manuscripts
+    """원고 목록 조회 (manifest 색인 기준, 폴더/파일을 매번 열지 않음)"""
+    location = status if status in ("pending", "completed", "failed") else "pending"
+    return [_build_manuscript_info(entry) for entry in get_manifest().list(location)]
 
 
 def get_next_manuscript_id() -> str:
-    """다음 원고 ID 생성"""
-    existing = list(PENDING_DIR.iterdir()) + list(COMPLETED_DIR.iterdir()) + list(FAILED_DIR.iterdir())
-    max_id = 0
-    for folder in existing:
-        if folder.is_dir() and folder.name.isdigit():
-            max_id = max(max_id, int(folder.name))
-    return str(max_id + 1).zfill(4)
+    """다음 원고 ID 생성 (manifest 카운터로 원자적 할당 → 동시 요청끼리 겹치지 않음)"""
+    return get_manifest().next_manuscript_id()
 
 
 def generate_queue_id() -> str:
@@ -242,14 +218,21 @@ def create_queue(
         new_id = f"{str(index + 1).zfill(3)}_{manuscript_id}"
         destination_dir = queue_dir / new_id
         shutil.move(str(source_dir), str(destination_dir))
+        get_manifest().moved(source_dir, destination_dir)
         meta["manuscripts"].append(new_id)
         log.debug(f"원고 이동: {manuscript_id} → {new_id}")
 
     _write_json(queue_dir / "queue.json", meta)
+    get_manifest().queue_updated(queue_dir)
     log.success("큐 생성 완료", queue_id=queue_id, count=len(meta["manuscripts"]))
     return queue_id, queue_dir
 
 
+def queue_manuscript_position(queue_manuscript_id: str) -> int:
+    """큐 원고 ID(001_abc12345_0001)의 큐 생성 시 순번 (0부터, create_queue 에 넘긴 목록 기준)"""
+    return int(queue_manuscript_id.split("_", 1)[0]) - 1
+
+
 def get_queue_dir(queue_id: str) -> Optional[Path]:
     """큐 디렉토리 반환"""
     queue_dir = MANUSCRIPTS_DIR / queue_id
@@ -280,51 +263,29 @@ def update_queue_status(queue_id: str, status: str) -> None:
     meta["status"] = status
     meta["updated_at"] = datetime.now().isoformat()
     _write_json(meta_path, meta)
+    get_manifest().queue_updated(queue_dir)
 
 
 def get_queue_manuscripts(queue_id: str) -> list[ManuscriptInfo]:
-    """큐 내 원고 목록"""
-    queue_dir = get_queue_dir(queue_id)
-    if not queue_dir:
+    """큐 내 원고 목록 (manifest 색인 기준)"""
+    if not get_queue_dir(queue_id):
         return []
-
-    manuscripts: list[ManuscriptInfo] = []
-    for folder in sorted(queue_dir.iterdir()):
-        if not folder.is_dir() or folder.name.startswith("."):
-            continue
-
-        data = parse_manuscript_txt(folder)
-        if data:
-            manuscripts.append(_build_manuscript_info(folder, data))
-
-    return manuscripts
+    return [_build_manuscript_info(entry) for entry in get_manifest().list(queue_id)]
 
 
 def list_active_queues() -> list[QueueInfo]:
-    """진행중인 큐 목록"""
-    queues: list[QueueInfo] = []
-    for folder in sorted(MANUSCRIPTS_DIR.iterdir()):
-        if not folder.is_dir() or not folder.name.startswith("queue_"):
-            continue
-
-        meta = get_queue_meta(folder.name)
-        if not meta:
-            continue
-
-        manuscripts = [
-            file for file in folder.iterdir() if file.is_dir() and not file.name.startswith(".")
-        ]
-        queues.append(
-            QueueInfo(
-                queue_id=folder.name,
-                created_at=meta.get("created_at", ""),
-                manuscript_count=len(manuscripts),
-                status=meta.get("status", "unknown"),
-                account_id=meta.get("account_id"),
-                schedule_date=meta.get("schedule_date"),
-            )
+    """진행중인 큐 목록 (manifest 색인 기준, queue.json 은 바뀐 큐만 다시 읽음)"""
+    return [
+        QueueInfo(
+            queue_id=queue["queue_id"],
+            created_at=queue["created_at"],
+            manuscript_count=queue["manuscript_count"],
+            status=queue["status"],
+            account_id=queue["account_id"],
+            schedule_date=queue["schedule_date"],
         )
-    return queues
+        for queue in get_manifest().list_queues()
+    ]
 
 
 def move_queue_manuscript_to_completed(
@@ -343,6 +304,7 @@ def move_queue_manuscript_to_completed(
     if completed_dir.exists():
         shutil.rmtree(completed_dir)
     shutil.move(str(manuscript_dir), str(completed_dir))
+    get_manifest().moved(manuscript_dir, completed_dir)
 
     result_data = {
         "post_url": result.get("post_url"),
@@ -372,6 +334,7 @@ def move_queue_manuscript_to_failed(
     if failed_dir.exists():
         shutil.rmtree(failed_dir)
     shutil.move(str(manuscript_dir), str(failed_dir))
+    get_manifest().moved(manuscript_dir, failed_dir)
 
     error_data = {
         "error": result.get("message"),
@@ -395,6 +358,7 @@ def cleanup_empty_queue(queue_id: str) -> None:
     ]
     if not remaining:
         shutil.rmtree(queue_dir)
+        get_manifest().removed(queue_dir)
         log.info(f"빈 큐 삭제: {queue_id}")
 
 
@@ -421,6 +385,7 @@ __all__ = [
     "move_to_completed",
     "move_to_failed",
     "parse_manuscript_txt",
+    "queue_manuscript_position",
     "should_publish_immediately",
     "update_queue_status",
 ]
@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter
 
+from services.browser_pool import get_browser_pool
+
 from .common import get_manuscript_list
 
 router = APIRouter()
@@ -17,5 +19,6 @@ async def health():
             "pending": len(get_manuscript_list("pending")),
             "completed": len(get_manuscript_list("completed")),
             "failed": len(get_manuscript_list("failed")),
-        }
+        },
+        "browser": get_browser_pool().stats(),
     }
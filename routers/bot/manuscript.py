@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from services.manuscript_manifest import get_manifest
 from utils.logger import log
 
 from .common import (
@@ -48,6 +49,7 @@ async def prepare_manuscript(request: PrepareRequest):
 
     with open(manuscript_dir / "manuscript.json", "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+    get_manifest().created(manuscript_dir)
 
     log.success("원고 저장 완료", id=manuscript_id, title=request.manuscript.title[:30])
 
@@ -95,6 +97,7 @@ async def delete_manuscript(manuscript_id: str):
         manuscript_dir = dir_path / manuscript_id
         if manuscript_dir.exists():
             shutil.rmtree(manuscript_dir)
+            get_manifest().removed(manuscript_dir)
             return JSONResponse(content={
                 "success": True,
                 "message": f"원고 {manuscript_id} 삭제 완료",
@@ -116,6 +119,7 @@ async def retry_manuscript(manuscript_id: str):
 
     pending_dir = PENDING_DIR / manuscript_id
     shutil.move(str(failed_dir), str(pending_dir))
+    get_manifest().moved(failed_dir, pending_dir)
 
     return JSONResponse(content={
         "success": True,
@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from routers.auth.naver import naver_login_with_playwright
+from services.manuscript_manifest import get_manifest
 from utils.logger import log
 
 from .common import (
@@ -182,6 +183,7 @@ async def start_queue(request: StartQueueRequest):
             manuscript_id=manuscript.id,
             schedule_time=schedule_time,
             account_id=account_id,
+            password=password,
         )
         results.append(result)
 
@@ -227,10 +229,12 @@ async def delete_queue(queue_id: str):
         if dst.exists():
             shutil.rmtree(dst)
         shutil.move(str(folder), str(dst))
+        get_manifest().moved(folder, dst)
         restored.append(original_id)
 
     # 큐 폴더 삭제
     shutil.rmtree(queue_dir)
+    get_manifest().removed(queue_dir)
 
     return JSONResponse(content={
         "success": True,
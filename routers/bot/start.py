@@ -109,6 +109,7 @@ async def start_bot(request: StartBotRequest):
             manuscript_id=manuscript.id,
             schedule_time=schedule_time,
             account_id=account_id,
+            password=password,
         )
         results.append(result)
 
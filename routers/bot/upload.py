@@ -9,6 +9,7 @@ from typing import Optional
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from fastapi.responses import JSONResponse
 
+from services.manuscript_manifest import get_manifest
 from utils.logger import log
 
 from .common import PENDING_DIR, get_manuscript_list
@@ -129,6 +130,7 @@ async def upload_manuscripts(
                         with open(target_path, "wb") as dst:
                             dst.write(src.read())
 
+                get_manifest().created(dst_dir)
                 uploaded.append({
                     "original": folder_name,
                     "id": new_folder_name,
@@ -171,6 +173,7 @@ async def delete_pending(manuscript_id: str):
         raise HTTPException(status_code=404, detail="원고를 찾을 수 없습니다.")
 
     shutil.rmtree(manuscript_dir)
+    get_manifest().removed(manuscript_dir)
 
     return JSONResponse(content={
         "success": True,
@@ -185,6 +188,7 @@ async def clear_pending():
     for folder in PENDING_DIR.iterdir():
         if folder.is_dir():
             shutil.rmtree(folder)
+            get_manifest().removed(folder)
             count += 1
 
     return JSONResponse(content={
@@ -1,5 +1,6 @@
 """업로드 스케줄 발행 API - ZIP 업로드 + 예약발행"""
 
+import asyncio
 import zipfile
 from datetime import datetime
 from pathlib import Path
@@ -11,21 +12,153 @@ from fastapi.responses import JSONResponse
 
 from routers.auth.naver import naver_login_with_playwright
 from routers.generate.batch import generate_batch_id
+from routers.jobs import job_accepted
+from services.job_queue import JobContext, JobItem, get_job_queue, register_job_handler
+from services.manuscript_manifest import get_manifest
 from utils.logger import log
 
 from .common import (
+    COMPLETED_DIR,
     PENDING_DIR,
     create_queue,
+    get_queue_dir,
     get_queue_manuscripts,
+    queue_manuscript_position,
     update_queue_status,
     cleanup_empty_queue,
     publish_manuscripts_batch,
+    publish_queue_manuscript,
 )
 from .auto_schedule import calculate_schedule, build_schedule_times
 
 router = APIRouter()
 
 
+# ========== 백그라운드 작업 ==========
+
+def submit_upload_schedule_job(
+    queue_id: str,
+    batch_id: str,
+    account_id: str,
+    password: str,
+    manuscripts: list,
+    uploaded: list[dict],
+    schedule: list[dict],
+    delay_between_posts: int,
+) -> str:
+    """큐 원고 1건 = 작업 항목 1개로 등록 (비밀번호는 메모리에만 보관)"""
+    keyword_to_schedule = {item["keyword"]: item for item in schedule}
+    items = []
+    for idx, manuscript in enumerate(manuscripts):
+        position = queue_manuscript_position(manuscript.id)
+        keyword = uploaded[position]["keyword"] if position < len(uploaded) else manuscript.title
+        sched = keyword_to_schedule.get(keyword)
+        items.append(JobItem(idx, keyword, {
+            "manuscript_id": manuscript.id,
+            "scheduled_at": sched["schedule_time"].isoformat() if sched else None,
+            "day": sched["day"] if sched else None,
+            "slot": sched["slot"] if sched else None,
+        }))
+
+    params = {
+        "queue_id": queue_id,
+        "batch_id": batch_id,
+        "account_id": account_id,
+        "delay_between_posts": delay_between_posts,
+    }
+    return get_job_queue().submit("upload_schedule", items, params, {account_id: password})
+
+
+async def run_upload_schedule_job(ctx: JobContext) -> dict:
+    """백그라운드 업로드 예약발행: 로그인 후 아직 발행하지 않은 원고부터 1건씩 발행"""
+    params = ctx.params
+    queue_id = params["queue_id"]
+    account_id = params["account_id"]
+    items = await ctx.get_items()
+    pending = await ctx.pending_items()
+
+    if pending:
+        queue_dir = get_queue_dir(queue_id)
+        if queue_dir is None:
+            raise RuntimeError(f"큐를 찾을 수 없습니다: {queue_id}")
+
+        password = ctx.secrets.get(account_id)
+        if not password:
+            raise RuntimeError("계정 비밀번호가 없습니다. 재개할 때 비밀번호를 함께 보내 주세요.")
+
+        update_queue_status(queue_id, "processing")
+        login_result = await naver_login_with_playwright(
+            account_id=account_id,
+            password=password,
+            debug=True,
+        )
+        if not login_result["success"]:
+            update_queue_status(queue_id, "failed")
+            raise RuntimeError(f"로그인 실패: {login_result.get('message')}")
+        cookies = login_result["cookies"]
+
+        for position, item in enumerate(pending):
+            manuscript_id = item.payload["manuscript_id"]
+            scheduled_at = item.payload["scheduled_at"]
+            schedule_info = {
+                "day": item.payload["day"],
+                "slot": item.payload["slot"],
+                "scheduled_at": scheduled_at,
+            }
+
+            if not (queue_dir / manuscript_id).exists():
+                # 재시작 직전에 발행/실패 처리까지 끝난 원고 (큐 폴더에서 이미 빠짐)
+                published = (COMPLETED_DIR / f"{queue_id}_{manuscript_id}").exists()
+                await ctx.finish_item(item.index, {
+                    "manuscript_id": manuscript_id,
+                    "success": published,
+                    "message": "재시작 전에 처리된 원고",
+                    **schedule_info,
+                })
+                continue
+
+            await ctx.start_item(item.index)
+            log.step(item.index + 1, len(items), f"{manuscript_id} ({scheduled_at or '즉시'})")
+            result = await publish_queue_manuscript(
+                cookies=cookies,
+                queue_dir=queue_dir,
+                manuscript_id=manuscript_id,
+                schedule_time=datetime.fromisoformat(scheduled_at) if scheduled_at else None,
+                account_id=account_id,
+                password=password,
+            )
+            result.update(schedule_info)
+            if result["success"]:
+                await ctx.finish_item(item.index, result)
+            else:
+                await ctx.fail_item(item.index, result.get("message") or "발행 실패", result)
+
+            if position < len(pending) - 1:
+                await asyncio.sleep(params["delay_between_posts"])
+
+        cleanup_empty_queue(queue_id)
+
+    results = [item.result for item in await ctx.get_items() if item.result]
+    success_count = sum(1 for r in results if r.get("success"))
+    log.success("업로드 스케줄 발행 완료", queue_id=queue_id, 성공=f"{success_count}/{len(items)}")
+    return {
+        "success": True,
+        "queue_id": queue_id,
+        "batch_id": params["batch_id"],
+        "account": f"{account_id[:3]}***",
+        "summary": {
+            "uploaded": len(items),
+            "published": success_count,
+            "failed": len(items) - success_count,
+            "elapsed": round(ctx.elapsed, 1),
+        },
+        "results": results,
+    }
+
+
+register_job_handler("upload_schedule", run_upload_schedule_job, requires_secrets=True)
+
+
 @router.post("/upload-schedule")
 async def upload_schedule_bot(
     file: UploadFile = File(...),
@@ -36,6 +169,7 @@ async def upload_schedule_bot(
     posts_per_day: int = Form(3),
     interval_hours: int = Form(2),
     delay_between_posts: int = Form(10),
+    background: bool = Form(False),
 ):
     """업로드 스케줄 발행: ZIP 업로드 + 예약발행
 
@@ -50,6 +184,8 @@ async def upload_schedule_bot(
         posts_per_day: 하루 발행 수 (1-10, 기본: 3)
         interval_hours: 발행 간격 (1-12시간, 기본: 2)
         delay_between_posts: 발행 간 대기 시간 (초, 기본: 10)
+        background: True면 큐 생성까지만 하고 작업 ID를 바로 반환(202),
+                    로그인/발행은 백그라운드 작업으로 원고 1건씩 처리
 
     ZIP 구조:
         upload.zip
@@ -134,6 +270,7 @@ async def upload_schedule_bot(
                         with open(target_path, "wb") as dst:
                             dst.write(src.read())
 
+                get_manifest().created(dst_dir)
                 uploaded.append({
                     "id": new_folder_name,
                     "keyword": folder_name,
@@ -180,6 +317,19 @@ async def upload_schedule_bot(
     log.kv("큐 ID", queue_id)
     log.kv("원고 수", len(manuscripts))
 
+    if background:
+        job_id = submit_upload_schedule_job(
+            queue_id=queue_id,
+            batch_id=batch_id,
+            account_id=account_id,
+            password=password,
+            manuscripts=manuscripts,
+            uploaded=uploaded,
+            schedule=schedule,
+            delay_between_posts=delay_between_posts,
+        )
+        return job_accepted(job_id, items=len(manuscripts))
+
     # ========== 4단계: 로그인 ==========
     log.header("4단계: 네이버 로그인", "🔐")
     update_queue_status(queue_id, "processing")
@@ -208,6 +358,7 @@ async def upload_schedule_bot(
         manuscripts=manuscripts,
         schedule_times=schedule_times,
         account_id=account_id,
+        password=password,
         delay=delay_between_posts,
     )
 
@@ -7,7 +7,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.concurrency import run_in_threadpool
 
 from llm.alibaba_service import MODEL_NAME, alibaba_gen
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from schema.generate import GenerateRequest
 from utils.get_category_db_name import get_category_db_name
 from utils.logger import log
@@ -40,7 +40,7 @@ async def generator_alibaba(request: GenerateRequest):
     log.kv("참조원고", "있음" if ref else "없음")
     log.kv("분류시간", f"{c_elapsed:.2f}s")
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category or "기타")
 
     try:
@@ -67,11 +67,11 @@ async def generator_alibaba(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
 
                 if ref:
                     ref_document = {"content": ref, "keyword": parsed["keyword"]}
-                    db_service.insert_document("ref", ref_document)
+                    await db_service.insert_document("ref", ref_document)
 
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
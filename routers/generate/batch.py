@@ -1,28 +1,38 @@
 """배치 원고 생성 API - 키워드 여러개 한번에 처리 (원고 + 이미지)"""
 
 import asyncio
+import json
+import os
 import time
 import uuid
 import httpx
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.concurrency import run_in_threadpool
 
+from routers.jobs import job_accepted
 from schema.generate import BatchGenerateRequest
-from llm.gpt4o_service import gpt4o_gen
-from llm.image_service import image_gen_single, get_random_poses
+from services.job_queue import JobContext, JobItem, get_job_queue, register_job_handler
+from services.manuscript_manifest import PENDING_DIR, get_manifest
+from llm.gpt4o_service import MODEL_NAME as TEXT_MODEL_NAME, agpt4o_gen
+from llm.image_service import MODEL_NAME as IMAGE_MODEL_NAME, image_gen_single, get_random_poses
+from utils.ai_client_factory import get_ai_service_type, get_image_service_type
+from utils.batch_engine import BatchItemResult, get_provider_limiter, run_batch
 from utils.get_category_db_name import get_category_db_name
 from utils.logger import log
+from utils.sse import SSE_HEADERS, relay_sse
 
 router = APIRouter()
 
-MANUSCRIPTS_DIR = Path("manuscripts")
-PENDING_DIR = MANUSCRIPTS_DIR / "pending"
+# 원고 1건 생성에 드는 예상 토큰 수 (프로바이더 TPM 제한용)
+BATCH_ESTIMATED_TOKENS = int(os.getenv("BATCH_ESTIMATED_TOKENS", "8000"))
+IMAGE_LIMITER_NAME = f"{get_image_service_type(IMAGE_MODEL_NAME)}-image"
+
 PENDING_DIR.mkdir(parents=True, exist_ok=True)
 
 
@@ -31,32 +41,22 @@ def generate_batch_id() -> str:
     return uuid.uuid4().hex[:8]
 
 
-def get_next_manuscript_id(batch_id: str = None) -> str:
-    """다음 원고 ID 생성
+def get_next_manuscript_id(batch_id: str = None, sequence: Optional[int] = None) -> str:
+    """다음 원고 ID 생성 (순번이 없으면 manifest 카운터로 원자적 할당)
 
     Args:
         batch_id: 배치 고유 ID (있으면 {batch_id}_{순번} 형식)
+        sequence: 배치 안 순번 (동시 생성 시 완료 순서가 아니라 키워드 순서로 번호 부여)
 
     Returns:
         batch_id가 있으면: abc12345_0001
         batch_id가 없으면: 0001 (레거시 호환)
     """
+    if batch_id and sequence is not None:
+        return f"{batch_id}_{str(sequence).zfill(4)}"
     if batch_id:
-        # 해당 배치의 원고만 카운트
-        existing = [
-            f for f in PENDING_DIR.iterdir()
-            if f.is_dir() and f.name.startswith(f"{batch_id}_")
-        ] if PENDING_DIR.exists() else []
-        next_num = len(existing) + 1
-        return f"{batch_id}_{str(next_num).zfill(4)}"
-    else:
-        # 레거시: 순차 번호
-        existing = list(PENDING_DIR.iterdir()) if PENDING_DIR.exists() else []
-        max_id = 0
-        for folder in existing:
-            if folder.is_dir() and folder.name.isdigit():
-                max_id = max(max_id, int(folder.name))
-        return str(max_id + 1).zfill(4)
+        return get_manifest().next_batch_manuscript_id(batch_id)
+    return get_manifest().next_manuscript_id()
 
 
 def generate_images_parallel(keyword: str, count: int, category: str = "") -> list[dict]:
@@ -84,6 +84,12 @@ def generate_images_parallel(keyword: str, count: int, category: str = "") -> li
     return images
 
 
+async def generate_images_limited(keyword: str, count: int, category: str = "") -> list[dict]:
+    """이미지 프로바이더 동시 호출/RPM 한도 안에서 이미지 병렬 생성"""
+    async with get_provider_limiter(IMAGE_LIMITER_NAME).limit(requests=count):
+        return await run_in_threadpool(generate_images_parallel, keyword, count, category)
+
+
 async def download_image(url: str, save_path: Path) -> bool:
     """URL에서 이미지 다운로드"""
     try:
@@ -98,7 +104,13 @@ async def download_image(url: str, save_path: Path) -> bool:
     return False
 
 
-async def save_to_pending(keyword: str, content: str, image_urls: list[str] = None, batch_id: Optional[str] = None) -> str:
+async def save_to_pending(
+    keyword: str,
+    content: str,
+    image_urls: list[str] = None,
+    batch_id: Optional[str] = None,
+    sequence: Optional[int] = None,
+) -> str:
     """생성된 원고와 이미지를 pending 폴더에 저장
 
     Args:
@@ -106,8 +118,10 @@ async def save_to_pending(keyword: str, content: str, image_urls: list[str] = No
         content: 원고 내용
         image_urls: 이미지 URL 목록
         batch_id: 배치 고유 ID (있으면 {batch_id}_{순번} 형식으로 저장)
+        sequence: 배치 안 순번 (없으면 기존 폴더 수 + 1)
     """
-    manuscript_id = get_next_manuscript_id(batch_id)
+    # ID는 manifest 카운터 또는 키워드 순번으로 정해져 동시 저장끼리 번호가 겹치지 않음
+    manuscript_id = get_next_manuscript_id(batch_id, sequence)
     manuscript_dir = PENDING_DIR / manuscript_id
     manuscript_dir.mkdir(parents=True, exist_ok=True)
 
@@ -129,17 +143,97 @@ async def save_to_pending(keyword: str, content: str, image_urls: list[str] = No
         downloaded = sum(1 for r in results if r)
         log.debug(f"이미지 다운로드", 성공=f"{downloaded}/{len(image_urls)}")
 
+    get_manifest().created(manuscript_dir)
     return manuscript_id
 
 
+async def _generate_batch_item(
+    keyword: str,
+    ref: str,
+    generate_images: bool,
+    image_count: int,
+) -> dict:
+    """키워드 1건: 분류 → 원고 → 이미지 → pending 저장 (실패 시 예외 → 배치 엔진이 재시도)"""
+    # 1. 카테고리 분류
+    category = await get_category_db_name(keyword=keyword + ref)
+
+    # 2. 원고 생성
+    async with get_provider_limiter(get_ai_service_type(TEXT_MODEL_NAME)).limit(
+        tokens=BATCH_ESTIMATED_TOKENS
+    ):
+        content = await agpt4o_gen(
+            user_instructions=keyword,
+            ref=ref,
+            category=category
+        )
+    if not content:
+        raise ValueError("원고 생성 실패")
+
+    # 3. 이미지 생성 (옵션)
+    image_urls = []
+    if generate_images:
+        images = await generate_images_limited(keyword, image_count, category or "")
+        image_urls = [img["url"] for img in images if img.get("url")]
+
+    # 4. pending 폴더에 저장
+    manuscript_id = await save_to_pending(keyword, content, image_urls)
+    log.success(f"완료", keyword=keyword[:20], id=manuscript_id, images=len(image_urls))
+
+    return {
+        "keyword": keyword,
+        "success": True,
+        "manuscript_id": manuscript_id,
+        "content_length": len(content),
+        "images_count": len(image_urls),
+    }
+
+
+def _batch_item_response(result: BatchItemResult) -> dict:
+    if result.ok:
+        return {**result.value, "attempts": result.attempts}
+    log.error(f"에러", keyword=result.item[:20], error=result.error)
+    return {
+        "keyword": result.item,
+        "success": False,
+        "message": result.error,
+        "attempts": result.attempts,
+    }
+
+
+def _batch_report(results: list[dict], total: int, elapsed: float) -> dict[str, Any]:
+    success_count = sum(1 for result in results if result["success"])
+    log.divider()
+    log.success(f"배치 완료", 성공=f"{success_count}/{total}", 시간=f"{elapsed:.1f}s")
+    return {
+        "total": total,
+        "success": success_count,
+        "failed": total - success_count,
+        "elapsed": round(elapsed, 1),
+        "results": results,
+    }
+
+
+def _sse(data: dict, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.post("/generate/batch")
-async def generate_batch(request: BatchGenerateRequest):
+async def generate_batch(request: BatchGenerateRequest, http_request: Request):
     """
     배치 원고 + 이미지 생성
 
+    키워드를 concurrency개씩 동시에 처리하고, 실제 호출 속도는 프로바이더별
+    동시 호출/RPM/TPM 제한(utils.batch_engine)으로 맞춘다. 실패한 키워드는 따로 재시도한다.
+
     - keywords: 키워드 목록
     - generate_images: 이미지 생성 여부 (기본: True)
     - image_count: 키워드당 이미지 개수 (기본: 5)
+    - concurrency: 동시 처리 키워드 수 (기본: BATCH_CONCURRENCY)
+    - stream: True면 키워드가 끝날 때마다 SSE("data: 결과")로 보내고
+              마지막에 "event: done"으로 전체 보고서(키워드 순서) 전송
+    - background: True면 작업 ID만 바로 반환(202)하고 백그라운드 작업으로 처리
+                  (진행 상황은 /jobs/{job_id}, 재시작 후 끝나지 않은 키워드부터 이어서 실행)
     """
     start_ts = time.time()
     service = request.service.lower()
@@ -153,83 +247,76 @@ async def generate_batch(request: BatchGenerateRequest):
     log.kv("키워드 수", len(keywords))
     log.kv("이미지 생성", "ON" if generate_images else "OFF")
 
-    results = []
-    success_count = 0
-
-    for idx, keyword in enumerate(keywords):
-        keyword = keyword.strip()
-        if not keyword:
-            continue
-
-        log.step(idx + 1, len(keywords), keyword[:30])
-
-        try:
-            # 1. 카테고리 분류
-            category = await get_category_db_name(keyword=keyword + ref)
-
-            # 2. 원고 생성
-            content = await run_in_threadpool(
-                gpt4o_gen,
-                user_instructions=keyword,
-                ref=ref,
-                category=category
-            )
-
-            if not content:
-                results.append({
-                    "keyword": keyword,
-                    "success": False,
-                    "message": "원고 생성 실패",
-                })
-                log.error(f"원고 생성 실패", keyword=keyword[:20])
-                continue
-
-            # 3. 이미지 생성 (옵션)
-            image_urls = []
-            if generate_images:
-                log.debug(f"이미지 생성 중...", count=image_count)
-                images = await run_in_threadpool(
-                    generate_images_parallel,
-                    keyword,
-                    image_count,
-                    category or ""
-                )
-                image_urls = [img["url"] for img in images if img.get("url")]
-                log.debug(f"이미지 생성 완료", count=len(image_urls))
-
-            # 4. pending 폴더에 저장
-            manuscript_id = await save_to_pending(keyword, content, image_urls)
-            success_count += 1
-
-            results.append({
-                "keyword": keyword,
-                "success": True,
-                "manuscript_id": manuscript_id,
-                "content_length": len(content),
-                "images_count": len(image_urls),
-            })
-            log.success(f"완료", keyword=keyword[:20], id=manuscript_id, images=len(image_urls))
-
-        except Exception as e:
-            results.append({
-                "keyword": keyword,
-                "success": False,
-                "message": str(e),
-            })
-            log.error(f"에러", keyword=keyword[:20], error=str(e))
-
-        # 요청 간 딜레이
-        if idx < len(keywords) - 1:
-            await asyncio.sleep(1)
-
-    elapsed = time.time() - start_ts
-    log.divider()
-    log.success(f"배치 완료", 성공=f"{success_count}/{len(keywords)}", 시간=f"{elapsed:.1f}s")
-
-    return JSONResponse(content={
-        "total": len(keywords),
-        "success": success_count,
-        "failed": len(keywords) - success_count,
-        "elapsed": round(elapsed, 1),
-        "results": results,
-    })
+    targets = [keyword.strip() for keyword in keywords if keyword.strip()]
+
+    if request.background:
+        job_id = get_job_queue().submit(
+            "generate_batch",
+            [JobItem(index, keyword, {}) for index, keyword in enumerate(targets)],
+            {
+                "ref": ref,
+                "generate_images": generate_images,
+                "image_count": image_count,
+                "concurrency": request.concurrency,
+            },
+        )
+        return job_accepted(job_id, items=len(targets))
+
+    async def worker(index: int, keyword: str) -> dict:
+        log.step(index + 1, len(targets), keyword[:30])
+        return await _generate_batch_item(keyword, ref, generate_images, image_count)
+
+    async def run() -> AsyncIterator[tuple[int, dict]]:
+        async for result in run_batch(targets, worker, concurrency=request.concurrency):
+            yield result.index, _batch_item_response(result)
+
+    def report(responses: dict[int, dict]) -> dict[str, Any]:
+        results = [responses[index] for index in sorted(responses)]
+        return _batch_report(results, len(keywords), time.time() - start_ts)
+
+    if request.stream:
+        async def events() -> AsyncIterator[str]:
+            responses: dict[int, dict] = {}
+            async for index, response in run():
+                responses[index] = response
+                yield _sse({"index": index, **response})
+            yield _sse(report(responses), event="done")
+
+        return StreamingResponse(
+            relay_sse(events(), request=http_request),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+
+    responses = {index: response async for index, response in run()}
+    return JSONResponse(content=report(responses))
+
+
+async def run_generate_batch_job(ctx: JobContext) -> dict[str, Any]:
+    """백그라운드 배치 생성: 끝나지 않은 키워드만 처리하고 전체 보고서 반환"""
+    params = ctx.params
+    pending = await ctx.pending_items()
+
+    async def worker(position: int, keyword: str) -> dict:
+        await ctx.start_item(pending[position].index)
+        return await _generate_batch_item(
+            keyword, params["ref"], params["generate_images"], params["image_count"]
+        )
+
+    keywords = [item.key for item in pending]
+    async for result in run_batch(keywords, worker, concurrency=params.get("concurrency")):
+        response = _batch_item_response(result)
+        index = pending[result.index].index
+        if result.ok:
+            await ctx.finish_item(index, response)
+        else:
+            await ctx.fail_item(index, result.error or "실패", response)
+
+    results = [
+        item.result or {"keyword": item.key, "success": False, "message": item.error}
+        for item in await ctx.get_items()
+    ]
+    return _batch_report(results, len(results), ctx.elapsed)
+
+
+register_job_handler("generate_batch", run_generate_batch_job)
@@ -5,7 +5,7 @@ from datetime import datetime
 from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from schema.generate import GenerateRequest
 from llm.blog_filler_service import blog_filler_gen, MODEL_NAME
@@ -36,7 +36,7 @@ async def generator_blog_filler(request: GenerateRequest):
     log.kv("참조원고", "있음" if ref else "없음")
     log.kv("분류시간", f"{c_elapsed:.2f}s")
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     try:
@@ -58,11 +58,11 @@ async def generator_blog_filler(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
 
                 if ref:
                     ref_document = {"content": ref, "keyword": parsed["keyword"]}
-                    db_service.insert_document("ref", ref_document)
+                    await db_service.insert_document("ref", ref_document)
 
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
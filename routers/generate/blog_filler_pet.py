@@ -5,7 +5,7 @@ from datetime import datetime
 from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from schema.generate import GenerateRequest
 from llm.blog_filler_pet_service import blog_filler_pet_gen, MODEL_NAME
 from utils.query_parser import parse_query
@@ -54,7 +54,7 @@ async def generator_blog_filler_pet(request: GenerateRequest):
     log.kv("모델", model_name)
     log.kv("참조원고", "있음" if ref else "없음")
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=DB_NAME)
 
     try:
@@ -79,11 +79,11 @@ async def generator_blog_filler_pet(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
 
                 if ref:
                     ref_document = {"content": ref, "keyword": parsed["keyword"]}
-                    db_service.insert_document("ref", ref_document)
+                    await db_service.insert_document("ref", ref_document)
 
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
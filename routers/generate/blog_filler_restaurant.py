@@ -5,7 +5,7 @@ from datetime import datetime
 from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from schema.generate import GenerateRequest
 from llm.blog_filler_restaurant_service import blog_filler_restaurant_gen, MODEL_NAME
 from utils.progress_logger import progress
@@ -31,7 +31,7 @@ async def generator_blog_filler_restaurant(request: GenerateRequest):
     log.kv("카테고리", DB_NAME)
     log.kv("모델", MODEL_NAME)
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=DB_NAME)
 
     try:
@@ -51,7 +51,7 @@ async def generator_blog_filler_restaurant(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
                 char_count = len(generated_manuscript.replace(" ", ""))
@@ -3,7 +3,7 @@ from datetime import datetime
 from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from schema.generate import GenerateRequest
 from llm.chatgpt4o_service import chatgpt4o_gen, MODEL_NAME
@@ -36,7 +36,7 @@ async def generate_chatgpt4o(request: GenerateRequest):
     log.kv("참조원고", "있음" if ref else "없음")
     log.kv("분류시간", f"{c_elapsed:.2f}s")
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     is_ref = len(ref) != 0
@@ -61,11 +61,11 @@ async def generate_chatgpt4o(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
 
                 if is_ref:
                     ref_document = {"content": ref, "keyword": parsed["keyword"]}
-                    db_service.insert_document("ref", ref_document)
+                    await db_service.insert_document("ref", ref_document)
 
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
@@ -3,7 +3,7 @@ from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from llm.claude_service import claude_gen, MODEL_NAME
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from utils.progress_logger import progress
 from utils.logger import log
@@ -31,7 +31,7 @@ async def generate_manuscript_claude_api(request: GenerateRequest):
 
     category = await get_category_db_name(keyword=keyword)
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     is_ref = bool(ref and ref.strip())
@@ -58,7 +58,7 @@ async def generate_manuscript_claude_api(request: GenerateRequest):
                 "keyword": keyword,
             }
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
                 document["_id"] = str(document["_id"])
                 return document
             except Exception:
@@ -3,7 +3,7 @@ from datetime import datetime
 from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from schema.generate import GenerateRequest
 from llm.gemini_3_flash_service import gemini_3_flash_gen, MODEL_NAME
@@ -38,7 +38,7 @@ async def generator_gemini_3_flash(request: GenerateRequest):
     print(f"⏱️  분류시간  : {c_elapsed:.2f}s")
     print("=" * 60 + "\n")
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     is_ref = len(ref) != 0
@@ -64,11 +64,11 @@ async def generator_gemini_3_flash(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
 
                 if is_ref:
                     ref_document = {"content": ref, "keyword": parsed["keyword"]}
-                    db_service.insert_document("ref", ref_document)
+                    await db_service.insert_document("ref", ref_document)
 
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
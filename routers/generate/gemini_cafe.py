@@ -5,7 +5,7 @@ from datetime import datetime
 from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from schema.generate import GenerateRequest
 from llm.gemini_cafe_service import gemini_cafe_gen, MODEL_NAME
@@ -27,7 +27,7 @@ async def generator_gemini_cafe(request: GenerateRequest):
 
     log.info("Gemini Cafe 생성", keyword=keyword[:20], category=category)
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     try:
@@ -50,7 +50,7 @@ async def generator_gemini_cafe(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
                 char_count = len(generated_text.replace(" ", ""))
@@ -8,7 +8,7 @@ from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from llm.gemini_cafe_daily_service import gemini_cafe_daily_gen, MODEL_NAME
 from _prompts.viral import PERSONAS
@@ -43,7 +43,7 @@ async def generator_gemini_cafe_daily(request: CafeDailyRequest):
     log.kv("페르소나", request.persona_id or "랜덤")
     log.kv("모델", MODEL_NAME)
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     try:
@@ -74,7 +74,7 @@ async def generator_gemini_cafe_daily(request: CafeDailyRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
                 char_count = len(generated_text.replace(" ", ""))
@@ -2,12 +2,11 @@
 import time
 from datetime import datetime
 from fastapi import HTTPException, APIRouter
-from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
-from utils.get_category_db_name import get_category_db_name
+from async_mongodb_service import AsyncMongoDBService
+from utils.category_pipeline import generate_with_category
 from schema.generate import GenerateRequest
-from llm.gemini_new_service import gemini_new_gen, MODEL_NAME
+from llm.gemini_new_service import gemini_new_generator, MODEL_NAME
 from utils.query_parser import parse_query
 from utils.progress_logger import progress
 from utils.logger import log
@@ -24,25 +23,23 @@ async def generator_gemini_new(request: GenerateRequest):
     keyword = request.keyword.strip()
     ref = request.ref
 
-    category = await get_category_db_name(keyword=keyword + ref)
-    c_elapsed = time.time() - start_ts
-
     log.header("Gemini New 원고 생성", "🚀")
     log.kv("서비스", service.upper())
     log.kv("키워드", keyword)
-    log.kv("카테고리", category)
     log.kv("모델", MODEL_NAME)
     log.kv("참조원고", "있음" if ref else "없음")
-    log.kv("분류시간", f"{c_elapsed:.2f}s")
 
-    db_service = MongoDBService()
-    db_service.set_db_name(db_name=category)
+    db_service = AsyncMongoDBService()
 
     try:
+        # 분류 LLM을 기다리는 동안 카테고리와 무관한 프롬프트 준비를 먼저 끝내고,
+        # 카테고리가 유저 프롬프트에 들어가므로 생성은 분류 결과가 나온 뒤 시작
         with progress(label=f"{service}:{MODEL_NAME}:{keyword}"):
-            generated_manuscript = await run_in_threadpool(
-                gemini_new_gen, user_instructions=keyword, ref=ref, category=category
+            generated_manuscript, category = await generate_with_category(
+                keyword + ref, gemini_new_generator(keyword, ref)
             )
+        log.kv("카테고리", category)
+        db_service.set_db_name(db_name=category)
 
         if generated_manuscript:
             parsed = parse_query(keyword)
@@ -57,11 +54,11 @@ async def generator_gemini_new(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
 
                 if ref:
                     ref_document = {"content": ref, "keyword": parsed["keyword"]}
-                    db_service.insert_document("ref", ref_document)
+                    await db_service.insert_document("ref", ref_document)
 
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
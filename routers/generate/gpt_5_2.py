@@ -1,6 +1,6 @@
 from fastapi import HTTPException, APIRouter
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from schema.generate import GenerateRequest
 from llm.gpt_5_2_service import gpt_5_2_gen, model_name
@@ -21,7 +21,7 @@ async def generator_gpt_5_2(request: GenerateRequest):
 
     category = await get_category_db_name(keyword=keyword)
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     is_ref = len(ref) != 0
@@ -46,7 +46,7 @@ async def generator_gpt_5_2(request: GenerateRequest):
                 "keyword": keyword,
             }
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
                 document["_id"] = str(document["_id"])
 
                 return document
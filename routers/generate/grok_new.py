@@ -4,7 +4,7 @@ from datetime import datetime
 from fastapi import HTTPException, APIRouter
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from utils.get_category_db_name import get_category_db_name
 from schema.generate import GenerateRequest
 from llm.grok_new_service import grok_new_gen, MODEL_NAME
@@ -34,7 +34,7 @@ async def generator_grok_new(request: GenerateRequest):
     print(f"참조원고: {'있음' if ref else '없음'}")
     print("=" * 60 + "\n")
 
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     try:
@@ -54,7 +54,7 @@ async def generator_grok_new(request: GenerateRequest):
             }
 
             try:
-                db_service.insert_document("manuscripts", document)
+                await db_service.insert_document("manuscripts", document)
                 document["_id"] = str(document["_id"])
                 elapsed = time.time() - start_ts
 
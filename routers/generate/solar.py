@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.concurrency import run_in_threadpool
 
 from config import UPSTAGE_API_KEY, solar_client
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from schema.generate import GenerateRequest
 from utils.get_category_db_name import get_category_db_name
 from utils.query_parser import parse_query
@@ -76,7 +76,7 @@ async def generate_solar(request: GenerateRequest):
     ref = request.ref
 
     category = await get_category_db_name(keyword=keyword)
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
     db_service.set_db_name(db_name=category)
 
     # 디버그 출력: 어떤 서비스/모델/키워드/참조 여부로 실행하는지 표시
@@ -104,7 +104,7 @@ async def generate_solar(request: GenerateRequest):
         }
 
         try:
-            db_service.insert_document("manuscripts", document)
+            await db_service.insert_document("manuscripts", document)
             document["_id"] = str(document.get("_id", ""))
         except Exception as e:
             # 저장 실패는 경고만 남기고 본문은 반환
@@ -1,11 +1,12 @@
 """
 스트리밍 생성 엔드포인트 - SSE(Server-Sent Events) 방식
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from utils.ai_client_factory import call_ai_stream
+from utils.ai_client_factory import acall_ai_stream, get_ai_service_type, validate_api_key
+from utils.sse import SSE_HEADERS, relay_sse
 
 router = APIRouter()
 
@@ -18,7 +19,7 @@ class StreamRequest(BaseModel):
 
 
 @router.post("/generate/stream")
-async def generate_stream(request: StreamRequest):
+async def generate_stream(request: StreamRequest, http_request: Request):
     """
     스트리밍 AI 응답 엔드포인트
 
@@ -30,26 +31,31 @@ async def generate_stream(request: StreamRequest):
     - Gemini: gemini-2.0-flash 등 (네이티브 스트리밍)
     - DeepSeek: deepseek-v4-pro, deepseek-v4-flash (네이티브 스트리밍)
     - Solar: solar-pro (네이티브 스트리밍)
-    - Grok: grok-4 등 (시뮬레이션)
-    - GPT-5: gpt-5 등 (시뮬레이션)
+    - Grok: grok-4 등 (네이티브 스트리밍)
+    - GPT-5: gpt-5 등 (네이티브 스트리밍)
+
+    async 프로바이더 SDK로 중계하므로 스트림마다 스레드를 점유하지 않음.
+    청크가 없는 동안 하트비트 주석을 보내고, 클라이언트가 끊기면 업스트림 요청을 취소.
 
     Returns:
         StreamingResponse: text/event-stream 형식
     """
     try:
+        # 제너레이터는 첫 청크에서야 실행되므로 설정 오류는 여기서 미리 400 처리
+        validate_api_key(get_ai_service_type(request.model))
+
         return StreamingResponse(
-            call_ai_stream(
-                model_name=request.model,
-                system_prompt=request.system_prompt,
-                user_prompt=request.user_prompt,
-                max_tokens=request.max_tokens,
+            relay_sse(
+                acall_ai_stream(
+                    model_name=request.model,
+                    system_prompt=request.system_prompt,
+                    user_prompt=request.user_prompt,
+                    max_tokens=request.max_tokens,
+                ),
+                request=http_request,
             ),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
-            },
+            headers=SSE_HEADERS,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
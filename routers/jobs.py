@@ -0,0 +1,94 @@
+"""백그라운드 작업 API - 진행 상황 조회(폴링/SSE), 취소, 재개"""
+
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from schema.jobs import JobAccepted, JobResumeRequest
+from services.job_queue import get_job_queue
+from utils.sse import SSE_HEADERS, relay_sse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def job_accepted(job_id: str, items: Optional[int] = None) -> JSONResponse:
+    """작업 등록 응답 (202 + 상태 조회 경로)"""
+    body = JobAccepted(
+        job_id=job_id,
+        status_url=f"/jobs/{job_id}",
+        events_url=f"/jobs/{job_id}/events",
+        items=items,
+    )
+    return JSONResponse(status_code=202, content=body.model_dump())
+
+
+async def _get_or_404(job_id: str, include_items: bool = True) -> dict:
+    job = await run_in_threadpool(get_job_queue().view, job_id, include_items)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("")
+async def list_jobs(status: Optional[str] = None, kind: Optional[str] = None, limit: int = 50):
+    """작업 목록 (최근 등록 순)"""
+    jobs = await run_in_threadpool(get_job_queue().list, status, kind, min(limit, 200))
+    return {"jobs": jobs}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, include_items: bool = True):
+    """작업 상태 + 항목별 진행 상황"""
+    return await _get_or_404(job_id, include_items)
+
+
+@router.get("/{job_id}/events")
+async def job_events(job_id: str, request: Request):
+    """
+    작업 진행 SSE
+
+    상태가 바뀔 때마다 "data: 작업 스냅샷"을 보내고, 끝나거나(completed/failed/cancelled)
+    paused 가 되면 최종 상태를 "event: done"으로 보낸 뒤 종료
+    """
+    await _get_or_404(job_id, include_items=False)
+
+    async def events() -> AsyncIterator[str]:
+        async for snapshot in get_job_queue().watch(job_id):
+            yield f"data: {json.dumps(snapshot, ensure_ascii=False)}\n\n"
+        final = await run_in_threadpool(get_job_queue().view, job_id)
+        yield f"event: done\ndata: {json.dumps(final, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        relay_sse(events(), request=request),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """작업 취소 (대기 중이면 바로, 실행 중이면 진행 중인 항목까지 중단)"""
+    job = await get_job_queue().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.post("/{job_id}/resume")
+async def resume_job(job_id: str, request: JobResumeRequest):
+    """paused/failed/cancelled 작업을 끝나지 않은 항목부터 다시 실행"""
+    secrets = {
+        account["id"]: account["password"]
+        for account in request.accounts
+        if account.get("id") and account.get("password")
+    }
+    try:
+        job = await get_job_queue().resume(job_id, secrets)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
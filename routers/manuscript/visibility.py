@@ -2,7 +2,8 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from bson import ObjectId
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
+from services.manuscript_events import ManuscriptEvent, aemit
 
 
 router = APIRouter()
@@ -31,7 +32,7 @@ async def toggle_manuscript_visibility(request: ToggleVisibilityRequest):
     isVisible 값을 토글합니다. (true ↔ false)
     필드가 없으면 false로 간주하고 true로 변경합니다.
     """
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
 
     try:
         db_service.set_db_name(db_name=request.category)
@@ -41,7 +42,7 @@ async def toggle_manuscript_visibility(request: ToggleVisibilityRequest):
         except Exception:
             raise HTTPException(status_code=400, detail="유효하지 않은 manuscript_id 형식입니다.")
 
-        docs = db_service.find_documents("manuscripts", {"_id": obj_id})
+        docs = await db_service.find_documents("manuscripts", {"_id": obj_id})
 
         if not docs:
             raise HTTPException(status_code=404, detail="해당 원고를 찾을 수 없습니다.")
@@ -50,7 +51,7 @@ async def toggle_manuscript_visibility(request: ToggleVisibilityRequest):
         current_visible = doc.get("isVisible", False)
         new_visible = not current_visible
 
-        updated_count = db_service.update_document(
+        updated_count = await db_service.update_document(
             "manuscripts",
             {"_id": obj_id},
             {"isVisible": new_visible},
@@ -59,6 +60,8 @@ async def toggle_manuscript_visibility(request: ToggleVisibilityRequest):
         if updated_count == 0:
             raise HTTPException(status_code=500, detail="원고 업데이트에 실패했습니다.")
 
+        await aemit(ManuscriptEvent("visibility", request.category, request.manuscript_id))
+
         return ToggleVisibilityResponse(
             success=True,
             manuscript_id=request.manuscript_id,
@@ -80,7 +83,7 @@ async def get_manuscript_visibility(category: str, manuscript_id: str):
     """
     원고 노출 여부 조회 API
     """
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
 
     try:
         db_service.set_db_name(db_name=category)
@@ -90,7 +93,7 @@ async def get_manuscript_visibility(category: str, manuscript_id: str):
         except Exception:
             raise HTTPException(status_code=400, detail="유효하지 않은 manuscript_id 형식입니다.")
 
-        docs = db_service.find_documents("manuscripts", {"_id": obj_id})
+        docs = await db_service.find_documents("manuscripts", {"_id": obj_id})
 
         if not docs:
             raise HTTPException(status_code=404, detail="해당 원고를 찾을 수 없습니다.")
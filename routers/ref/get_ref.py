@@ -2,11 +2,10 @@ from bson import ObjectId
 from fastapi import APIRouter, HTTPException
 from fastapi.encoders import jsonable_encoder
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 
 
 router = APIRouter()
-db_service = MongoDBService()
 
 
 @router.get(
@@ -22,7 +21,7 @@ db_service = MongoDBService()
 async def get_ref_documents():
 
     try:
-        documents = db_service.find_documents("ref", {})
+        documents = await AsyncMongoDBService().find_documents("ref", {})
         if not documents:
             raise HTTPException(status_code=404, detail="참조문서를 찾을 수 없습니다.")
         safe_docs = jsonable_encoder(
@@ -37,7 +36,7 @@ async def get_ref_documents():
 @router.get("/ref/{keyword}", summary="키워드별 참조문서 조회")
 async def get_ref_documents_by_keyword(keyword: str):
     try:
-        documents = db_service.find_documents("ref", {"keyword": keyword})
+        documents = await AsyncMongoDBService().find_documents("ref", {"keyword": keyword})
         if not documents:
             raise HTTPException(
                 status_code=404, detail="해당 키워드의 참조문서를 찾을 수 없습니다."
@@ -1,12 +1,15 @@
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException
 from fastapi.concurrency import run_in_threadpool
 
-from mongodb_service import MongoDBService
+from mongodb_service import get_mongo_client
 from schema.search import SearchRequest
-from config import MONGO_URI
-from pymongo import MongoClient
+from services.manuscript_store import reads_unified, unified_collection
+from services.search_index import can_use_search_index, search_manuscripts
+from services.search_results import build_projection, parse_fields, shape_document
 from _constants.categories import CATEGORIES
+from utils.category_fanout import CATEGORY_FANOUT_TIMEOUT_MS, fan_out_categories
 from utils.logger import log
 
 router = APIRouter()
@@ -15,71 +18,117 @@ router = APIRouter()
 COLLECTION_LIST = CATEGORIES
 
 
-def search_all(keyword: str, limit: int = 20) -> List[Dict[str, Any]]:
+def _keyword_query(keyword: str) -> Dict[str, Any]:
+    # 정규식 검색 (검색어는 리터럴로 이스케이프)
+    pattern = re.escape(keyword)
+    return {
+        "$or": [
+            {"content": {"$regex": pattern, "$options": "i"}},
+            {"keyword": {"$regex": pattern, "$options": "i"}},
+        ],
+        "deleted": {"$ne": True}
+    }
+
+
+def _search_unified(
+    keyword: str,
+    limit: int,
+    projection: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """통합 원고 컬렉션에서 키워드 검색 + 점수순 정렬 (쿼리 한 번)"""
+    pipeline = [
+        {"$match": {**_keyword_query(keyword), "category": {"$in": COLLECTION_LIST}}},
+        {"$project": {**projection, "category": 1}},
+        {"$sort": {"__score": -1, "createdAt": -1}},
+        {"$limit": limit},
+    ]
+    docs = []
+    for doc in unified_collection().aggregate(pipeline, maxTimeMS=CATEGORY_FANOUT_TIMEOUT_MS):
+        doc["_id"] = str(doc["_id"])
+        doc["__category"] = doc["category"]
+        docs.append(shape_document(doc, keyword))
+    return docs
+
+
+def _search_category(
+    category: str,
+    keyword: str,
+    limit: int,
+    projection: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """단일 카테고리 DB에서 키워드 검색 + 점수 계산 (검색 색인 미사용 시 폴백)"""
+    collection = get_mongo_client()[category]["manuscripts"]
+    query = _keyword_query(keyword)
+
+    # 검색 실행 (최신순 정렬, 요약 필드 + 스니펫 + 점수만 조회)
+    cursor = (
+        collection.find(query, projection)
+        .sort("createdAt", -1)
+        .limit(limit)
+        .max_time_ms(CATEGORY_FANOUT_TIMEOUT_MS)
+    )
+
+    docs = []
+    for doc in cursor:
+        # _id를 문자열로 변환
+        if "_id" in doc:
+            doc["_id"] = str(doc["_id"])
+
+        # 어느 카테고리에서 나왔는지 표시
+        doc["__category"] = category
+
+        docs.append(shape_document(doc, keyword))
+    return docs
+
+
+def search_all(
+    keyword: str,
+    limit: int = 20,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
-    모든 카테고리 DB에서 키워드 검색
+    모든 카테고리에서 키워드 검색
+    (검색 색인이 준비됐으면 색인 조회, 아니면 통합 원고 컬렉션 또는 카테고리 DB 병렬 정규식 조회)
 
     Args:
         keyword: 검색할 키워드
         limit: 반환할 결과 수
+        fields: 요약 외에 추가로 받을 필드 (예: ["content"])
 
     Returns:
-        검색 결과 리스트 (score 내림차순 정렬)
+        {
+            "results": 검색 결과 리스트 (score 내림차순 정렬),
+            "partial": 일부 카테고리 실패/시간초과 여부,
+            "failedCategories": 실패한 카테고리 목록
+        }
     """
-    client = MongoClient(MONGO_URI)
-    results = []
-
     try:
-        for category in COLLECTION_LIST:
-            try:
-                db = client[category]
-                collection = db["manuscripts"]
-
-                # 정규식 검색 (text index 없이도 동작)
-                query = {
-                    "$or": [
-                        {"content": {"$regex": keyword, "$options": "i"}},
-                        {"keyword": {"$regex": keyword, "$options": "i"}},
-                    ],
-                    "deleted": {"$ne": True}
-                }
-
-                # 검색 실행 (최신순 정렬)
-                cursor = collection.find(query).sort("createdAt", -1).limit(limit)
-
-                for doc in cursor:
-                    # _id를 문자열로 변환
-                    if "_id" in doc:
-                        doc["_id"] = str(doc["_id"])
+        if can_use_search_index(keyword):
+            found = search_manuscripts(keyword, limit=limit, sort="score", fields=fields)
+            return {"results": found["documents"], "partial": False, "failedCategories": []}
 
-                    # 어느 카테고리에서 나왔는지 표시
-                    doc["__category"] = category
+        projection = build_projection(keyword, fields)
 
-                    # 간단한 점수 계산 (keyword 일치도)
-                    score = 0
-                    if "keyword" in doc and keyword.lower() in doc["keyword"].lower():
-                        score += 10
-                    if "content" in doc and keyword.lower() in doc["content"].lower():
-                        score += doc["content"].lower().count(keyword.lower())
-                    doc["__score"] = score
+        if reads_unified():
+            results = _search_unified(keyword, limit, projection)
+            return {"results": results, "partial": False, "failedCategories": []}
 
-                    results.append(doc)
+        # 해당 카테고리 DB가 없거나 오류가 나도 나머지는 계속 진행
+        outcome = fan_out_categories(
+            lambda category: _search_category(category, keyword, limit, projection),
+            COLLECTION_LIST,
+        )
 
-            except Exception as e:
-                # 해당 카테고리 DB가 없거나 오류가 나도 계속 진행
-                log.warning(f"카테고리 검색 오류", category=category)
-                continue
+        results = [doc for docs in outcome.results.values() for doc in docs]
 
         # 점수로 정렬하고 상위 결과만 반환
         results.sort(key=lambda d: d.get("__score", 0), reverse=True)
-        return results[:limit]
+        return {"results": results[:limit], **outcome.report()}
 
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"통합 검색 중 오류 발생: {str(e)}"
         )
-    finally:
-        client.close()
 
 
 MAX_QUERY_LENGTH = 100
@@ -92,6 +141,7 @@ async def search_all_endpoint(body: SearchRequest):
 
     - **q**: 검색 키워드 (필수)
     - **limit**: 결과 수 제한 (기본값: 20, 최대: 100)
+    - **fields**: 요약 외에 추가로 받을 필드 (선택, 예: ["content"])
 
     Returns:
         {
@@ -99,11 +149,15 @@ async def search_all_endpoint(body: SearchRequest):
             "count": 결과 수,
             "results": [
                 {
-                    ...원고 데이터...,
+                    ...원고 요약 (keyword, engine, createdAt 등)...,
                     "__category": "카테고리명",
-                    "__score": 검색 점수
+                    "__score": 검색 점수,
+                    "__snippet": "…검색어 주변 본문…",
+                    "__highlights": [[시작, 끝], ...]
                 }
-            ]
+            ],
+            "partial": 일부 카테고리 조회 실패 여부,
+            "failedCategories": 실패/시간초과 카테고리
         }
     """
     query = body.q.strip()
@@ -117,11 +171,19 @@ async def search_all_endpoint(body: SearchRequest):
             detail=f"검색어가 너무 깁니다. (최대 {MAX_QUERY_LENGTH}자)"
         )
 
-    docs = await run_in_threadpool(search_all, query, body.limit)
+    try:
+        fields = parse_fields(body.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = await run_in_threadpool(search_all, query, body.limit, fields)
+    docs = result["results"]
     log.success("통합 검색", query=query[:20], count=len(docs))
 
     return {
         "query": query,
         "count": len(docs),
         "results": docs,
+        "partial": result["partial"],
+        "failedCategories": result["failedCategories"],
     }
@@ -1,11 +1,8 @@
 """검색 자동완성 API"""
 from typing import List, Dict, Any
 from fastapi import APIRouter, Query
-from fastapi.concurrency import run_in_threadpool
-from pymongo import MongoClient
 
-from config import MONGO_URI
-from _constants.categories import CATEGORIES
+from services.autocomplete_index import suggest_keywords
 
 router = APIRouter()
 
@@ -15,7 +12,7 @@ MAX_QUERY_LENGTH = 50
 
 def get_autocomplete_suggestions(query: str, limit: int = 5) -> List[Dict[str, Any]]:
     """
-    모든 카테고리 DB에서 키워드 자동완성 추천
+    키워드 자동완성 추천 (인메모리 색인, 초성 검색 지원)
 
     Args:
         query: 검색어 (2자 이상)
@@ -27,47 +24,7 @@ def get_autocomplete_suggestions(query: str, limit: int = 5) -> List[Dict[str, A
     if len(query) < 2 or len(query) > MAX_QUERY_LENGTH:
         return []
 
-    client = MongoClient(MONGO_URI)
-    keyword_counts: Dict[str, int] = {}
-
-    try:
-        for category in CATEGORIES:
-            try:
-                db = client[category]
-                collection = db["manuscripts"]
-
-                pipeline = [
-                    {
-                        "$match": {
-                            "keyword": {"$regex": query, "$options": "i"}
-                        }
-                    },
-                    {
-                        "$group": {
-                            "_id": "$keyword",
-                            "count": {"$sum": 1}
-                        }
-                    }
-                ]
-
-                for doc in collection.aggregate(pipeline):
-                    kw = doc["_id"]
-                    if kw:
-                        keyword_counts[kw] = keyword_counts.get(kw, 0) + doc["count"]
-
-            except Exception:
-                continue
-
-        sorted_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
-
-        return [{"keyword": kw, "count": cnt} for kw, cnt in sorted_keywords]
-
-    finally:
-        client.close()
+    return suggest_keywords(query, limit)
 
 
 @router.get("/search/autocomplete")
@@ -80,10 +37,12 @@ async def autocomplete(
 
     - **q**: 검색어 (2자 이상 필수)
     - **limit**: 결과 수 (기본값: 5, 최대: 10)
+    - 초성 검색 지원 (예: "ㅇㄱㅂ" → "위고비")
 
     Returns:
         {"suggestions": [{"keyword": "위고비 효능", "count": 152}, ...]}
     """
-    suggestions = await run_in_threadpool(get_autocomplete_suggestions, q, limit)
+    # 메모리 조회만 하므로 스레드풀 없이 바로 응답
+    suggestions = get_autocomplete_suggestions(q, limit)
 
     return {"suggestions": suggestions}
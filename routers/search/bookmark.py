@@ -3,10 +3,10 @@ from typing import List, Dict, Any
 from datetime import datetime
 from fastapi import APIRouter, Query, Body, HTTPException
 from fastapi.concurrency import run_in_threadpool
-from pymongo import MongoClient, DESCENDING
+from pymongo import DESCENDING
 from bson import ObjectId
 
-from config import MONGO_URI
+from mongodb_service import get_mongo_client
 
 router = APIRouter()
 
@@ -26,33 +26,29 @@ def get_bookmarks(user_id: str, limit: int = 20, offset: int = 0) -> Dict[str, A
     Returns:
         {"bookmarks": [...], "total": n}
     """
-    client = MongoClient(MONGO_URI)
-
-    try:
-        db = client[BOOKMARK_DB]
-        collection = db[BOOKMARK_COLLECTION]
-
-        total = collection.count_documents({"userId": user_id})
-
-        cursor = collection.find(
-            {"userId": user_id}
-        ).sort("createdAt", DESCENDING).skip(offset).limit(limit)
-
-        bookmarks = []
-        for doc in cursor:
-            bookmarks.append({
-                "_id": str(doc["_id"]),
-                "manuscriptId": doc.get("manuscriptId", ""),
-                "category": doc.get("category", ""),
-                "keyword": doc.get("keyword", ""),
-                "preview": doc.get("preview", ""),
-                "createdAt": doc.get("createdAt"),
-            })
-
-        return {"bookmarks": bookmarks, "total": total}
+    client = get_mongo_client()
+
+    db = client[BOOKMARK_DB]
+    collection = db[BOOKMARK_COLLECTION]
+
+    total = collection.count_documents({"userId": user_id})
+
+    cursor = collection.find(
+        {"userId": user_id}
+    ).sort("createdAt", DESCENDING).skip(offset).limit(limit)
+
+    bookmarks = []
+    for doc in cursor:
+        bookmarks.append({
+            "_id": str(doc["_id"]),
+            "manuscriptId": doc.get("manuscriptId", ""),
+            "category": doc.get("category", ""),
+            "keyword": doc.get("keyword", ""),
+            "preview": doc.get("preview", ""),
+            "createdAt": doc.get("createdAt"),
+        })
 
-    finally:
-        client.close()
+    return {"bookmarks": bookmarks, "total": total}
 
 
 def add_bookmark(
@@ -75,33 +71,29 @@ def add_bookmark(
     Returns:
         {"ok": True, "bookmarkId": "..."}
     """
-    client = MongoClient(MONGO_URI)
-
-    try:
-        db = client[BOOKMARK_DB]
-        collection = db[BOOKMARK_COLLECTION]
+    client = get_mongo_client()
 
-        existing = collection.find_one({
-            "userId": user_id,
-            "manuscriptId": manuscript_id
-        })
+    db = client[BOOKMARK_DB]
+    collection = db[BOOKMARK_COLLECTION]
 
-        if existing:
-            return {"ok": True, "bookmarkId": str(existing["_id"]), "message": "이미 즐겨찾기에 추가됨"}
+    existing = collection.find_one({
+        "userId": user_id,
+        "manuscriptId": manuscript_id
+    })
 
-        result = collection.insert_one({
-            "userId": user_id,
-            "manuscriptId": manuscript_id,
-            "category": category,
-            "keyword": keyword,
-            "preview": preview[:200] if preview else "",
-            "createdAt": datetime.now(),
-        })
+    if existing:
+        return {"ok": True, "bookmarkId": str(existing["_id"]), "message": "이미 즐겨찾기에 추가됨"}
 
-        return {"ok": True, "bookmarkId": str(result.inserted_id)}
+    result = collection.insert_one({
+        "userId": user_id,
+        "manuscriptId": manuscript_id,
+        "category": category,
+        "keyword": keyword,
+        "preview": preview[:200] if preview else "",
+        "createdAt": datetime.now(),
+    })
 
-    finally:
-        client.close()
+    return {"ok": True, "bookmarkId": str(result.inserted_id)}
 
 
 def remove_bookmark(user_id: str, bookmark_id: str = None, manuscript_id: str = None) -> Dict[str, Any]:
@@ -116,31 +108,27 @@ def remove_bookmark(user_id: str, bookmark_id: str = None, manuscript_id: str =
     Returns:
         {"ok": True}
     """
-    client = MongoClient(MONGO_URI)
-
-    try:
-        db = client[BOOKMARK_DB]
-        collection = db[BOOKMARK_COLLECTION]
+    client = get_mongo_client()
 
-        if bookmark_id:
-            try:
-                object_id = ObjectId(bookmark_id)
-            except Exception:
-                raise ValueError(f"잘못된 북마크 ID: {bookmark_id}")
+    db = client[BOOKMARK_DB]
+    collection = db[BOOKMARK_COLLECTION]
 
-            result = collection.delete_one({"_id": object_id, "userId": user_id})
-        elif manuscript_id:
-            result = collection.delete_one({"manuscriptId": manuscript_id, "userId": user_id})
-        else:
-            raise ValueError("bookmark_id 또는 manuscript_id가 필요합니다")
+    if bookmark_id:
+        try:
+            object_id = ObjectId(bookmark_id)
+        except Exception:
+            raise ValueError(f"잘못된 북마크 ID: {bookmark_id}")
 
-        if result.deleted_count == 0:
-            raise ValueError("즐겨찾기를 찾을 수 없습니다")
+        result = collection.delete_one({"_id": object_id, "userId": user_id})
+    elif manuscript_id:
+        result = collection.delete_one({"manuscriptId": manuscript_id, "userId": user_id})
+    else:
+        raise ValueError("bookmark_id 또는 manuscript_id가 필요합니다")
 
-        return {"ok": True}
+    if result.deleted_count == 0:
+        raise ValueError("즐겨찾기를 찾을 수 없습니다")
 
-    finally:
-        client.close()
+    return {"ok": True}
 
 
 def check_bookmark(user_id: str, manuscript_id: str) -> Dict[str, Any]:
@@ -154,23 +142,19 @@ def check_bookmark(user_id: str, manuscript_id: str) -> Dict[str, Any]:
     Returns:
         {"bookmarked": True/False, "bookmarkId": "..."}
     """
-    client = MongoClient(MONGO_URI)
-
-    try:
-        db = client[BOOKMARK_DB]
-        collection = db[BOOKMARK_COLLECTION]
+    client = get_mongo_client()
 
-        doc = collection.find_one({
-            "userId": user_id,
-            "manuscriptId": manuscript_id
-        })
+    db = client[BOOKMARK_DB]
+    collection = db[BOOKMARK_COLLECTION]
 
-        if doc:
-            return {"bookmarked": True, "bookmarkId": str(doc["_id"])}
-        return {"bookmarked": False, "bookmarkId": None}
+    doc = collection.find_one({
+        "userId": user_id,
+        "manuscriptId": manuscript_id
+    })
 
-    finally:
-        client.close()
+    if doc:
+        return {"bookmarked": True, "bookmarkId": str(doc["_id"])}
+    return {"bookmarked": False, "bookmarkId": None}
 
 
 @router.get("/search/bookmarks")
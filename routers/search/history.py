@@ -3,9 +3,9 @@ from typing import List, Dict, Any
 from datetime import datetime
 from fastapi import APIRouter, Query, Body
 from fastapi.concurrency import run_in_threadpool
-from pymongo import MongoClient, DESCENDING
+from pymongo import DESCENDING
 
-from config import MONGO_URI
+from mongodb_service import get_mongo_client
 
 router = APIRouter()
 
@@ -24,28 +24,24 @@ def get_recent_searches(user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
     Returns:
         [{"keyword": "위고비", "searchedAt": "...", "category": "..."}, ...]
     """
-    client = MongoClient(MONGO_URI)
+    client = get_mongo_client()
 
-    try:
-        db = client[HISTORY_DB]
-        collection = db[HISTORY_COLLECTION]
+    db = client[HISTORY_DB]
+    collection = db[HISTORY_COLLECTION]
 
-        cursor = collection.find(
-            {"userId": user_id}
-        ).sort("searchedAt", DESCENDING).limit(limit)
+    cursor = collection.find(
+        {"userId": user_id}
+    ).sort("searchedAt", DESCENDING).limit(limit)
 
-        results = []
-        for doc in cursor:
-            results.append({
-                "keyword": doc.get("keyword", ""),
-                "category": doc.get("category", ""),
-                "searchedAt": doc.get("searchedAt"),
-            })
+    results = []
+    for doc in cursor:
+        results.append({
+            "keyword": doc.get("keyword", ""),
+            "category": doc.get("category", ""),
+            "searchedAt": doc.get("searchedAt"),
+        })
 
-        return results
-
-    finally:
-        client.close()
+    return results
 
 
 def save_search_history(user_id: str, keyword: str, category: str = "") -> Dict[str, Any]:
@@ -60,29 +56,25 @@ def save_search_history(user_id: str, keyword: str, category: str = "") -> Dict[
     Returns:
         {"ok": True}
     """
-    client = MongoClient(MONGO_URI)
-
-    try:
-        db = client[HISTORY_DB]
-        collection = db[HISTORY_COLLECTION]
+    client = get_mongo_client()
 
-        collection.update_one(
-            {"userId": user_id, "keyword": keyword},
-            {
-                "$set": {
-                    "userId": user_id,
-                    "keyword": keyword,
-                    "category": category,
-                    "searchedAt": datetime.now(),
-                }
-            },
-            upsert=True
-        )
+    db = client[HISTORY_DB]
+    collection = db[HISTORY_COLLECTION]
 
-        return {"ok": True}
+    collection.update_one(
+        {"userId": user_id, "keyword": keyword},
+        {
+            "$set": {
+                "userId": user_id,
+                "keyword": keyword,
+                "category": category,
+                "searchedAt": datetime.now(),
+            }
+        },
+        upsert=True
+    )
 
-    finally:
-        client.close()
+    return {"ok": True}
 
 
 def delete_search_history(user_id: str, keyword: str = None) -> Dict[str, Any]:
@@ -96,21 +88,17 @@ def delete_search_history(user_id: str, keyword: str = None) -> Dict[str, Any]:
     Returns:
         {"ok": True, "deletedCount": n}
     """
-    client = MongoClient(MONGO_URI)
-
-    try:
-        db = client[HISTORY_DB]
-        collection = db[HISTORY_COLLECTION]
+    client = get_mongo_client()
 
-        if keyword:
-            result = collection.delete_one({"userId": user_id, "keyword": keyword})
-        else:
-            result = collection.delete_many({"userId": user_id})
+    db = client[HISTORY_DB]
+    collection = db[HISTORY_COLLECTION]
 
-        return {"ok": True, "deletedCount": result.deleted_count}
+    if keyword:
+        result = collection.delete_one({"userId": user_id, "keyword": keyword})
+    else:
+        result = collection.delete_many({"userId": user_id})
 
-    finally:
-        client.close()
+    return {"ok": True, "deletedCount": result.deleted_count}
 
 
 @router.get("/search/history")
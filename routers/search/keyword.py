@@ -1,11 +1,13 @@
-from typing import List, Dict, Any, Optional
+import re
+from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException
 from fastapi.concurrency import run_in_threadpool
-from pymongo import MongoClient
 
-from mongodb_service import MongoDBService
 from schema.search import KeywordSearchRequest
-from config import MONGO_URI
+from services.manuscript_pagination import paginate_manuscripts
+from services.search_cache import cached_response, search_cache_key
+from services.search_index import can_use_search_index, search_manuscripts
+from services.search_results import build_projection, parse_fields, shape_document
 from _constants.categories import CATEGORIES
 from utils.logger import log
 
@@ -17,106 +19,80 @@ def search_manuscripts_by_keyword(
     category: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
-    키워드로 원고 검색
+    키워드로 원고 검색 (최신순)
 
     Args:
         query: 검색할 키워드
         category: 카테고리 필터 (None이면 전체 검색)
         skip: 건너뛸 문서 수
         limit: 반환할 문서 수
+        cursor: 다음 페이지 커서 (이전 응답의 nextCursor, 있으면 skip 대신 사용)
+        fields: 요약 외에 추가로 받을 필드 (예: ["content"])
 
     Returns:
         {
-            "documents": [...],
-            "total": 전체 결과 수,
-            "page": 현재 페이지,
-            "limit": 페이지당 결과 수
+            "documents": [원고 요약 + __snippet/__highlights, ...],
+            "total": 전체 결과 수 (색인 검색은 후보 수, 상한에서 끊기면 totalCapped=True),
+            "skip": 건너뛴 문서 수,
+            "limit": 페이지당 결과 수,
+            "nextCursor": 다음 페이지 커서 (마지막 페이지면 None)
         }
     """
-    search_query = {
-        "$or": [
-            {"content": {"$regex": query, "$options": "i"}},
-            {"keyword": {"$regex": query, "$options": "i"}},
-        ],
-        "deleted": {"$ne": True}
-    }
-
-    if category:
-        db_service = MongoDBService()
-        try:
-            db_service.set_db_name(db_name=category)
-
-            total = db_service.db["manuscripts"].count_documents(search_query)
-
-            documents = list(
-                db_service.db["manuscripts"]
-                .find(search_query)
-                .sort("createdAt", -1)
-                .skip(skip)
-                .limit(limit)
+    try:
+        if can_use_search_index(query):
+            found = search_manuscripts(
+                query,
+                category=category,
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
+                fields=fields,
             )
-
-            for doc in documents:
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-                doc["__category"] = category
-
             return {
-                "documents": documents,
-                "total": total,
+                "documents": found["documents"],
+                "total": found["total"],
+                "totalCapped": found["totalCapped"],
                 "skip": skip,
                 "limit": limit,
+                "nextCursor": found["nextCursor"],
             }
-        finally:
-            db_service.close_connection()
-    else:
-        client = MongoClient(MONGO_URI)
-        all_documents = []
-        total = 0
-
-        try:
-            for cat in CATEGORIES:
-                try:
-                    db = client[cat]
-                    collection = db["manuscripts"]
-
-                    cat_total = collection.count_documents(search_query)
-                    total += cat_total
-
-                    docs = list(
-                        collection.find(search_query)
-                        .sort("createdAt", -1)
-                        .limit(limit * 2)
-                    )
-
-                    for doc in docs:
-                        if "_id" in doc:
-                            doc["_id"] = str(doc["_id"])
-                        doc["__category"] = cat
-                        all_documents.append(doc)
-
-                except Exception:
-                    continue
-
-            from datetime import datetime
-            all_documents.sort(
-                key=lambda d: d.get("createdAt") or datetime.min,
-                reverse=True
-            )
 
-            paginated = all_documents[skip:skip + limit]
-
-            return {
-                "documents": paginated,
-                "total": total,
-                "skip": skip,
-                "limit": limit,
-            }
+        # 검색 색인 미준비/1글자 검색어 → 정규식 검색 (검색어는 리터럴로 이스케이프)
+        pattern = re.escape(query)
+        search_query = {
+            "$or": [
+                {"content": {"$regex": pattern, "$options": "i"}},
+                {"keyword": {"$regex": pattern, "$options": "i"}},
+            ],
+            "deleted": {"$ne": True}
+        }
 
-        finally:
-            client.close()
+        # 카테고리별 keyset 조회 + 최신순 병합
+        page = paginate_manuscripts(
+            search_query,
+            [category] if category else CATEGORIES,
+            limit=limit,
+            cursor=cursor,
+            skip=skip,
+            projection=build_projection(query, fields),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = {
+        "documents": [shape_document(doc, query) for doc in page.documents],
+        "total": page.total,
+        "skip": skip,
+        "limit": limit,
+        "nextCursor": page.next_cursor,
+    }
+    if not category:
+        result.update(page.report)
+    return result
 
 
 MAX_QUERY_LENGTH = 100
@@ -131,6 +107,8 @@ async def search_keyword(request: KeywordSearchRequest):
     - category: 카테고리 필터 (선택)
     - page: 페이지 번호 (기본값: 1)
     - limit: 페이지당 결과 수 (기본값: 20, 최대: 100)
+    - cursor: 다음 페이지 커서 (이전 응답의 nextCursor, 있으면 page 대신 사용)
+    - fields: 요약 외에 추가로 받을 필드 (선택, 예: ["content"])
     """
     query = request.query.strip()
 
@@ -143,15 +121,34 @@ async def search_keyword(request: KeywordSearchRequest):
             detail=f"검색어가 너무 깁니다. (최대 {MAX_QUERY_LENGTH}자)"
         )
 
+    try:
+        fields = parse_fields(request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     skip = (request.page - 1) * request.limit
 
-    result = await run_in_threadpool(
-        search_manuscripts_by_keyword,
-        query=query,
-        category=request.category,
-        skip=skip,
-        limit=request.limit,
-    )
+    def search():
+        return run_in_threadpool(
+            search_manuscripts_by_keyword,
+            query=query,
+            category=request.category,
+            skip=skip,
+            limit=request.limit,
+            cursor=request.cursor,
+            fields=fields,
+        )
+
+    if request.category:
+        # 카테고리 지정 검색은 대시보드 반복 조회가 많아 캐시 (해당 카테고리 원고 변경 시 무효화)
+        result = await cached_response(
+            "keyword",
+            search_cache_key(query, request.category, skip, request.limit, request.cursor, fields),
+            search,
+            category=request.category,
+        )
+    else:
+        result = await search()
     log.success("원고 검색", query=query[:15], total=result['total'])
 
     return result
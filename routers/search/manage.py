@@ -5,10 +5,21 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Path, Query
 from fastapi.concurrency import run_in_threadpool
 
-from schema.search import ManuscriptUpdateRequest
+from schema.search import (
+    BulkManuscriptRequest,
+    BulkUpdateRequest,
+    BulkVisibilityRequest,
+    ManuscriptUpdateRequest,
+)
+from services.manuscript_bulk_service import (
+    bulk_delete_manuscripts,
+    bulk_set_visibility,
+    bulk_update_manuscripts,
+)
 from services.manuscript_manage_service import (
     delete_manuscript_by_id,
     get_visible_manuscripts,
+    restore_manuscript_by_id,
     toggle_visibility_by_id,
     update_manuscript_by_id,
 )
@@ -41,6 +52,30 @@ async def delete_manuscript(
     return result
 
 
+@router.post("/search/manuscript/{manuscript_id}/restore")
+async def restore_manuscript(
+    manuscript_id: str = Path(..., description="원고 ID"),
+    category: str = Query(..., description="카테고리 (DB명)")
+):
+    """
+    삭제된 원고 복구 API
+
+    - **manuscript_id**: MongoDB Document ID (필수)
+    - **category**: 카테고리/DB명 (필수)
+
+    Returns:
+        {"ok": true, "restoredId": "..."}
+    """
+    result = await run_in_threadpool(
+        restore_manuscript_by_id,
+        manuscript_id=manuscript_id,
+        category=category,
+    )
+    log.success("원고 복구", id=manuscript_id[:8])
+
+    return result
+
+
 @router.patch("/search/manuscript/{manuscript_id}")
 async def update_manuscript(
     manuscript_id: str = Path(..., description="원고 ID"),
@@ -94,11 +129,84 @@ async def toggle_visibility(
     return result
 
 
+@router.post("/search/manuscripts/bulk-delete")
+async def bulk_delete(body: BulkManuscriptRequest):
+    """
+    원고 일괄 삭제 API (소프트 삭제, 카테고리별로 묶어 처리)
+
+    - **items**: [{"category": "카테고리", "manuscriptId": "원고 ID"}, ...]
+
+    Returns:
+        {"ok": bool, "total": int, "succeeded": int, "failed": int,
+         "results": [{"category", "manuscriptId", "ok", "status"}, ...]}
+        (status: ok | unchanged(이미 삭제) | not_found | invalid_id | failed)
+    """
+    try:
+        result = await run_in_threadpool(
+            bulk_delete_manuscripts, [item.model_dump() for item in body.items]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    log.success("원고 일괄 삭제", total=result["total"], succeeded=result["succeeded"])
+
+    return result
+
+
+@router.post("/search/manuscripts/bulk-visibility")
+async def bulk_visibility(body: BulkVisibilityRequest):
+    """
+    원고 노출여부 일괄 지정 API (토글이 아니라 visible 값으로 설정)
+
+    - **items**: [{"category": "카테고리", "manuscriptId": "원고 ID"}, ...]
+    - **visible**: 설정할 노출여부
+
+    Returns:
+        {"ok": bool, "total": int, "succeeded": int, "failed": int, "results": [...]}
+    """
+    try:
+        result = await run_in_threadpool(
+            bulk_set_visibility, [item.model_dump() for item in body.items], body.visible
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    log.success(
+        "노출여부 일괄 변경",
+        total=result["total"],
+        succeeded=result["succeeded"],
+        visible=body.visible,
+    )
+
+    return result
+
+
+@router.post("/search/manuscripts/bulk-update")
+async def bulk_update(body: BulkUpdateRequest):
+    """
+    원고 내용 일괄 수정 API
+
+    - **items**: [{"category": "카테고리", "manuscriptId": "원고 ID", "content": "내용", "memo": "메모(선택)"}, ...]
+
+    Returns:
+        {"ok": bool, "total": int, "succeeded": int, "failed": int, "results": [...]}
+    """
+    try:
+        result = await run_in_threadpool(
+            bulk_update_manuscripts, [item.model_dump() for item in body.items]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    log.success("원고 일괄 수정", total=result["total"], succeeded=result["succeeded"])
+
+    return result
+
+
 @router.get("/search/manuscripts/visible")
 async def get_visible_manuscripts_api(
     category: Optional[str] = Query(None, description="카테고리 필터 (없으면 전체)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 결과 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 nextCursor)"),
+    fields: Optional[str] = Query(None, description="요약 외에 추가로 받을 필드 (쉼표 구분, 예: content)"),
 ):
     """
     노출 원고 목록 조회 API
@@ -108,9 +216,11 @@ async def get_visible_manuscripts_api(
     - **category**: 카테고리 필터 (선택, 없으면 전체 카테고리)
     - **page**: 페이지 번호 (기본값: 1)
     - **limit**: 페이지당 결과 수 (기본값: 20, 최대: 100)
+    - **cursor**: 다음 페이지 커서 (있으면 page 대신 사용, 깊은 페이지도 일정한 비용)
+    - **fields**: 요약 외에 추가로 받을 필드 (쉼표 구분, 예: content)
 
     Returns:
-        {"documents": [...], "total": int, "skip": int, "limit": int}
+        {"documents": [...], "total": int, "skip": int, "limit": int, "nextCursor": str | null}
     """
     skip = (page - 1) * limit
 
@@ -119,6 +229,8 @@ async def get_visible_manuscripts_api(
         category=category,
         skip=skip,
         limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
     log.success("노출 원고 조회", count=len(result['documents']), total=result['total'])
 
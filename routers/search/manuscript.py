@@ -1,16 +1,15 @@
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Path
-from fastapi.concurrency import run_in_threadpool
 from bson import ObjectId
 
-from mongodb_service import MongoDBService
+from async_mongodb_service import AsyncMongoDBService
 from config import MONGO_DB_NAME
 from utils.logger import log
 
 router = APIRouter()
 
 
-def get_manuscript_by_id(
+async def get_manuscript_by_id(
     manuscript_id: str,
     category: Optional[str] = None,
 ) -> Dict[str, Any]:
@@ -28,7 +27,7 @@ def get_manuscript_by_id(
         ValueError: 잘못된 ID 형식
         HTTPException: 원고를 찾을 수 없음
     """
-    db_service = MongoDBService()
+    db_service = AsyncMongoDBService()
 
     try:
         # ObjectId 형식 검증
@@ -44,7 +43,7 @@ def get_manuscript_by_id(
             db_service.set_db_name(db_name=MONGO_DB_NAME)
 
         # 원고 조회
-        document = db_service.db["manuscripts"].find_one({"_id": object_id})
+        document = await db_service.find_one("manuscripts", {"_id": object_id})
 
         if not document:
             raise HTTPException(
@@ -84,8 +83,7 @@ async def get_manuscript(
     Returns:
         원고 Document 객체
     """
-    document = await run_in_threadpool(
-        get_manuscript_by_id,
+    document = await get_manuscript_by_id(
         manuscript_id=manuscript_id,
         category=category,
     )
@@ -1,19 +1,20 @@
 """인기 검색어 API"""
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Dict, Any
 from fastapi import APIRouter, Query
 from fastapi.concurrency import run_in_threadpool
-from pymongo import MongoClient
 
-from config import MONGO_URI
-from _constants.categories import CATEGORIES
+from services.manuscript_rollup import popular_keywords_with_change
+from services.search_cache import cached_response, search_cache_key
 
 router = APIRouter()
 
 
+PERIOD_DAYS = {"today": 1, "week": 7, "month": 30}
+
+
 def get_popular_keywords(period: str = "week", limit: int = 10) -> Dict[str, Any]:
     """
-    인기 검색어 조회
+    인기 검색어 조회 (일별 집계 버킷만 읽음)
 
     Args:
         period: 기간 (today, week, month)
@@ -21,69 +22,14 @@ def get_popular_keywords(period: str = "week", limit: int = 10) -> Dict[str, Any
 
     Returns:
         {"period": "week", "keywords": [...]}
+        change는 직전 같은 길이 기간 대비 순위 변동 (양수 = 상승)
     """
-    client = MongoClient(MONGO_URI)
-    keyword_counts: Dict[str, int] = {}
-
-    now = datetime.now()
-    if period == "today":
-        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    elif period == "month":
-        start_date = now - timedelta(days=30)
-    else:
-        start_date = now - timedelta(days=7)
-
-    try:
-        for category in CATEGORIES:
-            try:
-                db = client[category]
-                collection = db["manuscripts"]
-
-                pipeline = [
-                    {
-                        "$match": {
-                            "createdAt": {"$gte": start_date},
-                            "deleted": {"$ne": True}
-                        }
-                    },
-                    {
-                        "$group": {
-                            "_id": "$keyword",
-                            "count": {"$sum": 1}
-                        }
-                    }
-                ]
-
-                for doc in collection.aggregate(pipeline):
-                    kw = doc["_id"]
-                    if kw:
-                        keyword_counts[kw] = keyword_counts.get(kw, 0) + doc["count"]
-
-            except Exception:
-                continue
-
-        sorted_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
-
-        keywords = []
-        for rank, (kw, cnt) in enumerate(sorted_keywords, 1):
-            keywords.append({
-                "rank": rank,
-                "keyword": kw,
-                "count": cnt,
-                "change": 0
-            })
-
-        return {
-            "period": period,
-            "keywords": keywords
-        }
+    days = PERIOD_DAYS.get(period, 7)
 
-    finally:
-        client.close()
+    return {
+        "period": period,
+        "keywords": popular_keywords_with_change(days, limit)
+    }
 
 
 @router.get("/search/popular")
@@ -98,8 +44,12 @@ async def popular_keywords(
     - **limit**: 결과 수 (기본값: 10, 최대: 20)
 
     Returns:
-        {"period": "week", "keywords": [{"rank": 1, "keyword": "위고비", "count": 523, "change": 0}, ...]}
+        {"period": "week", "keywords": [{"rank": 1, "keyword": "위고비", "count": 523, "change": 2, "isNew": false}, ...]}
     """
-    result = await run_in_threadpool(get_popular_keywords, period, limit)
+    result = await cached_response(
+        "popular",
+        search_cache_key(period, limit),
+        lambda: run_in_threadpool(get_popular_keywords, period, limit),
+    )
 
     return result
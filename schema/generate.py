@@ -17,6 +17,9 @@ class BatchGenerateRequest(BaseModel):
     ref: str = ""
     generate_images: bool = True  # 이미지도 생성할지 (기본: True)
     image_count: int = 5  # 키워드당 이미지 개수
+    concurrency: Optional[int] = None  # 동시 처리 키워드 수 (기본: BATCH_CONCURRENCY)
+    stream: bool = False  # True면 키워드가 끝날 때마다 SSE로 결과 전송
+    background: bool = False  # True면 작업 ID만 바로 반환하고 백그라운드 작업으로 처리
 
 
 class ImageGenerateRequest(BaseModel):
@@ -0,0 +1,16 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class JobResumeRequest(BaseModel):
+    # 재시작 후 paused 된 봇 작업은 계정 비밀번호를 다시 받아야 이어서 실행
+    accounts: List[dict] = []  # [{"id": "...", "password": "..."}]
+
+
+class JobAccepted(BaseModel):
+    success: bool = True
+    job_id: str
+    status: str = "queued"
+    status_url: str
+    events_url: str
+    items: Optional[int] = None
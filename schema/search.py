@@ -7,11 +7,14 @@ class KeywordSearchRequest(BaseModel):
     category: Optional[str] = Field(None, description="카테고리 필터 (DB명)")
     page: int = Field(1, ge=1, description="페이지 번호")
     limit: int = Field(20, ge=1, le=100, description="페이지당 결과 수")
+    cursor: Optional[str] = Field(None, description="다음 페이지 커서 (이전 응답의 nextCursor)")
+    fields: Optional[List[str]] = Field(None, description="요약 외에 추가로 받을 필드 (예: content)")
 
 
 class SearchRequest(BaseModel):
     q: str = Field(..., description="검색 키워드")
     limit: int = Field(20, ge=1, le=100, description="결과 수 제한")
+    fields: Optional[List[str]] = Field(None, description="요약 외에 추가로 받을 필드 (예: content)")
 
 
 class SearchFilters(BaseModel):
@@ -41,6 +44,29 @@ class ManuscriptUpdateRequest(BaseModel):
     memo: Optional[str] = Field(None, description="수정 메모")
 
 
+class ManuscriptRef(BaseModel):
+    category: str = Field(..., description="카테고리 (DB명)")
+    manuscriptId: str = Field(..., description="원고 ID")
+
+
+class BulkManuscriptRequest(BaseModel):
+    items: List[ManuscriptRef] = Field(..., description="대상 원고 목록")
+
+
+class BulkVisibilityRequest(BaseModel):
+    items: List[ManuscriptRef] = Field(..., description="대상 원고 목록")
+    visible: bool = Field(..., description="설정할 노출여부")
+
+
+class BulkUpdateItem(ManuscriptRef):
+    content: str = Field(..., description="수정된 원고 내용")
+    memo: Optional[str] = Field(None, description="수정 메모")
+
+
+class BulkUpdateRequest(BaseModel):
+    items: List[BulkUpdateItem] = Field(..., description="수정할 원고 목록")
+
+
 class SearchHistoryRequest(BaseModel):
     keyword: str = Field(..., description="검색어")
     category: Optional[str] = Field(None, description="카테고리")
@@ -0,0 +1,65 @@
+"""핫 경로 쿼리 플랜 점검
+
+services.query_indexes.HOT_QUERIES 의 쿼리 모양(원고 최신순/노출 목록, ref 키워드 조회,
+북마크/검색 기록 사용자별 조회, 검색 색인)을 각 DB에서 explain()으로 돌려
+COLLSCAN(콜렉션 전체 스캔)으로 실행되는 쿼리를 찾는다.
+
+COLLSCAN이 나오면 mongodb_service.QUERY_INDEX_MAP 에 인덱스가 빠졌거나
+아직 생성되지 않은 것이므로 --ensure 로 인덱스를 보장한 뒤 다시 점검한다.
+
+사용법:
+    python scripts/audit_query_plans.py
+    python scripts/audit_query_plans.py --category 안과 --category 치과
+    python scripts/audit_query_plans.py --ensure   # 조회용 인덱스 보장 후 점검
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from _constants.categories import CATEGORIES
+from mongodb_service import close_mongo_client, ensure_database_query_indexes
+from services.query_indexes import audit_hot_queries, query_index_db_names
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="핫 경로 쿼리 COLLSCAN 점검")
+    parser.add_argument("--category", action="append", help="대상 카테고리 (반복 가능, 기본: 전체)")
+    parser.add_argument("--ensure", action="store_true", help="점검 전에 조회용 인덱스 보장")
+    parser.add_argument("--verbose", action="store_true", help="통과한 쿼리도 출력")
+    args = parser.parse_args()
+
+    categories = args.category or CATEGORIES
+
+    try:
+        if args.ensure:
+            done = ensure_database_query_indexes(query_index_db_names(categories))
+            print(f"조회용 인덱스 보장: {done}개 DB")
+
+        findings = audit_hot_queries(categories)
+        collscans = [f for f in findings if f.collscan]
+        errors = [f for f in findings if f.error]
+
+        for finding in findings:
+            plan = " > ".join(finding.stages)
+            if finding.error:
+                print(f"[fail] {finding.db} {finding.query}: {finding.error}")
+            elif finding.collscan:
+                print(f"[COLLSCAN] {finding.db} {finding.query}: {plan}")
+            elif args.verbose:
+                print(f"[ok] {finding.db} {finding.query}: {plan}")
+
+        print(f"총 {len(findings)}건 점검, COLLSCAN {len(collscans)}건, 실패 {len(errors)}건")
+        return 1 if collscans or errors else 0
+    finally:
+        close_mongo_client()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
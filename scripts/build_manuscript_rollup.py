@@ -0,0 +1,67 @@
+"""원고 일별 집계(rollup) 백필
+
+각 카테고리 DB의 manuscripts 콜렉션을 날짜 × 엔진 × 키워드로 한 번 집계해
+search_system.manuscript_daily_rollup 버킷을 다시 만든다.
+(/search/stats, /search/popular 는 준비 완료 표시 후 이 버킷만 읽는다)
+
+staging 컬렉션에 만든 뒤 rename으로 교체하므로 실행 중에도 운영 집계는 그대로 읽히고,
+실행 중 저장/삭제/복구되는 원고는 원고 이벤트가 staging에도 반영한다.
+한 카테고리라도 실패하면 교체하지 않는다.
+
+사용법:
+    python scripts/build_manuscript_rollup.py
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from _constants.categories import CATEGORIES
+from mongodb_service import close_mongo_client
+from services.manuscript_rollup import (
+    abort_rollup_rebuild,
+    begin_rollup_rebuild,
+    category_buckets,
+    finish_rollup_rebuild,
+    rebuild_category_rollup,
+)
+
+
+def build_category(category: str, cutoff: datetime) -> int:
+    return rebuild_category_rollup(category, category_buckets(category, end=cutoff))
+
+
+def main() -> int:
+    failed: list[str] = []
+    try:
+        cutoff = begin_rollup_rebuild()
+        for category in CATEGORIES:
+            try:
+                count = build_category(category, cutoff)
+            except Exception as error:  # noqa: BLE001
+                print(f"[fail] {category}: {error}")
+                failed.append(category)
+                continue
+            print(f"[ok] {category}: 버킷 {count}개")
+
+        if failed:
+            abort_rollup_rebuild()
+        else:
+            finish_rollup_rebuild()
+    finally:
+        close_mongo_client()
+
+    if failed:
+        print(f"실패 카테고리: {', '.join(failed)} (교체하지 않음)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
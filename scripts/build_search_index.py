@@ -0,0 +1,90 @@
+"""원고 통합 검색 색인 백필
+
+각 카테고리 DB의 manuscripts 콜렉션을 읽어 search_system.manuscript_search_index 에
+bigram 색인을 채운다. 전체 카테고리를 끝내면 색인 준비 완료(ready)로 표시해
+/search/all, /search/keyword 가 정규식 검색 대신 색인을 사용하게 한다.
+
+이후 API로 생성/수정/삭제되는 원고는 원고 이벤트로 자동 반영된다.
+(API를 거치지 않고 DB에 직접 쓰는 스크립트를 돌린 뒤에는 다시 실행)
+
+사용법:
+    python scripts/build_search_index.py
+    python scripts/build_search_index.py --category 안과 --category 치과
+    python scripts/build_search_index.py --no-ready   # 색인만 채우고 전환은 보류
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from _constants.categories import CATEGORIES
+from mongodb_service import close_mongo_client, get_mongo_client
+from services.search_index import index_manuscripts, mark_search_index_ready
+
+BATCH_SIZE = 500
+PROJECTION = {"keyword": 1, "content": 1, "createdAt": 1, "deleted": 1}
+
+
+def _iter_batches(category: str) -> Iterator[list[dict[str, Any]]]:
+    cursor = get_mongo_client()[category]["manuscripts"].find({}, PROJECTION, batch_size=BATCH_SIZE)
+    batch: list[dict[str, Any]] = []
+    for document in cursor:
+        batch.append(document)
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_category(category: str) -> int:
+    count = 0
+    for batch in _iter_batches(category):
+        count += index_manuscripts(category, batch)
+    return count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="원고 검색 색인 백필")
+    parser.add_argument("--category", action="append", help="대상 카테고리 (반복 가능, 기본: 전체)")
+    parser.add_argument("--no-ready", action="store_true", help="완료 후 ready 표시 생략")
+    args = parser.parse_args()
+
+    categories = args.category or CATEGORIES
+    failed: list[str] = []
+    total = 0
+
+    try:
+        for category in categories:
+            try:
+                count = build_category(category)
+            except Exception as error:  # noqa: BLE001
+                print(f"[fail] {category}: {error}")
+                failed.append(category)
+                continue
+            total += count
+            print(f"[ok] {category}: {count}건")
+
+        print(f"총 {total}건 색인")
+        if failed:
+            print(f"실패 카테고리: {', '.join(failed)} → ready 표시 안 함")
+            return 1
+
+        # 일부 카테고리만 돌린 경우는 전체 색인이 아니므로 전환하지 않음
+        if not args.no_ready and not args.category:
+            mark_search_index_ready()
+            print("검색 색인 ready 표시 완료")
+        return 0
+    finally:
+        close_mongo_client()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""카테고리 DB 원고 → 통합 manuscripts 컬렉션 이관
+
+각 카테고리 DB의 manuscripts 콜렉션을 _id 순으로 배치 복사해
+UNIFIED_MANUSCRIPT_DB.manuscripts (category 필드 포함)에 채운다.
+
+- 카테고리별 진행 위치(마지막 _id)를 search_system.manuscript_store_migration 에 기록하므로
+  중단돼도 다시 실행하면 이어서 복사한다 (--reset 으로 처음부터)
+- 복사는 _id 기준 덮어쓰기라 여러 번 돌려도 안전하다
+
+전환 순서:
+    1. MANUSCRIPT_STORAGE=dual 로 배포 (새 변경은 통합 컬렉션에도 이중 쓰기)
+    2. python scripts/migrate_unified_manuscripts.py  (전체 카테고리 완료까지)
+    3. MANUSCRIPT_STORAGE=unified 로 배포 (카테고리 통합 조회를 통합 컬렉션에서)
+
+사용법:
+    python scripts/migrate_unified_manuscripts.py
+    python scripts/migrate_unified_manuscripts.py --category 안과 --batch-size 1000
+    python scripts/migrate_unified_manuscripts.py --reset
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from _constants.categories import CATEGORIES
+from mongodb_service import SEARCH_SYSTEM_DB_NAME, close_mongo_client, get_mongo_client
+from services.manuscript_store import UNIFIED_MANUSCRIPT_DB, copy_manuscripts
+
+CHECKPOINT_COLLECTION = "manuscript_store_migration"
+DEFAULT_BATCH_SIZE = 500
+
+
+def _checkpoints():
+    return get_mongo_client()[SEARCH_SYSTEM_DB_NAME][CHECKPOINT_COLLECTION]
+
+
+def _load_checkpoint(category: str) -> Optional[dict[str, Any]]:
+    return _checkpoints().find_one({"_id": category})
+
+
+def _save_checkpoint(category: str, last_id: Any, copied: int, done: bool) -> None:
+    _checkpoints().update_one(
+        {"_id": category},
+        {
+            "$set": {"lastId": last_id, "done": done, "updatedAt": datetime.now()},
+            "$inc": {"copied": copied},
+        },
+        upsert=True,
+    )
+
+
+def migrate_category(category: str, batch_size: int) -> int:
+    checkpoint = _load_checkpoint(category) or {}
+    if checkpoint.get("done"):
+        return 0
+
+    collection = get_mongo_client()[category]["manuscripts"]
+    last_id = checkpoint.get("lastId")
+    total = 0
+
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+        batch = list(collection.find(query).sort("_id", 1).limit(batch_size))
+        if not batch:
+            break
+
+        copied = copy_manuscripts(category, batch)
+        last_id = batch[-1]["_id"]
+        total += copied
+        _save_checkpoint(category, last_id, copied, done=False)
+
+    _save_checkpoint(category, last_id, 0, done=True)
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="카테고리 DB 원고를 통합 컬렉션으로 이관")
+    parser.add_argument("--category", action="append", help="대상 카테고리 (반복 가능, 기본: 전체)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="배치 크기")
+    parser.add_argument("--reset", action="store_true", help="진행 기록을 지우고 처음부터 이관")
+    args = parser.parse_args()
+
+    categories = args.category or CATEGORIES
+    failed: list[str] = []
+    total = 0
+
+    try:
+        if args.reset:
+            _checkpoints().delete_many({"_id": {"$in": list(categories)}})
+
+        for category in categories:
+            try:
+                count = migrate_category(category, args.batch_size)
+            except Exception as error:  # noqa: BLE001
+                print(f"[fail] {category}: {error}")
+                failed.append(category)
+                continue
+            total += count
+            print(f"[ok] {category}: {count}건")
+
+        print(f"총 {total}건 → {UNIFIED_MANUSCRIPT_DB}.manuscripts")
+        if failed:
+            print(f"실패 카테고리: {', '.join(failed)} → 다시 실행하면 이어서 이관")
+            return 1
+        return 0
+    finally:
+        close_mongo_client()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
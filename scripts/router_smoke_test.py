@@ -104,7 +104,7 @@ def check_blog_filler_pet_router_contract() -> None:
             if collection == "manuscripts" and "_id" not in document:
                 document["_id"] = "pet-doc-1"
 
-        db_service.insert_document.side_effect = insert_document
+        db_service.insert_document = AsyncMock(side_effect=insert_document)
         return db_service
 
     scenarios = [
@@ -132,7 +132,7 @@ def check_blog_filler_pet_router_contract() -> None:
                 run_in_threadpool,
             ),
             patch(
-                "routers.generate.blog_filler_pet.MongoDBService",
+                "routers.generate.blog_filler_pet.AsyncMongoDBService",
                 side_effect=lambda: build_db_service(),
             ),
             patch(
@@ -0,0 +1,275 @@
+"""
+검색어 자동완성 인메모리 색인
+
+키 입력마다 모든 카테고리 DB에서 $regex + $group을 돌리던 것을,
+프로세스 메모리의 정렬 배열(bisect 접두사 검색)로 바꾼다.
+
+- 항목: 원고 keyword별 원고 수 (삭제 원고 제외)
+- 접두사 키: 키워드의 각 단어 시작 위치부터의 문자열 (공백 제거, 소문자)
+  → "효능"으로 "위고비 효능", "위고비효"로 "위고비 효능" 매칭
+- 초성 키: 같은 위치의 초성 문자열 → "ㅇㄱㅂ"으로 "위고비", "위ㄱ"으로 "위고비" 매칭
+- 시작 시 카테고리 DB에서 한 번 적재 + AUTOCOMPLETE_RELOAD_SECONDS마다 재적재
+  (다른 워커에서 생긴 원고 반영), 이 프로세스의 원고 저장/삭제/복구는 이벤트로 즉시 반영
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import os
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+from _constants.categories import CATEGORIES
+from mongodb_service import get_mongo_client
+from services.manuscript_events import ManuscriptEvent, subscribe
+from services.manuscript_store import category_filter, reads_unified, unified_collection
+from utils.category_fanout import CATEGORY_FANOUT_TIMEOUT_MS, fan_out_categories
+from utils.logger import log
+
+AUTOCOMPLETE_RELOAD_SECONDS = float(os.getenv("AUTOCOMPLETE_RELOAD_SECONDS", "600"))
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JAMO_FIRST = 0x3131
+_JAMO_LAST = 0x314E
+
+
+# ---------- 한글 분해 ----------
+def to_choseong(text: str) -> str:
+    """완성형 한글은 초성으로, 나머지 문자는 그대로 (길이 보존)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(_CHOSEONG[(code - _HANGUL_BASE) // 588])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _is_jamo(ch: str) -> bool:
+    return _JAMO_FIRST <= ord(ch) <= _JAMO_LAST
+
+
+def normalize_autocomplete_text(text: str) -> str:
+    """소문자화 + 공백 제거"""
+    return "".join(text.lower().split())
+
+
+def _word_start_keys(keyword: str) -> List[str]:
+    """키워드 각 단어 시작 위치부터의 접두사 키 (공백 제거)"""
+    words = keyword.lower().split()
+    return ["".join(words[i:]) for i in range(len(words))]
+
+
+def _matches_mixed(query: str, text: str) -> bool:
+    """글자/초성이 섞인 검색어가 text 앞부분과 맞는지 (초성 자리는 초성끼리 비교)"""
+    if len(text) < len(query):
+        return False
+    for q, t in zip(query, text):
+        if q == t:
+            continue
+        if not (_is_jamo(q) and to_choseong(t) == q):
+            return False
+    return True
+
+
+# ---------- 색인 ----------
+class AutocompleteIndex:
+    """키워드 → 원고 수 + 접두사/초성 정렬 배열"""
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        # (접두사 키, 키워드)
+        self._text_keys: List[Tuple[str, str]] = []
+        # (초성 키, 같은 위치의 접두사 키, 키워드)
+        self._choseong_keys: List[Tuple[str, str, str]] = []
+
+        for keyword, count in (counts or {}).items():
+            if keyword and count > 0:
+                self._counts[keyword] = count
+                self._text_keys.extend(self._text_entries(keyword))
+                self._choseong_keys.extend(self._choseong_entries(keyword))
+        self._text_keys.sort()
+        self._choseong_keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @staticmethod
+    def _text_entries(keyword: str) -> List[Tuple[str, str]]:
+        return [(key, keyword) for key in _word_start_keys(keyword)]
+
+    @staticmethod
+    def _choseong_entries(keyword: str) -> List[Tuple[str, str, str]]:
+        return [(to_choseong(key), key, keyword) for key in _word_start_keys(keyword)]
+
+    def add(self, keyword: str, delta: int = 1) -> None:
+        """원고 수 증감 (처음 보는 키워드는 정렬 배열에 삽입, 0 이하면 추천에서 제외)"""
+        if not keyword:
+            return
+        with self._lock:
+            if keyword not in self._counts:
+                if delta <= 0:
+                    return
+                for entry in self._text_entries(keyword):
+                    insort(self._text_keys, entry)
+                for entry in self._choseong_entries(keyword):
+                    insort(self._choseong_keys, entry)
+                self._counts[keyword] = 0
+            self._counts[keyword] += delta
+
+    def suggest(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        접두사(초성 포함) 일치 키워드를 원고 수 순으로 반환
+
+        Args:
+            query: 검색어
+            limit: 결과 수
+
+        Returns:
+            [{"keyword": "위고비 효능", "count": 152}, ...]
+        """
+        needle = normalize_autocomplete_text(query)
+        if not needle:
+            return []
+
+        # add() 가 다른 스레드에서 같은 배열에 insort 하므로 스캔 중에는 잠금
+        with self._lock:
+            matched: set[str] = set()
+            if any(_is_jamo(ch) for ch in needle):
+                prefix = to_choseong(needle)
+                cho_keys = self._choseong_keys
+                for i in range(bisect_left(cho_keys, (prefix,)), len(cho_keys)):
+                    cho_key, text_key, keyword = cho_keys[i]
+                    if not cho_key.startswith(prefix):
+                        break
+                    if _matches_mixed(needle, text_key):
+                        matched.add(keyword)
+            else:
+                text_keys = self._text_keys
+                for i in range(bisect_left(text_keys, (needle,)), len(text_keys)):
+                    text_key, keyword = text_keys[i]
+                    if not text_key.startswith(needle):
+                        break
+                    matched.add(keyword)
+
+            counts = self._counts
+            top = heapq.nlargest(
+                limit,
+                ((counts.get(keyword, 0), keyword) for keyword in matched),
+            )
+        return [{"keyword": keyword, "count": count} for count, keyword in top if count > 0]
+
+
+_index = AutocompleteIndex()
+
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    return _index
+
+
+def suggest_keywords(query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """자동완성 추천 (Mongo 조회 없음)"""
+    return _index.suggest(query, limit)
+
+
+# ---------- 적재/갱신 ----------
+_KEYWORD_MATCH = {"deleted": {"$ne": True}, "keyword": {"$type": "string", "$ne": ""}}
+_KEYWORD_GROUP = {"$group": {"_id": "$keyword", "count": {"$sum": 1}}}
+
+
+def _load_category_keyword_counts(category: str) -> Dict[str, int]:
+    pipeline = [{"$match": _KEYWORD_MATCH}, _KEYWORD_GROUP]
+    collection = get_mongo_client()[category]["manuscripts"]
+    return {
+        doc["_id"]: doc["count"]
+        for doc in collection.aggregate(pipeline, maxTimeMS=CATEGORY_FANOUT_TIMEOUT_MS * 10)
+    }
+
+
+def _load_unified_keyword_counts() -> Dict[str, int]:
+    pipeline = [{"$match": {**_KEYWORD_MATCH, **category_filter(CATEGORIES)}}, _KEYWORD_GROUP]
+    return {
+        doc["_id"]: doc["count"]
+        for doc in unified_collection().aggregate(pipeline, maxTimeMS=CATEGORY_FANOUT_TIMEOUT_MS * 10)
+    }
+
+
+def load_autocomplete_index() -> int:
+    """
+    카테고리 DB(통합 저장소 조회 모드면 통합 원고 컬렉션)에서 키워드별 원고 수를 읽어 색인 교체
+
+    Returns:
+        적재한 키워드 수
+    """
+    global _index
+
+    if reads_unified():
+        counts = _load_unified_keyword_counts()
+        _index = AutocompleteIndex(counts)
+        log.info("자동완성 색인 적재", keywords=len(counts))
+        return len(counts)
+
+    outcome = fan_out_categories(
+        _load_category_keyword_counts,
+        CATEGORIES,
+        timeout_ms=CATEGORY_FANOUT_TIMEOUT_MS * 10,
+    )
+
+    counts: Dict[str, int] = {}
+    for category_counts in outcome.results.values():
+        for keyword, count in category_counts.items():
+            counts[keyword] = counts.get(keyword, 0) + count
+
+    if outcome.partial and len(_index):
+        # 일부 카테고리만 읽혔으면 기존 색인을 유지
+        log.warning("자동완성 색인 재적재 일부 실패 → 기존 색인 유지")
+        return len(_index)
+
+    _index = AutocompleteIndex(counts)
+    log.info("자동완성 색인 적재", keywords=len(counts))
+    return len(counts)
+
+
+def handle_manuscript_event(event: ManuscriptEvent) -> None:
+    """원고 저장/삭제/복구 이벤트 → 키워드 원고 수 증감"""
+    keyword = (event.document or {}).get("keyword")
+    if not isinstance(keyword, str):
+        return
+    if event.kind in ("insert", "restore"):
+        _index.add(keyword, 1)
+    elif event.kind == "delete":
+        _index.add(keyword, -1)
+
+
+def register_autocomplete_index() -> None:
+    """원고 이벤트 구독 (애플리케이션 시작 시 호출)"""
+    subscribe(handle_manuscript_event)
+
+
+async def keep_autocomplete_index_fresh(
+    interval: float = AUTOCOMPLETE_RELOAD_SECONDS,
+) -> None:
+    """시작 시 적재 후 interval초마다 재적재 (백그라운드 태스크)"""
+    while True:
+        try:
+            await asyncio.to_thread(load_autocomplete_index)
+        except Exception as e:
+            log.warning(f"자동완성 색인 적재 실패: {e}")
+        await asyncio.sleep(interval)
+
+
+__all__ = [
+    "AutocompleteIndex",
+    "get_autocomplete_index",
+    "keep_autocomplete_index_fresh",
+    "load_autocomplete_index",
+    "register_autocomplete_index",
+    "suggest_keywords",
+    "to_choseong",
+]
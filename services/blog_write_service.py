@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import re
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from playwright.async_api import Frame
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
-from playwright.async_api import async_playwright
 
+from services.browser_pool import account_key, get_browser_pool
 from utils.logger import log
 
 
@@ -41,6 +44,105 @@ SELECTORS = {
 EDITOR_SELECTOR = (
     'div.se-component-content, div[contenteditable="true"], p.se-text-paragraph'
 )
+# 세션이 끊기면 글쓰기 페이지가 네이버 로그인 페이지로 리다이렉트됨
+LOGIN_PAGE_MARKER = "nid.naver.com"
+SESSION_EXPIRED_ERROR = "SESSION_EXPIRED"
+MAIN_FRAME_SELECTOR = "iframe#mainFrame, iframe[name='mainFrame']"
+IMAGE_COMPONENT_SELECTOR = "div.se-component.se-image"
+
+# 고정 sleep 대신 준비 신호(셀렉터/네트워크/컴포넌트 수)를 기다리는 상한 (ms)
+EDITOR_READY_TIMEOUT_MS = int(os.getenv("BLOG_EDITOR_READY_TIMEOUT_MS", "20000"))
+IMAGE_UPLOAD_TIMEOUT_MS = int(os.getenv("BLOG_IMAGE_UPLOAD_TIMEOUT_MS", "30000"))
+UI_STEP_TIMEOUT_MS = int(os.getenv("BLOG_UI_STEP_TIMEOUT_MS", "5000"))
+# 네트워크가 조용해진 뒤 선택적 팝업(임시저장/도움말)이 뜨기를 기다리는 시간
+POPUP_TIMEOUT_MS = int(os.getenv("BLOG_POPUP_TIMEOUT_MS", "1000"))
+PUBLISH_RESULT_TIMEOUT_MS = int(os.getenv("BLOG_PUBLISH_RESULT_TIMEOUT_MS", "15000"))
+# 진행 중인 XHR/fetch 가 0인 상태가 이만큼 유지되면 network-idle 로 봄
+NETWORK_QUIET_MS = int(os.getenv("BLOG_NETWORK_QUIET_MS", "300"))
+# 추적할 에디터 업로드 요청 URL (통계/자동저장/폴링 요청은 제외)
+UPLOAD_URL_PATTERN = re.compile(
+    os.getenv("BLOG_UPLOAD_URL_PATTERN", r"upphoto\.naver\.com|/photo-uploader/|/upload")
+)
+
+
+class SessionExpiredError(RuntimeError):
+    """네이버 로그인 세션이 서버에서 만료/폐기됨"""
+
+
+class StepTrace:
+    """발행 단계별 소요 시간 (ms, 같은 이름은 누적)"""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = int((time.perf_counter() - started) * 1000)
+            self.timings[name] = self.timings.get(name, 0) + elapsed
+
+    def summary(self) -> dict[str, int]:
+        return {**self.timings, "total": int((time.perf_counter() - self._started) * 1000)}
+
+
+class NetworkTracker:
+    """페이지(모든 frame)의 진행 중인 에디터 업로드 XHR/fetch 요청 수 추적"""
+
+    RESOURCE_TYPES = ("xhr", "fetch")
+
+    def __init__(self, page: Page, url_pattern: re.Pattern = UPLOAD_URL_PATTERN) -> None:
+        self._page = page
+        self._url_pattern = url_pattern
+        self._inflight: set = set()
+        self._started = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def __enter__(self) -> "NetworkTracker":
+        self._page.on("request", self._on_request)
+        self._page.on("requestfinished", self._on_done)
+        self._page.on("requestfailed", self._on_done)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._page.remove_listener("request", self._on_request)
+        self._page.remove_listener("requestfinished", self._on_done)
+        self._page.remove_listener("requestfailed", self._on_done)
+
+    def _on_request(self, request) -> None:
+        if request.resource_type in self.RESOURCE_TYPES and self._url_pattern.search(request.url):
+            self._inflight.add(request)
+            self._started += 1
+            self._idle.clear()
+
+    def _on_done(self, request) -> None:
+        self._inflight.discard(request)
+        if not self._inflight:
+            self._idle.set()
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def wait_idle(self, timeout_ms: int, quiet_ms: int = NETWORK_QUIET_MS) -> bool:
+        """진행 중인 요청이 없고 quiet_ms 동안 새 요청도 없을 때까지 대기 (상한 timeout_ms)"""
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+            started = self._started
+            await asyncio.sleep(min(quiet_ms / 1000, max(deadline - time.monotonic(), 0)))
+            if self._idle.is_set() and self._started == started:
+                return True
 
 
 async def _capture_debug_screenshot(page: Page, filename: str, debug: bool) -> None:
@@ -53,16 +155,47 @@ async def _capture_debug_screenshot(page: Page, filename: str, debug: bool) -> N
         log.warning("디버그 스크린샷 실패", file=filename, error=str(error))
 
 
-async def upload_single_image(frame: Frame, page: Page, image_path: str) -> bool:
-    """단일 이미지 업로드 (file_chooser 방식)"""
+async def upload_single_image(
+    frame: Frame,
+    page: Page,
+    image_path: str,
+    network: Optional[NetworkTracker] = None,
+) -> bool:
+    """
+    단일 이미지 업로드 (file_chooser 방식)
+
+    에디터의 이미지 컴포넌트가 하나 늘고, 업로드 XHR 이 끝나고(network-idle),
+    새 이미지가 로드될 때까지 기다린다 (상한 IMAGE_UPLOAD_TIMEOUT_MS).
+    """
+    started = time.perf_counter()
     try:
+        before = await frame.locator(IMAGE_COMPONENT_SELECTOR).count()
         async with page.expect_file_chooser() as file_chooser_info:
-            await frame.click(SELECTORS["image_btn"], timeout=5000)
+            await frame.click(SELECTORS["image_btn"], timeout=UI_STEP_TIMEOUT_MS)
 
         file_chooser = await file_chooser_info.value
         await file_chooser.set_files(image_path)
-        await asyncio.sleep(2)
-        log.debug("이미지 업로드", path=Path(image_path).name)
+        await frame.wait_for_function(
+            "([selector, before]) => document.querySelectorAll(selector).length > before",
+            arg=[IMAGE_COMPONENT_SELECTOR, before],
+            timeout=IMAGE_UPLOAD_TIMEOUT_MS,
+        )
+        if network is not None:
+            await network.wait_idle(IMAGE_UPLOAD_TIMEOUT_MS)
+        await frame.wait_for_function(
+            """(selector) => {
+                const images = document.querySelectorAll(selector + ' img');
+                const image = images[images.length - 1];
+                return !!image && image.complete && image.naturalWidth > 0;
+            }""",
+            arg=IMAGE_COMPONENT_SELECTOR,
+            timeout=IMAGE_UPLOAD_TIMEOUT_MS,
+        )
+        log.debug(
+            "이미지 업로드",
+            path=Path(image_path).name,
+            ms=int((time.perf_counter() - started) * 1000),
+        )
         return True
     except Exception as error:
         log.warning("이미지 업로드 실패", path=Path(image_path).name, error=str(error))
@@ -102,32 +235,44 @@ def match_images_to_subheadings(paragraphs: list[str], images: list[str]) -> dic
     return image_map
 
 
-async def close_existing_draft_popup(frame: Frame) -> bool:
+async def _dismiss(frame: Frame, selector: str, timeout: int) -> bool:
+    """selector 가 timeout 안에 보이면 클릭하고 사라질 때까지 대기"""
+    button = frame.locator(selector).first
+    try:
+        await button.wait_for(state="visible", timeout=timeout)
+    except Exception:
+        return False
+    await button.click(timeout=UI_STEP_TIMEOUT_MS)
+    await button.wait_for(state="hidden", timeout=UI_STEP_TIMEOUT_MS)
+    return True
+
+
+async def close_existing_draft_popup(frame: Frame, timeout: int = POPUP_TIMEOUT_MS) -> bool:
     """기존 글 팝업 닫기"""
     try:
-        await frame.click(SELECTORS["popup_cancel"], timeout=3000)
-        await asyncio.sleep(1)
+        if not await _dismiss(frame, SELECTORS["popup_cancel"], timeout):
+            return False
         log.debug("기존 글 팝업 닫음")
         return True
     except Exception:
         return False
 
 
-async def close_help_panel(frame: Frame) -> bool:
+async def close_help_panel(frame: Frame, timeout: int = POPUP_TIMEOUT_MS) -> bool:
     """도움말 패널 닫기"""
     try:
-        await frame.click(SELECTORS["help_close"], timeout=3000)
-        await asyncio.sleep(0.5)
-        return True
+        return await _dismiss(frame, SELECTORS["help_close"], timeout)
     except Exception:
         return False
 
 
 async def open_publish_overlay(frame: Frame) -> bool:
-    """발행 오버레이 열기"""
+    """발행 오버레이 열기 (최종 발행 버튼이 보일 때까지)"""
     try:
         await frame.click(SELECTORS["publish_btn"], timeout=10000)
-        await asyncio.sleep(2)
+        await frame.wait_for_selector(
+            SELECTORS["publish_confirm"], state="visible", timeout=UI_STEP_TIMEOUT_MS
+        )
         return True
     except Exception as error:
         log.warning("발행 오버레이 오픈 실패", error=str(error))
@@ -154,7 +299,10 @@ async def input_tags(frame: Frame, page: Page, tags: Optional[list[str]]) -> boo
         for tag in tags[:30]:
             await tag_input.fill(tag)
             await page.keyboard.press("Enter")
-            await asyncio.sleep(0.2)
+            # 태그가 추가되면 입력창이 비워짐
+            await frame.wait_for_function(
+                "(input) => input.value === ''", arg=tag_input, timeout=UI_STEP_TIMEOUT_MS
+            )
         log.debug("태그 입력", count=len(tags))
         return True
     except Exception:
@@ -168,12 +316,10 @@ async def click_schedule_radio(frame: Frame) -> bool:
         if await label.count() > 0:
             await label.click(timeout=5000)
             log.debug("예약 레이블 클릭 완료")
-            await asyncio.sleep(1)
         else:
             label = frame.get_by_text("예약", exact=True)
             await label.click(timeout=5000)
             log.debug("예약 텍스트 클릭 완료")
-            await asyncio.sleep(1)
 
         time_setting_selector = "div.time_setting__v6YRU, div[class*='time_setting']"
         try:
@@ -182,7 +328,6 @@ async def click_schedule_radio(frame: Frame) -> bool:
         except Exception:
             log.debug("time_setting 안 보임 - 재시도")
             await label.click(force=True)
-            await asyncio.sleep(1)
 
         try:
             await frame.wait_for_selector(SELECTORS["schedule_hour"], timeout=5000)
@@ -208,7 +353,6 @@ async def set_schedule_date(frame: Frame, target_date: datetime) -> bool:
     try:
         date_input = frame.locator(SELECTORS["date_input"])
         await date_input.click(timeout=3000)
-        await asyncio.sleep(0.5)
 
         datepicker = frame.locator(".ui-datepicker-header")
         await datepicker.wait_for(state="visible", timeout=3000)
@@ -220,9 +364,16 @@ async def set_schedule_date(frame: Frame, target_date: datetime) -> bool:
         target_year = target.year
         month_diff = (target_year - current_year) * 12 + (target_month - current_month)
 
+        month_label = frame.locator(SELECTORS["datepicker_month"]).first
         for _ in range(month_diff):
+            previous_month = await month_label.text_content()
             await frame.click(SELECTORS["datepicker_next_month"], timeout=3000)
-            await asyncio.sleep(0.5)
+            # 헤더의 월 표시가 바뀌면 다음 달 렌더링 완료
+            await frame.wait_for_function(
+                "([selector, previous]) => document.querySelector(selector)?.textContent !== previous",
+                arg=[SELECTORS["datepicker_month"], previous_month],
+                timeout=UI_STEP_TIMEOUT_MS,
+            )
 
         day_selector = "td:not(.ui-state-disabled) button.ui-state-default"
         day_buttons = await frame.query_selector_all(day_selector)
@@ -230,8 +381,16 @@ async def set_schedule_date(frame: Frame, target_date: datetime) -> bool:
         for button in day_buttons:
             text = await button.text_content()
             if text and text.strip() == str(target.day):
+                previous_value = await date_input.input_value()
                 await button.click()
-                await asyncio.sleep(0.5)
+                try:
+                    await frame.wait_for_function(
+                        "([selector, previous]) => document.querySelector(selector)?.value !== previous",
+                        arg=[SELECTORS["date_input"], previous_value],
+                        timeout=UI_STEP_TIMEOUT_MS,
+                    )
+                except PlaywrightTimeout:
+                    log.debug("날짜 입력값 변경 확인 안 됨", day=target.day)
                 log.debug("날짜 선택 완료", day=target.day)
                 return True
 
@@ -254,12 +413,10 @@ async def set_schedule_time(frame: Frame, hour: int, minute: int) -> bool:
         hour_select = frame.locator(SELECTORS["schedule_hour"])
         await hour_select.wait_for(timeout=5000)
         await hour_select.select_option(value=hour_str)
-        await asyncio.sleep(0.5)
 
         minute_select = frame.locator(SELECTORS["schedule_minute"])
         await minute_select.wait_for(timeout=5000)
         await minute_select.select_option(value=minute_str)
-        await asyncio.sleep(0.5)
 
         log.debug("예약 시간 설정 완료", time=f"{hour_str}:{minute_str}")
         return True
@@ -324,23 +481,45 @@ async def publish_scheduled(
         raise RuntimeError("최종 발행 실패")
 
 
+async def _wait_for_editor(page: Page) -> Frame:
+    """mainFrame 과 에디터 본문이 나타날 때까지 대기"""
+    frame_element = await page.wait_for_selector(
+        MAIN_FRAME_SELECTOR, state="attached", timeout=EDITOR_READY_TIMEOUT_MS
+    )
+    frame = await frame_element.content_frame() if frame_element else None
+    if not frame:
+        raise RuntimeError("mainFrame을 찾을 수 없습니다")
+    await frame.wait_for_selector(EDITOR_SELECTOR, state="visible", timeout=EDITOR_READY_TIMEOUT_MS)
+    return frame
+
+
 async def _focus_editor(frame: Frame) -> None:
     try:
         editor = await frame.wait_for_selector(EDITOR_SELECTOR, timeout=5000)
         if editor:
             await editor.click()
-            await asyncio.sleep(0.5)
     except Exception:
         return
 
 
+async def _wait_for_publish_result(page: Page, editor_url: str) -> None:
+    """발행 후 글쓰기 화면을 벗어날 때까지 대기 (못 벗어나도 실패로 보지 않음)"""
+    try:
+        await page.wait_for_url(lambda url: url != editor_url, timeout=PUBLISH_RESULT_TIMEOUT_MS)
+    except PlaywrightTimeout:
+        log.warning("발행 후 페이지 이동 확인 안 됨", url=page.url[:50])
+
+
 async def _write_editor_content(
     page: Page,
     frame: Frame,
     title: str,
     content: str,
     images: Optional[list[str]],
+    network: Optional[NetworkTracker] = None,
+    trace: Optional[StepTrace] = None,
 ) -> None:
+    trace = trace or StepTrace()
     full_text = f"{title}\n{content}"
     paragraphs = full_text.split("\n")
     image_map = match_images_to_subheadings(paragraphs, images) if images else {}
@@ -359,14 +538,12 @@ async def _write_editor_content(
 
         if index < len(paragraphs) - 1:
             await page.keyboard.press("Enter")
-            await asyncio.sleep(0.1)
 
         if index in image_map:
             await page.keyboard.press("Enter")
-            await asyncio.sleep(0.3)
-            await upload_single_image(frame, page, image_map[index])
+            with trace.step("images"):
+                await upload_single_image(frame, page, image_map[index], network)
             await page.keyboard.press("Enter")
-            await asyncio.sleep(0.3)
 
 
 def _parse_schedule_time(schedule_time: Optional[str]) -> Optional[datetime]:
@@ -383,12 +560,21 @@ def _build_success_result(post_url: str) -> dict[str, Optional[str] | bool]:
     }
 
 
-def _build_error_result(message: str) -> dict[str, Optional[str] | bool]:
-    return {
+def _build_error_result(
+    message: str, error: Optional[str] = None
+) -> dict[str, Optional[str] | bool]:
+    result: dict[str, Optional[str] | bool] = {
         "success": False,
         "post_url": None,
         "message": message,
     }
+    if error:
+        result["error"] = error
+    return result
+
+
+def _is_login_page(page: Page) -> bool:
+    return LOGIN_PAGE_MARKER in (page.url or "")
 
 
 async def write_blog_post(
@@ -401,76 +587,84 @@ async def write_blog_post(
     is_public: bool = True,
     schedule_time: Optional[str] = None,
     debug: bool = False,
+    account_id: Optional[str] = None,
 ) -> dict[str, Optional[str] | bool]:
-    """Playwright로 네이버 블로그 글쓰기"""
-    del category
-
-    async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(headless=False, slow_mo=300)
-        context = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
-        )
-        await context.add_cookies(cookies)
+    """Playwright로 네이버 블로그 글쓰기
 
-        page = await context.new_page()
+    브라우저를 새로 띄우지 않고 브라우저 풀(services.browser_pool)의 계정별 컨텍스트에서
+    새 페이지만 열어 쓴다. account_id가 없으면 로그인 쿠키 값으로 컨텍스트를 구분한다.
+    """
+    del category
 
-        try:
-            log.step(1, 5, "글쓰기 페이지 접속")
-            await page.goto(
-                "https://blog.naver.com/GoBlogWrite.naver",
-                wait_until="domcontentloaded",
-                timeout=30000,
-            )
-            await asyncio.sleep(3)
-            await _capture_debug_screenshot(page, "write_step1_page.png", debug)
-
-            frame = page.frame(name="mainFrame")
-            if not frame:
-                raise RuntimeError("mainFrame을 찾을 수 없습니다")
-
-            await asyncio.sleep(2)
-
-            log.step(2, 5, "팝업 처리")
-            await close_existing_draft_popup(frame)
-            await close_help_panel(frame)
-            await _capture_debug_screenshot(page, "write_step2_popup.png", debug)
-
-            await _focus_editor(frame)
-
-            log.step(3, 5, f"콘텐츠 입력 ({len(content)}자)")
-            await _write_editor_content(page, frame, title, content, images)
-            await asyncio.sleep(1)
-            await _capture_debug_screenshot(page, "write_step3_content.png", debug)
-
-            log.step(4, 5, "발행 설정")
-            schedule_dt = _parse_schedule_time(schedule_time)
-            if schedule_dt:
-                await publish_scheduled(frame, page, schedule_dt, is_public, tags)
-            else:
-                await publish_immediately(frame, page, is_public, tags)
-
-            await asyncio.sleep(3)
-            await _capture_debug_screenshot(page, "write_step4_done.png", debug)
-
-            log.step(5, 5, "발행 완료")
-            current_url = page.url
-            log.success("글 발행 완료", url=current_url[:50])
-            return _build_success_result(current_url)
-
-        except PlaywrightTimeout as error:
-            await _capture_debug_screenshot(page, "write_error_timeout.png", debug)
-            return _build_error_result(f"타임아웃: {str(error)}")
-        except Exception as error:
-            await _capture_debug_screenshot(page, "write_error_unknown.png", debug)
-            return _build_error_result(f"에러: {str(error)}")
-        finally:
-            await browser.close()
+    pool = get_browser_pool()
+    key = account_key(account_id, cookies)
+    trace = StepTrace()
+    async with pool.page(key, cookies=cookies) as page:
+        with NetworkTracker(page) as network:
+            try:
+                log.step(1, 5, "글쓰기 페이지 접속")
+                with trace.step("page_load"):
+                    await page.goto(
+                        "https://blog.naver.com/GoBlogWrite.naver",
+                        wait_until="domcontentloaded",
+                        timeout=30000,
+                    )
+                if _is_login_page(page):
+                    raise SessionExpiredError("로그인 페이지로 이동됨")
+                with trace.step("editor_ready"):
+                    frame = await _wait_for_editor(page)
+                    await network.wait_idle(UI_STEP_TIMEOUT_MS)
+                await _capture_debug_screenshot(page, "write_step1_page.png", debug)
+
+                log.step(2, 5, "팝업 처리")
+                with trace.step("popups"):
+                    await close_existing_draft_popup(frame)
+                    await close_help_panel(frame)
+                await _capture_debug_screenshot(page, "write_step2_popup.png", debug)
+
+                await _focus_editor(frame)
+
+                log.step(3, 5, f"콘텐츠 입력 ({len(content)}자)")
+                with trace.step("content"):
+                    await _write_editor_content(page, frame, title, content, images, network, trace)
+                await _capture_debug_screenshot(page, "write_step3_content.png", debug)
+
+                log.step(4, 5, "발행 설정")
+                editor_url = page.url
+                with trace.step("publish"):
+                    schedule_dt = _parse_schedule_time(schedule_time)
+                    if schedule_dt:
+                        await publish_scheduled(frame, page, schedule_dt, is_public, tags)
+                    else:
+                        await publish_immediately(frame, page, is_public, tags)
+                    await _wait_for_publish_result(page, editor_url)
+                await _capture_debug_screenshot(page, "write_step4_done.png", debug)
+
+                log.step(5, 5, "발행 완료")
+                current_url = page.url
+                log.success("글 발행 완료", url=current_url[:50])
+                return _build_success_result(current_url)
+
+            except Exception as error:
+                if isinstance(error, SessionExpiredError) or _is_login_page(page):
+                    # 서버에서 끊긴 세션을 남겨 두면 이후 큐도 로그인 없이 계속 실패하므로 폐기
+                    log.warning("네이버 세션 만료", url=page.url[:50])
+                    await pool.revoke(key)
+                    return _build_error_result(
+                        "로그인 세션이 만료되었습니다. 다시 로그인해주세요.", SESSION_EXPIRED_ERROR
+                    )
+                if isinstance(error, PlaywrightTimeout):
+                    await _capture_debug_screenshot(page, "write_error_timeout.png", debug)
+                    return _build_error_result(f"타임아웃: {str(error)}")
+                await _capture_debug_screenshot(page, "write_error_unknown.png", debug)
+                return _build_error_result(f"에러: {str(error)}")
+            finally:
+                log.info("발행 단계별 소요(ms)", **trace.summary())
 
 
 __all__ = [
+    "NetworkTracker",
+    "SESSION_EXPIRED_ERROR",
+    "StepTrace",
     "write_blog_post",
 ]
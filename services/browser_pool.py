@@ -0,0 +1,404 @@
+"""
+Playwright 브라우저 풀 (계정별 컨텍스트 재사용 + 세션 저장)
+
+글 1건마다 Chromium 을 새로 띄우고(콜드 스타트) 큐마다 다시 로그인하던 방식 대신,
+프로세스당 브라우저 1개를 계속 띄워 두고 네이버 계정별 컨텍스트를 재사용한다.
+
+- 컨텍스트 풀: 계정 키별 최대 BROWSER_POOL_SIZE개 (가득 차면 가장 오래 안 쓴 유휴 컨텍스트 정리)
+- 같은 계정은 한 번에 한 페이지만 사용 (에디터 임시저장 팝업 등 충돌 방지)
+- 세션 저장: 사용 후 storage_state 를 BROWSER_STATE_DIR/<계정 해시>.json (0600) 에 저장
+  → 재시작/컨텍스트 재생성 후에도 로그인 상태 유지, 쿠키가 유효하면 재로그인 생략
+- 재활용: BROWSER_CONTEXT_MAX_USES번 사용 / BROWSER_CONTEXT_MAX_AGE초가 지나면 새 컨텍스트,
+  브라우저 연결이 끊기면 브라우저와 컨텍스트를 모두 다시 생성, 페이지 사용 중 컨텍스트가 닫히면 폐기
+- 로그인은 풀 밖의 임시 컨텍스트에서 시도하고, 성공했을 때만 계정 컨텍스트/세션 파일을 교체
+  → 틀린 비밀번호 등 실패한 로그인이 발행 중인 세션을 지우지 않음
+- 저장된 세션은 이 프로세스에서 실제 로그인으로 확인한 비밀번호(해시만 메모리에 보관)와
+  일치할 때만 재사용, 세션이 서버에서 끊기거나 로그아웃하면 revoke() 로 폐기
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from utils.logger import log
+
+BROWSER_HEADLESS = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"  # headless면 봇으로 감지됨
+BROWSER_SLOW_MO = int(os.getenv("BROWSER_SLOW_MO", "300"))
+BROWSER_POOL_SIZE = max(1, int(os.getenv("BROWSER_POOL_SIZE", "4")))
+BROWSER_CONTEXT_MAX_USES = int(os.getenv("BROWSER_CONTEXT_MAX_USES", "50"))
+BROWSER_CONTEXT_MAX_AGE = float(os.getenv("BROWSER_CONTEXT_MAX_AGE", "3600"))
+BROWSER_STATE_DIR = Path(os.getenv("BROWSER_STATE_DIR", str(Path("manuscripts") / ".sessions")))
+# 만료 시각이 없는 세션 쿠키는 저장 후 이 시간(초) 동안만 유효하다고 봄
+BROWSER_SESSION_TTL = float(os.getenv("BROWSER_SESSION_TTL", str(6 * 3600)))
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+NAVER_SESSION_COOKIES = ("NID_AUT", "NID_SES")
+
+BrowserLauncher = Callable[[], Awaitable[Any]]
+
+
+def account_key(account_id: Optional[str] = None, cookies: Optional[list] = None) -> str:
+    """컨텍스트 풀 키 (계정 ID, 없으면 로그인 쿠키 값 기준)"""
+    if account_id:
+        return f"account:{account_id}"
+    token = next(
+        (cookie.get("value", "") for cookie in cookies or [] if cookie.get("name") == "NID_AUT"),
+        "",
+    )
+    return f"cookie:{hashlib.sha256(token.encode()).hexdigest()[:16]}" if token else "anonymous"
+
+
+def _is_closed_error(error: BaseException) -> bool:
+    return "has been closed" in str(error) or "Target closed" in str(error)
+
+
+@dataclass
+class _PooledContext:
+    key: str
+    context: Any = None
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    busy: bool = False
+    closed: bool = False
+    revoked: bool = False
+
+
+class BrowserPool:
+    """브라우저 1개 + 계정별 컨텍스트 풀"""
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        max_uses: int = BROWSER_CONTEXT_MAX_USES,
+        max_age: float = BROWSER_CONTEXT_MAX_AGE,
+        state_dir: Path = BROWSER_STATE_DIR,
+        launch: Optional[BrowserLauncher] = None,
+    ) -> None:
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.state_dir = Path(state_dir)
+        self._launch = launch or self._launch_chromium
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._browser_lock = asyncio.Lock()
+        self._condition = asyncio.Condition()
+        self._contexts: "OrderedDict[str, _PooledContext]" = OrderedDict()
+        # 실제 로그인에 성공한 비밀번호 해시 (디스크에 저장하지 않음)
+        self._password_salt = secrets.token_bytes(16)
+        self._verified_passwords: Dict[str, bytes] = {}
+
+    # ---------- 브라우저 ----------
+    async def _launch_chromium(self) -> Any:
+        from playwright.async_api import async_playwright
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(headless=BROWSER_HEADLESS, slow_mo=BROWSER_SLOW_MO)
+
+    async def _ensure_browser(self) -> Any:
+        async with self._browser_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                log.warning("브라우저 연결 끊김 → 다시 실행")
+                # 끊긴 브라우저의 컨텍스트는 쓸 수 없음 (세션은 파일로 남아 있음)
+                for entry in self._contexts.values():
+                    entry.context = None
+            self._browser = await self._launch()
+            log.info("브라우저 실행", headless=BROWSER_HEADLESS, slow_mo=BROWSER_SLOW_MO)
+            return self._browser
+
+    # ---------- 세션 저장 ----------
+    def state_path(self, key: str) -> Path:
+        return self.state_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:24]}.json"
+
+    def saved_cookies(self, key: str) -> Optional[List[dict]]:
+        """저장된 세션의 네이버 로그인 쿠키가 아직 유효하면 쿠키 목록, 아니면 None"""
+        path = self.state_path(key)
+        try:
+            saved_at = path.stat().st_mtime
+            with open(path, "r", encoding="utf-8") as file:
+                cookies = json.load(file).get("cookies", [])
+        except (OSError, ValueError):
+            return None
+
+        now = time.time()
+        for name in NAVER_SESSION_COOKIES:
+            cookie = next((c for c in cookies if c.get("name") == name), None)
+            if cookie is None:
+                return None
+            expires = cookie.get("expires", -1)
+            if expires is not None and expires > 0:
+                if expires <= now:
+                    return None
+            elif now - saved_at > BROWSER_SESSION_TTL:
+                return None
+        return cookies
+
+    def forget(self, key: str) -> None:
+        """저장된 세션 삭제 (로그인 실패/로그아웃)"""
+        self.state_path(key).unlink(missing_ok=True)
+        self._verified_passwords.pop(key, None)
+
+    async def revoke(self, key: str) -> None:
+        """
+        세션 폐기 (저장 파일 + 확인된 비밀번호 + 컨텍스트의 쿠키)
+
+        사용 중인 컨텍스트는 반납될 때 저장 없이 폐기된다.
+        """
+        self.forget(key)
+        async with self._condition:
+            entry = self._contexts.get(key)
+            if entry is None:
+                return
+            entry.revoked = True
+            if entry.busy:
+                return
+            self._contexts.pop(key)
+        await self._close_context(entry, save=False)
+
+    # ---------- 비밀번호 확인 ----------
+    def _password_digest(self, key: str, password: str) -> bytes:
+        return hashlib.pbkdf2_hmac(
+            "sha256", f"{key}:{password}".encode(), self._password_salt, 100_000
+        )
+
+    def remember_password(self, key: str, password: str) -> None:
+        """실제 로그인에 성공한 비밀번호 기록 (해시만 메모리에 보관)"""
+        self._verified_passwords[key] = self._password_digest(key, password)
+
+    def password_matches(self, key: str, password: str) -> bool:
+        """이 프로세스에서 로그인으로 확인된 비밀번호와 같은지"""
+        verified = self._verified_passwords.get(key)
+        return verified is not None and hmac.compare_digest(
+            verified, self._password_digest(key, password)
+        )
+
+    async def _save_state(self, entry: _PooledContext) -> None:
+        if entry.context is None:
+            return
+        path = self.state_path(entry.key)
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            await entry.context.storage_state(path=str(path))
+            os.chmod(path, 0o600)
+        except Exception as e:
+            log.warning("세션 저장 실패", key=entry.key, error=str(e))
+
+    async def _close_context(self, entry: _PooledContext, save: bool = True) -> None:
+        if entry.context is None:
+            return
+        if save and not entry.closed:
+            await self._save_state(entry)
+        try:
+            await entry.context.close()
+        except Exception:
+            pass
+        entry.context = None
+
+    # ---------- 컨텍스트 풀 ----------
+    async def _acquire(self, key: str) -> _PooledContext:
+        evicted: List[_PooledContext] = []
+        async with self._condition:
+            while True:
+                entry = self._contexts.get(key)
+                if entry is not None:
+                    if not entry.busy:
+                        break
+                elif len(self._contexts) < self.size:
+                    entry = _PooledContext(key)
+                    self._contexts[key] = entry
+                    break
+                else:
+                    idle = next((e for e in self._contexts.values() if not e.busy), None)
+                    if idle is not None:
+                        # 가장 오래 안 쓴 유휴 컨텍스트 정리 (OrderedDict 앞쪽 = 오래 전 사용)
+                        self._contexts.pop(idle.key)
+                        evicted.append(idle)
+                        continue
+                await self._condition.wait()
+            entry.busy = True
+            self._contexts.move_to_end(key)
+
+        for idle in evicted:
+            await self._close_context(idle)
+        return entry
+
+    async def _release(self, entry: _PooledContext, discard: bool = False) -> None:
+        discard = discard or entry.revoked
+        if discard:
+            await self._close_context(entry, save=False)
+        async with self._condition:
+            entry.busy = False
+            entry.last_used = time.monotonic()
+            if discard and self._contexts.get(entry.key) is entry:
+                self._contexts.pop(entry.key)
+            self._condition.notify_all()
+
+    async def _prepare(self, entry: _PooledContext, fresh: bool) -> Any:
+        """건강한 컨텍스트 보장 (닫혔거나 오래됐거나 많이 썼으면 새로 만듦)"""
+        browser = await self._ensure_browser()
+        expired = entry.uses >= self.max_uses or time.monotonic() - entry.created_at > self.max_age
+        if entry.context is not None and (entry.closed or expired or fresh):
+            await self._close_context(entry, save=not fresh)
+
+        if entry.context is None:
+            state_path = self.state_path(entry.key)
+            context = await browser.new_context(
+                user_agent=USER_AGENT,
+                storage_state=str(state_path) if state_path.exists() and not fresh else None,
+            )
+            entry.closed = False
+            context.on("close", lambda *_: setattr(entry, "closed", True))
+            entry.context = context
+            entry.created_at = time.monotonic()
+            entry.uses = 0
+        return entry.context
+
+    @asynccontextmanager
+    async def page(
+        self,
+        key: str,
+        cookies: Optional[list] = None,
+        fresh: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        계정 컨텍스트에서 새 페이지 하나 사용
+
+        Args:
+            key: account_key() 로 만든 풀 키
+            cookies: 컨텍스트에 넣을 로그인 쿠키 (저장된 세션보다 우선)
+            fresh: True면 저장된 세션 없이 빈 컨텍스트
+
+        Yields:
+            Playwright Page (끝나면 닫고 세션 저장)
+        """
+        entry = await self._acquire(key)
+        discard = False
+        page = None
+        try:
+            context = await self._prepare(entry, fresh)
+            if cookies:
+                await context.add_cookies(cookies)
+            page = await context.new_page()
+            entry.uses += 1
+            yield page
+        except BaseException as e:
+            # 컨텍스트/브라우저가 닫혔으면 이 컨텍스트는 폐기 (세션 파일은 남김)
+            discard = _is_closed_error(e)
+            raise
+        finally:
+            if page is not None and not discard:
+                try:
+                    await page.close()
+                except Exception as e:
+                    discard = discard or _is_closed_error(e)
+            if not discard and not entry.closed and not entry.revoked:
+                await self._save_state(entry)
+            await self._release(entry, discard=discard)
+
+    @asynccontextmanager
+    async def login_page(self) -> AsyncIterator[Any]:
+        """
+        로그인 시도용 페이지 (풀에 넣지 않는 빈 임시 컨텍스트)
+
+        끝나면 컨텍스트를 저장 없이 닫는다. 성공한 로그인의 쿠키는 store_session() 으로 넘긴다.
+
+        Yields:
+            Playwright Page
+        """
+        browser = await self._ensure_browser()
+        context = await browser.new_context(user_agent=USER_AGENT)
+        try:
+            yield await context.new_page()
+        finally:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    async def store_session(self, key: str, cookies: list) -> None:
+        """
+        로그인에 성공한 쿠키로 계정 컨텍스트를 교체하고 세션 저장
+
+        기존 컨텍스트는 저장 없이 닫는다 (사용 중이면 반납될 때까지 기다림).
+        """
+        entry = await self._acquire(key)
+        discard = False
+        try:
+            context = await self._prepare(entry, fresh=True)
+            await context.add_cookies(cookies)
+            await self._save_state(entry)
+        except BaseException as e:
+            discard = _is_closed_error(e)
+            raise
+        finally:
+            await self._release(entry, discard=discard)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "browser": bool(self._browser is not None and self._browser.is_connected()),
+            "contexts": len(self._contexts),
+            "busy": sum(1 for entry in self._contexts.values() if entry.busy),
+            "size": self.size,
+        }
+
+    async def aclose(self) -> None:
+        """세션 저장 후 컨텍스트/브라우저 종료"""
+        for entry in list(self._contexts.values()):
+            await self._close_context(entry)
+        self._contexts.clear()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 공유 브라우저 풀"""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
+
+
+async def aclose_browser_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+
+
+__all__ = [
+    "BrowserPool",
+    "USER_AGENT",
+    "account_key",
+    "aclose_browser_pool",
+    "get_browser_pool",
+]
@@ -0,0 +1,621 @@
+"""
+오래 걸리는 배치 작업 큐 (SQLite 저장 + 항목별 진행 상태 + 재시작 후 이어하기)
+
+/generate/batch, /bot/auto-schedule, /bot/upload-schedule 처럼 몇 시간씩 걸리는 작업을
+HTTP 요청 하나 안에서 돌리면 연결이 끊기거나 머신이 멈출 때(fly.toml auto_stop_machines)
+진행 상황이 모두 사라진다. 요청은 작업 ID만 바로 돌려주고, 실제 처리는 백그라운드 워커가 한다.
+
+- 저장소: JOB_DB_PATH (SQLite, 기본 manuscripts/jobs.sqlite3 → 봇 파일 큐와 같은 볼륨)
+  - jobs: 작업 1건 (종류, 파라미터, 상태, 최종 결과)
+  - job_items: 작업 안 항목 (키워드/큐/원고) 별 상태 + 결과 + 중간 진행 기록
+- 워커: run_job_worker (api lifespan) 가 queued 작업을 JOB_CONCURRENCY개씩 실행
+- 이어하기: 시작 시 running 으로 남은 작업/항목을 queued/pending 으로 되돌리고,
+  핸들러는 pending_items() 로 끝나지 않은 항목만 다시 처리한다
+  (resume_job 으로 다시 넣을 때는 failed 항목도 다시 처리)
+- SQLite 쓰기/조회는 블로킹이므로 코루틴 API(JobContext, cancel/resume, watch, 워커)는
+  asyncio.to_thread 로 실행하고, 동기 조회 API(view/list)는 라우터가 스레드풀에서 부른다
+- 비밀값(계정 비밀번호): 디스크에 저장하지 않고 메모리에만 보관
+  → 재시작 후 비밀값이 필요한 작업은 paused 가 되고, resume_job 으로 다시 넣으면 이어서 실행
+- 취소: cancel_job → 대기 중이면 바로 cancelled, 실행 중이면 태스크 취소
+- 진행 상황: get_job (폴링) / watch_job (변경될 때마다 스냅샷, SSE 용)
+
+작업 상태: queued | running | paused | completed | failed | cancelled
+항목 상태: pending | running | done | failed | cancelled
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from utils.logger import log
+
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", str(Path("manuscripts") / "jobs.sqlite3"))
+JOB_CONCURRENCY = max(1, int(os.getenv("JOB_CONCURRENCY", "1")))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+RESUMABLE_STATUSES = ("paused", "failed", "cancelled")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    version INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, idx)
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _loads(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
+
+
+@dataclass
+class JobItem:
+    """작업 안 항목 하나"""
+
+    index: int
+    key: str
+    payload: Dict[str, Any]
+    status: str = "pending"
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+class JobStore:
+    """jobs / job_items SQLite 저장소 (연결 1개를 잠금으로 공유, 첫 사용 때 파일 생성)"""
+
+    def __init__(self, path: str = JOB_DB_PATH) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _write(self, sql: str, params: Sequence[Any] = ()) -> int:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return conn.execute(sql, params).rowcount
+
+    def _touch(self, job_id: str, **fields: Any) -> int:
+        """작업 필드 갱신 + version 증가 (watch_job 이 변경을 감지하는 기준)"""
+        assignments = "".join(f", {name} = ?" for name in fields)
+        return self._write(
+            f"UPDATE jobs SET version = version + 1, updated_at = ?{assignments} WHERE id = ?",
+            (_now(), *fields.values(), job_id),
+        )
+
+    # ---------- 생성/조회 ----------
+    def create_job(self, kind: str, items: Sequence[JobItem], params: Dict[str, Any]) -> str:
+        job_id = uuid.uuid4().hex[:12]
+        now = _now()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO jobs (id, kind, status, params, created_at, updated_at) "
+                    "VALUES (?, ?, 'queued', ?, ?, ?)",
+                    (job_id, kind, _dumps(params), now, now),
+                )
+                conn.executemany(
+                    "INSERT INTO job_items (job_id, idx, key, payload, status, updated_at) "
+                    "VALUES (?, ?, ?, ?, 'pending', ?)",
+                    [(job_id, item.index, item.key, _dumps(item.payload), now) for item in items],
+                )
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = _loads(job["params"])
+        job["result"] = _loads(job["result"])
+        return job
+
+    def list_jobs(
+        self, status: Optional[str] = None, kind: Optional[str] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        where, params = [], []
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        if kind:
+            where.append("kind = ?")
+            params.append(kind)
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT id FROM jobs {clause} ORDER BY created_at DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [job for job in (self.get_job(row["id"]) for row in rows) if job]
+
+    def get_items(self, job_id: str) -> List[JobItem]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT * FROM job_items WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall()
+        return [
+            JobItem(
+                index=row["idx"],
+                key=row["key"],
+                payload=_loads(row["payload"]),
+                status=row["status"],
+                result=_loads(row["result"]),
+                error=row["error"],
+                attempts=row["attempts"],
+            )
+            for row in rows
+        ]
+
+    def count_items(self, job_id: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT status, COUNT(*) AS n FROM job_items WHERE job_id = ? GROUP BY status",
+                (job_id,),
+            ).fetchall()
+        counts = {status: 0 for status in ("pending", "running", "done", "failed", "cancelled")}
+        counts.update({row["status"]: row["n"] for row in rows})
+        counts["total"] = sum(counts.values())
+        return counts
+
+    # ---------- 작업 상태 ----------
+    def claim_next_job(self, exclude: Sequence[str] = ()) -> Optional[Dict[str, Any]]:
+        """가장 오래된 queued 작업 하나를 running 으로 바꿔 반환"""
+        placeholders = ",".join("?" for _ in exclude)
+        skip = f"AND id NOT IN ({placeholders})" if exclude else ""
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT id FROM jobs WHERE status = 'queued' {skip} ORDER BY created_at LIMIT 1",
+                tuple(exclude),
+            ).fetchone()
+            if row is None:
+                return None
+            started = self._write(
+                "UPDATE jobs SET status = 'running', error = NULL, version = version + 1, "
+                "updated_at = ?, started_at = COALESCE(started_at, ?) "
+                "WHERE id = ? AND status = 'queued'",
+                (_now(), _now(), row["id"]),
+            )
+            return self.get_job(row["id"]) if started else None
+
+    def set_status(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        fields: Dict[str, Any] = {"status": status, "error": error}
+        if status in TERMINAL_STATUSES:
+            fields["finished_at"] = _now()
+        self._touch(job_id, **fields)
+
+    def finish_job(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        self._touch(job_id, status=status, result=_dumps(result), error=error, finished_at=_now())
+        if status == "cancelled":
+            self._write(
+                "UPDATE job_items SET status = 'cancelled', updated_at = ? "
+                "WHERE job_id = ? AND status IN ('pending', 'running')",
+                (_now(), job_id),
+            )
+
+    def request_cancel(self, job_id: str) -> None:
+        self._touch(job_id, cancel_requested=1)
+
+    def requeue(self, job_id: str, retry_failed: bool = False) -> None:
+        """
+        멈춘/실패/취소된 작업을 끝나지 않은 항목부터 다시 대기열에 넣음
+
+        Args:
+            job_id: 작업 ID
+            retry_failed: True면 failed 항목도 pending 으로 되돌려 다시 처리
+                          (재시작 복구에서는 False → 실패한 항목을 매번 다시 돌리지 않음)
+        """
+        statuses = ("running", "cancelled", "failed") if retry_failed else ("running", "cancelled")
+        placeholders = ",".join("?" for _ in statuses)
+        self._write(
+            "UPDATE job_items SET status = 'pending', error = NULL, updated_at = ? "
+            f"WHERE job_id = ? AND status IN ({placeholders})",
+            (_now(), job_id, *statuses),
+        )
+        self._touch(job_id, status="queued", error=None, cancel_requested=0, finished_at=None)
+
+    def recover_interrupted(self) -> List[str]:
+        """프로세스가 죽어 running 으로 남은 작업 → queued (항목은 pending 으로)"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id FROM jobs WHERE status = 'running'"
+            ).fetchall()
+        job_ids = [row["id"] for row in rows]
+        for job_id in job_ids:
+            self.requeue(job_id)
+        return job_ids
+
+    # ---------- 항목 상태 ----------
+    def update_item(
+        self,
+        job_id: str,
+        index: int,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        attempt: bool = False,
+    ) -> None:
+        self._write(
+            "UPDATE job_items SET status = ?, result = COALESCE(?, result), error = ?, "
+            "attempts = attempts + ?, updated_at = ? WHERE job_id = ? AND idx = ?",
+            (status, _dumps(result), error, 1 if attempt else 0, _now(), job_id, index),
+        )
+        self._touch(job_id)
+
+
+class JobContext:
+    """
+    핸들러에 넘기는 작업 실행 문맥 (항목 상태 기록 + 이어하기용 조회)
+
+    저장소 접근은 모두 코루틴 (SQLite 호출을 스레드에서 실행해 이벤트 루프를 막지 않음)
+    """
+
+    def __init__(self, store: JobStore, job: Dict[str, Any], secrets: Dict[str, str]) -> None:
+        self.store = store
+        self.job_id: str = job["id"]
+        self.kind: str = job["kind"]
+        self.params: Dict[str, Any] = job["params"]
+        self.secrets = secrets
+        # 처음 시작한 시각 (재개해도 유지 → 전체 소요시간 계산용)
+        self.started_at = datetime.fromisoformat(job["started_at"] or _now())
+
+    @property
+    def elapsed(self) -> float:
+        return (datetime.now() - self.started_at).total_seconds()
+
+    async def get_items(self) -> List[JobItem]:
+        return await asyncio.to_thread(self.store.get_items, self.job_id)
+
+    async def pending_items(self) -> List[JobItem]:
+        """아직 끝나지 않은 항목 (재시작 후에는 중단된 항목부터)"""
+        return [item for item in await self.get_items() if item.status in ("pending", "running")]
+
+    async def _update_item(self, index: int, status: str, **fields: Any) -> None:
+        await asyncio.to_thread(self.store.update_item, self.job_id, index, status, **fields)
+
+    async def start_item(self, index: int) -> None:
+        await self._update_item(index, "running", attempt=True)
+
+    async def save_progress(self, index: int, progress: Dict[str, Any]) -> None:
+        """항목 중간 진행 기록 (재시작 후 item.result 로 이어서 처리)"""
+        await self._update_item(index, "running", result=progress)
+
+    async def finish_item(self, index: int, result: Dict[str, Any]) -> None:
+        await self._update_item(index, "done", result=result)
+
+    async def fail_item(self, index: int, error: str, result: Optional[Dict[str, Any]] = None) -> None:
+        await self._update_item(index, "failed", result=result, error=error)
+
+
+JobRun = Callable[[JobContext], Awaitable[Optional[Dict[str, Any]]]]
+
+
+@dataclass
+class JobHandler:
+    run: JobRun
+    # 계정 비밀번호처럼 디스크에 저장하지 않는 값이 있어야 실행 가능한 작업
+    requires_secrets: bool = False
+
+
+_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(kind: str, run: JobRun, requires_secrets: bool = False) -> None:
+    """
+    작업 종류별 실행 함수 등록
+
+    Args:
+        kind: 작업 종류 (예: "generate_batch")
+        run: JobContext → 최종 결과 dict 코루틴 (항목 상태는 ctx로 기록)
+        requires_secrets: True면 메모리에 비밀값이 없을 때 실행하지 않고 paused
+    """
+    _HANDLERS[kind] = JobHandler(run, requires_secrets)
+
+
+class JobQueue:
+    """작업 제출/취소/재개 + 백그라운드 실행"""
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        concurrency: int = JOB_CONCURRENCY,
+        poll_interval: float = JOB_POLL_INTERVAL,
+    ) -> None:
+        self.store = store or JobStore()
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._secrets: Dict[str, Dict[str, str]] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # ---------- 외부 API ----------
+    def submit(
+        self,
+        kind: str,
+        items: Sequence[JobItem],
+        params: Dict[str, Any],
+        secrets: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        작업 등록 (바로 반환, 실행은 워커가)
+
+        Args:
+            kind: register_job_handler 로 등록한 작업 종류
+            items: 항목 목록 (index 순서 = 처리/보고 순서)
+            params: 핸들러 파라미터 (디스크 저장 → 비밀번호 넣지 말 것)
+            secrets: 메모리에만 보관할 비밀값
+
+        Returns:
+            작업 ID
+
+        Raises:
+            ValueError: 등록되지 않은 작업 종류
+        """
+        if kind not in _HANDLERS:
+            raise ValueError(f"알 수 없는 작업 종류: {kind}")
+        job_id = self.store.create_job(kind, items, params)
+        if secrets:
+            self._secrets[job_id] = dict(secrets)
+        log.info("작업 등록", job_id=job_id, kind=kind, items=len(items))
+        self._notify()
+        return job_id
+
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 취소 (없으면 None, 이미 끝난 작업은 그대로)"""
+        job = await asyncio.to_thread(self.store.get_job, job_id)
+        if job is None:
+            return None
+        if job["status"] in ("queued", "paused"):
+            await asyncio.to_thread(self.store.finish_job, job_id, "cancelled", error="사용자 취소")
+            self._secrets.pop(job_id, None)
+        elif job["status"] == "running":
+            await asyncio.to_thread(self.store.request_cancel, job_id)
+            task = self._running.get(job_id)
+            if task is not None:
+                task.cancel()
+        return await asyncio.to_thread(self.view, job_id)
+
+    async def resume(self, job_id: str, secrets: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        paused/failed/cancelled 작업을 끝나지 않은 항목부터 다시 실행 (failed 항목 포함)
+
+        Raises:
+            ValueError: 재개할 수 없는 상태
+        """
+        job = await asyncio.to_thread(self.store.get_job, job_id)
+        if job is None:
+            return None
+        if job["status"] not in RESUMABLE_STATUSES:
+            raise ValueError(f"{job['status']} 상태의 작업은 재개할 수 없습니다.")
+        if secrets:
+            self._secrets[job_id] = dict(secrets)
+        await asyncio.to_thread(self.store.requeue, job_id, retry_failed=True)
+        self._notify()
+        return await asyncio.to_thread(self.view, job_id)
+
+    def view(self, job_id: str, include_items: bool = True) -> Optional[Dict[str, Any]]:
+        """API 응답용 작업 상태 (파라미터는 제외)"""
+        job = self.store.get_job(job_id)
+        if job is None:
+            return None
+        view: Dict[str, Any] = {
+            "job_id": job["id"],
+            "kind": job["kind"],
+            "status": job["status"],
+            "error": job["error"],
+            "progress": self.store.count_items(job_id),
+            "result": job["result"],
+            "created_at": job["created_at"],
+            "started_at": job["started_at"],
+            "finished_at": job["finished_at"],
+            "updated_at": job["updated_at"],
+        }
+        if include_items:
+            view["items"] = [
+                {
+                    "index": item.index,
+                    "key": item.key,
+                    "status": item.status,
+                    "attempts": item.attempts,
+                    "error": item.error,
+                    "result": item.result,
+                }
+                for item in self.store.get_items(job_id)
+            ]
+        return view
+
+    def list(self, status: Optional[str] = None, kind: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        return [
+            self.view(job["id"], include_items=False)
+            for job in self.store.list_jobs(status=status, kind=kind, limit=limit)
+        ]
+
+    async def watch(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """작업이 바뀔 때마다 스냅샷 (끝나거나 paused 가 되면 종료)"""
+        version = -1
+        while True:
+            job = await asyncio.to_thread(self.store.get_job, job_id)
+            if job is None:
+                return
+            if job["version"] != version:
+                version = job["version"]
+                yield await asyncio.to_thread(self.view, job_id)
+            if job["status"] in (*TERMINAL_STATUSES, "paused"):
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    # ---------- 실행 ----------
+    async def _execute(self, job: Dict[str, Any]) -> None:
+        job_id = job["id"]
+        handler = _HANDLERS.get(job["kind"])
+        if handler is None:
+            await asyncio.to_thread(
+                self.store.finish_job, job_id, "failed", error=f"알 수 없는 작업 종류: {job['kind']}"
+            )
+            return
+        if handler.requires_secrets and job_id not in self._secrets:
+            await asyncio.to_thread(
+                self.store.set_status,
+                job_id,
+                "paused",
+                error="재시작으로 계정 정보가 사라졌습니다. 비밀번호와 함께 재개해 주세요.",
+            )
+            log.warning("작업 일시정지 (비밀값 없음)", job_id=job_id)
+            return
+
+        context = JobContext(self.store, job, self._secrets.get(job_id, {}))
+        log.info("작업 시작", job_id=job_id, kind=job["kind"])
+        try:
+            result = await handler.run(context)
+        except asyncio.CancelledError:
+            current = await asyncio.to_thread(self.store.get_job, job_id)
+            if self._stopping and not current["cancel_requested"]:
+                # 서버 종료 → 다음 시작 때 이어서 실행
+                await asyncio.to_thread(self.store.requeue, job_id)
+                log.warning("서버 종료로 작업 중단 → 재시작 후 이어서 실행", job_id=job_id)
+            else:
+                await asyncio.to_thread(self.store.finish_job, job_id, "cancelled", error="사용자 취소")
+                self._secrets.pop(job_id, None)
+                log.warning("작업 취소", job_id=job_id)
+            raise
+        except Exception as e:
+            await asyncio.to_thread(self.store.finish_job, job_id, "failed", error=str(e))
+            log.error("작업 실패", job_id=job_id, error=str(e))
+            return
+
+        await asyncio.to_thread(self.store.finish_job, job_id, "completed", result=result)
+        self._secrets.pop(job_id, None)
+        log.success("작업 완료", job_id=job_id, kind=job["kind"])
+
+    def _start(self, job: Dict[str, Any]) -> None:
+        task = asyncio.create_task(self._execute(job))
+        self._running[job["id"]] = task
+
+        def done(_: asyncio.Task) -> None:
+            self._running.pop(job["id"], None)
+            self._notify()
+
+        task.add_done_callback(done)
+
+    async def run_worker(self) -> None:
+        """
+        queued 작업을 concurrency개씩 실행하는 루프 (취소될 때까지)
+
+        시작 시 이전 프로세스에서 running 으로 남은 작업을 다시 대기열에 넣는다.
+        """
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        recovered = await asyncio.to_thread(self.store.recover_interrupted)
+        if recovered:
+            log.info("중단된 작업 이어서 실행", count=len(recovered))
+
+        try:
+            while True:
+                self._wakeup.clear()
+                while len(self._running) < self.concurrency:
+                    job = await asyncio.to_thread(self.store.claim_next_job, list(self._running))
+                    if job is None:
+                        break
+                    self._start(job)
+                # wait_for 는 내부 대기가 끝나는 순간 들어온 cancel()을 삼킬 수 있음 (3.11)
+                # → asyncio.timeout 으로 취소를 그대로 전파
+                try:
+                    async with asyncio.timeout(self.poll_interval):
+                        await self._wakeup.wait()
+                except TimeoutError:
+                    pass
+        finally:
+            self._stopping = True
+            tasks = list(self._running.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """프로세스 공유 작업 큐"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
+
+
+async def run_job_worker() -> None:
+    """api lifespan 에서 띄우는 백그라운드 작업 워커"""
+    await get_job_queue().run_worker()
+
+
+__all__ = [
+    "JOB_DB_PATH",
+    "JobContext",
+    "JobItem",
+    "JobQueue",
+    "JobStore",
+    "get_job_queue",
+    "register_job_handler",
+    "run_job_worker",
+]
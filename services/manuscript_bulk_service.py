@@ -0,0 +1,251 @@
+"""
+원고 일괄 관리 (삭제 / 노출여부 / 내용 수정)
+
+큐레이션에서 원고 수백 건을 한 번에 정리할 때 건별 API(find_one → update_one)를
+수백 번 부르지 않도록, (카테고리, ID) 목록을 카테고리별로 묶어 쓰기 한 번에 처리한다.
+
+- 카테고리별 쓰기: 노출여부는 update_many, 내용 수정은 bulk_write(UpdateOne...)
+- 쓰기 전 조회 없음: 노출여부는 토글 대신 목표 값을 받고,
+  일치 수가 모자랄 때만 _id를 한 번 조회해 없는 원고를 가려낸다
+- 삭제는 통계 집계 차감에 필요한 필드만 카테고리별 $in 조회 한 번으로 읽고,
+  아직 삭제되지 않은 원고만 표시한다 (이미 삭제된 원고는 unchanged)
+- 카테고리들은 병렬로 처리 (utils.category_fanout), 원고 이벤트는 emit_many로 한 번에 전달
+- 항목별 결과 status: ok | unchanged | not_found | invalid_id | failed
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from mongodb_service import get_mongo_client
+from services.manuscript_events import MANUSCRIPTS_COLLECTION, ManuscriptEvent, emit_many
+from utils.category_fanout import fan_out_categories
+
+BULK_MANAGE_MAX_ITEMS = int(os.getenv("BULK_MANAGE_MAX_ITEMS", "1000"))
+BULK_MANAGE_TIMEOUT_MS = int(os.getenv("BULK_MANAGE_TIMEOUT_MS", "30000"))
+
+# 삭제 이벤트 구독자(집계/자동완성/검색 색인)가 쓰는 필드
+_DELETE_EVENT_PROJECTION = {"createdAt": 1, "engine": 1, "keyword": 1, "deleted": 1}
+# 수정 이벤트로 검색 색인을 다시 만들 때 쓰는 필드
+_UPDATE_EVENT_PROJECTION = {"keyword": 1, "content": 1, "createdAt": 1, "deleted": 1, "updatedAt": 1}
+
+# 카테고리 하나 처리 결과: ({ObjectId: status}, 이벤트 목록)
+CategoryOutcome = Tuple[Dict[Any, str], List[ManuscriptEvent]]
+
+
+def _result(category: str, manuscript_id: str, status: str, **extra: Any) -> Dict[str, Any]:
+    return {
+        "category": category,
+        "manuscriptId": manuscript_id,
+        "ok": status in ("ok", "unchanged"),
+        "status": status,
+        **extra,
+    }
+
+
+def _collection(category: str):
+    return get_mongo_client()[category][MANUSCRIPTS_COLLECTION]
+
+
+def _existing_ids(category: str, ids: List[ObjectId]) -> set:
+    return {doc["_id"] for doc in _collection(category).find({"_id": {"$in": ids}}, {"_id": 1})}
+
+
+def _run_bulk(
+    items: Sequence[Dict[str, Any]],
+    apply: Callable[[str, List[Tuple[ObjectId, Dict[str, Any]]]], CategoryOutcome],
+) -> Dict[str, Any]:
+    """
+    항목을 카테고리별로 묶어 apply를 병렬 실행하고 항목 순서대로 결과 조립
+
+    Raises:
+        ValueError: 항목이 없거나 BULK_MANAGE_MAX_ITEMS 초과
+    """
+    if not items:
+        raise ValueError("처리할 원고가 없습니다.")
+    if len(items) > BULK_MANAGE_MAX_ITEMS:
+        raise ValueError(f"한 번에 최대 {BULK_MANAGE_MAX_ITEMS}건까지 처리할 수 있습니다.")
+
+    groups: Dict[str, List[Tuple[ObjectId, Dict[str, Any]]]] = {}
+    for item in items:
+        try:
+            object_id = ObjectId(item["manuscriptId"])
+        except Exception:
+            continue
+        groups.setdefault(item["category"], []).append((object_id, item))
+
+    outcome = fan_out_categories(
+        lambda category: apply(category, groups[category]),
+        list(groups),
+        timeout_ms=BULK_MANAGE_TIMEOUT_MS,
+    )
+
+    events: List[ManuscriptEvent] = []
+    statuses: Dict[str, Dict[Any, str]] = {}
+    for category, (category_statuses, category_events) in outcome.results.items():
+        statuses[category] = category_statuses
+        events.extend(category_events)
+
+    results = []
+    for item in items:
+        category, manuscript_id = item["category"], item["manuscriptId"]
+        if not ObjectId.is_valid(manuscript_id):
+            results.append(_result(category, manuscript_id, "invalid_id"))
+            continue
+        if category not in statuses:
+            # 카테고리 처리 실패/시간초과 → 반영 여부를 알 수 없음
+            error = outcome.failed.get(category, "시간 초과")
+            results.append(_result(category, manuscript_id, "failed", error=error))
+            continue
+        results.append(_result(category, manuscript_id, statuses[category][ObjectId(manuscript_id)]))
+
+    emit_many(events)
+
+    succeeded = sum(1 for result in results if result["ok"])
+    return {
+        "ok": succeeded == len(results),
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+# ---------- 삭제 ----------
+def _delete_in_category(
+    category: str, entries: List[Tuple[ObjectId, Dict[str, Any]]]
+) -> CategoryOutcome:
+    ids = list(dict.fromkeys(object_id for object_id, _ in entries))
+    collection = _collection(category)
+
+    documents = {
+        doc["_id"]: doc for doc in collection.find({"_id": {"$in": ids}}, _DELETE_EVENT_PROJECTION)
+    }
+    pending = [object_id for object_id, doc in documents.items() if not doc.get("deleted")]
+
+    deleted = set()
+    if pending:
+        collection.update_many(
+            {"_id": {"$in": pending}, "deleted": {"$ne": True}},
+            {"$set": {"deleted": True, "deletedAt": datetime.now()}},
+        )
+        deleted = set(pending)
+
+    statuses = {
+        object_id: "ok" if object_id in deleted else "unchanged" if object_id in documents else "not_found"
+        for object_id in ids
+    }
+    events = [
+        ManuscriptEvent("delete", category, str(object_id), documents[object_id])
+        for object_id in pending
+    ]
+    return statuses, events
+
+
+def bulk_delete_manuscripts(items: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    원고 일괄 소프트 삭제
+
+    Args:
+        items: [{"category": ..., "manuscriptId": ...}, ...]
+
+    Returns:
+        {"ok", "total", "succeeded", "failed", "results": [항목별 결과]}
+
+    Raises:
+        ValueError: 항목 없음/개수 초과
+    """
+    return _run_bulk(items, _delete_in_category)
+
+
+# ---------- 노출여부 ----------
+def bulk_set_visibility(items: Sequence[Dict[str, Any]], visible: bool) -> Dict[str, Any]:
+    """
+    원고 노출여부 일괄 지정 (토글이 아니라 목표 값으로 설정)
+
+    Args:
+        items: [{"category": ..., "manuscriptId": ...}, ...]
+        visible: 설정할 노출여부
+
+    Returns:
+        {"ok", "total", "succeeded", "failed", "results": [항목별 결과]}
+
+    Raises:
+        ValueError: 항목 없음/개수 초과
+    """
+
+    def apply(category: str, entries: List[Tuple[ObjectId, Dict[str, Any]]]) -> CategoryOutcome:
+        ids = list(dict.fromkeys(object_id for object_id, _ in entries))
+        result = _collection(category).update_many(
+            {"_id": {"$in": ids}},
+            {"$set": {"visible": visible, "visibilityUpdatedAt": datetime.now()}},
+        )
+        found = set(ids) if result.matched_count == len(ids) else _existing_ids(category, ids)
+
+        statuses = {object_id: "ok" if object_id in found else "not_found" for object_id in ids}
+        events = [
+            ManuscriptEvent("visibility", category, str(object_id))
+            for object_id in ids
+            if object_id in found
+        ]
+        return statuses, events
+
+    return _run_bulk(items, apply)
+
+
+# ---------- 내용 수정 ----------
+def bulk_update_manuscripts(items: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    원고 내용 일괄 수정
+
+    Args:
+        items: [{"category": ..., "manuscriptId": ..., "content": ..., "memo": 선택}, ...]
+               (같은 원고가 여러 번 오면 마지막 내용이 남음)
+
+    Returns:
+        {"ok", "total", "succeeded", "failed", "results": [항목별 결과]}
+
+    Raises:
+        ValueError: 항목 없음/개수 초과
+    """
+
+    def apply(category: str, entries: List[Tuple[ObjectId, Dict[str, Any]]]) -> CategoryOutcome:
+        now = datetime.now()
+        operations = []
+        for object_id, item in entries:
+            update_data: Dict[str, Any] = {"content": item["content"], "updatedAt": now}
+            memo: Optional[str] = item.get("memo")
+            if memo:
+                update_data["updateMemo"] = memo
+            operations.append(UpdateOne({"_id": object_id}, {"$set": update_data}))
+
+        collection = _collection(category)
+        collection.bulk_write(operations, ordered=False)
+
+        # 수정 후 문서를 한 번에 읽어 존재 여부 확인 + 검색 색인 이벤트에 사용
+        ids = list(dict.fromkeys(object_id for object_id, _ in entries))
+        documents = {
+            doc["_id"]: doc for doc in collection.find({"_id": {"$in": ids}}, _UPDATE_EVENT_PROJECTION)
+        }
+
+        statuses = {object_id: "ok" if object_id in documents else "not_found" for object_id in ids}
+        events = [
+            ManuscriptEvent("update", category, str(object_id), document)
+            for object_id, document in documents.items()
+        ]
+        return statuses, events
+
+    return _run_bulk(items, apply)
+
+
+__all__ = [
+    "BULK_MANAGE_MAX_ITEMS",
+    "bulk_delete_manuscripts",
+    "bulk_set_visibility",
+    "bulk_update_manuscripts",
+]
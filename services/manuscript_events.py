@@ -0,0 +1,130 @@
+"""
+원고 변경 이벤트
+
+원고가 생성/수정/삭제/복구/노출변경될 때 구독자(검색 색인 등)에게 알린다.
+각 카테고리 DB의 manuscripts 컬렉션 쓰기 경로에서 emit/aemit을 호출한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+from utils.logger import log
+
+MANUSCRIPTS_COLLECTION = "manuscripts"
+
+ManuscriptEventKind = Literal["insert", "update", "delete", "restore", "visibility"]
+
+
+@dataclass
+class ManuscriptEvent:
+    kind: ManuscriptEventKind
+    category: str
+    manuscript_id: str
+    document: Optional[Dict[str, Any]] = field(default=None)
+
+
+ManuscriptEventHandler = Callable[[ManuscriptEvent], None]
+ManuscriptBatchHandler = Callable[[List[ManuscriptEvent]], None]
+
+_handlers: List[ManuscriptEventHandler] = []
+_batch_handlers: Dict[ManuscriptEventHandler, ManuscriptBatchHandler] = {}
+_handlers_lock = threading.Lock()
+
+
+def subscribe(
+    handler: ManuscriptEventHandler,
+    batch_handler: Optional[ManuscriptBatchHandler] = None,
+) -> None:
+    """
+    이벤트 핸들러 등록 (같은 핸들러는 한 번만)
+
+    Args:
+        handler: 이벤트 1건 핸들러
+        batch_handler: emit_many로 여러 건을 한 번에 받을 핸들러 (없으면 handler를 건별 호출)
+    """
+    with _handlers_lock:
+        if handler not in _handlers:
+            _handlers.append(handler)
+        if batch_handler is not None:
+            _batch_handlers[handler] = batch_handler
+
+
+def unsubscribe(handler: ManuscriptEventHandler) -> None:
+    with _handlers_lock:
+        if handler in _handlers:
+            _handlers.remove(handler)
+        _batch_handlers.pop(handler, None)
+
+
+def emit(event: ManuscriptEvent) -> None:
+    """
+    등록된 핸들러를 순서대로 실행
+
+    핸들러 오류는 로그만 남기고 원래 쓰기 작업에는 영향을 주지 않는다.
+    """
+    with _handlers_lock:
+        handlers = list(_handlers)
+
+    for handler in handlers:
+        try:
+            handler(event)
+        except Exception as e:
+            log.warning(
+                f"원고 이벤트 처리 실패: {e}",
+                kind=event.kind,
+                category=event.category,
+            )
+
+
+def emit_many(events: List[ManuscriptEvent]) -> None:
+    """
+    여러 이벤트를 한 번에 전달 (일괄 관리 API용)
+
+    batch_handler가 있는 구독자는 목록 전체를 한 번에 받아 DB 쓰기를 묶고,
+    없는 구독자는 건별로 받는다.
+    """
+    if not events:
+        return
+
+    with _handlers_lock:
+        handlers = [(handler, _batch_handlers.get(handler)) for handler in _handlers]
+
+    for handler, batch_handler in handlers:
+        if batch_handler is not None:
+            try:
+                batch_handler(events)
+            except Exception as e:
+                log.warning(f"원고 이벤트 일괄 처리 실패: {e}", count=len(events))
+            continue
+        for event in events:
+            try:
+                handler(event)
+            except Exception as e:
+                log.warning(
+                    f"원고 이벤트 처리 실패: {e}",
+                    kind=event.kind,
+                    category=event.category,
+                )
+
+
+async def aemit(event: ManuscriptEvent) -> None:
+    """emit의 async 버전 (핸들러가 블로킹 I/O를 하므로 스레드에서 실행)"""
+    with _handlers_lock:
+        if not _handlers:
+            return
+    await asyncio.to_thread(emit, event)
+
+
+__all__ = [
+    "MANUSCRIPTS_COLLECTION",
+    "ManuscriptEvent",
+    "aemit",
+    "emit",
+    "emit_many",
+    "subscribe",
+    "unsubscribe",
+]
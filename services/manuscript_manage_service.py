@@ -7,11 +7,12 @@ from typing import Any, Optional
 
 from bson import ObjectId
 from fastapi import HTTPException
-from pymongo import MongoClient
 
 from _constants.categories import CATEGORIES
-from config import MONGO_URI
 from mongodb_service import MongoDBService
+from services.manuscript_events import ManuscriptEvent, emit
+from services.manuscript_pagination import paginate_manuscripts
+from services.search_results import build_projection, parse_fields, shape_document
 
 
 VisibleManuscriptsResult = dict[str, Any]
@@ -62,6 +63,9 @@ def delete_manuscript_by_id(manuscript_id: str, category: str) -> dict[str, Any]
         if result.modified_count == 0:
             raise HTTPException(status_code=500, detail="삭제 처리 실패")
 
+        # 이미 삭제된 원고를 다시 삭제하면 집계가 두 번 빠지지 않도록 첫 삭제만 알림
+        if not document.get("deleted"):
+            emit(ManuscriptEvent("delete", category, manuscript_id, document))
         return {"ok": True, "deletedId": manuscript_id}
 
     except ValueError as error:
@@ -77,6 +81,43 @@ def delete_manuscript_by_id(manuscript_id: str, category: str) -> dict[str, Any]
         db_service.close_connection()
 
 
+def restore_manuscript_by_id(manuscript_id: str, category: str) -> dict[str, Any]:
+    db_service = MongoDBService()
+
+    try:
+        object_id = _parse_object_id(manuscript_id)
+        db_service.set_db_name(db_name=category)
+
+        document = db_service.db["manuscripts"].find_one({"_id": object_id, "deleted": True})
+        if not document:
+            raise HTTPException(
+                status_code=404,
+                detail=f"삭제된 원고를 찾을 수 없습니다. (ID: {manuscript_id})",
+            )
+
+        result = db_service.db["manuscripts"].update_one(
+            {"_id": object_id, "deleted": True},
+            {"$set": {"deleted": False, "restoredAt": datetime.now()}, "$unset": {"deletedAt": ""}},
+        )
+        if result.modified_count == 0:
+            raise HTTPException(status_code=500, detail="복구 처리 실패")
+
+        emit(ManuscriptEvent("restore", category, manuscript_id, document))
+        return {"ok": True, "restoredId": manuscript_id}
+
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    except HTTPException:
+        raise
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail=f"원고 복구 중 오류 발생: {str(error)}",
+        )
+    finally:
+        db_service.close_connection()
+
+
 def update_manuscript_by_id(
     manuscript_id: str,
     category: str,
@@ -111,6 +152,8 @@ def update_manuscript_by_id(
             raise HTTPException(status_code=500, detail="수정 처리 실패")
 
         updated_doc = db_service.db["manuscripts"].find_one({"_id": object_id})
+        emit(ManuscriptEvent("update", category, manuscript_id, updated_doc))
+
         serialized_doc = _serialize_document(updated_doc)
         return {
             "ok": True,
@@ -156,6 +199,7 @@ def toggle_visibility_by_id(manuscript_id: str, category: str) -> dict[str, Any]
         if result.modified_count == 0:
             raise HTTPException(status_code=500, detail="노출여부 변경 실패")
 
+        emit(ManuscriptEvent("visibility", category, manuscript_id))
         return {
             "ok": True,
             "visible": new_visible,
@@ -175,79 +219,47 @@ def toggle_visibility_by_id(manuscript_id: str, category: str) -> dict[str, Any]
         db_service.close_connection()
 
 
-def _get_category_visible_manuscripts(category: str, skip: int, limit: int) -> VisibleManuscriptsResult:
-    db_service = MongoDBService()
-
-    try:
-        db_service.set_db_name(db_name=category)
-        total = db_service.db["manuscripts"].count_documents(VISIBLE_MANUSCRIPT_QUERY)
-        documents = list(
-            db_service.db["manuscripts"]
-            .find(VISIBLE_MANUSCRIPT_QUERY)
-            .sort("createdAt", -1)
-            .skip(skip)
-            .limit(limit)
-        )
-        return {
-            "documents": [
-                _serialize_document(document, category) for document in documents
-            ],
-            "total": total,
-            "skip": skip,
-            "limit": limit,
-        }
-    finally:
-        db_service.close_connection()
-
-
-def _get_all_visible_manuscripts(skip: int, limit: int) -> VisibleManuscriptsResult:
-    client = MongoClient(MONGO_URI)
-    all_documents: list[dict[str, Any]] = []
-    total = 0
-
-    try:
-        for category in CATEGORIES:
-            try:
-                collection = client[category]["manuscripts"]
-                total += collection.count_documents(VISIBLE_MANUSCRIPT_QUERY)
-                documents = list(
-                    collection.find(VISIBLE_MANUSCRIPT_QUERY)
-                    .sort("createdAt", -1)
-                    .limit(limit * 2)
-                )
-                all_documents.extend(
-                    _serialize_document(document, category) for document in documents
-                )
-            except Exception:
-                continue
-
-        all_documents.sort(
-            key=lambda document: document.get("createdAt") or datetime.min,
-            reverse=True,
-        )
-        return {
-            "documents": all_documents[skip:skip + limit],
-            "total": total,
-            "skip": skip,
-            "limit": limit,
-        }
-    finally:
-        client.close()
-
-
 def get_visible_manuscripts(
     category: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
 ) -> VisibleManuscriptsResult:
-    if category:
-        return _get_category_visible_manuscripts(category, skip, limit)
-    return _get_all_visible_manuscripts(skip, limit)
+    """
+    노출 원고 최신순 조회 (카테고리 없으면 전체 카테고리 병합)
+
+    cursor(이전 응답의 nextCursor)를 주면 skip 없이 keyset으로 다음 페이지를 읽는다.
+    문서는 요약 필드 + 앞부분 스니펫만 담고, fields(쉼표 구분)로 content 등을 추가할 수 있다.
+    """
+    try:
+        page = paginate_manuscripts(
+            VISIBLE_MANUSCRIPT_QUERY,
+            [category] if category else CATEGORIES,
+            limit=limit,
+            cursor=cursor,
+            skip=skip,
+            projection=build_projection(fields=parse_fields(fields)),
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+    result: VisibleManuscriptsResult = {
+        "documents": [shape_document(document) for document in page.documents],
+        "total": page.total,
+        "skip": skip,
+        "limit": limit,
+        "nextCursor": page.next_cursor,
+    }
+    if not category:
+        result.update(page.report)
+    return result
 
 
 __all__ = [
     "delete_manuscript_by_id",
     "get_visible_manuscripts",
+    "restore_manuscript_by_id",
     "toggle_visibility_by_id",
     "update_manuscript_by_id",
 ]
@@ -0,0 +1,413 @@
+"""
+봇 파일 원고 저장소(manuscripts/) 목록 색인 (SQLite manifest)
+
+원고 목록/큐 목록을 볼 때마다 모든 폴더를 돌며 .txt 를 열어 파싱하고,
+다음 원고 번호를 폴더를 다시 훑어 계산하던 방식(O(n) + 동시 배치끼리 번호 충돌)을 대체한다.
+
+- 위치(location): pending | completed | failed | queue_xxx (manuscripts/ 바로 아래 폴더 이름)
+- entries: (위치, 폴더명) → 제목/카테고리/이미지 수/생성시각/폴더 mtime
+- queues: 큐 메타 (queue.json 요약)
+- counters: 원고 번호 원자적 할당 (BEGIN IMMEDIATE → 프로세스가 여러 개여도 겹치지 않음)
+- 저장/이동/삭제하는 코드가 created/moved/removed 로 바로 반영하고,
+  목록 조회 때는 위치 폴더 mtime 만 비교해 바뀐 경우에만 폴더 이름을 다시 읽어 차이(추가/삭제)만 반영
+  → 평소 목록 조회는 stat 1번 + SQLite 조회 1번, 직접 복사/삭제한 폴더도 다음 조회 때 맞춰짐
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.logger import log
+
+MANUSCRIPTS_DIR = Path("manuscripts")
+PENDING_DIR = MANUSCRIPTS_DIR / "pending"
+COMPLETED_DIR = MANUSCRIPTS_DIR / "completed"
+FAILED_DIR = MANUSCRIPTS_DIR / "failed"
+
+STATUS_LOCATIONS = ("pending", "completed", "failed")
+QUEUE_PREFIX = "queue_"
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+
+MANIFEST_PATH = os.getenv("MANUSCRIPT_MANIFEST_PATH", str(MANUSCRIPTS_DIR / "manifest.sqlite3"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    location TEXT NOT NULL,
+    name TEXT NOT NULL,
+    title TEXT,
+    category TEXT,
+    images_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT '',
+    mtime REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (location, name)
+);
+CREATE TABLE IF NOT EXISTS locations (
+    location TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS queues (
+    queue_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'unknown',
+    account_id TEXT,
+    schedule_date TEXT,
+    meta_mtime_ns INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_LEGACY_COUNTER = "legacy"
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _child_names(folder: Path) -> List[str]:
+    return [
+        child.name
+        for child in folder.iterdir()
+        if child.is_dir() and not child.name.startswith(".")
+    ]
+
+
+def read_summary(folder: Path) -> Optional[Dict[str, Any]]:
+    """
+    목록용 원고 요약 (txt 는 첫 줄만 읽음)
+
+    Returns:
+        {"title", "category", "images_count", "created_at"} 또는 원고 파일이 없으면 None
+    """
+    files = [file for file in folder.iterdir() if file.is_file()]
+    txt_files = [file for file in files if file.suffix.lower() == ".txt"]
+    if txt_files:
+        with open(txt_files[0], "r", encoding="utf-8") as file:
+            title = ""
+            for line in file:
+                title = line.strip()
+                if title:
+                    break
+        return {
+            "title": title,
+            "category": None,
+            "images_count": sum(1 for file in files if file.suffix.lower() in IMAGE_EXTENSIONS),
+            "created_at": datetime.fromtimestamp(txt_files[0].stat().st_mtime).isoformat(),
+        }
+
+    json_path = folder / "manuscript.json"
+    if not json_path.exists():
+        return None
+    with open(json_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    images_dir = folder / "images"
+    return {
+        "title": data.get("title", "제목 없음"),
+        "category": data.get("category"),
+        "images_count": len(list(images_dir.glob("*"))) if images_dir.exists() else 0,
+        "created_at": data.get("created_at", ""),
+    }
+
+
+def _read_queue_meta(queue_dir: Path) -> Optional[Dict[str, Any]]:
+    meta_path = queue_dir / "queue.json"
+    if not meta_path.exists():
+        return None
+    with open(meta_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+class ManuscriptManifest:
+    """manuscripts/ 폴더 구조의 SQLite 색인 (연결 1개를 잠금으로 공유, 첫 사용 때 생성)"""
+
+    def __init__(self, root: Path = MANUSCRIPTS_DIR, path: Optional[str] = None) -> None:
+        self.root = Path(os.path.abspath(root))
+        self.path = path or str(self.root / "manifest.sqlite3")
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            # 카운터는 BEGIN IMMEDIATE 로 직접 트랜잭션을 잡으므로 autocommit 모드
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _execute(self, sql: str, params: Tuple[Any, ...] = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._connection().execute(sql, params)
+
+    def _locate(self, folder: Path) -> Optional[Tuple[str, str]]:
+        """manuscripts/<위치>/<폴더명> → (위치, 폴더명), 저장소 밖이면 None"""
+        try:
+            parts = Path(os.path.abspath(folder)).relative_to(self.root).parts
+        except ValueError:
+            return None
+        return (parts[0], parts[1]) if len(parts) == 2 else None
+
+    # ---------- 쓰기 반영 ----------
+    def _upsert(self, location: str, name: str) -> None:
+        folder = self.root / location / name
+        try:
+            summary = read_summary(folder) or {}
+            mtime = folder.stat().st_mtime
+        except (OSError, ValueError) as e:
+            log.warning("manifest 원고 요약 실패", folder=str(folder), error=str(e))
+            summary, mtime = {}, 0.0
+        self._execute(
+            "INSERT OR REPLACE INTO entries "
+            "(location, name, title, category, images_count, created_at, mtime) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                location,
+                name,
+                summary.get("title"),
+                summary.get("category"),
+                summary.get("images_count", 0),
+                summary.get("created_at", ""),
+                mtime,
+            ),
+        )
+
+    def created(self, folder: Path) -> None:
+        """원고 폴더 생성/내용 변경 반영"""
+        located = self._locate(folder)
+        if located:
+            self._upsert(*located)
+
+    def moved(self, source: Path, destination: Path) -> None:
+        """원고 폴더 이동 반영 (요약은 그대로 옮기고 다시 파싱하지 않음)"""
+        src, dst = self._locate(source), self._locate(destination)
+        if dst is None:
+            if src:
+                self._execute("DELETE FROM entries WHERE location = ? AND name = ?", src)
+            return
+        with self._lock:
+            self._execute("DELETE FROM entries WHERE location = ? AND name = ?", dst)
+            moved = (
+                self._execute(
+                    "UPDATE entries SET location = ?, name = ? WHERE location = ? AND name = ?",
+                    (*dst, *src),
+                ).rowcount
+                if src
+                else 0
+            )
+        if not moved:
+            self._upsert(*dst)
+
+    def removed(self, folder: Path) -> None:
+        """원고 폴더 삭제 반영 (큐 폴더면 큐와 안의 원고 전체)"""
+        located = self._locate(folder)
+        if located:
+            self._execute("DELETE FROM entries WHERE location = ? AND name = ?", located)
+            return
+        if Path(os.path.abspath(folder)).parent == self.root:
+            self.drop_location(folder.name)
+
+    def drop_location(self, location: str) -> None:
+        with self._lock:
+            self._execute("DELETE FROM entries WHERE location = ?", (location,))
+            self._execute("DELETE FROM locations WHERE location = ?", (location,))
+            self._execute("DELETE FROM queues WHERE queue_id = ?", (location,))
+
+    def queue_updated(self, queue_dir: Path) -> None:
+        """queue.json 생성/변경 반영"""
+        meta = _read_queue_meta(queue_dir) or {}
+        self._execute(
+            "INSERT OR REPLACE INTO queues "
+            "(queue_id, created_at, status, account_id, schedule_date, meta_mtime_ns) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                queue_dir.name,
+                meta.get("created_at", ""),
+                meta.get("status", "unknown"),
+                meta.get("account_id"),
+                meta.get("schedule_date"),
+                _mtime_ns(queue_dir / "queue.json") or 0,
+            ),
+        )
+
+    # ---------- 동기화 ----------
+    def _sync(self, location: str) -> None:
+        """위치 폴더 mtime 이 바뀌었으면 폴더 이름 목록만 다시 읽어 추가/삭제 반영"""
+        folder = self.root / location
+        mtime_ns = _mtime_ns(folder)
+        with self._lock:
+            row = self._execute(
+                "SELECT mtime_ns FROM locations WHERE location = ?", (location,)
+            ).fetchone()
+            if mtime_ns is None:
+                if row is not None:
+                    self.drop_location(location)
+                return
+            if row is not None and row["mtime_ns"] == mtime_ns:
+                return
+
+            on_disk = set(_child_names(folder))
+            indexed = {
+                r["name"]
+                for r in self._execute("SELECT name FROM entries WHERE location = ?", (location,))
+            }
+            for name in indexed - on_disk:
+                self._execute("DELETE FROM entries WHERE location = ? AND name = ?", (location, name))
+            for name in on_disk - indexed:
+                self._upsert(location, name)
+            self._execute(
+                "INSERT OR REPLACE INTO locations (location, mtime_ns) VALUES (?, ?)",
+                (location, mtime_ns),
+            )
+
+    def _sync_queues(self) -> None:
+        """manuscripts/ 아래 queue_* 폴더와 queues 테이블 맞추기 (queue.json 은 바뀐 것만 다시 읽음)"""
+        with self._lock:
+            on_disk = (
+                {name for name in _child_names(self.root) if name.startswith(QUEUE_PREFIX)}
+                if self.root.exists()
+                else set()
+            )
+            indexed = {
+                row["queue_id"]: row["meta_mtime_ns"]
+                for row in self._execute("SELECT queue_id, meta_mtime_ns FROM queues")
+            }
+            for queue_id in set(indexed) - on_disk:
+                self.drop_location(queue_id)
+            for queue_id in on_disk:
+                meta_mtime = _mtime_ns(self.root / queue_id / "queue.json")
+                if meta_mtime is None:
+                    self._execute("DELETE FROM queues WHERE queue_id = ?", (queue_id,))
+                elif indexed.get(queue_id) != meta_mtime:
+                    self.queue_updated(self.root / queue_id)
+
+    # ---------- 조회 ----------
+    def list(self, location: str) -> List[Dict[str, Any]]:
+        """위치 안 원고 요약 목록 (폴더명 순, 원고 파일 없는 폴더 제외)"""
+        self._sync(location)
+        rows = self._execute(
+            "SELECT name, title, category, images_count, created_at FROM entries "
+            "WHERE location = ? AND title IS NOT NULL ORDER BY name",
+            (location,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, location: str) -> int:
+        self._sync(location)
+        return self._execute(
+            "SELECT COUNT(*) FROM entries WHERE location = ? AND title IS NOT NULL", (location,)
+        ).fetchone()[0]
+
+    def list_queues(self) -> List[Dict[str, Any]]:
+        """큐 목록 (큐 ID 순) + 큐 안 원고 폴더 수"""
+        self._sync_queues()
+        queues = [dict(row) for row in self._execute("SELECT * FROM queues ORDER BY queue_id")]
+        for queue in queues:
+            self._sync(queue["queue_id"])
+            queue["manuscript_count"] = self._execute(
+                "SELECT COUNT(*) FROM entries WHERE location = ?", (queue["queue_id"],)
+            ).fetchone()[0]
+        return queues
+
+    # ---------- 번호 할당 ----------
+    def allocate(self, counter: str, seed: Callable[[], int]) -> int:
+        """
+        카운터를 1 올려 반환 (프로세스/스레드 사이 원자적)
+
+        Args:
+            counter: 카운터 이름
+            seed: 카운터가 처음 쓰일 때 시작값(현재 최대 번호)을 계산하는 함수
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT value FROM counters WHERE name = ?", (counter,)).fetchone()
+                value = (row["value"] if row else seed()) + 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO counters (name, value) VALUES (?, ?)", (counter, value)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return value
+
+    def _max_legacy_id(self) -> int:
+        numbers = [
+            int(name)
+            for location in STATUS_LOCATIONS
+            if (self.root / location).exists()
+            for name in _child_names(self.root / location)
+            if name.isdigit()
+        ]
+        return max(numbers, default=0)
+
+    def next_manuscript_id(self) -> str:
+        """레거시 순차 원고 ID (0001, 0002 ...), pending/completed/failed 전체에서 유일"""
+        while True:
+            manuscript_id = str(self.allocate(_LEGACY_COUNTER, self._max_legacy_id)).zfill(4)
+            if not any((self.root / location / manuscript_id).exists() for location in STATUS_LOCATIONS):
+                return manuscript_id
+
+    def next_batch_manuscript_id(self, batch_id: str) -> str:
+        """배치 원고 ID ({batch_id}_0001 ...)"""
+        prefix = f"{batch_id}_"
+
+        def seed() -> int:
+            pending = self.root / "pending"
+            suffixes = [
+                int(name[len(prefix):])
+                for name in (_child_names(pending) if pending.exists() else [])
+                if name.startswith(prefix) and name[len(prefix):].isdigit()
+            ]
+            return max(suffixes, default=0)
+
+        while True:
+            manuscript_id = f"{prefix}{str(self.allocate(f'batch:{batch_id}', seed)).zfill(4)}"
+            if not (self.root / "pending" / manuscript_id).exists():
+                return manuscript_id
+
+
+_manifest: Optional[ManuscriptManifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_manifest() -> ManuscriptManifest:
+    """프로세스 공유 manifest"""
+    global _manifest
+    with _manifest_lock:
+        if _manifest is None:
+            _manifest = ManuscriptManifest(MANUSCRIPTS_DIR, MANIFEST_PATH)
+        return _manifest
+
+
+__all__ = [
+    "COMPLETED_DIR",
+    "FAILED_DIR",
+    "IMAGE_EXTENSIONS",
+    "MANUSCRIPTS_DIR",
+    "ManuscriptManifest",
+    "PENDING_DIR",
+    "get_manifest",
+    "read_summary",
+]
@@ -0,0 +1,291 @@
+"""
+카테고리 통합 원고 페이지네이션 (keyset 커서 + k-way 병합)
+
+전체 카테고리 목록을 최신순으로 보여줄 때, 카테고리마다 (createdAt, _id) keyset 조건으로
+다음 페이지 후보만 읽고 heapq.merge로 병합한다.
+
+- 전체 정렬 순서: createdAt desc → 카테고리 desc → _id desc (createdAt 없는 원고는 맨 뒤)
+- 커서: 마지막 원고의 (createdAt, _id, 카테고리)를 담은 불투명 문자열 (nextCursor)
+- 한 페이지 비용: 카테고리당 최대 limit+1건 → O(limit × 카테고리 수), 페이지 깊이와 무관
+- 커서 없이 skip을 주면 카테고리당 skip+limit+1건을 읽어 병합 (정확하지만 깊을수록 비쌈)
+  (카테고리가 하나면 skip은 Mongo에서 처리)
+- 통합 저장소 조회 모드(services.manuscript_store)에서는 같은 순서·커서로
+  통합 컬렉션 쿼리 한 번에 처리
+"""
+
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+from itertools import islice
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from bson import ObjectId
+
+from mongodb_service import get_mongo_client
+from services.manuscript_store import UNIFIED_SORT, category_filter, reads_unified, unified_collection
+from utils.category_fanout import CATEGORY_FANOUT_TIMEOUT_MS, fan_out_categories
+
+MANUSCRIPT_SORT = [("createdAt", -1), ("_id", -1)]
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    created_at: Optional[datetime]
+    manuscript_id: Any
+    category: str
+
+
+@dataclass
+class ManuscriptPage:
+    documents: List[Dict[str, Any]] = field(default_factory=list)
+    total: int = 0
+    next_cursor: Optional[str] = None
+    report: Dict[str, object] = field(default_factory=dict)
+
+
+# ---------- 커서 ----------
+def encode_cursor(document: Dict[str, Any], category: str) -> str:
+    """원고 위치 → 커서 문자열"""
+    created_at = document.get("createdAt")
+    manuscript_id = document["_id"]
+    payload = {
+        "t": created_at.isoformat() if isinstance(created_at, datetime) else None,
+        "i": str(manuscript_id),
+        "o": isinstance(manuscript_id, ObjectId),
+        "c": category,
+    }
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> PageCursor:
+    """
+    커서 문자열 → PageCursor
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        created_at = datetime.fromisoformat(payload["t"]) if payload["t"] else None
+        manuscript_id = ObjectId(payload["i"]) if payload["o"] else payload["i"]
+        return PageCursor(created_at, manuscript_id, str(payload["c"]))
+    except Exception as error:
+        raise ValueError(f"잘못된 커서입니다: {token[:20]}") from error
+
+
+def keyset_query(cursor: PageCursor, category: str) -> Optional[Dict[str, Any]]:
+    """
+    한 카테고리에서 커서 이후(정렬상 뒤) 원고만 고르는 조건
+
+    Returns:
+        Mongo 쿼리 (이 카테고리에 더 볼 원고가 없으면 None)
+    """
+    missing = {"createdAt": None}
+
+    if cursor.created_at is None:
+        # 커서가 createdAt 없는 구간 → 그 구간 안에서 카테고리/_id 순
+        if category < cursor.category:
+            return missing
+        if category == cursor.category:
+            return {"createdAt": None, "_id": {"$lt": cursor.manuscript_id}}
+        return None
+
+    created_at = cursor.created_at
+    if category < cursor.category:
+        return {"$or": [{"createdAt": {"$lte": created_at}}, missing]}
+    if category == cursor.category:
+        return {
+            "$or": [
+                {"createdAt": {"$lt": created_at}},
+                {"createdAt": created_at, "_id": {"$lt": cursor.manuscript_id}},
+                missing,
+            ]
+        }
+    return {"$or": [{"createdAt": {"$lt": created_at}}, missing]}
+
+
+def unified_keyset_query(cursor: PageCursor) -> Dict[str, Any]:
+    """통합 컬렉션 정렬(UNIFIED_SORT)에서 커서 이후 원고만 고르는 조건"""
+    after_in_group = {
+        "$or": [
+            {"category": {"$lt": cursor.category}},
+            {"category": cursor.category, "_id": {"$lt": cursor.manuscript_id}},
+        ]
+    }
+    if cursor.created_at is None:
+        return {"$and": [{"createdAt": None}, after_in_group]}
+    return {
+        "$or": [
+            {"createdAt": {"$lt": cursor.created_at}},
+            {"$and": [{"createdAt": cursor.created_at}, after_in_group]},
+            {"createdAt": None},
+        ]
+    }
+
+
+def _merge_key(item: tuple[str, Dict[str, Any]]) -> tuple:
+    category, document = item
+    created_at = document.get("createdAt")
+    if not isinstance(created_at, datetime):
+        created_at = datetime.min
+    return created_at, category, str(document["_id"])
+
+
+def merge_category_documents(
+    documents_by_category: Dict[str, List[Dict[str, Any]]],
+) -> Iterable[tuple[str, Dict[str, Any]]]:
+    """카테고리별 최신순 목록을 하나의 최신순 스트림으로 병합 (k-way heap merge)"""
+    streams = [
+        [(category, document) for document in documents]
+        for category, documents in documents_by_category.items()
+    ]
+    return heapq.merge(*streams, key=_merge_key, reverse=True)
+
+
+# ---------- 조회 ----------
+def paginate_manuscripts(
+    base_query: Dict[str, Any],
+    categories: Iterable[str],
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    projection: Optional[Dict[str, Any]] = None,
+) -> ManuscriptPage:
+    """
+    여러 카테고리 manuscripts 컬렉션을 하나의 최신순 목록으로 페이지 조회
+
+    Args:
+        base_query: 공통 조건 (삭제/노출/검색어 등)
+        categories: 대상 카테고리
+        limit: 페이지 크기
+        cursor: 이전 응답의 nextCursor (있으면 skip 대신 사용)
+        skip: 커서 없이 건너뛸 원고 수
+        projection: find projection (createdAt은 병합 정렬에 쓰이므로 포함 필요)
+
+    Returns:
+        ManuscriptPage (documents는 _id 문자열화 + __category 포함)
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    page_cursor = decode_cursor(cursor) if cursor else None
+    categories = list(categories)
+
+    if reads_unified():
+        return _paginate_unified(base_query, categories, limit, page_cursor, skip, projection)
+
+    # 카테고리가 하나면 skip은 Mongo에 맡기고, 여럿이면 병합 후 건너뜀
+    mongo_skip = skip if page_cursor is None and len(categories) == 1 else 0
+    merge_skip = skip if page_cursor is None and len(categories) > 1 else 0
+    fetch_count = merge_skip + limit + 1
+
+    def load(category: str) -> tuple[int, List[Dict[str, Any]]]:
+        collection = get_mongo_client()[category]["manuscripts"]
+        total = collection.count_documents(base_query, maxTimeMS=CATEGORY_FANOUT_TIMEOUT_MS)
+
+        query = base_query
+        if page_cursor is not None:
+            condition = keyset_query(page_cursor, category)
+            if condition is None:
+                return total, []
+            query = {"$and": [base_query, condition]}
+
+        documents = list(
+            collection.find(query, projection)
+            .sort(MANUSCRIPT_SORT)
+            .skip(mongo_skip)
+            .limit(fetch_count)
+            .max_time_ms(CATEGORY_FANOUT_TIMEOUT_MS)
+        )
+        return total, documents
+
+    outcome = fan_out_categories(load, categories)
+
+    total = 0
+    documents_by_category: Dict[str, List[Dict[str, Any]]] = {}
+    for category, (category_total, documents) in outcome.results.items():
+        total += category_total
+        documents_by_category[category] = documents
+
+    merged = merge_category_documents(documents_by_category)
+    window = list(islice(merged, merge_skip, merge_skip + limit + 1))
+
+    page = window[:limit]
+    next_cursor = None
+    if len(window) > limit and page:
+        last_category, last_document = page[-1]
+        next_cursor = encode_cursor(last_document, last_category)
+
+    serialized = []
+    for category, document in page:
+        document["_id"] = str(document["_id"])
+        document["__category"] = category
+        serialized.append(document)
+
+    return ManuscriptPage(
+        documents=serialized,
+        total=total,
+        next_cursor=next_cursor,
+        report=outcome.report(),
+    )
+
+
+def _paginate_unified(
+    base_query: Dict[str, Any],
+    categories: List[str],
+    limit: int,
+    page_cursor: Optional[PageCursor],
+    skip: int,
+    projection: Optional[Dict[str, Any]],
+) -> ManuscriptPage:
+    """통합 컬렉션에서 카테고리 조건 + keyset 쿼리 한 번으로 페이지 조회"""
+    collection = unified_collection()
+    query = {"$and": [base_query, category_filter(categories)]}
+    total = collection.count_documents(query, maxTimeMS=CATEGORY_FANOUT_TIMEOUT_MS)
+
+    if page_cursor is not None:
+        query = {"$and": [*query["$and"], unified_keyset_query(page_cursor)]}
+    if projection is not None:
+        projection = {**projection, "category": 1}
+
+    window = list(
+        collection.find(query, projection)
+        .sort(UNIFIED_SORT)
+        .skip(skip if page_cursor is None else 0)
+        .limit(limit + 1)
+        .max_time_ms(CATEGORY_FANOUT_TIMEOUT_MS)
+    )
+
+    page = window[:limit]
+    next_cursor = None
+    if len(window) > limit and page:
+        next_cursor = encode_cursor(page[-1], page[-1]["category"])
+
+    for document in page:
+        document["_id"] = str(document["_id"])
+        document["__category"] = document["category"]
+
+    return ManuscriptPage(
+        documents=page,
+        total=total,
+        next_cursor=next_cursor,
+        report={"partial": False, "failedCategories": []},
+    )
+
+
+__all__ = [
+    "ManuscriptPage",
+    "PageCursor",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_query",
+    "merge_category_documents",
+    "paginate_manuscripts",
+    "unified_keyset_query",
+]
@@ -0,0 +1,502 @@
+"""
+원고 일별 집계(rollup)
+
+/search/stats, /search/popular 가 요청마다 모든 카테고리 DB에서 $group을 돌리던 것을,
+원고 저장/삭제/복구 시점에 미리 올려 둔 카운터만 읽도록 바꾼다.
+
+- 버킷: 날짜(YYYY-MM-DD, createdAt 기준) × 엔진 × 카테고리 × 키워드 → count
+- 저장 위치: search_system DB의 manuscript_daily_rollup 컬렉션
+- 원고 이벤트(services.manuscript_events): insert/restore → +1, delete → -1
+- 기존 원고는 scripts/build_manuscript_rollup.py로 백필 (준비 표시 전에는 카테고리 DB 직접 집계)
+
+재구축은 staging 컬렉션에 만든 뒤 rename으로 통째로 교체한다.
+- 집계는 cutoff(시작 시각) 이전에 만든 원고만 센다
+- 재구축 중 이벤트는 운영 컬렉션과 staging에 함께 반영한다
+  (cutoff 이후 원고, 또는 이미 집계를 마친 카테고리의 삭제/복구만 → 이중 집계 없음)
+- 집계 중인 카테고리에서 그 사이 삭제/복구된 원고는 ±1 오차가 날 수 있다 (다시 실행하면 맞음)
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ASCENDING, UpdateOne
+
+from _constants.categories import CATEGORIES
+from mongodb_service import get_mongo_client
+from services.manuscript_events import MANUSCRIPTS_COLLECTION, ManuscriptEvent, subscribe
+from utils.category_fanout import CATEGORY_FANOUT_TIMEOUT_MS, fan_out_categories
+from utils.logger import log
+from utils.ttl_cache import TTLCache
+
+ROLLUP_DB = "search_system"
+ROLLUP_COLLECTION = "manuscript_daily_rollup"
+ROLLUP_STAGING_COLLECTION = "manuscript_daily_rollup_staging"
+ROLLUP_META_COLLECTION = "manuscript_daily_rollup_meta"
+
+UNKNOWN_ENGINE = "unknown"
+# 순위 변동 계산 시 이전 기간에서 살펴볼 순위 깊이
+PREVIOUS_RANK_DEPTH = 100
+# 재구축 상태 캐시 수명(초). 재구축 시작 시 cutoff를 이만큼 뒤로 잡아 모든 프로세스가 알아채게 한다
+REBUILD_STATE_TTL = 1.0
+
+_ready_cache: TTLCache[bool] = TTLCache(maxsize=1, ttl=60.0)
+_rebuild_cache: TTLCache[Optional[Dict[str, Any]]] = TTLCache(maxsize=1, ttl=REBUILD_STATE_TTL)
+_indexes_ensured = False
+
+_BUCKET_INDEX = [("date", ASCENDING), ("category", ASCENDING), ("engine", ASCENDING), ("keyword", ASCENDING)]
+
+
+def _rollup_collection():
+    return get_mongo_client()[ROLLUP_DB][ROLLUP_COLLECTION]
+
+
+def _staging_collection():
+    return get_mongo_client()[ROLLUP_DB][ROLLUP_STAGING_COLLECTION]
+
+
+def _meta_collection():
+    return get_mongo_client()[ROLLUP_DB][ROLLUP_META_COLLECTION]
+
+
+def _ensure_bucket_index(collection) -> None:
+    collection.create_index(_BUCKET_INDEX, unique=True, name="uniq_date_category_engine_keyword")
+
+
+def ensure_rollup_indexes() -> None:
+    """집계 컬렉션 인덱스 보장 (프로세스당 한 번)"""
+    global _indexes_ensured
+
+    if _indexes_ensured:
+        return
+
+    _ensure_bucket_index(_rollup_collection())
+    _indexes_ensured = True
+
+
+# ---------- 준비 상태 ----------
+def is_rollup_ready() -> bool:
+    """백필이 끝나 집계 버킷을 읽어도 되는지 (60초 캐시)"""
+    cached = _ready_cache.get("ready")
+    if cached is not None:
+        return cached
+
+    try:
+        meta = _meta_collection().find_one({"_id": "status"}) or {}
+        ready = bool(meta.get("ready"))
+    except Exception as e:
+        log.warning(f"원고 집계 상태 조회 실패 → 카테고리 DB 직접 집계: {e}")
+        ready = False
+
+    _ready_cache.set("ready", ready)
+    return ready
+
+
+def mark_rollup_ready(ready: bool = True) -> None:
+    """백필 완료/해제 표시"""
+    _meta_collection().update_one(
+        {"_id": "status"},
+        {"$set": {"ready": ready, "updatedAt": datetime.now()}},
+        upsert=True,
+    )
+    _ready_cache.clear()
+
+
+# ---------- 버킷 ----------
+def bucket_key(document: Dict[str, Any], category: str) -> Optional[Dict[str, str]]:
+    """원고 → 버킷 키 (createdAt이 없으면 집계 대상 아님)"""
+    created_at = document.get("createdAt")
+    if not isinstance(created_at, datetime):
+        return None
+    return {
+        "date": created_at.strftime("%Y-%m-%d"),
+        "category": category,
+        "engine": document.get("engine") or UNKNOWN_ENGINE,
+        "keyword": document.get("keyword") or "",
+    }
+
+
+def category_buckets(
+    category: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    max_time_ms: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    카테고리 DB 원고를 직접 날짜 × 엔진 × 키워드로 집계 (백필/준비 전 조회용)
+
+    Args:
+        category: 카테고리
+        start: createdAt 하한 (포함)
+        end: createdAt 상한 (미포함)
+        max_time_ms: 쿼리 타임아웃
+
+    Returns:
+        [{"date", "engine", "keyword", "count"}]
+    """
+    created_at: Dict[str, Any] = {"$type": "date"}
+    if start is not None:
+        created_at["$gte"] = start
+    if end is not None:
+        created_at["$lt"] = end
+
+    pipeline = [
+        {"$match": {"deleted": {"$ne": True}, "createdAt": created_at}},
+        {
+            "$group": {
+                "_id": {
+                    "date": {"$dateToString": {"format": "%Y-%m-%d", "date": "$createdAt"}},
+                    "engine": "$engine",
+                    "keyword": "$keyword",
+                },
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+    options: Dict[str, Any] = {"allowDiskUse": True}
+    if max_time_ms is not None:
+        options["maxTimeMS"] = max_time_ms
+
+    collection = get_mongo_client()[category][MANUSCRIPTS_COLLECTION]
+    return [
+        {
+            "date": doc["_id"]["date"],
+            "engine": doc["_id"].get("engine") or UNKNOWN_ENGINE,
+            "keyword": doc["_id"].get("keyword") or "",
+            "count": doc["count"],
+        }
+        for doc in collection.aggregate(pipeline, **options)
+    ]
+
+
+def apply_rollup_delta(category: str, document: Dict[str, Any], delta: int, collection=None) -> None:
+    """원고 1건만큼 버킷 카운터 증감 (collection 기본: 운영 집계 컬렉션)"""
+    key = bucket_key(document, category)
+    if key is None:
+        return
+    if collection is None:
+        ensure_rollup_indexes()
+        collection = _rollup_collection()
+    collection.update_one(key, {"$inc": {"count": delta}}, upsert=True)
+
+
+# ---------- 재구축 ----------
+def _rebuild_state() -> Optional[Dict[str, Any]]:
+    """진행 중인 재구축 상태 {"cutoff", "done"} (없으면 None, REBUILD_STATE_TTL 캐시)"""
+    if "state" in _rebuild_cache:
+        return _rebuild_cache.get("state")
+
+    try:
+        state = _meta_collection().find_one({"_id": "rebuild", "active": True})
+    except Exception as e:
+        log.warning(f"원고 집계 재구축 상태 조회 실패: {e}")
+        state = None
+
+    _rebuild_cache.set("state", state)
+    return state
+
+
+def mirrors_to_staging(state: Optional[Dict[str, Any]], event: ManuscriptEvent) -> bool:
+    """
+    재구축 중 이벤트를 staging에도 반영해야 하는지
+
+    - cutoff 이후 만든 원고: 집계에서 빠지므로 항상 반영
+    - cutoff 이전 원고의 삭제/복구: 그 카테고리 집계가 끝난 뒤라면 반영 (아니면 집계가 새 상태를 읽음)
+    """
+    if state is None or event.document is None:
+        return False
+    created_at = event.document.get("createdAt")
+    if isinstance(created_at, datetime) and created_at >= state["cutoff"]:
+        return True
+    return event.kind != "insert" and event.category in state.get("done", [])
+
+
+def begin_rollup_rebuild() -> datetime:
+    """
+    staging을 비우고 재구축 시작을 기록
+
+    cutoff를 REBUILD_STATE_TTL만큼 뒤로 잡고 그때까지 기다려,
+    cutoff 이후 이벤트는 모든 프로세스가 staging에도 반영하도록 한다.
+
+    Returns:
+        cutoff (이 시각 이전에 만든 원고만 집계)
+    """
+    staging = _staging_collection()
+    staging.drop()
+    _ensure_bucket_index(staging)
+
+    cutoff = datetime.now() + timedelta(seconds=REBUILD_STATE_TTL)
+    # Mongo 날짜 정밀도(ms)에 맞춰 이벤트 쪽 비교와 집계 쪽 비교를 일치시킴
+    cutoff = cutoff.replace(microsecond=cutoff.microsecond // 1000 * 1000)
+    _meta_collection().update_one(
+        {"_id": "rebuild"},
+        {"$set": {"active": True, "cutoff": cutoff, "done": [], "startedAt": datetime.now()}},
+        upsert=True,
+    )
+    _rebuild_cache.clear()
+
+    time.sleep(max(0.0, (cutoff - datetime.now()).total_seconds()))
+    return cutoff
+
+
+def rebuild_category_rollup(category: str, buckets: Iterable[Dict[str, Any]]) -> int:
+    """
+    한 카테고리 집계 결과를 staging에 더하고 완료 표시 (begin_rollup_rebuild 이후)
+
+    Args:
+        category: 카테고리
+        buckets: cutoff 이전 원고의 {"date", "engine", "keyword", "count"} 목록
+
+    Returns:
+        기록한 버킷 수
+    """
+    ops = []
+    for bucket in buckets:
+        key = {
+            "date": bucket["date"],
+            "category": category,
+            "engine": bucket.get("engine") or UNKNOWN_ENGINE,
+            "keyword": bucket.get("keyword") or "",
+        }
+        # 이미 staging에 반영된 cutoff 이후 이벤트와 합쳐지도록 $set이 아닌 $inc
+        ops.append(UpdateOne(key, {"$inc": {"count": bucket["count"]}}, upsert=True))
+
+    if ops:
+        _staging_collection().bulk_write(ops, ordered=False)
+    _meta_collection().update_one({"_id": "rebuild"}, {"$addToSet": {"done": category}})
+    _rebuild_cache.clear()
+    return len(ops)
+
+
+def finish_rollup_rebuild() -> None:
+    """staging을 운영 컬렉션으로 교체하고 준비 완료 표시"""
+    _staging_collection().rename(ROLLUP_COLLECTION, dropTarget=True)
+    _meta_collection().update_one(
+        {"_id": "rebuild"},
+        {"$set": {"active": False, "finishedAt": datetime.now()}},
+    )
+    _rebuild_cache.clear()
+    mark_rollup_ready()
+
+
+def abort_rollup_rebuild() -> None:
+    """재구축 중단 (운영 컬렉션은 그대로)"""
+    _meta_collection().update_one({"_id": "rebuild"}, {"$set": {"active": False}})
+    _rebuild_cache.clear()
+    _staging_collection().drop()
+
+
+# ---------- 이벤트 ----------
+def _event_delta(event: ManuscriptEvent) -> int:
+    if event.document is None:
+        return 0
+    if event.kind in ("insert", "restore"):
+        return 1
+    if event.kind == "delete":
+        return -1
+    return 0
+
+
+def handle_manuscript_event(event: ManuscriptEvent) -> None:
+    """원고 저장/삭제/복구 이벤트 → 버킷 증감"""
+    delta = _event_delta(event)
+    if not delta:
+        return
+    apply_rollup_delta(event.category, event.document, delta)
+    if mirrors_to_staging(_rebuild_state(), event):
+        apply_rollup_delta(event.category, event.document, delta, _staging_collection())
+
+
+def _add_delta(deltas: Dict[tuple, int], event: ManuscriptEvent, delta: int) -> None:
+    key = bucket_key(event.document, event.category)
+    if key is None:
+        return
+    bucket = tuple(key.items())
+    deltas[bucket] = deltas.get(bucket, 0) + delta
+
+
+def _bulk_inc(collection, deltas: Dict[tuple, int]) -> None:
+    ops = [
+        UpdateOne(dict(bucket), {"$inc": {"count": delta}}, upsert=True)
+        for bucket, delta in deltas.items()
+        if delta
+    ]
+    if ops:
+        collection.bulk_write(ops, ordered=False)
+
+
+def handle_manuscript_events(events: List[ManuscriptEvent]) -> None:
+    """원고 이벤트 여러 건 → 버킷별로 합산해 bulk_write 한 번으로 증감"""
+    deltas: Dict[tuple, int] = {}
+    staging_deltas: Dict[tuple, int] = {}
+    state: Optional[Dict[str, Any]] = None
+    state_loaded = False
+
+    for event in events:
+        delta = _event_delta(event)
+        if not delta:
+            continue
+        _add_delta(deltas, event, delta)
+        if not state_loaded:
+            state, state_loaded = _rebuild_state(), True
+        if mirrors_to_staging(state, event):
+            _add_delta(staging_deltas, event, delta)
+
+    if any(deltas.values()):
+        ensure_rollup_indexes()
+        _bulk_inc(_rollup_collection(), deltas)
+    if staging_deltas:
+        _bulk_inc(_staging_collection(), staging_deltas)
+
+
+def register_manuscript_rollup() -> None:
+    """원고 이벤트 구독 (애플리케이션 시작 시 호출)"""
+    subscribe(handle_manuscript_event, handle_manuscript_events)
+
+
+# ---------- 조회 ----------
+def period_dates(days: int, end: Optional[datetime] = None) -> List[str]:
+    """end(기본: 오늘)까지 최근 days일 날짜 문자열 (오래된 순)"""
+    end = end or datetime.now()
+    return [(end - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days - 1, -1, -1)]
+
+
+def _date_match(dates: List[str]) -> Dict[str, Any]:
+    return {"$match": {"date": {"$gte": dates[0], "$lte": dates[-1]}, "count": {"$gt": 0}}}
+
+
+def _manuscript_buckets(dates: List[str]) -> List[Dict[str, Any]]:
+    """백필 전 대체 경로: 카테고리 DB를 병렬로 직접 집계 → [{"date", "category", "engine", "keyword", "count"}]"""
+    start = datetime.strptime(dates[0], "%Y-%m-%d")
+    end = datetime.strptime(dates[-1], "%Y-%m-%d") + timedelta(days=1)
+
+    outcome = fan_out_categories(
+        lambda category: category_buckets(category, start, end, CATEGORY_FANOUT_TIMEOUT_MS),
+        CATEGORIES,
+    )
+    if outcome.partial:
+        log.warning("원고 직접 집계 일부 카테고리 실패", **outcome.report())
+
+    return [
+        {**bucket, "category": category}
+        for category, buckets in outcome.results.items()
+        for bucket in buckets
+    ]
+
+
+def _rollup_groups(dates: List[str]) -> List[Dict[str, Any]]:
+    """집계 버킷 → 날짜 × 엔진 × 카테고리 합계 [{"date", "engine", "category", "count"}]"""
+    pipeline = [
+        _date_match(dates),
+        {
+            "$group": {
+                "_id": {"date": "$date", "engine": "$engine", "category": "$category"},
+                "count": {"$sum": "$count"},
+            }
+        },
+    ]
+    return [{**doc["_id"], "count": doc["count"]} for doc in _rollup_collection().aggregate(pipeline)]
+
+
+def summarize_rollup(dates: List[str]) -> Dict[str, Any]:
+    """
+    기간 내 원고 수 요약 (백필 전에는 카테고리 DB 직접 집계)
+
+    Returns:
+        {"totalCount", "byEngine", "byCategory", "daily": [{"date", "count"}]}
+    """
+    groups = _rollup_groups(dates) if is_rollup_ready() else _manuscript_buckets(dates)
+
+    total_count = 0
+    by_engine: Dict[str, int] = {}
+    by_category: Dict[str, int] = {}
+    daily_counts: Dict[str, int] = {date: 0 for date in dates}
+
+    for group in groups:
+        count = group["count"]
+        total_count += count
+        by_engine[group["engine"]] = by_engine.get(group["engine"], 0) + count
+        by_category[group["category"]] = by_category.get(group["category"], 0) + count
+        if group["date"] in daily_counts:
+            daily_counts[group["date"]] += count
+
+    return {
+        "totalCount": total_count,
+        "byEngine": by_engine,
+        "byCategory": by_category,
+        "daily": [{"date": date, "count": count} for date, count in daily_counts.items()],
+    }
+
+
+def rank_keywords(dates: List[str], limit: int) -> List[Dict[str, Any]]:
+    """기간 내 키워드별 원고 수 상위 limit개 [{"keyword", "count"}] (백필 전에는 카테고리 DB 직접 집계)"""
+    if not is_rollup_ready():
+        counts: Dict[str, int] = {}
+        for bucket in _manuscript_buckets(dates):
+            if bucket["keyword"]:
+                counts[bucket["keyword"]] = counts.get(bucket["keyword"], 0) + bucket["count"]
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [{"keyword": keyword, "count": count} for keyword, count in ranked]
+
+    pipeline = [
+        _date_match(dates),
+        {"$match": {"keyword": {"$ne": ""}}},
+        {"$group": {"_id": "$keyword", "count": {"$sum": "$count"}}},
+        {"$match": {"count": {"$gt": 0}}},
+        {"$sort": {"count": -1, "_id": 1}},
+        {"$limit": limit},
+    ]
+    return [
+        {"keyword": doc["_id"], "count": doc["count"]}
+        for doc in _rollup_collection().aggregate(pipeline)
+    ]
+
+
+def popular_keywords_with_change(days: int, limit: int) -> List[Dict[str, Any]]:
+    """
+    인기 키워드 + 직전 같은 길이 기간 대비 순위 변동
+
+    Returns:
+        [{"rank", "keyword", "count", "change", "isNew"}]
+        change: 이전 순위 - 현재 순위 (양수 = 상승), 이전 기간에 없던 키워드는 isNew=True, change=0
+    """
+    current = rank_keywords(period_dates(days), limit)
+
+    previous_end = datetime.now() - timedelta(days=days)
+    previous = rank_keywords(period_dates(days, previous_end), PREVIOUS_RANK_DEPTH)
+    previous_ranks = {item["keyword"]: rank for rank, item in enumerate(previous, 1)}
+
+    keywords = []
+    for rank, item in enumerate(current, 1):
+        previous_rank = previous_ranks.get(item["keyword"])
+        keywords.append({
+            "rank": rank,
+            "keyword": item["keyword"],
+            "count": item["count"],
+            "change": previous_rank - rank if previous_rank else 0,
+            "isNew": previous_rank is None,
+        })
+    return keywords
+
+
+__all__ = [
+    "ROLLUP_COLLECTION",
+    "abort_rollup_rebuild",
+    "apply_rollup_delta",
+    "begin_rollup_rebuild",
+    "bucket_key",
+    "category_buckets",
+    "finish_rollup_rebuild",
+    "handle_manuscript_event",
+    "is_rollup_ready",
+    "mark_rollup_ready",
+    "mirrors_to_staging",
+    "period_dates",
+    "popular_keywords_with_change",
+    "rank_keywords",
+    "rebuild_category_rollup",
+    "register_manuscript_rollup",
+    "summarize_rollup",
+]
@@ -0,0 +1,178 @@
+"""
+원고 통합 저장소 (단일 manuscripts 컬렉션)
+
+카테고리마다 DB를 나눠 저장한 원고를 category 필드가 있는 컬렉션 하나로 모아,
+카테고리 통합 조회를 카테고리별 fan-out 대신 인덱스를 타는 쿼리 한 번으로 처리한다.
+
+- 저장 모드 (MANUSCRIPT_STORAGE):
+  - category: 카테고리 DB만 사용 (기본값, 기존 동작)
+  - dual: 카테고리 DB 쓰기 + 통합 컬렉션 이중 쓰기, 조회는 카테고리 DB (이관 기간)
+  - unified: 이중 쓰기 유지, 카테고리 통합 조회는 통합 컬렉션 (전환 후, 되돌리기 가능)
+- 이중 쓰기: 원고 이벤트(services.manuscript_events)마다 카테고리 DB 원고를 통합 컬렉션에 복사
+- 기존 원고: scripts/migrate_unified_manuscripts.py로 배치 이관 (중단 후 이어서 실행 가능)
+- 통합 컬렉션의 _id는 원본과 같고, category는 원본 DB 이름
+- 원고 단건 조회/수정은 카테고리 DB가 원본이므로 그대로 카테고리 DB에서 처리
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, ReplaceOne
+
+from mongodb_service import get_mongo_client
+from services.manuscript_events import MANUSCRIPTS_COLLECTION, ManuscriptEvent, subscribe
+from utils.logger import log
+
+STORAGE_MODES = ("category", "dual", "unified")
+
+MANUSCRIPT_STORAGE = os.getenv("MANUSCRIPT_STORAGE", "category").lower()
+UNIFIED_MANUSCRIPT_DB = os.getenv("UNIFIED_MANUSCRIPT_DB", "manuscript_store")
+UNIFIED_MANUSCRIPT_COLLECTION = MANUSCRIPTS_COLLECTION
+
+# 통합 목록 정렬: 카테고리 병합 순서(createdAt desc → 카테고리 desc → _id desc)와 동일
+UNIFIED_SORT = [("createdAt", DESCENDING), ("category", DESCENDING), ("_id", DESCENDING)]
+
+if MANUSCRIPT_STORAGE not in STORAGE_MODES:
+    log.warning(f"알 수 없는 MANUSCRIPT_STORAGE={MANUSCRIPT_STORAGE} → category 사용")
+    MANUSCRIPT_STORAGE = "category"
+
+_indexes_ensured = False
+
+
+def reads_unified() -> bool:
+    """카테고리 통합 조회를 통합 컬렉션에서 할지"""
+    return MANUSCRIPT_STORAGE == "unified"
+
+
+def writes_unified() -> bool:
+    """원고 변경을 통합 컬렉션에도 쓸지"""
+    return MANUSCRIPT_STORAGE in ("dual", "unified")
+
+
+def unified_collection():
+    """통합 manuscripts 컬렉션 (최초 사용 시 인덱스 보장)"""
+    ensure_unified_indexes()
+    return get_mongo_client()[UNIFIED_MANUSCRIPT_DB][UNIFIED_MANUSCRIPT_COLLECTION]
+
+
+def ensure_unified_indexes() -> None:
+    """통합 컬렉션 인덱스 보장 (프로세스당 한 번)"""
+    global _indexes_ensured
+
+    if _indexes_ensured:
+        return
+
+    collection = get_mongo_client()[UNIFIED_MANUSCRIPT_DB][UNIFIED_MANUSCRIPT_COLLECTION]
+    # 전체 최신순 목록/keyset 페이지
+    collection.create_index(UNIFIED_SORT, name="createdAt_category_id")
+    # 카테고리 지정 최신순 목록
+    collection.create_index(
+        [("category", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+        name="category_createdAt_id",
+    )
+    _indexes_ensured = True
+
+
+def category_filter(categories: Iterable[str]) -> Dict[str, Any]:
+    """카테고리 목록 → 통합 컬렉션 조건"""
+    categories = list(categories)
+    if len(categories) == 1:
+        return {"category": categories[0]}
+    return {"category": {"$in": categories}}
+
+
+# ---------- 이중 쓰기 / 이관 ----------
+def unified_document(category: str, document: Dict[str, Any]) -> Dict[str, Any]:
+    """카테고리 DB 원고 → 통합 컬렉션 문서 (category는 원본 DB 이름)"""
+    return {**document, "category": category}
+
+
+def copy_manuscripts(category: str, documents: Iterable[Dict[str, Any]]) -> int:
+    """
+    원고 여러 건을 통합 컬렉션에 덮어쓰기 (이관/재실행 모두 멱등)
+
+    Returns:
+        복사한 원고 수
+    """
+    operations = [
+        ReplaceOne({"_id": document["_id"]}, unified_document(category, document), upsert=True)
+        for document in documents
+    ]
+    if not operations:
+        return 0
+    unified_collection().bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def _to_object_id(manuscript_id: str) -> Any:
+    try:
+        return ObjectId(manuscript_id)
+    except Exception:
+        return manuscript_id
+
+
+def _load_manuscript(category: str, manuscript_id: str) -> Optional[Dict[str, Any]]:
+    return get_mongo_client()[category][MANUSCRIPTS_COLLECTION].find_one(
+        {"_id": _to_object_id(manuscript_id)}
+    )
+
+
+def sync_manuscript(
+    category: str, manuscript_id: str, document: Optional[Dict[str, Any]] = None
+) -> None:
+    """카테고리 DB 원고 한 건을 통합 컬렉션에 반영 (document 없으면 카테고리 DB에서 읽음)"""
+    document = document or _load_manuscript(category, manuscript_id)
+    if document is None:
+        return
+    copy_manuscripts(category, [document])
+
+
+def handle_manuscript_event(event: ManuscriptEvent) -> None:
+    """원고 변경 이벤트 → 통합 컬렉션 이중 쓰기"""
+    if not writes_unified():
+        return
+
+    # insert만 전체 문서를 싣고 오고, 나머지는 변경 후 문서를 다시 읽음
+    document = dict(event.document) if event.kind == "insert" and event.document else None
+    if document is not None and "_id" not in document:
+        document = None
+    sync_manuscript(event.category, event.manuscript_id, document)
+
+
+def handle_manuscript_events(events: List[ManuscriptEvent]) -> None:
+    """원고 이벤트 여러 건 → 카테고리별로 한 번에 다시 읽어 통합 컬렉션에 반영"""
+    if not writes_unified():
+        return
+
+    ids_by_category: Dict[str, List[Any]] = {}
+    for event in events:
+        ids_by_category.setdefault(event.category, []).append(_to_object_id(event.manuscript_id))
+
+    for category, ids in ids_by_category.items():
+        documents = get_mongo_client()[category][MANUSCRIPTS_COLLECTION].find({"_id": {"$in": ids}})
+        copy_manuscripts(category, documents)
+
+
+def register_manuscript_store() -> None:
+    """원고 이벤트 구독 (애플리케이션 시작 시, 다른 구독자보다 먼저 호출)"""
+    if writes_unified():
+        subscribe(handle_manuscript_event, handle_manuscript_events)
+
+
+__all__ = [
+    "MANUSCRIPT_STORAGE",
+    "UNIFIED_MANUSCRIPT_COLLECTION",
+    "UNIFIED_MANUSCRIPT_DB",
+    "UNIFIED_SORT",
+    "category_filter",
+    "copy_manuscripts",
+    "ensure_unified_indexes",
+    "reads_unified",
+    "register_manuscript_store",
+    "sync_manuscript",
+    "unified_document",
+    "writes_unified",
+]
@@ -0,0 +1,182 @@
+"""
+조회용 인덱스 보장 + 쿼리 플랜 점검
+
+- 인덱스 정의: mongodb_service.QUERY_INDEX_MAP (콜렉션별 선언)
+  - DB별 서비스 첫 사용 시 ensure_unique_indexes에서 함께 보장
+  - 애플리케이션 시작 시 카테고리/기본/search_system DB 전체를 백그라운드로 보장
+- 플랜 점검: HOT_QUERIES(핫 경로 쿼리 모양)를 explain()으로 돌려
+  COLLSCAN(콜렉션 전체 스캔)이 남은 쿼리를 찾는다 (scripts/audit_query_plans.py)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from _constants.categories import CATEGORIES
+from config import MONGO_DB_NAME
+from mongodb_service import SEARCH_SYSTEM_DB_NAME, ensure_database_query_indexes, get_mongo_client
+from services.manuscript_manage_service import VISIBLE_MANUSCRIPT_QUERY
+from services.manuscript_pagination import MANUSCRIPT_SORT
+from services.manuscript_store import UNIFIED_MANUSCRIPT_COLLECTION, UNIFIED_MANUSCRIPT_DB, UNIFIED_SORT
+from services.search_index import SEARCH_INDEX_COLLECTION, SEARCH_INDEX_DB
+from utils.logger import log
+
+ENSURE_QUERY_INDEXES_ON_STARTUP = os.getenv("ENSURE_QUERY_INDEXES_ON_STARTUP", "1") == "1"
+
+# explain 대상 쿼리에 넣는 예시 값 (플랜 모양만 보므로 실제 값일 필요 없음)
+SAMPLE_USER_ID = "__audit__"
+SAMPLE_KEYWORD = "위고비"
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """점검할 핫 경로 쿼리 모양"""
+
+    name: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: Optional[List[Tuple[str, int]]] = None
+    limit: int = 20
+    # None이면 카테고리 DB 전체, 아니면 해당 DB만
+    db: Optional[str] = None
+
+
+HOT_QUERIES: Tuple[HotQuery, ...] = (
+    HotQuery("manuscripts.recent", "manuscripts", {"deleted": {"$ne": True}}, MANUSCRIPT_SORT),
+    HotQuery("manuscripts.visible", "manuscripts", VISIBLE_MANUSCRIPT_QUERY, MANUSCRIPT_SORT),
+    HotQuery("ref.by_keyword", "ref", {"keyword": SAMPLE_KEYWORD}),
+    HotQuery(
+        "bookmarks.by_user",
+        "bookmarks",
+        {"userId": SAMPLE_USER_ID},
+        [("createdAt", -1)],
+        db=SEARCH_SYSTEM_DB_NAME,
+    ),
+    HotQuery(
+        "search_history.by_user",
+        "search_history",
+        {"userId": SAMPLE_USER_ID},
+        [("searchedAt", -1)],
+        db=SEARCH_SYSTEM_DB_NAME,
+    ),
+    HotQuery(
+        "manuscript_store.recent",
+        UNIFIED_MANUSCRIPT_COLLECTION,
+        {"deleted": {"$ne": True}},
+        UNIFIED_SORT,
+        db=UNIFIED_MANUSCRIPT_DB,
+    ),
+    HotQuery(
+        "search_index.grams",
+        SEARCH_INDEX_COLLECTION,
+        {"grams": {"$all": ["위고", "고비"]}, "deleted": False},
+        [("createdAt", -1)],
+        db=SEARCH_INDEX_DB,
+    ),
+)
+
+
+@dataclass
+class PlanFinding:
+    """쿼리 하나의 explain 결과 요약"""
+
+    query: str
+    db: str
+    stages: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def collscan(self) -> bool:
+        return "COLLSCAN" in self.stages
+
+
+# ---------- 인덱스 보장 ----------
+def query_index_db_names(categories: Optional[Iterable[str]] = None) -> List[str]:
+    """조회용 인덱스를 보장할 DB 목록 (카테고리 + 기본 + search_system)"""
+    names = list(categories if categories is not None else CATEGORIES)
+    if MONGO_DB_NAME:
+        names.append(MONGO_DB_NAME)
+    names.append(SEARCH_SYSTEM_DB_NAME)
+    return list(dict.fromkeys(names))
+
+
+async def ensure_query_indexes_on_startup() -> None:
+    """애플리케이션 시작 시 전체 DB 조회용 인덱스 보장 (실패해도 서비스는 계속)"""
+    if not ENSURE_QUERY_INDEXES_ON_STARTUP:
+        return
+
+    db_names = query_index_db_names()
+    try:
+        done = await asyncio.to_thread(ensure_database_query_indexes, db_names)
+    except Exception as e:
+        log.warning(f"조회용 인덱스 보장 실패: {e}")
+        return
+    log.info("조회용 인덱스 보장", databases=done, total=len(db_names))
+
+
+# ---------- 플랜 점검 ----------
+def _plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    # SBE 엔진(7.0+)은 winningPlan 아래 queryPlan으로 한 번 더 감싼다
+    if "queryPlan" in plan:
+        plan = plan["queryPlan"]
+    yield plan
+    if isinstance(plan.get("inputStage"), dict):
+        yield from _plan_nodes(plan["inputStage"])
+    for child in plan.get("inputStages") or []:
+        yield from _plan_nodes(child)
+
+
+def plan_stages(explain: Dict[str, Any]) -> List[str]:
+    """explain() 결과 → 채택된 플랜의 stage 이름 목록 (바깥 → 안쪽)"""
+    winning = (explain.get("queryPlanner") or {}).get("winningPlan") or {}
+    return [node["stage"] for node in _plan_nodes(winning) if node.get("stage")]
+
+
+def explain_hot_query(db_name: str, query: HotQuery) -> PlanFinding:
+    """핫 쿼리 하나를 explain()으로 돌려 stage 요약"""
+    finding = PlanFinding(query=query.name, db=db_name)
+    try:
+        cursor = get_mongo_client()[db_name][query.collection].find(query.filter)
+        if query.sort:
+            cursor = cursor.sort(query.sort)
+        finding.stages = plan_stages(cursor.limit(query.limit).explain())
+    except Exception as e:
+        finding.error = str(e)
+    return finding
+
+
+def audit_hot_queries(
+    categories: Optional[Iterable[str]] = None,
+    queries: Iterable[HotQuery] = HOT_QUERIES,
+) -> List[PlanFinding]:
+    """
+    핫 쿼리 플랜 점검
+
+    Args:
+        categories: 카테고리 DB 대상 쿼리를 돌릴 DB (기본: 전체 카테고리)
+        queries: 점검할 쿼리 모양
+
+    Returns:
+        (DB, 쿼리)별 점검 결과
+    """
+    category_dbs = list(categories if categories is not None else CATEGORIES)
+    findings = []
+    for query in queries:
+        for db_name in [query.db] if query.db else category_dbs:
+            findings.append(explain_hot_query(db_name, query))
+    return findings
+
+
+__all__ = [
+    "HOT_QUERIES",
+    "HotQuery",
+    "PlanFinding",
+    "audit_hot_queries",
+    "ensure_query_indexes_on_startup",
+    "explain_hot_query",
+    "plan_stages",
+    "query_index_db_names",
+]
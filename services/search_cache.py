@@ -0,0 +1,371 @@
+"""
+검색 API 응답 캐시
+
+대시보드가 같은 조회를 분당 여러 번 보내는 /search/stats, /search/popular,
+카테고리 지정 /search/keyword 응답을 짧게 캐시한다.
+
+- 엔드포인트(namespace)별 TTL: SEARCH_CACHE_TTLS
+- single-flight: 같은 키로 동시에 들어온 요청은 계산 한 번을 함께 기다림
+- 무효화: 원고 생성/수정/삭제/복구/노출변경 이벤트(services.manuscript_events)마다
+  영향받는 namespace(+카테고리)를 비움
+- 버전 토큰: 계산 시작 전에 (namespace, 카테고리) 버전을 받아 두고, 계산 중 무효화로 버전이
+  바뀌었으면 결과를 저장하지 않음 (무효화 전 데이터로 만든 응답이 TTL 동안 남지 않도록)
+- 저장소 (SEARCH_CACHE_BACKEND):
+  - memory: 프로세스 메모리 TTL+LRU (기본값, 무효화는 세대 번호 증가)
+  - mongo: search_system DB 컬렉션 + TTL 인덱스 (여러 워커 간 공유)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from services.manuscript_events import ManuscriptEvent, subscribe
+from utils.logger import log
+from utils.ttl_cache import TTLCache
+
+T = TypeVar("T")
+
+SEARCH_CACHE_BACKEND = os.getenv("SEARCH_CACHE_BACKEND", "memory").lower()
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+SEARCH_CACHE_DB = "search_system"
+SEARCH_CACHE_COLLECTION = "search_response_cache"
+SEARCH_CACHE_VERSION_COLLECTION = "search_response_cache_versions"
+
+# namespace별 TTL(초)
+SEARCH_CACHE_TTLS: Dict[str, float] = {
+    "stats": float(os.getenv("SEARCH_CACHE_TTL_STATS", "60")),
+    "popular": float(os.getenv("SEARCH_CACHE_TTL_POPULAR", "60")),
+    "keyword": float(os.getenv("SEARCH_CACHE_TTL_KEYWORD", "30")),
+}
+
+# 원고 이벤트 → 비울 namespace (keyword는 해당 카테고리만)
+_INVALIDATION: Dict[str, Tuple[str, ...]] = {
+    "insert": ("stats", "popular", "keyword"),
+    "delete": ("stats", "popular", "keyword"),
+    "restore": ("stats", "popular", "keyword"),
+    "update": ("keyword",),
+    "visibility": ("keyword",),
+}
+_CATEGORY_SCOPED = {"keyword"}
+
+
+def search_cache_key(*parts: Any) -> str:
+    """요청 파라미터 → 캐시 키"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SearchCacheBackend:
+    """검색 응답 캐시 저장소 인터페이스"""
+
+    def version(self, namespace: str, category: Optional[str]) -> Tuple[int, int]:
+        """(namespace, 카테고리) 현재 버전 토큰 (무효화마다 바뀜)"""
+        raise NotImplementedError
+
+    def get(self, namespace: str, category: Optional[str], key: str) -> Optional[Any]:
+        """현재 버전으로 저장된 값만 반환"""
+        raise NotImplementedError
+
+    def set(
+        self,
+        namespace: str,
+        category: Optional[str],
+        key: str,
+        value: Any,
+        ttl: float,
+        version: Tuple[int, int],
+    ) -> None:
+        """version 이 아직 현재 버전일 때만 저장 (계산 중 무효화됐으면 버림)"""
+        raise NotImplementedError
+
+    def invalidate(self, namespace: str, category: Optional[str] = None) -> None:
+        """namespace 전체 또는 namespace+카테고리 항목 무효화"""
+        raise NotImplementedError
+
+
+class MemorySearchCache(SearchCacheBackend):
+    """
+    프로세스 메모리 저장소
+
+    무효화는 (namespace, 카테고리) 세대 번호를 올려 기존 키를 못 찾게 하고,
+    남은 항목은 TTL/LRU로 자연히 빠진다.
+    """
+
+    def __init__(self, maxsize: int = SEARCH_CACHE_SIZE) -> None:
+        self._cache: TTLCache[Any] = TTLCache(maxsize=maxsize)
+        self._generations: Dict[Tuple[str, Optional[str]], int] = {}
+        self._lock = threading.Lock()
+
+    def _version(self, namespace: str, category: Optional[str]) -> Tuple[int, int]:
+        return (
+            self._generations.get((namespace, None), 0),
+            self._generations.get((namespace, category), 0) if category else 0,
+        )
+
+    def version(self, namespace: str, category: Optional[str]) -> Tuple[int, int]:
+        with self._lock:
+            return self._version(namespace, category)
+
+    def get(self, namespace: str, category: Optional[str], key: str) -> Optional[Any]:
+        version = self.version(namespace, category)
+        return self._cache.get((namespace, category, version, key))
+
+    def set(
+        self,
+        namespace: str,
+        category: Optional[str],
+        key: str,
+        value: Any,
+        ttl: float,
+        version: Tuple[int, int],
+    ) -> None:
+        with self._lock:
+            if self._version(namespace, category) != tuple(version):
+                return
+            self._cache.set((namespace, category, tuple(version), key), value, ttl=ttl)
+
+    def invalidate(self, namespace: str, category: Optional[str] = None) -> None:
+        with self._lock:
+            generation_key = (namespace, category)
+            self._generations[generation_key] = self._generations.get(generation_key, 0) + 1
+
+
+class MongoSearchCache(SearchCacheBackend):
+    """
+    MongoDB 저장소. expiresAt TTL 인덱스로 만료 문서 자동 삭제
+
+    버전은 별도 컬렉션의 카운터 문서("namespace:" / "namespace:카테고리")이고, 캐시 문서에
+    저장 당시 버전을 함께 기록해 조회 때 현재 버전과 다르면 무시한다
+    (버전 확인과 저장 사이에 무효화가 끼어들어도 낡은 값이 나가지 않음).
+    """
+
+    def __init__(self) -> None:
+        from mongodb_service import get_mongo_client
+
+        db = get_mongo_client()[SEARCH_CACHE_DB]
+        self.collection = db[SEARCH_CACHE_COLLECTION]
+        self.versions = db[SEARCH_CACHE_VERSION_COLLECTION]
+        try:
+            self.collection.create_index("expiresAt", expireAfterSeconds=0)
+            self.collection.create_index([("namespace", 1), ("category", 1)])
+        except Exception as e:
+            log.warning(f"검색 캐시 인덱스 생성 실패: {e}")
+
+    def version(self, namespace: str, category: Optional[str]) -> Tuple[int, int]:
+        ids = [f"{namespace}:", f"{namespace}:{category}"] if category else [f"{namespace}:"]
+        counters = {
+            doc["_id"]: doc.get("generation", 0)
+            for doc in self.versions.find({"_id": {"$in": ids}})
+        }
+        return (
+            counters.get(f"{namespace}:", 0),
+            counters.get(f"{namespace}:{category}", 0) if category else 0,
+        )
+
+    def get(self, namespace: str, category: Optional[str], key: str) -> Optional[Any]:
+        doc = self.collection.find_one(
+            {"_id": f"{namespace}:{key}", "expiresAt": {"$gt": datetime.now()}}
+        )
+        if not doc or tuple(doc.get("version") or ()) != self.version(namespace, category):
+            return None
+        return doc.get("value")
+
+    def set(
+        self,
+        namespace: str,
+        category: Optional[str],
+        key: str,
+        value: Any,
+        ttl: float,
+        version: Tuple[int, int],
+    ) -> None:
+        if self.version(namespace, category) != tuple(version):
+            return
+        self.collection.replace_one(
+            {"_id": f"{namespace}:{key}"},
+            {
+                "namespace": namespace,
+                "category": category,
+                "version": list(version),
+                "value": value,
+                "expiresAt": datetime.now() + timedelta(seconds=ttl),
+            },
+            upsert=True,
+        )
+
+    def invalidate(self, namespace: str, category: Optional[str] = None) -> None:
+        # 버전을 먼저 올려야 진행 중인 계산의 저장/낡은 문서 조회가 모두 무시됨
+        self.versions.update_one(
+            {"_id": f"{namespace}:{category or ''}"},
+            {"$inc": {"generation": 1}},
+            upsert=True,
+        )
+        query: Dict[str, Any] = {"namespace": namespace}
+        if category:
+            query["category"] = category
+        self.collection.delete_many(query)
+
+
+_backend: Optional[SearchCacheBackend] = None
+_backend_lock = threading.Lock()
+_inflight: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
+
+
+class _LeaderCancelled(Exception):
+    """single-flight 로 계산하던 요청이 취소됨 (기다리던 요청은 다시 시도)"""
+
+
+def _build_backend(backend: str) -> SearchCacheBackend:
+    if backend == "mongo":
+        try:
+            return MongoSearchCache()
+        except Exception as e:
+            log.warning(f"Mongo 검색 캐시 사용 불가 → 메모리 캐시: {e}")
+    return MemorySearchCache()
+
+
+def get_search_cache() -> SearchCacheBackend:
+    """설정된 검색 캐시 저장소 반환 (최초 호출 시 생성)"""
+    global _backend
+
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _build_backend(SEARCH_CACHE_BACKEND)
+    return _backend
+
+
+def set_search_cache(backend: Optional[SearchCacheBackend]) -> None:
+    """저장소 교체 (None이면 다음 호출 때 설정값으로 재생성)"""
+    global _backend
+
+    with _backend_lock:
+        _backend = backend
+
+
+async def _run_backend(fn: Callable[..., T], *args: Any) -> T:
+    backend = get_search_cache()
+    if isinstance(backend, MemorySearchCache):
+        return fn(*args)
+    return await asyncio.to_thread(fn, *args)
+
+
+async def cached_response(
+    namespace: str,
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    category: Optional[str] = None,
+) -> T:
+    """
+    캐시된 응답 반환 (없으면 compute 한 번만 실행해 저장)
+
+    Args:
+        namespace: 엔드포인트 구분 (SEARCH_CACHE_TTLS 키)
+        key: search_cache_key로 만든 요청 키
+        compute: 응답을 만드는 코루틴 함수
+        category: 카테고리 단위 무효화 대상이면 카테고리
+
+    Returns:
+        응답 값
+    """
+    backend = get_search_cache()
+    try:
+        hit = await _run_backend(backend.get, namespace, category, key)
+    except Exception as e:
+        log.warning(f"검색 캐시 조회 실패: {e}")
+        hit = None
+    if hit is not None:
+        return hit
+
+    # 같은 키 계산이 진행 중이면 그 결과를 함께 기다림
+    # (계산하던 요청이 클라이언트 연결 끊김 등으로 취소되면 기다리던 요청 중 하나가 이어서 계산)
+    flight_key = (namespace, key)
+    while True:
+        pending = _inflight.get(flight_key)
+        if pending is None:
+            break
+        try:
+            return await asyncio.shield(pending)
+        except _LeaderCancelled:
+            continue
+
+    future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+    _inflight[flight_key] = future
+    try:
+        # 계산 전에 버전을 받아 둠 → 계산 중 무효화되면 저장하지 않음
+        try:
+            version = await _run_backend(backend.version, namespace, category)
+        except Exception as e:
+            log.warning(f"검색 캐시 버전 조회 실패: {e}")
+            version = None
+        value = await compute()
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelled())
+        # 기다리는 쪽이 없을 때 "exception was never retrieved" 경고 방지
+        future.exception()
+        raise
+    except BaseException as error:
+        future.set_exception(error)
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(flight_key, None)
+
+    future.set_result(value)
+    if version is not None:
+        try:
+            await _run_backend(
+                backend.set, namespace, category, key, value, SEARCH_CACHE_TTLS[namespace], version
+            )
+        except Exception as e:
+            log.warning(f"검색 캐시 저장 실패: {e}")
+    return value
+
+
+def invalidate_search_cache(namespace: str, category: Optional[str] = None) -> None:
+    try:
+        get_search_cache().invalidate(namespace, category)
+    except Exception as e:
+        log.warning(f"검색 캐시 무효화 실패: {e}", namespace=namespace)
+
+
+def handle_manuscript_event(event: ManuscriptEvent) -> None:
+    """원고 변경 이벤트 → 영향받는 캐시 무효화"""
+    for namespace in _INVALIDATION.get(event.kind, ()):
+        category = event.category if namespace in _CATEGORY_SCOPED else None
+        invalidate_search_cache(namespace, category)
+
+
+def handle_manuscript_events(events: List[ManuscriptEvent]) -> None:
+    """원고 이벤트 여러 건 → 겹치는 무효화는 한 번만"""
+    targets = set()
+    for event in events:
+        for namespace in _INVALIDATION.get(event.kind, ()):
+            targets.add((namespace, event.category if namespace in _CATEGORY_SCOPED else None))
+    for namespace, category in targets:
+        invalidate_search_cache(namespace, category)
+
+
+def register_search_cache() -> None:
+    """원고 이벤트 구독 (애플리케이션 시작 시 호출)"""
+    subscribe(handle_manuscript_event, handle_manuscript_events)
+
+
+__all__ = [
+    "MemorySearchCache",
+    "MongoSearchCache",
+    "SEARCH_CACHE_TTLS",
+    "SearchCacheBackend",
+    "cached_response",
+    "get_search_cache",
+    "invalidate_search_cache",
+    "register_search_cache",
+    "search_cache_key",
+    "set_search_cache",
+]
@@ -0,0 +1,500 @@
+"""
+원고 통합 검색 색인 (한국어 문자 bigram)
+
+카테고리 DB마다 정규식($regex)으로 전체 스캔하던 검색을,
+search_system DB의 전역 색인 컬렉션 하나에서 멀티키 인덱스 조회로 바꾼다.
+
+- 원고 1건 = 색인 문서 1건 (_id: "<카테고리>:<원고 _id>")
+- grams: keyword + content 를 정규화(소문자, 공백/기호 제거)한 뒤 만든 고유 문자 bigram 배열
+  → {grams: 1, createdAt: -1} 멀티키 인덱스가 bigram별 포스팅 리스트 역할
+- 검색어 bigram 전체를 $all로 조회한 후보를 원문 부분일치(__score)로 한 번 더 거름 (bigram 오탐 제거)
+  - $all 은 첫 원소만 인덱스 범위로 쓰므로 가장 드문 bigram을 앞에 둠 (빈도는 limit 걸린 count로 추정)
+  - 걸러진 만큼 후보를 더 읽어 페이지를 채우고, total 은 SEARCH_INDEX_COUNT_LIMIT 에서 끊음
+- 원고 생성/수정/삭제 이벤트(services.manuscript_events)로 증분 갱신
+- 기존 원고는 scripts/build_search_index.py로 백필하고, 완료 표시(ready) 전에는 정규식 검색으로 폴백
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Literal, Optional
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, ReplaceOne
+
+from mongodb_service import get_mongo_client
+from services.manuscript_events import (
+    MANUSCRIPTS_COLLECTION,
+    ManuscriptEvent,
+    subscribe,
+)
+from services.manuscript_pagination import PageCursor, decode_cursor, encode_cursor
+from services.manuscript_store import category_filter, reads_unified, unified_collection
+from services.search_results import build_projection, shape_document
+from utils.category_fanout import CATEGORY_FANOUT_TIMEOUT_MS, fan_out_categories
+from utils.logger import log
+from utils.ttl_cache import TTLCache
+
+SEARCH_INDEX_DB = "search_system"
+SEARCH_INDEX_COLLECTION = "manuscript_search_index"
+SEARCH_INDEX_META_COLLECTION = "manuscript_search_index_meta"
+
+SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX_ENABLED", "1") == "1"
+# 점수순 검색 시 원문을 읽어 점수를 매길 최신 후보 수 상한
+SEARCH_INDEX_SCORE_CANDIDATES = int(os.getenv("SEARCH_INDEX_SCORE_CANDIDATES", "200"))
+# total 계산 상한 (이보다 많으면 totalCapped=True)
+SEARCH_INDEX_COUNT_LIMIT = int(os.getenv("SEARCH_INDEX_COUNT_LIMIT", "1000"))
+# 한 번의 검색에서 원문 대조할 후보 수 상한 (넘으면 거기까지의 커서를 돌려줌)
+SEARCH_INDEX_MAX_SCAN = int(os.getenv("SEARCH_INDEX_MAX_SCAN", "2000"))
+
+GRAM_SIZE = 2
+
+SearchSort = Literal["recent", "score"]
+
+# 색인 준비 여부는 자주 바뀌지 않으므로 짧게 캐시
+_ready_cache: TTLCache[bool] = TTLCache(maxsize=1, ttl=60.0)
+# bigram별 문서 수 추정치 (SEARCH_INDEX_COUNT_LIMIT 에서 끊은 값)
+_gram_frequency: TTLCache[int] = TTLCache(maxsize=4096, ttl=300.0)
+_indexes_ensured = False
+
+
+# ---------- 텍스트 → bigram ----------
+def normalize_search_text(text: Optional[str]) -> str:
+    """소문자화 + 공백/기호 제거 (한글/영문/숫자만 남김)"""
+    if not isinstance(text, str):
+        return ""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+
+def text_grams(text: Optional[str]) -> List[str]:
+    """
+    정규화한 텍스트의 고유 문자 bigram 목록
+
+    Args:
+        text: 원문
+
+    Returns:
+        정렬된 bigram 리스트 (정규화 후 1글자면 그 글자 하나)
+    """
+    normalized = normalize_search_text(text)
+    if len(normalized) < GRAM_SIZE:
+        return [normalized] if normalized else []
+    return sorted({normalized[i:i + GRAM_SIZE] for i in range(len(normalized) - GRAM_SIZE + 1)})
+
+
+def can_use_search_index(query: str) -> bool:
+    """색인으로 처리 가능한 검색어인지 (bigram 1개 이상 + 색인 준비 완료)"""
+    if len(normalize_search_text(query)) < GRAM_SIZE:
+        return False
+    return is_search_index_ready()
+
+
+# ---------- 색인 컬렉션 ----------
+def _index_collection():
+    return get_mongo_client()[SEARCH_INDEX_DB][SEARCH_INDEX_COLLECTION]
+
+
+def _meta_collection():
+    return get_mongo_client()[SEARCH_INDEX_DB][SEARCH_INDEX_META_COLLECTION]
+
+
+def ensure_search_index() -> None:
+    """색인 컬렉션 인덱스 보장 (프로세스당 한 번)"""
+    global _indexes_ensured
+
+    if _indexes_ensured:
+        return
+
+    collection = _index_collection()
+    collection.create_index(
+        [("grams", ASCENDING), ("createdAt", DESCENDING)], name="grams_createdAt"
+    )
+    collection.create_index(
+        [("category", ASCENDING), ("createdAt", DESCENDING)], name="category_createdAt"
+    )
+    _indexes_ensured = True
+
+
+def is_search_index_ready() -> bool:
+    """백필이 끝나 색인으로 검색해도 되는지"""
+    if not SEARCH_INDEX_ENABLED:
+        return False
+
+    cached = _ready_cache.get("ready")
+    if cached is not None:
+        return cached
+
+    try:
+        meta = _meta_collection().find_one({"_id": "status"}) or {}
+        ready = bool(meta.get("ready"))
+    except Exception as e:
+        log.warning(f"검색 색인 상태 조회 실패 → 정규식 검색: {e}")
+        ready = False
+
+    _ready_cache.set("ready", ready)
+    return ready
+
+
+def mark_search_index_ready(ready: bool = True) -> None:
+    """백필 완료/해제 표시"""
+    _meta_collection().update_one(
+        {"_id": "status"},
+        {"$set": {"ready": ready, "updatedAt": datetime.now()}},
+        upsert=True,
+    )
+    _ready_cache.clear()
+
+
+def index_entry_id(category: str, manuscript_id: Any) -> str:
+    return f"{category}:{manuscript_id}"
+
+
+def build_index_entry(category: str, document: Dict[str, Any]) -> Dict[str, Any]:
+    """원고 문서 → 색인 문서"""
+    manuscript_id = str(document["_id"])
+    text = f"{document.get('keyword') or ''} {document.get('content') or ''}"
+    return {
+        "_id": index_entry_id(category, manuscript_id),
+        "category": category,
+        "manuscriptId": manuscript_id,
+        "grams": text_grams(text),
+        "createdAt": document.get("createdAt") or datetime.now(),
+        "deleted": bool(document.get("deleted", False)),
+    }
+
+
+def index_manuscript(category: str, document: Dict[str, Any]) -> None:
+    """원고 1건 색인 (있으면 교체)"""
+    ensure_search_index()
+    entry = build_index_entry(category, document)
+    _index_collection().replace_one({"_id": entry["_id"]}, entry, upsert=True)
+
+
+def index_manuscripts(category: str, documents: Iterable[Dict[str, Any]]) -> int:
+    """
+    원고 여러 건 일괄 색인 (백필용)
+
+    Returns:
+        처리한 문서 수
+    """
+    ensure_search_index()
+    ops = []
+    for document in documents:
+        entry = build_index_entry(category, document)
+        ops.append(ReplaceOne({"_id": entry["_id"]}, entry, upsert=True))
+
+    if ops:
+        _index_collection().bulk_write(ops, ordered=False)
+    return len(ops)
+
+
+def mark_manuscript_deleted(category: str, manuscript_id: str) -> None:
+    """소프트 삭제된 원고를 색인에서 제외"""
+    _index_collection().update_one(
+        {"_id": index_entry_id(category, manuscript_id)},
+        {"$set": {"deleted": True}},
+    )
+
+
+def _load_manuscript(category: str, manuscript_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        object_id: Any = ObjectId(manuscript_id)
+    except Exception:
+        object_id = manuscript_id
+    return get_mongo_client()[category][MANUSCRIPTS_COLLECTION].find_one(
+        {"_id": object_id},
+        {"keyword": 1, "content": 1, "createdAt": 1, "deleted": 1},
+    )
+
+
+def handle_manuscript_event(event: ManuscriptEvent) -> None:
+    """원고 변경 이벤트 → 색인 증분 갱신"""
+    if event.kind == "delete":
+        mark_manuscript_deleted(event.category, event.manuscript_id)
+        return
+
+    if event.kind not in ("insert", "update", "restore"):
+        return
+
+    document = event.document if event.kind != "restore" else None
+    document = document or _load_manuscript(event.category, event.manuscript_id)
+    if document is None:
+        return
+    index_manuscript(event.category, document)
+
+
+def handle_manuscript_events(events: List[ManuscriptEvent]) -> None:
+    """원고 이벤트 여러 건 → 삭제 표시는 한 번에, 나머지는 카테고리별 일괄 색인"""
+    deleted_ids = [
+        index_entry_id(event.category, event.manuscript_id)
+        for event in events
+        if event.kind == "delete"
+    ]
+    if deleted_ids:
+        _index_collection().update_many({"_id": {"$in": deleted_ids}}, {"$set": {"deleted": True}})
+
+    documents_by_category: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        if event.kind not in ("insert", "update", "restore"):
+            continue
+        document = event.document if event.kind != "restore" else None
+        document = document or _load_manuscript(event.category, event.manuscript_id)
+        if document is not None:
+            documents_by_category.setdefault(event.category, []).append(document)
+
+    for category, documents in documents_by_category.items():
+        index_manuscripts(category, documents)
+
+
+def register_search_index() -> None:
+    """원고 이벤트 구독 (애플리케이션 시작 시 호출)"""
+    if SEARCH_INDEX_ENABLED:
+        subscribe(handle_manuscript_event, handle_manuscript_events)
+
+
+# ---------- 검색 ----------
+def _fetch_manuscripts(
+    entries: List[Dict[str, Any]], projection: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """색인 항목의 원고 요약을 카테고리별 $in 조회로 가져옴 → {색인 _id: 원고}"""
+    ids_by_category: Dict[str, List[Any]] = {}
+    for entry in entries:
+        try:
+            object_id: Any = ObjectId(entry["manuscriptId"])
+        except Exception:
+            object_id = entry["manuscriptId"]
+        ids_by_category.setdefault(entry["category"], []).append(object_id)
+
+    if reads_unified():
+        # 통합 원고 컬렉션이면 카테고리 구분 없이 _id 한 번에 조회
+        all_ids = [object_id for ids in ids_by_category.values() for object_id in ids]
+        documents: Dict[str, Dict[str, Any]] = {}
+        for doc in (
+            unified_collection()
+            .find(
+                {
+                    "_id": {"$in": all_ids},
+                    **category_filter(ids_by_category),
+                    "deleted": {"$ne": True},
+                },
+                {**projection, "category": 1},
+            )
+            .max_time_ms(CATEGORY_FANOUT_TIMEOUT_MS)
+        ):
+            doc["_id"] = str(doc["_id"])
+            doc["__category"] = doc["category"]
+            documents[index_entry_id(doc["category"], doc["_id"])] = doc
+        return documents
+
+    def load(category: str) -> List[Dict[str, Any]]:
+        return list(
+            get_mongo_client()[category][MANUSCRIPTS_COLLECTION]
+            .find(
+                {"_id": {"$in": ids_by_category[category]}, "deleted": {"$ne": True}},
+                projection,
+            )
+            .max_time_ms(CATEGORY_FANOUT_TIMEOUT_MS)
+        )
+
+    outcome = fan_out_categories(load, list(ids_by_category))
+
+    documents = {}
+    for category, docs in outcome.results.items():
+        for doc in docs:
+            doc["_id"] = str(doc["_id"])
+            doc["__category"] = category
+            documents[index_entry_id(category, doc["_id"])] = doc
+    return documents
+
+
+def _index_keyset_query(cursor: PageCursor) -> Dict[str, Any]:
+    """색인 정렬(createdAt desc, _id desc)에서 커서 이후 항목 조건"""
+    entry_id = index_entry_id(cursor.category, cursor.manuscript_id)
+    if cursor.created_at is None:
+        return {"_id": {"$lt": entry_id}}
+    return {
+        "$or": [
+            {"createdAt": {"$lt": cursor.created_at}},
+            {"createdAt": cursor.created_at, "_id": {"$lt": entry_id}},
+        ]
+    }
+
+
+def _entry_cursor(entry: Dict[str, Any]) -> str:
+    manuscript_id: Any = entry["manuscriptId"]
+    if ObjectId.is_valid(manuscript_id):
+        manuscript_id = ObjectId(manuscript_id)
+    return encode_cursor(
+        {"_id": manuscript_id, "createdAt": entry.get("createdAt")}, entry["category"]
+    )
+
+
+def _gram_count(collection, gram: str) -> int:
+    cached = _gram_frequency.get(gram)
+    if cached is not None:
+        return cached
+    count = collection.count_documents(
+        {"grams": gram}, limit=SEARCH_INDEX_COUNT_LIMIT, hint="grams_createdAt"
+    )
+    _gram_frequency.set(gram, count)
+    return count
+
+
+def rarest_first(collection, grams: List[str]) -> List[str]:
+    """bigram을 추정 빈도 오름차순으로 (가장 드문 bigram이 $all 인덱스 범위가 되도록)"""
+    if len(grams) < 2:
+        return grams
+    return sorted(grams, key=lambda gram: _gram_count(collection, gram))
+
+
+def _scan_matches(
+    collection,
+    index_query: Dict[str, Any],
+    page_cursor: Optional[PageCursor],
+    projection: Dict[str, Any],
+    wanted: int,
+) -> tuple:
+    """
+    최신순으로 후보를 배치 단위로 읽으며 원문에 검색어가 있는 원고를 wanted건까지 모음
+
+    Returns:
+        ([(색인 항목, 원고), ...], 마지막으로 대조한 색인 항목, 후보를 끝까지 읽었는지)
+    """
+    matches: List[tuple] = []
+    last_entry: Optional[Dict[str, Any]] = None
+    scanned = 0
+    keyset = _index_keyset_query(page_cursor) if page_cursor is not None else None
+
+    while len(matches) < wanted and scanned < SEARCH_INDEX_MAX_SCAN:
+        batch_size = min(max((wanted - len(matches)) * 2, 50), SEARCH_INDEX_MAX_SCAN - scanned)
+        find_query = {"$and": [index_query, keyset]} if keyset else index_query
+        entries = list(
+            collection.find(find_query, {"category": 1, "manuscriptId": 1, "createdAt": 1})
+            .sort([("createdAt", DESCENDING), ("_id", DESCENDING)])
+            .hint("grams_createdAt")
+            .limit(batch_size)
+        )
+        if not entries:
+            return matches, last_entry, True
+
+        manuscripts = _fetch_manuscripts(entries, projection)
+        filled = False
+        for entry in entries:
+            scanned += 1
+            last_entry = entry
+            doc = manuscripts.get(entry["_id"])
+            # bigram이 모두 있어도 검색어가 그대로 등장하지 않으면 제외 (__score 0)
+            if doc is not None and doc.get("__score"):
+                matches.append((entry, doc))
+                if len(matches) >= wanted:
+                    filled = True
+                    break
+
+        if not filled and len(entries) < batch_size:
+            return matches, last_entry, True
+        keyset = _index_keyset_query(decode_cursor(_entry_cursor(last_entry)))
+
+    return matches, last_entry, False
+
+
+def search_manuscripts(
+    query: str,
+    category: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20,
+    sort: SearchSort = "recent",
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    색인으로 원고 검색
+
+    Args:
+        query: 검색어 (정규화 후 2글자 이상)
+        category: 카테고리 필터 (None이면 전체)
+        skip: 건너뛸 결과 수
+        limit: 반환할 결과 수
+        sort: "recent"(최신순) | "score"(점수순, 최신 후보 SEARCH_INDEX_SCORE_CANDIDATES건 내에서)
+        cursor: 최신순 다음 페이지 커서 (있으면 skip 대신 사용)
+        fields: 요약 외에 추가로 받을 필드 (services.search_results)
+
+    Returns:
+        {
+            "documents": [...],
+            "total": 색인 후보 수 (SEARCH_INDEX_COUNT_LIMIT 에서 끊음),
+            "totalCapped": total 이 상한에서 끊겼는지,
+            "nextCursor": 다음 페이지 커서
+        }
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    page_cursor = decode_cursor(cursor) if cursor else None
+    needle = normalize_search_text(query)
+    collection = _index_collection()
+    grams = rarest_first(collection, text_grams(needle))
+    index_query: Dict[str, Any] = {"grams": {"$all": grams}, "deleted": False}
+    if category:
+        index_query["category"] = category
+
+    total = collection.count_documents(
+        index_query, limit=SEARCH_INDEX_COUNT_LIMIT, hint="grams_createdAt"
+    )
+    projection = build_projection(query, fields)
+
+    if sort == "score":
+        matches, _, _ = _scan_matches(
+            collection,
+            index_query,
+            None,
+            projection,
+            max(SEARCH_INDEX_SCORE_CANDIDATES, skip + limit),
+        )
+        documents = [shape_document(doc, query) for _, doc in matches]
+        documents.sort(key=lambda d: d["__score"], reverse=True)
+        return {
+            "documents": documents[skip:skip + limit],
+            "total": total,
+            "totalCapped": total >= SEARCH_INDEX_COUNT_LIMIT,
+            "nextCursor": None,
+        }
+
+    offset = 0 if page_cursor else skip
+    matches, last_entry, exhausted = _scan_matches(
+        collection, index_query, page_cursor, projection, offset + limit + 1
+    )
+    page = matches[offset:offset + limit]
+
+    next_cursor = None
+    if page and len(matches) > offset + limit:
+        next_cursor = _entry_cursor(page[-1][0])
+    elif not exhausted and last_entry is not None:
+        # 대조 상한에 걸림 → 대조한 곳까지의 커서로 이어서 검색
+        next_cursor = _entry_cursor(last_entry)
+
+    return {
+        "documents": [shape_document(doc, query) for _, doc in page],
+        "total": total,
+        "totalCapped": total >= SEARCH_INDEX_COUNT_LIMIT,
+        "nextCursor": next_cursor,
+    }
+
+
+__all__ = [
+    "SEARCH_INDEX_COLLECTION",
+    "SEARCH_INDEX_DB",
+    "build_index_entry",
+    "can_use_search_index",
+    "ensure_search_index",
+    "handle_manuscript_event",
+    "index_manuscript",
+    "index_manuscripts",
+    "is_search_index_ready",
+    "mark_manuscript_deleted",
+    "mark_search_index_ready",
+    "normalize_search_text",
+    "register_search_index",
+    "search_manuscripts",
+    "text_grams",
+]
@@ -0,0 +1,171 @@
+"""
+검색 결과 모양 만들기 (projection + 스니펫)
+
+검색/목록 응답에 원고 content 전체를 싣지 않고,
+Mongo projection으로 메타데이터와 첫 일치 위치 주변 스니펫만 가져온다.
+
+- 스니펫/점수는 Mongo projection 식($indexOfCP, $substrCP, $replaceAll)으로 서버에서 계산
+  → content 전체가 네트워크/파이썬 직렬화를 거치지 않음
+- __snippet: 첫 일치 위치 앞뒤 SNIPPET_CONTEXT자 (일치가 없으면 앞부분), 잘린 쪽은 "…"
+- __highlights: __snippet 안 검색어 위치 [[시작, 끝], ...]
+- fields: 추가로 받을 필드 (예: ["content"]) — 전체 원고는 /search/manuscript/{id} 사용 권장
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+SNIPPET_LENGTH = int(os.getenv("SEARCH_SNIPPET_LENGTH", "120"))
+SNIPPET_CONTEXT = int(os.getenv("SEARCH_SNIPPET_CONTEXT", "40"))
+
+SUMMARY_FIELDS = (
+    "keyword",
+    "category",
+    "engine",
+    "service",
+    "createdAt",
+    "updatedAt",
+    "visible",
+    "isVisible",
+)
+
+ELLIPSIS = "…"
+
+# projection에 항상 들어가거나 스니펫 계산에 쓰는 경로 → 하위 경로를 함께 요청하면 Mongo path collision
+_PROJECTED_PATHS = (*SUMMARY_FIELDS, "content")
+
+_FIELD_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9_]*(\.[A-Za-z0-9_]+)*$")
+
+_CONTENT = {"$ifNull": ["$content", ""]}
+
+
+def _paths_overlap(a: str, b: str) -> bool:
+    """한 경로가 다른 경로의 상위/하위 경로인지 (예: content, content.y)"""
+    return a.startswith(f"{b}.") or b.startswith(f"{a}.")
+
+
+def parse_fields(fields: Optional[Iterable[str]]) -> List[str]:
+    """
+    추가 요청 필드 검증 (쉼표 구분 문자열도 허용, 중복은 한 번만)
+
+    Raises:
+        ValueError: 잘못된 필드 이름, 또는 기본 포함 필드/다른 요청 필드와 겹치는 경로
+    """
+    if not fields:
+        return []
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    names = []
+    for name in fields:
+        name = name.strip()
+        if not name:
+            continue
+        if not _FIELD_NAME.match(name):
+            raise ValueError(f"잘못된 필드 이름입니다: {name}")
+        if name in names:
+            continue
+        overlap = next(
+            (path for path in (*_PROJECTED_PATHS, *names) if _paths_overlap(name, path)),
+            None,
+        )
+        if overlap is not None:
+            raise ValueError(f"필드 경로가 겹칩니다: {name} ({overlap})")
+        names.append(name)
+    return names
+
+
+def _needle(query: Optional[str]) -> str:
+    return (query or "").strip().lower()
+
+
+def build_projection(query: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    검색 결과용 projection
+
+    Args:
+        query: 검색어 (있으면 일치 위치 스니펫 + __score 계산)
+        fields: 추가로 포함할 필드
+
+    Returns:
+        find()에 넘길 projection
+    """
+    projection: Dict[str, Any] = {field: 1 for field in SUMMARY_FIELDS}
+    for field in fields or []:
+        projection[field] = 1
+
+    needle = _needle(query)
+    lowered = {"$toLower": _CONTENT}
+
+    if needle:
+        # "$"로 시작하는 검색어가 필드 경로로 해석되지 않도록 리터럴 처리
+        literal = {"$literal": needle}
+        position = {"$indexOfCP": [lowered, literal]}
+        start = {"$max": [0, {"$subtract": [position, SNIPPET_CONTEXT]}]}
+        occurrences = {
+            "$divide": [
+                {
+                    "$subtract": [
+                        {"$strLenCP": lowered},
+                        {"$strLenCP": {"$replaceAll": {"input": lowered, "find": literal, "replacement": ""}}},
+                    ]
+                },
+                len(needle),
+            ]
+        }
+        keyword_hit = {
+            "$cond": [
+                {"$gte": [{"$indexOfCP": [{"$toLower": {"$ifNull": ["$keyword", ""]}}, literal]}, 0]},
+                10,
+                0,
+            ]
+        }
+        projection["__score"] = {"$toInt": {"$add": [keyword_hit, occurrences]}}
+    else:
+        start = 0
+
+    projection["__snippetStart"] = start
+    projection["__snippet"] = {"$substrCP": [_CONTENT, start, SNIPPET_LENGTH]}
+    projection["__contentLength"] = {"$strLenCP": _CONTENT}
+    return projection
+
+
+def find_highlights(snippet: str, query: Optional[str]) -> List[List[int]]:
+    """스니펫 안 검색어 위치 (대소문자 무시)"""
+    needle = _needle(query)
+    if not needle:
+        return []
+
+    lowered = snippet.lower()
+    highlights = []
+    position = lowered.find(needle)
+    while position >= 0:
+        highlights.append([position, position + len(needle)])
+        position = lowered.find(needle, position + len(needle))
+    return highlights
+
+
+def shape_document(document: Dict[str, Any], query: Optional[str] = None) -> Dict[str, Any]:
+    """projection 결과 → 응답 문서 (스니펫 말줄임 + 하이라이트 위치)"""
+    start = document.pop("__snippetStart", 0) or 0
+    length = document.pop("__contentLength", 0) or 0
+    snippet = document.get("__snippet") or ""
+
+    prefix = ELLIPSIS if start > 0 else ""
+    suffix = ELLIPSIS if start + len(snippet) < length else ""
+    document["__snippet"] = f"{prefix}{snippet}{suffix}"
+    document["__highlights"] = [
+        [begin + len(prefix), end + len(prefix)] for begin, end in find_highlights(snippet, query)
+    ]
+    return document
+
+
+__all__ = [
+    "SUMMARY_FIELDS",
+    "build_projection",
+    "find_highlights",
+    "parse_fields",
+    "shape_document",
+]
@@ -0,0 +1,225 @@
+import asyncio
+
+from _constants.Model import Model
+from utils.ai_client import text as text_module
+from utils.ai_client import text_registry
+from utils.ai_client.text_providers import stream_grok_text
+from utils.ai_client.text_providers_async import (
+    acall_chat_completion_text,
+    astream_openai_text,
+)
+
+
+def _set_deepseek_key(monkeypatch) -> None:
+    """.env 없이도 DeepSeek 키 검사/클라이언트 생성을 통과하도록 키 고정"""
+    monkeypatch.setattr(text_registry, "DEEPSEEK_API_KEY", "test-key")
+    monkeypatch.setitem(text_registry.PROVIDER_API_KEYS, "deepseek", "test-key")
+
+
+class _FakeMessage:
+    content = " 비동기 응답 "
+
+
+class _FakeChoice:
+    message = _FakeMessage()
+
+
+class _FakeAsyncChatCompletions:
+    def __init__(self) -> None:
+        self.request: dict[str, object] = {}
+
+    async def create(self, **request: object) -> object:
+        self.request = request
+        await asyncio.sleep(0)
+        return type("Response", (), {"choices": [_FakeChoice()], "usage": None})()
+
+
+class _FakeAsyncChat:
+    def __init__(self) -> None:
+        self.completions = _FakeAsyncChatCompletions()
+
+
+class _FakeAsyncClient:
+    def __init__(self) -> None:
+        self.chat = _FakeAsyncChat()
+
+
+def test_acall_chat_completion_forwards_request_options() -> None:
+    client = _FakeAsyncClient()
+
+    text, input_tokens, output_tokens = asyncio.run(
+        acall_chat_completion_text(
+            client=client,
+            model_name=Model.DEEPSEEK_V4_PRO,
+            system_prompt="system",
+            user_prompt="user",
+            provider_name="DeepSeek",
+            max_tokens=128,
+            reasoning_effort="high",
+        )
+    )
+
+    assert text == "비동기 응답"
+    assert (input_tokens, output_tokens) == (0, 0)
+    assert client.chat.completions.request["max_tokens"] == 128
+    assert client.chat.completions.request["reasoning_effort"] == "high"
+    assert client.chat.completions.request["messages"] == [
+        {"role": "system", "content": "system"},
+        {"role": "user", "content": "user"},
+    ]
+
+
+def test_acall_ai_uses_async_client_and_strips_text(monkeypatch) -> None:
+    _set_deepseek_key(monkeypatch)
+    client = _FakeAsyncClient()
+    monkeypatch.setattr(text_module, "get_async_ai_client", lambda service_type: client)
+
+    text = asyncio.run(
+        text_module.acall_ai(
+            model_name=Model.DEEPSEEK_V4_FLASH,
+            system_prompt="system",
+            user_prompt="user",
+        )
+    )
+
+    assert text == "비동기 응답"
+    assert client.chat.completions.request["extra_body"] == {
+        "thinking": {"type": "disabled"}
+    }
+
+
+def test_async_client_is_reused_within_event_loop(monkeypatch) -> None:
+    _set_deepseek_key(monkeypatch)
+
+    async def fetch_twice() -> tuple[object, object]:
+        first = text_registry.get_async_ai_client("deepseek")
+        second = text_registry.get_async_ai_client("deepseek")
+        await text_registry.aclose_ai_clients()
+        return first, second
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert first is not None
+    assert first is second
+
+
+def test_pool_size_can_be_overridden_per_provider(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_POOL_SIZE_GROK", "4")
+
+    assert text_registry.get_pool_size("grok") == 4
+    assert text_registry.get_client_pool_sizes()["openai"] == text_registry.LLM_POOL_SIZE
+
+
+class _Event:
+    def __init__(self, type: str, delta: str = "") -> None:
+        self.type = type
+        self.delta = delta
+
+
+class _FakeResponsesStream:
+    def __init__(self, events: list[_Event]) -> None:
+        self.events = events
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def __aiter__(self) -> "_FakeResponsesStream":
+        self._iter = iter(self.events)
+        return self
+
+    async def __anext__(self) -> _Event:
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeAsyncResponses:
+    def __init__(self) -> None:
+        self.request: dict[str, object] = {}
+
+    async def create(self, **request: object) -> _FakeResponsesStream:
+        self.request = request
+        self.stream = _FakeResponsesStream(
+            [
+                _Event("response.created"),
+                _Event("response.output_text.delta", "안녕"),
+                _Event("response.reasoning_summary_text.delta", "생각"),
+                _Event("response.output_text.delta", "하세요"),
+                _Event("response.completed"),
+            ]
+        )
+        return self.stream
+
+
+def test_astream_openai_responses_yields_incremental_deltas() -> None:
+    client = type("Client", (), {"responses": _FakeAsyncResponses()})()
+
+    async def collect() -> list[str]:
+        return [
+            chunk
+            async for chunk in astream_openai_text(
+                client=client,
+                model_name="gpt-5.2",
+                system_prompt="system",
+                user_prompt="user",
+                max_tokens=128,
+            )
+        ]
+
+    chunks = asyncio.run(collect())
+
+    assert client.responses.request["stream"] is True
+    assert chunks == ["data: 안녕\n\n", "data: 하세요\n\n", "data: [DONE]\n\n"]
+    assert client.responses.stream.closed
+
+
+def test_astream_closes_upstream_stream_when_consumer_stops_early() -> None:
+    client = type("Client", (), {"responses": _FakeAsyncResponses()})()
+
+    async def first_chunk() -> str:
+        stream = astream_openai_text(
+            client=client,
+            model_name="gpt-5.2",
+            system_prompt="system",
+            user_prompt="user",
+            max_tokens=128,
+        )
+        chunk = await stream.__anext__()
+        # SSE 클라이언트 연결 끊김 → StreamingResponse 가 생성기를 닫음
+        await stream.aclose()
+        return chunk
+
+    assert asyncio.run(first_chunk()) == "data: 안녕\n\n"
+    assert client.responses.stream.closed
+
+
+class _FakeGrokChunk:
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+
+class _FakeGrokSession:
+    def append(self, message: object) -> None:
+        pass
+
+    def stream(self):
+        for piece in ["그록", "", " 스트림"]:
+            yield None, _FakeGrokChunk(piece)
+
+
+def test_stream_grok_uses_native_stream() -> None:
+    chat = type("Chat", (), {"create": lambda self, model: _FakeGrokSession()})()
+    client = type("Client", (), {"chat": chat})()
+
+    chunks = list(
+        stream_grok_text(
+            client=client,
+            model_name="grok-4",
+            system_prompt="system",
+            user_prompt="user",
+        )
+    )
+
+    assert chunks == ["data: 그록\n\n", "data:  스트림\n\n", "data: [DONE]\n\n"]
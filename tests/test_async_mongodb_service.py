@@ -0,0 +1,90 @@
+import asyncio
+
+import async_mongodb_service
+from async_mongodb_service import AsyncMongoDBService
+
+
+class _FakeInsertResult:
+    inserted_id = "new-id"
+
+
+class _FakeCursor:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+        self.calls: list[tuple[str, object]] = []
+
+    def sort(self, spec: object) -> "_FakeCursor":
+        self.calls.append(("sort", spec))
+        return self
+
+    def limit(self, value: int) -> "_FakeCursor":
+        self.calls.append(("limit", value))
+        return self
+
+    async def to_list(self) -> list[dict]:
+        return self.docs
+
+
+class _FakeCollection:
+    def __init__(self) -> None:
+        self.inserted: list[dict] = []
+        self.cursor = _FakeCursor([{"keyword": "테스트"}])
+
+    async def insert_one(self, document: dict) -> _FakeInsertResult:
+        self.inserted.append(document)
+        return _FakeInsertResult()
+
+    def find(self, query: dict, projection: object = None) -> _FakeCursor:
+        return self.cursor
+
+
+class _FakeDatabase:
+    name = "test_db"
+
+    def __init__(self) -> None:
+        self.collection = _FakeCollection()
+
+    def __getitem__(self, name: str) -> _FakeCollection:
+        return self.collection
+
+
+def _service_with_fake_db() -> AsyncMongoDBService:
+    service = AsyncMongoDBService.__new__(AsyncMongoDBService)
+    service.db = _FakeDatabase()
+    return service
+
+
+def test_async_service_awaits_collection_calls(monkeypatch) -> None:
+    monkeypatch.setattr(async_mongodb_service, "_indexed_db_names", {"test_db"})
+    service = _service_with_fake_db()
+
+    async def run() -> tuple[object, list[dict]]:
+        inserted_id = await service.insert_document("manuscripts", {"content": "본문"})
+        docs = await service.find_documents(
+            "manuscripts", {}, sort=[("createdAt", -1)], limit=5
+        )
+        return inserted_id, docs
+
+    inserted_id, docs = asyncio.run(run())
+
+    assert inserted_id == "new-id"
+    assert docs == [{"keyword": "테스트"}]
+    assert service.db.collection.cursor.calls == [
+        ("sort", [("createdAt", -1)]),
+        ("limit", 5),
+    ]
+
+
+def test_async_client_is_shared_within_event_loop(monkeypatch) -> None:
+    # 클라이언트 생성은 연결하지 않으므로 .env 없이도 실행되도록 URI만 고정
+    monkeypatch.setattr(async_mongodb_service, "MONGO_URI", "mongodb://localhost:27017")
+
+    async def fetch_twice() -> tuple[object, object]:
+        first = async_mongodb_service.get_async_mongo_client()
+        second = async_mongodb_service.get_async_mongo_client()
+        await async_mongodb_service.aclose_mongo_client()
+        return first, second
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert first is second
@@ -0,0 +1,28 @@
+from services.autocomplete_index import AutocompleteIndex, to_choseong
+
+
+def test_suggest_prefix_word_start_and_choseong() -> None:
+    index = AutocompleteIndex({"위고비 효능": 5, "위고비 부작용": 9, "위염 증상": 3, "임플란트": 4})
+
+    assert to_choseong("위고비 A") == "ㅇㄱㅂ A"
+    assert [s["keyword"] for s in index.suggest("위고")] == ["위고비 부작용", "위고비 효능"]
+    assert [s["keyword"] for s in index.suggest("효능")] == ["위고비 효능"]
+    assert [s["keyword"] for s in index.suggest("위고비효")] == ["위고비 효능"]
+    assert [s["keyword"] for s in index.suggest("ㅇㄱㅂ")] == ["위고비 부작용", "위고비 효능"]
+    assert [s["keyword"] for s in index.suggest("위ㅇ")] == ["위염 증상"]
+    assert index.suggest("ㅇ", limit=1) == [{"keyword": "위고비 부작용", "count": 9}]
+
+
+def test_incremental_add_and_remove() -> None:
+    index = AutocompleteIndex()
+
+    index.add("다이어트 식단")
+    index.add("다이어트 식단")
+    index.add("다이어트 운동")
+    assert index.suggest("ㄷㅇ") == [
+        {"keyword": "다이어트 식단", "count": 2},
+        {"keyword": "다이어트 운동", "count": 1},
+    ]
+
+    index.add("다이어트 운동", -1)
+    assert index.suggest("다이") == [{"keyword": "다이어트 식단", "count": 2}]
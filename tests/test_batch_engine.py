@@ -0,0 +1,79 @@
+import asyncio
+
+from utils.batch_engine import ProviderLimiter, gather_batch, run_batch
+
+
+def test_batch_runs_concurrently_retries_in_isolation_and_keeps_order() -> None:
+    running = 0
+    peak = 0
+    attempts: dict = {}
+
+    async def worker(index: int, keyword: str):
+        nonlocal running, peak
+        attempts[keyword] = attempts.get(keyword, 0) + 1
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - index))
+        running -= 1
+        if keyword == "flaky" and attempts[keyword] == 1:
+            raise RuntimeError("일시 오류")
+        if keyword == "broken":
+            return None
+        return keyword.upper()
+
+    async def scenario():
+        finished = []
+        results = await gather_batch(
+            ["a", "flaky", "broken", "b", "c"],
+            worker,
+            concurrency=3,
+            retries=1,
+            retry_delay=0,
+            on_result=lambda result: finished.append(result.index),
+        )
+        return finished, results
+
+    finished, results = asyncio.run(scenario())
+
+    assert peak == 3
+    assert finished != sorted(finished)
+    assert [r.value for r in results] == ["A", "FLAKY", None, "B", "C"]
+    assert [r.attempts for r in results] == [1, 2, 2, 1, 1]
+    assert not results[2].ok and results[2].error == "결과 없음"
+
+
+def test_provider_limiter_waits_for_rpm_window() -> None:
+    limiter = ProviderLimiter("test", concurrency=10, rpm=2, window=0.2)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def call():
+            async with limiter.limit():
+                return loop.time() - started
+
+        return await asyncio.gather(call(), call(), call())
+
+    first, second, third = asyncio.run(scenario())
+    assert first < 0.1 and second < 0.1
+    assert third >= 0.19
+
+
+def test_run_batch_cancels_remaining_items_when_consumer_stops() -> None:
+    started = []
+
+    async def worker(index: int, item: int):
+        started.append(index)
+        await asyncio.sleep(0 if index == 0 else 10)
+        return item
+
+    async def scenario():
+        stream = run_batch(list(range(4)), worker, concurrency=4)
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    first = asyncio.run(asyncio.wait_for(scenario(), timeout=2))
+    assert first.index == 0
+    assert sorted(started) == [0, 1, 2, 3]
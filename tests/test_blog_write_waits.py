@@ -0,0 +1,60 @@
+import asyncio
+
+from services.blog_write_service import NetworkTracker, StepTrace
+
+
+class _FakeRequest:
+    def __init__(self, resource_type: str, url: str = "https://blog.upphoto.naver.com/upload") -> None:
+        self.resource_type = resource_type
+        self.url = url
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.handlers = {}
+
+    def on(self, event, handler) -> None:
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler) -> None:
+        self.handlers[event].remove(handler)
+
+    def emit(self, event, request) -> None:
+        for handler in list(self.handlers.get(event, [])):
+            handler(request)
+
+
+def test_network_tracker_waits_for_upload_xhr_to_finish() -> None:
+    page = _FakePage()
+
+    async def scenario():
+        with NetworkTracker(page) as network:
+            upload = _FakeRequest("xhr")
+            page.emit("request", upload)
+            page.emit("request", _FakeRequest("image"))  # XHR/fetch 만 추적
+            page.emit("request", _FakeRequest("xhr", "https://lcs.naver.com/m"))  # 업로드 외 요청 무시
+            page.emit("request", _FakeRequest("fetch", "https://blog.naver.com/AutoSave.naver"))
+            assert network.inflight == 1
+
+            # 요청이 끝나지 않으면 상한에서 False
+            assert await network.wait_idle(50, quiet_ms=10) is False
+
+            async def finish():
+                await asyncio.sleep(0.02)
+                page.emit("requestfinished", upload)
+
+            asyncio.create_task(finish())
+            assert await network.wait_idle(1000, quiet_ms=10) is True
+        assert all(not handlers for handlers in page.handlers.values())
+
+    asyncio.run(scenario())
+
+
+def test_step_trace_accumulates_repeated_steps() -> None:
+    trace = StepTrace()
+    for _ in range(2):
+        with trace.step("images"):
+            pass
+    summary = trace.summary()
+    assert set(summary) == {"images", "total"}
+    assert summary["total"] >= summary["images"] >= 0
@@ -0,0 +1,197 @@
+import asyncio
+import json
+import time
+
+from services.browser_pool import BrowserPool, account_key
+
+
+class _FakeContext:
+    def __init__(self, storage_state=None) -> None:
+        self.storage_state_path = storage_state
+        self.cookies = []
+        self.closed = False
+        self.pages = 0
+
+    def on(self, event, handler) -> None:
+        pass
+
+    async def add_cookies(self, cookies) -> None:
+        self.cookies.extend(cookies)
+
+    async def new_page(self):
+        self.pages += 1
+        context = self
+
+        class _Page:
+            async def close(self) -> None:
+                pass
+
+        page = _Page()
+        page.context = context
+        return page
+
+    async def storage_state(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"cookies": self.cookies}, file)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self, user_agent=None, storage_state=None):
+        context = _FakeContext(storage_state)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        pass
+
+
+def _pool(tmp_path, **kwargs):
+    browser = _FakeBrowser()
+
+    async def launch():
+        return browser
+
+    return BrowserPool(state_dir=tmp_path / "sessions", launch=launch, **kwargs), browser
+
+
+def test_pool_reuses_context_per_account_and_evicts_least_recently_used(tmp_path) -> None:
+    pool, browser = _pool(tmp_path, size=2, max_uses=3)
+
+    async def use(key):
+        async with pool.page(key) as page:
+            return page.context
+
+    async def scenario():
+        first = await use("a")
+        assert await use("a") is first
+        await use("b")
+        await use("c")  # 가득 참 → 가장 오래 안 쓴 a 정리
+        assert first.closed
+        again = await use("a")
+        assert again is not first
+        # 저장된 세션으로 새 컨텍스트 생성
+        assert again.storage_state_path == str(pool.state_path("a"))
+
+        await use("a")
+        await use("a")
+        recycled = await use("a")  # max_uses(3) 도달 → 새 컨텍스트
+        assert recycled is not again and again.closed
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    assert len(browser.contexts) == 5
+
+
+def test_saved_cookies_reused_only_while_session_cookies_are_valid(tmp_path) -> None:
+    pool, _ = _pool(tmp_path)
+    key = account_key("naver_user")
+    now = time.time()
+    cookies = [
+        {"name": "NID_AUT", "value": "aut", "expires": now + 3600},
+        {"name": "NID_SES", "value": "ses", "expires": now + 3600},
+    ]
+
+    async def login():
+        async with pool.page(key, cookies=cookies, fresh=True):
+            pass
+
+    asyncio.run(login())
+    assert [c["name"] for c in pool.saved_cookies(key)] == ["NID_AUT", "NID_SES"]
+
+    cookies[1]["expires"] = now - 1
+    asyncio.run(login())
+    assert pool.saved_cookies(key) is None
+
+    pool.forget(key)
+    assert not pool.state_path(key).exists()
+    assert account_key(None, cookies) == account_key(None, list(cookies))
+
+
+def test_saved_session_reused_only_for_verified_password_and_revoked_on_logout(tmp_path) -> None:
+    pool, _ = _pool(tmp_path)
+    key = account_key("naver_user")
+    assert not pool.password_matches(key, "pw")
+
+    pool.remember_password(key, "pw")
+    assert pool.password_matches(key, "pw")
+    assert not pool.password_matches(key, "wrong")
+
+    async def scenario():
+        async with pool.page(key) as page:
+            context = page.context
+        await pool.revoke(key)
+        return context
+
+    context = asyncio.run(scenario())
+    assert context.closed
+    assert not pool.password_matches(key, "pw")
+    assert not pool.state_path(key).exists()
+
+
+def test_expired_session_triggers_one_real_login_and_refreshes_cookies(monkeypatch) -> None:
+    from routers.bot import common
+    from services.blog_write_service import SESSION_EXPIRED_ERROR
+
+    posted_with = []
+    logins = []
+
+    async def write_blog_post(cookies, account_id, **post):
+        posted_with.append(list(cookies))
+        if cookies == ["stale"]:
+            return {"success": False, "post_url": None, "message": "만료", "error": SESSION_EXPIRED_ERROR}
+        return {"success": True, "post_url": "url", "message": "ok"}
+
+    async def login(account_id, password, reuse_session=True, debug=False):
+        logins.append(reuse_session)
+        return {"success": True, "cookies": ["fresh"]}
+
+    monkeypatch.setattr(common, "write_blog_post", write_blog_post)
+    monkeypatch.setattr(common, "naver_login_with_playwright", login)
+
+    cookies = ["stale"]
+    result = asyncio.run(common._write_with_relogin(cookies, "naver_user", "pw", title="t"))
+    assert result["success"]
+    assert logins == [False]
+    assert posted_with == [["stale"], ["fresh"]]
+    assert cookies == ["fresh"]
+
+
+def test_failed_login_in_throwaway_context_keeps_pooled_session(tmp_path) -> None:
+    pool, browser = _pool(tmp_path)
+    key = account_key("naver_user")
+    now = time.time()
+    cookies = [
+        {"name": "NID_AUT", "value": "aut", "expires": now + 3600},
+        {"name": "NID_SES", "value": "ses", "expires": now + 3600},
+    ]
+
+    async def scenario():
+        await pool.store_session(key, cookies)
+        async with pool.page(key) as page:
+            pooled = page.context
+
+        # 로그인 실패: 임시 컨텍스트만 닫히고 계정 컨텍스트/세션 파일은 그대로
+        async with pool.login_page() as page:
+            throwaway = page.context
+        assert throwaway.closed and throwaway is not pooled
+        assert not pooled.closed
+        assert pool.saved_cookies(key) is not None
+
+        # 로그인 성공: 계정 컨텍스트를 새 쿠키로 교체
+        fresh = [dict(cookie, value="new") for cookie in cookies]
+        await pool.store_session(key, fresh)
+        assert pooled.closed
+        assert [c["value"] for c in pool.saved_cookies(key)] == ["new", "new"]
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    assert pool.stats()["contexts"] == 0
@@ -0,0 +1,86 @@
+import asyncio
+import importlib
+
+# utils 패키지가 같은 이름의 함수를 re-export 하므로 모듈을 직접 가져옴
+classifier = importlib.import_module("utils.get_category_db_name")
+
+
+def test_preclassify_prefers_longest_category_match() -> None:
+    assert classifier.preclassify_category("스키장 셔틀 시간표") == "스키장_셔틀"
+    assert classifier.preclassify_category("DHC 콜라겐 후기") == "DHC_콜라겐"
+    assert classifier.preclassify_category("투데이라섹 회복기간") == "안과"
+    assert classifier.preclassify_category("치아미백 가격") == "라미네이트"
+
+
+def test_preclassify_leaves_ambiguous_keywords_to_llm() -> None:
+    assert classifier.preclassify_category("다이어트 유산균 추천") is None
+    assert classifier.preclassify_category("기타 레슨") is None
+    assert classifier.preclassify_category("요즘 뜨는 여행지") is None
+
+
+def test_preclassify_matches_whole_tokens_not_substrings() -> None:
+    assert classifier.preclassify_category("라섹 후기") == "안과"
+    for keyword in ("불안과 우울증 극복", "편안과 휴식 여행", "가구당 대출", "호텔경제학"):
+        assert classifier.preclassify_category(keyword) is None, keyword
+
+
+def test_llm_result_is_cached_by_normalized_keyword(monkeypatch) -> None:
+    calls: list[str] = []
+
+    async def fake_acall_ai(**kwargs: object) -> str:
+        calls.append(str(kwargs["user_prompt"]))
+        return " 호텔 "
+
+    monkeypatch.setattr(classifier, "acall_ai", fake_acall_ai)
+    classifier.clear_category_cache()
+
+    async def classify_twice() -> tuple[str, str]:
+        first = await classifier.get_category_db_name("제주 숙소 추천")
+        second = await classifier.get_category_db_name("제주숙소  추천")
+        return first, second
+
+    assert asyncio.run(classify_twice()) == ("호텔", "호텔")
+    assert len(calls) == 1
+    classifier.clear_category_cache()
+
+
+def test_pipeline_overlaps_preparation_and_agnostic_generation(monkeypatch) -> None:
+    from utils import category_pipeline
+
+    events: list[str] = []
+
+    async def slow_classify(keyword: str) -> str:
+        events.append("classify:start")
+        await asyncio.sleep(0.05)
+        events.append("classify:end")
+        return "호텔"
+
+    def prepare() -> str:
+        events.append("prepare")
+        return "prompt"
+
+    async def generate(prompt: str, category: str) -> str:
+        events.append(f"generate:{category}")
+        return f"{prompt}:{category}"
+
+    monkeypatch.setattr(category_pipeline, "get_category_db_name", slow_classify)
+    classifier.clear_category_cache()
+
+    # 카테고리가 프롬프트에 들어가는 생성기: 준비만 겹치고 생성은 분류 결과로
+    gated = category_pipeline.CategoryGenerator(prepare=prepare, generate=generate)
+    result = asyncio.run(category_pipeline.generate_with_category("제주 숙소 추천", gated))
+    assert result == ("prompt:호텔", "호텔")
+    assert events.index("prepare") < events.index("classify:end") < events.index("generate:호텔")
+
+    # 카테고리와 무관한 생성기: 분류를 기다리지 않고 생성 시작
+    events.clear()
+    agnostic = category_pipeline.CategoryGenerator(prepare=prepare, generate=generate, category_agnostic=True)
+    result = asyncio.run(category_pipeline.generate_with_category("제주 숙소 추천", agnostic))
+    assert result == ("prompt:", "호텔")
+    assert events.index("generate:") < events.index("classify:end")
+
+    # 로컬 분류로 바로 아는 카테고리는 분류 태스크 없이 생성
+    events.clear()
+    known = asyncio.run(category_pipeline.generate_with_category("라섹 후기", gated))
+    assert known == ("prompt:안과", "안과")
+    assert events == ["prepare", "generate:안과"]
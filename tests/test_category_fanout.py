@@ -0,0 +1,27 @@
+import threading
+import time
+
+from utils import category_fanout
+
+
+def test_fan_out_runs_categories_concurrently_and_reports_partial() -> None:
+    started = threading.Barrier(3, timeout=1)
+
+    def query(category: str) -> str:
+        if category == "실패":
+            raise RuntimeError("db down")
+        if category == "느림":
+            time.sleep(0.5)
+            return category
+        # 세 카테고리가 동시에 실행되어야 barrier를 통과
+        started.wait()
+        return category.upper()
+
+    outcome = category_fanout.fan_out_categories(
+        query, ["a", "b", "c", "실패", "느림"], timeout_ms=200
+    )
+
+    assert outcome.results == {"a": "A", "b": "B", "c": "C"}
+    assert outcome.failed == {"실패": "db down"}
+    assert outcome.timed_out == ["느림"]
+    assert outcome.report() == {"partial": True, "failedCategories": ["느림", "실패"]}
@@ -0,0 +1,127 @@
+import asyncio
+
+from services import job_queue
+from services.job_queue import JobItem, JobQueue, JobStore
+
+
+async def _wait_for(queue: JobQueue, job_id: str, *statuses: str) -> dict:
+    for _ in range(200):
+        job = queue.view(job_id)
+        if job["status"] in statuses:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"작업 상태가 {statuses} 가 되지 않음: {queue.view(job_id)['status']}")
+
+
+def test_job_resumes_from_last_completed_item_after_restart(tmp_path, monkeypatch) -> None:
+    processed = []
+
+    async def handler(ctx):
+        for item in await ctx.pending_items():
+            await ctx.start_item(item.index)
+            processed.append(item.key)
+            await ctx.finish_item(item.index, {"keyword": item.key})
+        return {"done": [item.result["keyword"] for item in await ctx.get_items()]}
+
+    monkeypatch.setattr(job_queue, "_HANDLERS", {})
+    job_queue.register_job_handler("test", handler)
+
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    queue = JobQueue(store, poll_interval=0.01)
+    job_id = queue.submit("test", [JobItem(i, k, {}) for i, k in enumerate("abc")], {})
+
+    # 이전 프로세스가 a 를 끝내고 b 처리 중에 죽은 상태
+    store.claim_next_job()
+    store.update_item(job_id, 0, "done", result={"keyword": "a"})
+    store.update_item(job_id, 1, "running", attempt=True)
+
+    async def scenario():
+        worker = asyncio.create_task(queue.run_worker())
+        job = await _wait_for(queue, job_id, "completed")
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        return job
+
+    job = asyncio.run(scenario())
+    assert processed == ["b", "c"]
+    assert job["result"] == {"done": ["a", "b", "c"]}
+    assert job["progress"]["done"] == 3
+    assert [item["attempts"] for item in job["items"]] == [0, 2, 1]
+
+
+def test_secret_jobs_pause_after_restart_and_cancel_stops_running_job(tmp_path, monkeypatch) -> None:
+    async def slow(ctx):
+        await ctx.start_item(0)
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(job_queue, "_HANDLERS", {})
+    job_queue.register_job_handler("bot", slow, requires_secrets=True)
+
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    queue = JobQueue(store, poll_interval=0.01)
+
+    async def scenario():
+        # 비밀번호는 디스크에 없으므로 새 프로세스(새 JobQueue)에서는 paused
+        job_id = JobQueue(store).submit("bot", [JobItem(0, "acc***", {})], {}, {"acc": "pw"})
+        worker = asyncio.create_task(queue.run_worker())
+        paused = await _wait_for(queue, job_id, "paused")
+
+        await queue.resume(job_id, {"acc": "pw"})
+        await _wait_for(queue, job_id, "running")
+        await queue.cancel(job_id)
+        cancelled = await _wait_for(queue, job_id, "cancelled")
+
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        return paused, cancelled
+
+    paused, cancelled = asyncio.run(scenario())
+    assert paused["progress"]["pending"] == 1
+    assert cancelled["items"][0]["status"] == "cancelled"
+    assert "acc" not in str(store.get_job(cancelled["job_id"])["params"])
+
+
+def test_resume_retries_failed_items_but_restart_recovery_does_not(tmp_path) -> None:
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    job_id = store.create_job("test", [JobItem(i, k, {}) for i, k in enumerate("ab")], {})
+    store.claim_next_job()
+    store.update_item(job_id, 0, "failed", error="timeout")
+    store.update_item(job_id, 1, "running", attempt=True)
+
+    store.recover_interrupted()
+    assert [item.status for item in store.get_items(job_id)] == ["failed", "pending"]
+
+    store.finish_job(job_id, "failed", error="timeout")
+    store.requeue(job_id, retry_failed=True)
+    items = store.get_items(job_id)
+    assert [(item.status, item.error) for item in items] == [("pending", None), ("pending", None)]
+
+
+def test_worker_stops_when_cancelled_right_after_a_job_completes(tmp_path, monkeypatch) -> None:
+    async def handler(ctx):
+        return {}
+
+    monkeypatch.setattr(job_queue, "_HANDLERS", {})
+    job_queue.register_job_handler("test", handler)
+
+    async def cancel_after(yields: int) -> bool:
+        store = JobStore(str(tmp_path / f"jobs-{yields}.sqlite3"))
+        queue = JobQueue(store, poll_interval=0.01)
+        job_id = queue.submit("test", [JobItem(0, "a", {})], {})
+        worker = asyncio.create_task(queue.run_worker())
+        while store.get_job(job_id)["status"] != "completed":
+            await asyncio.sleep(0)
+        # 작업 완료 콜백의 _notify() 와 cancel() 이 겹치는 시점들을 훑음
+        for _ in range(yields):
+            await asyncio.sleep(0)
+        worker.cancel()
+        done, _ = await asyncio.wait({worker}, timeout=1)
+        if not done:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+        return bool(done)
+
+    async def scenario():
+        return [await cancel_after(yields) for yields in range(6) for _ in range(3)]
+
+    assert all(asyncio.run(scenario()))
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from services import manuscript_bulk_service
+
+
+class FakeCollection:
+    def __init__(self, docs: list) -> None:
+        self.docs = {doc["_id"]: doc for doc in docs}
+        self.calls = 0
+
+    def _select(self, query):
+        ids = query["_id"]["$in"]
+        docs = [self.docs[i] for i in ids if i in self.docs]
+        if "deleted" in query:
+            docs = [d for d in docs if d.get("deleted") is not True]
+        return docs
+
+    def find(self, query, projection=None):
+        self.calls += 1
+        return [dict(d) for d in self._select(query)]
+
+    def update_many(self, query, update):
+        self.calls += 1
+        docs = self._select(query)
+        for doc in docs:
+            doc.update(update["$set"])
+        return SimpleNamespace(matched_count=len(docs))
+
+
+def test_bulk_delete_and_visibility_group_by_category(monkeypatch) -> None:
+    live, gone, missing, other = ObjectId(), ObjectId(), ObjectId(), ObjectId()
+    diet = FakeCollection([{"_id": live, "keyword": "위고비"}, {"_id": gone, "deleted": True}])
+    dental = FakeCollection([{"_id": other}])
+    client = {"diet": {"manuscripts": diet}, "dental": {"manuscripts": dental}}
+    emitted = []
+    monkeypatch.setattr(manuscript_bulk_service, "get_mongo_client", lambda: client)
+    monkeypatch.setattr(manuscript_bulk_service, "emit_many", emitted.extend)
+
+    items = [
+        {"category": "diet", "manuscriptId": str(live)},
+        {"category": "diet", "manuscriptId": str(gone)},
+        {"category": "diet", "manuscriptId": str(missing)},
+        {"category": "diet", "manuscriptId": "bad"},
+        {"category": "dental", "manuscriptId": str(other)},
+    ]
+    result = manuscript_bulk_service.bulk_delete_manuscripts(items)
+
+    assert [r["status"] for r in result["results"]] == ["ok", "unchanged", "not_found", "invalid_id", "ok"]
+    assert result["succeeded"] == 3 and not result["ok"]
+    assert sorted(e.manuscript_id for e in emitted) == sorted([str(live), str(other)])
+    assert diet.docs[live]["deleted"] is True
+    # 카테고리당 조회 1번 + 쓰기 1번
+    assert diet.calls == 2 and dental.calls == 2
+
+    emitted.clear()
+    result = manuscript_bulk_service.bulk_set_visibility(items[:3], visible=False)
+    assert [r["status"] for r in result["results"]] == ["ok", "ok", "not_found"]
+    assert diet.docs[live]["visible"] is False
+    assert [e.kind for e in emitted] == ["visibility", "visibility"]
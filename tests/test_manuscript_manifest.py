@@ -0,0 +1,52 @@
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from services.manuscript_manifest import ManuscriptManifest
+
+
+def _write_manuscript(folder, title: str, images: int = 0) -> None:
+    folder.mkdir(parents=True)
+    (folder / "원고.txt").write_text(f"\n{title}\n본문", encoding="utf-8")
+    for index in range(images):
+        (folder / f"image_{index}.png").write_bytes(b"")
+
+
+def test_manifest_tracks_moves_and_picks_up_external_changes(tmp_path, monkeypatch) -> None:
+    root = tmp_path / "manuscripts"
+    manifest = ManuscriptManifest(root, str(tmp_path / "manifest.sqlite3"))
+    _write_manuscript(root / "pending" / "0001", "첫 원고", images=2)
+    _write_manuscript(root / "pending" / "0002", "둘째 원고")
+
+    assert [(e["name"], e["title"], e["images_count"]) for e in manifest.list("pending")] == [
+        ("0001", "첫 원고", 2),
+        ("0002", "둘째 원고", 0),
+    ]
+
+    # 색인된 뒤에는 폴더가 그대로면 원고 파일을 다시 열지 않음
+    opened = []
+    monkeypatch.setattr("services.manuscript_manifest.read_summary", lambda f: opened.append(f))
+    manifest.list("pending")
+    assert opened == []
+
+    (root / "completed").mkdir()
+    shutil.move(str(root / "pending" / "0001"), str(root / "completed" / "0001"))
+    manifest.moved(root / "pending" / "0001", root / "completed" / "0001")
+    assert [e["title"] for e in manifest.list("completed")] == ["첫 원고"]
+    assert opened == []
+
+    # 코드 밖에서 지운 폴더는 다음 조회 때 빠짐
+    shutil.rmtree(root / "pending" / "0002")
+    assert manifest.count("pending") == 0
+
+
+def test_manifest_allocates_unique_ids_across_threads(tmp_path) -> None:
+    root = tmp_path / "manuscripts"
+    _write_manuscript(root / "completed" / "0007", "기존 원고")
+    manifest = ManuscriptManifest(root, str(tmp_path / "manifest.sqlite3"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ids = list(executor.map(lambda _: manifest.next_manuscript_id(), range(40)))
+
+    assert len(set(ids)) == 40
+    assert min(ids) == "0008"
+    assert manifest.next_batch_manuscript_id("abc") == "abc_0001"
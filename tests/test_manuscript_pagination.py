@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from services import manuscript_pagination
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(_matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(doc, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = doc.get(key)
+            if value is None:
+                return False
+            if "$lt" in condition and not value < condition["$lt"]:
+                return False
+            if "$lte" in condition and not value <= condition["$lte"]:
+                return False
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+        elif doc.get(key) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs: list) -> None:
+        self.docs = docs
+
+    def sort(self, spec):
+        # 내림차순 키만 사용 (None은 맨 뒤)
+        def key(d):
+            return tuple((d.get(k) is not None, d.get(k) or 0) for k, _ in spec)
+
+        return FakeCursor(sorted(self.docs, key=key, reverse=True))
+
+    def skip(self, n):
+        return FakeCursor(self.docs[n:])
+
+    def limit(self, n):
+        return FakeCursor(self.docs[:n])
+
+    def max_time_ms(self, ms):
+        return self
+
+    def __iter__(self):
+        return iter([dict(d) for d in self.docs])
+
+
+class FakeCollection:
+    def __init__(self, docs: list) -> None:
+        self.docs = docs
+
+    def count_documents(self, query, **kwargs):
+        return len([d for d in self.docs if _matches(d, query)])
+
+    def find(self, query, projection=None):
+        return FakeCursor([d for d in self.docs if _matches(d, query)])
+
+
+def test_cursor_pages_walk_all_categories_exactly_once(monkeypatch) -> None:
+    base = datetime(2025, 1, 1)
+    data = {
+        "a": [{"_id": ObjectId(), "createdAt": base + timedelta(minutes=i % 4)} for i in range(7)],
+        "b": [{"_id": ObjectId(), "createdAt": base + timedelta(minutes=i % 3)} for i in range(5)],
+        "c": [{"_id": ObjectId(), "createdAt": None} for _ in range(3)],
+    }
+    client = {name: {"manuscripts": FakeCollection(docs)} for name, docs in data.items()}
+    monkeypatch.setattr(manuscript_pagination, "get_mongo_client", lambda: client)
+
+    seen = []
+    cursor = None
+    while True:
+        page = manuscript_pagination.paginate_manuscripts({}, ["a", "b", "c"], limit=4, cursor=cursor)
+        assert page.total == 15
+        seen.extend((d["__category"], d["_id"]) for d in page.documents)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    expected = sorted(
+        ((cat, doc) for cat, docs in data.items() for doc in docs),
+        key=lambda item: (item[1]["createdAt"] or datetime.min, item[0], str(item[1]["_id"])),
+        reverse=True,
+    )
+    assert seen == [(cat, str(doc["_id"])) for cat, doc in expected]
+
+    # skip 방식도 같은 순서
+    third = manuscript_pagination.paginate_manuscripts({}, ["a", "b", "c"], limit=4, skip=8)
+    assert [(d["__category"], d["_id"]) for d in third.documents] == seen[8:12]
+
+
+def test_unified_storage_pages_in_the_same_order(monkeypatch) -> None:
+    base = datetime(2025, 1, 1)
+    data = {
+        "a": [{"_id": ObjectId(), "createdAt": base + timedelta(minutes=i % 2)} for i in range(5)],
+        "b": [{"_id": ObjectId(), "createdAt": base + timedelta(minutes=i % 3)} for i in range(4)],
+        "c": [{"_id": ObjectId(), "createdAt": None} for _ in range(2)],
+    }
+    client = {name: {"manuscripts": FakeCollection(docs)} for name, docs in data.items()}
+    unified = FakeCollection(
+        [{**doc, "category": cat} for cat, docs in data.items() for doc in docs]
+        + [{"_id": ObjectId(), "createdAt": base, "category": "other"}]
+    )
+    monkeypatch.setattr(manuscript_pagination, "get_mongo_client", lambda: client)
+
+    def walk():
+        seen, cursor = [], None
+        while True:
+            page = manuscript_pagination.paginate_manuscripts({}, ["a", "b", "c"], limit=3, cursor=cursor)
+            assert page.total == 11
+            seen.extend((d["__category"], d["_id"]) for d in page.documents)
+            cursor = page.next_cursor
+            if cursor is None:
+                return seen
+
+    fanned_out = walk()
+    monkeypatch.setattr(manuscript_pagination, "reads_unified", lambda: True)
+    monkeypatch.setattr(manuscript_pagination, "unified_collection", lambda: unified)
+    assert walk() == fanned_out
+
+
+def test_decode_cursor_rejects_garbage() -> None:
+    try:
+        manuscript_pagination.decode_cursor("not-a-cursor")
+    except ValueError:
+        return
+    raise AssertionError("ValueError expected")
@@ -0,0 +1,90 @@
+from datetime import datetime
+
+from services import manuscript_rollup
+from services.manuscript_events import ManuscriptEvent
+
+
+class FakeRollupCollection:
+    def __init__(self) -> None:
+        self.counts: dict[tuple, int] = {}
+
+    def update_one(self, key, update, upsert=False):
+        bucket = (key["date"], key["category"], key["engine"], key["keyword"])
+        self.counts[bucket] = self.counts.get(bucket, 0) + update["$inc"]["count"]
+
+
+def test_save_delete_restore_move_bucket_counters(monkeypatch) -> None:
+    collection = FakeRollupCollection()
+    monkeypatch.setattr(manuscript_rollup, "_rollup_collection", lambda: collection)
+    monkeypatch.setattr(manuscript_rollup, "_indexes_ensured", True)
+    monkeypatch.setattr(manuscript_rollup, "_rebuild_state", lambda: None)
+
+    document = {"createdAt": datetime(2025, 3, 1, 9), "engine": "gpt-5", "keyword": "위고비"}
+    bucket = ("2025-03-01", "diet", "gpt-5", "위고비")
+
+    for kind in ("insert", "insert", "delete", "restore", "update"):
+        manuscript_rollup.handle_manuscript_event(ManuscriptEvent(kind, "diet", "id", document))
+
+    assert collection.counts == {bucket: 2}
+
+
+def test_rebuild_mirrors_only_events_the_snapshot_misses(monkeypatch) -> None:
+    live, staging = FakeRollupCollection(), FakeRollupCollection()
+    monkeypatch.setattr(manuscript_rollup, "_rollup_collection", lambda: live)
+    monkeypatch.setattr(manuscript_rollup, "_staging_collection", lambda: staging)
+    monkeypatch.setattr(manuscript_rollup, "_indexes_ensured", True)
+    state = {"cutoff": datetime(2025, 3, 1, 12), "done": ["diet"]}
+    monkeypatch.setattr(manuscript_rollup, "_rebuild_state", lambda: state)
+
+    old = {"createdAt": datetime(2025, 3, 1, 9), "engine": "gpt-5", "keyword": "위고비"}
+    new = {"createdAt": datetime(2025, 3, 1, 13), "engine": "gpt-5", "keyword": "위고비"}
+    events = [
+        ManuscriptEvent("insert", "diet", "a", old),  # 스냅샷에 포함
+        ManuscriptEvent("insert", "diet", "b", new),  # cutoff 이후 → 반영
+        ManuscriptEvent("delete", "diet", "c", old),  # 집계 끝난 카테고리 → 반영
+        ManuscriptEvent("delete", "eye", "d", old),  # 아직 집계 전 → 스냅샷이 읽음
+    ]
+    for event in events:
+        manuscript_rollup.handle_manuscript_event(event)
+
+    assert staging.counts == {("2025-03-01", "diet", "gpt-5", "위고비"): 0}
+    assert live.counts == {
+        ("2025-03-01", "diet", "gpt-5", "위고비"): 1,
+        ("2025-03-01", "eye", "gpt-5", "위고비"): -1,
+    }
+
+
+def test_rank_keywords_falls_back_to_manuscripts_until_ready(monkeypatch) -> None:
+    monkeypatch.setattr(manuscript_rollup, "is_rollup_ready", lambda: False)
+    monkeypatch.setattr(manuscript_rollup, "CATEGORIES", ["diet", "eye"])
+    buckets = {
+        "diet": [{"date": "2025-03-01", "engine": "gpt-5", "keyword": "위고비", "count": 3}],
+        "eye": [
+            {"date": "2025-03-01", "engine": "gpt-5", "keyword": "라식", "count": 2},
+            {"date": "2025-03-02", "engine": "gpt-5", "keyword": "위고비", "count": 1},
+            {"date": "2025-03-02", "engine": "gpt-5", "keyword": "", "count": 5},
+        ],
+    }
+    monkeypatch.setattr(
+        manuscript_rollup, "category_buckets", lambda category, start, end, max_time_ms: buckets[category]
+    )
+
+    ranked = manuscript_rollup.rank_keywords(["2025-03-01", "2025-03-02"], 10)
+
+    assert ranked == [{"keyword": "위고비", "count": 4}, {"keyword": "라식", "count": 2}]
+
+
+def test_popular_keywords_report_rank_change(monkeypatch) -> None:
+    rankings = iter([
+        [{"keyword": "위고비", "count": 9}, {"keyword": "임플란트", "count": 5}, {"keyword": "라식", "count": 1}],
+        [{"keyword": "임플란트", "count": 7}, {"keyword": "위고비", "count": 3}, {"keyword": "교정", "count": 2}],
+    ])
+    monkeypatch.setattr(manuscript_rollup, "rank_keywords", lambda dates, limit: next(rankings))
+
+    keywords = manuscript_rollup.popular_keywords_with_change(7, 3)
+
+    assert [(k["keyword"], k["change"], k["isNew"]) for k in keywords] == [
+        ("위고비", 1, False),
+        ("임플란트", -1, False),
+        ("라식", 0, True),
+    ]
@@ -0,0 +1,214 @@
+import asyncio
+from types import SimpleNamespace
+
+from utils.ai_client import prompt_cache
+from utils.ai_client.text_providers import (
+    _build_anthropic_request,
+    _extract_anthropic_result,
+    call_gemini_text,
+)
+from utils.ttl_cache import TTLCache
+
+LONG_SYSTEM_PROMPT = "정적인 시스템 지침입니다. " * 400
+
+
+def test_anthropic_request_marks_long_system_prompt_cacheable() -> None:
+    request = _build_anthropic_request(
+        model_name="claude-sonnet-4-5",
+        system_prompt=LONG_SYSTEM_PROMPT,
+        user_prompt="user",
+        max_tokens=128,
+        prompt_cache=True,
+    )
+
+    assert request["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+    short = _build_anthropic_request(
+        model_name="claude-sonnet-4-5",
+        system_prompt="짧은 지침",
+        user_prompt="user",
+        max_tokens=128,
+        prompt_cache=True,
+    )
+    assert short["system"] == "짧은 지침"
+
+
+def test_anthropic_cache_usage_is_recorded() -> None:
+    before = prompt_cache.get_prompt_cache_stats()
+    response = SimpleNamespace(
+        content=[SimpleNamespace(text="응답")],
+        usage=SimpleNamespace(
+            input_tokens=20,
+            output_tokens=5,
+            cache_read_input_tokens=3000,
+            cache_creation_input_tokens=0,
+        ),
+    )
+
+    _extract_anthropic_result(response)
+    after = prompt_cache.get_prompt_cache_stats()
+
+    assert after["cached_tokens"] - before["cached_tokens"] == 3000
+    assert after["hit_calls"] - before["hit_calls"] == 1
+
+
+class _FakeGeminiCaches:
+    def __init__(self) -> None:
+        self.created = 0
+
+    def create(self, model: str, config: object) -> object:
+        self.created += 1
+        return SimpleNamespace(name=f"cachedContents/{self.created}")
+
+
+class _FakeGeminiModels:
+    def __init__(self) -> None:
+        self.configs: list[object] = []
+
+    def generate_content(self, model: str, config: object, contents: str) -> object:
+        self.configs.append(config)
+        return SimpleNamespace(
+            text="응답",
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=1200,
+                candidates_token_count=10,
+                cached_content_token_count=1100,
+            ),
+        )
+
+
+def test_gemini_reuses_cached_content_for_same_system_prompt() -> None:
+    client = SimpleNamespace(caches=_FakeGeminiCaches(), models=_FakeGeminiModels())
+
+    for _ in range(2):
+        call_gemini_text(
+            client=client,
+            model_name="gemini-test-model",
+            system_prompt=LONG_SYSTEM_PROMPT,
+            user_prompt="user",
+            prompt_cache=True,
+        )
+
+    assert client.caches.created == 1
+    assert all(config.cached_content == "cachedContents/1" for config in client.models.configs)
+    assert all(config.system_instruction is None for config in client.models.configs)
+    prompt_cache.forget_gemini_cached_content("gemini-test-model", LONG_SYSTEM_PROMPT)
+
+
+def test_gemini_skips_cached_content_unless_caller_opts_in() -> None:
+    client = SimpleNamespace(caches=_FakeGeminiCaches(), models=_FakeGeminiModels())
+
+    # 키워드가 들어간 시스템 프롬프트는 매번 달라 캐시를 만들면 쌓이기만 함
+    call_gemini_text(
+        client=client,
+        model_name="gemini-optin-model",
+        system_prompt=LONG_SYSTEM_PROMPT + "키워드: 라섹",
+        user_prompt="user",
+    )
+
+    assert client.caches.created == 0
+    assert client.models.configs[0].system_instruction is not None
+
+
+def test_concurrent_gemini_cache_misses_create_one_cache() -> None:
+    class _SlowAsyncCaches:
+        def __init__(self) -> None:
+            self.created = 0
+
+        async def create(self, model: str, config: object) -> object:
+            self.created += 1
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(name=f"cachedContents/{self.created}")
+
+    caches = _SlowAsyncCaches()
+    client = SimpleNamespace(aio=SimpleNamespace(caches=caches))
+
+    async def scenario() -> list:
+        return await asyncio.gather(
+            *(
+                prompt_cache.aget_gemini_cached_content(client, "m-single", LONG_SYSTEM_PROMPT)
+                for _ in range(5)
+            )
+        )
+
+    assert asyncio.run(scenario()) == ["cachedContents/1"] * 5
+    assert caches.created == 1
+    assert not prompt_cache._gemini_creating
+    prompt_cache.forget_gemini_cached_content("m-single", LONG_SYSTEM_PROMPT)
+
+
+def test_gemini_cache_map_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(prompt_cache, "_gemini_caches", TTLCache(maxsize=2, ttl=60))
+    client = SimpleNamespace(caches=_FakeGeminiCaches())
+
+    for index in range(3):
+        prompt_cache.get_gemini_cached_content(client, f"m-{index}", LONG_SYSTEM_PROMPT)
+
+    assert len(prompt_cache._gemini_caches) == 2
+    # 밀려난 항목은 다시 만들어짐
+    prompt_cache.get_gemini_cached_content(client, "m-0", LONG_SYSTEM_PROMPT)
+    assert client.caches.created == 4
+
+
+class _FailingGeminiModels(_FakeGeminiModels):
+    def __init__(self, error: Exception) -> None:
+        super().__init__()
+        self.error = error
+
+    def generate_content(self, model: str, config: object, contents: str) -> object:
+        if config.cached_content:
+            self.configs.append(config)
+            raise self.error
+        return super().generate_content(model, config, contents)
+
+
+def test_gemini_retries_without_cache_only_when_cached_content_is_missing() -> None:
+    import pytest
+
+    model = "gemini-retry-model"
+    missing = _FailingGeminiModels(Exception("404 NOT_FOUND. CachedContent not found (or permission denied)"))
+    client = SimpleNamespace(caches=_FakeGeminiCaches(), models=missing)
+    call_gemini_text(
+        client=client, model_name=model, system_prompt=LONG_SYSTEM_PROMPT, user_prompt="u", prompt_cache=True
+    )
+    assert [config.cached_content for config in missing.configs] == ["cachedContents/1", None]
+
+    rate_limited = _FailingGeminiModels(Exception("429 RESOURCE_EXHAUSTED"))
+    client = SimpleNamespace(caches=_FakeGeminiCaches(), models=rate_limited)
+    with pytest.raises(Exception, match="429"):
+        call_gemini_text(
+            client=client, model_name=model, system_prompt=LONG_SYSTEM_PROMPT, user_prompt="u", prompt_cache=True
+        )
+    assert len(rate_limited.configs) == 1
+    prompt_cache.forget_gemini_cached_content(model, LONG_SYSTEM_PROMPT)
+
+
+def test_only_permanent_cache_create_failures_are_remembered(monkeypatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr(
+        prompt_cache, "_gemini_uncacheable", TTLCache(maxsize=8, ttl=60, timer=lambda: now[0])
+    )
+
+    class _Caches:
+        def __init__(self, error: Exception) -> None:
+            self.error = error
+            self.attempts = 0
+
+        def create(self, model: str, config: object) -> object:
+            self.attempts += 1
+            raise self.error
+
+    transient = SimpleNamespace(caches=_Caches(Exception("503 UNAVAILABLE")))
+    for _ in range(2):
+        assert prompt_cache.get_gemini_cached_content(transient, "m-transient", LONG_SYSTEM_PROMPT) is None
+    assert transient.caches.attempts == 2
+
+    permanent = SimpleNamespace(caches=_Caches(Exception("Cached content is too small. too few tokens")))
+    for _ in range(2):
+        assert prompt_cache.get_gemini_cached_content(permanent, "m-permanent", LONG_SYSTEM_PROMPT) is None
+    assert permanent.caches.attempts == 1
+
+    # TTL 이 지나면 다시 시도
+    now[0] = 61
+    prompt_cache.get_gemini_cached_content(permanent, "m-permanent", LONG_SYSTEM_PROMPT)
+    assert permanent.caches.attempts == 2
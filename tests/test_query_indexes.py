@@ -0,0 +1,36 @@
+from mongodb_service import query_index_specs
+from services.query_indexes import PlanFinding, plan_stages
+
+
+def test_query_index_specs_are_scoped_per_database() -> None:
+    category = {coll for coll, _ in query_index_specs("안과")}
+    search_system = {coll for coll, _ in query_index_specs("search_system")}
+
+    assert category == {"manuscripts", "ref"}
+    assert search_system == {"bookmarks", "search_history"}
+
+
+def test_plan_stages_flags_collscan_in_nested_and_sbe_plans() -> None:
+    classic = {
+        "queryPlanner": {
+            "winningPlan": {
+                "stage": "LIMIT",
+                "inputStage": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}},
+            }
+        }
+    }
+    sbe = {
+        "queryPlanner": {
+            "winningPlan": {
+                "queryPlan": {
+                    "stage": "OR",
+                    "inputStages": [{"stage": "IXSCAN"}, {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}],
+                }
+            }
+        }
+    }
+
+    assert plan_stages(classic) == ["LIMIT", "SORT", "COLLSCAN"]
+    assert PlanFinding("q", "db", plan_stages(classic)).collscan
+    assert plan_stages(sbe) == ["OR", "IXSCAN", "FETCH", "IXSCAN"]
+    assert not PlanFinding("q", "db", plan_stages(sbe)).collscan
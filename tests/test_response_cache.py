@@ -0,0 +1,84 @@
+import pytest
+
+from utils.ai_client import response_cache
+from utils.ai_client import text as text_module
+from utils.ai_client import text_registry
+
+
+class _FakeMessage:
+    content = "분석 결과"
+
+
+class _FakeChoice:
+    message = _FakeMessage()
+
+
+class _CountingCompletions:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create(self, **request: object) -> object:
+        self.calls += 1
+        return type("Response", (), {"choices": [_FakeChoice()], "usage": None})()
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.chat = type("Chat", (), {})()
+        self.chat.completions = _CountingCompletions()
+
+
+def test_call_ai_reuses_cached_response_only_when_requested(monkeypatch) -> None:
+    client = _FakeClient()
+    monkeypatch.setattr(text_registry, "DEEPSEEK_API_KEY", "test-key")
+    monkeypatch.setattr(text_module, "get_ai_client", lambda service_type: client)
+    response_cache.set_response_cache(response_cache.MemoryResponseCache())
+
+    try:
+        for _ in range(2):
+            text = text_module.call_ai(
+                model_name="deepseek-v4-flash",
+                system_prompt="system",
+                user_prompt="같은 입력",
+                cache=True,
+            )
+            assert text == "분석 결과"
+        assert client.chat.completions.calls == 1
+
+        text_module.call_ai(
+            model_name="deepseek-v4-flash",
+            system_prompt="system",
+            user_prompt="같은 입력",
+        )
+        assert client.chat.completions.calls == 2
+    finally:
+        response_cache.set_response_cache(None)
+
+
+def test_disk_cache_expires_and_evicts(tmp_path) -> None:
+    cache = response_cache.DiskResponseCache(directory=str(tmp_path), maxsize=2, ttl=60)
+    keys = [response_cache.response_cache_key("m", "s", f"u{i}") for i in range(3)]
+
+    for key in keys:
+        cache.set(key, key[:6])
+
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+    assert cache.get(keys[-1]) == keys[-1][:6]
+
+    # 같은 키 덮어쓰기는 개수를 늘리지 않음
+    cache.set(keys[-1], "new")
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+    assert cache.get(keys[-1]) == "new"
+
+    expired = response_cache.DiskResponseCache(directory=str(tmp_path), ttl=-1)
+    expired.set(keys[0], "old")
+    assert expired.get(keys[0]) is None
+
+
+def test_response_cache_interface_is_abstract() -> None:
+    class Incomplete(response_cache.ResponseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
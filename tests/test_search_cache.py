@@ -0,0 +1,85 @@
+import asyncio
+
+from services import search_cache
+from services.manuscript_events import ManuscriptEvent
+
+
+def test_concurrent_requests_share_one_computation_until_invalidated() -> None:
+    search_cache.set_search_cache(search_cache.MemorySearchCache())
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"total": len(calls)}
+
+    async def scenario():
+        key = search_cache.search_cache_key("위고비", "diet", 0, 20)
+        first = await asyncio.gather(
+            *[search_cache.cached_response("keyword", key, compute, category="diet") for _ in range(5)]
+        )
+        cached = await search_cache.cached_response("keyword", key, compute, category="diet")
+
+        # 다른 카테고리 원고 변경은 영향 없음
+        search_cache.handle_manuscript_event(ManuscriptEvent("update", "dental", "x"))
+        still_cached = await search_cache.cached_response("keyword", key, compute, category="diet")
+
+        search_cache.handle_manuscript_event(ManuscriptEvent("visibility", "diet", "x"))
+        refreshed = await search_cache.cached_response("keyword", key, compute, category="diet")
+        return first, cached, still_cached, refreshed
+
+    try:
+        first, cached, still_cached, refreshed = asyncio.run(scenario())
+    finally:
+        search_cache.set_search_cache(None)
+
+    assert first == [{"total": 1}] * 5
+    assert cached == still_cached == {"total": 1}
+    assert refreshed == {"total": 2}
+    assert len(calls) == 2
+
+
+def test_invalidation_during_compute_is_not_overwritten_by_stale_result() -> None:
+    search_cache.set_search_cache(search_cache.MemorySearchCache())
+    values = iter(["stale", "fresh"])
+
+    async def compute():
+        value = next(values)
+        if value == "stale":
+            # 계산 중에 원고가 바뀜
+            search_cache.handle_manuscript_event(ManuscriptEvent("insert", "diet", "x"))
+        return value
+
+    async def scenario():
+        first = await search_cache.cached_response("stats", "k", compute)
+        second = await search_cache.cached_response("stats", "k", compute)
+        return first, second
+
+    try:
+        assert asyncio.run(scenario()) == ("stale", "fresh")
+    finally:
+        search_cache.set_search_cache(None)
+
+
+def test_waiters_recompute_when_first_caller_is_cancelled() -> None:
+    search_cache.set_search_cache(search_cache.MemorySearchCache())
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def scenario():
+        leader = asyncio.create_task(search_cache.cached_response("popular", "k", compute))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(search_cache.cached_response("popular", "k", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        await asyncio.gather(leader, return_exceptions=True)
+        return await waiter
+
+    try:
+        assert asyncio.run(scenario()) == 2
+    finally:
+        search_cache.set_search_cache(None)
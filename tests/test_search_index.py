@@ -0,0 +1,169 @@
+import pytest
+from bson import ObjectId
+
+from services import manuscript_events, search_index, search_results
+from services.manuscript_events import ManuscriptEvent
+
+
+class FakeIndexCollection:
+    def __init__(self) -> None:
+        self.docs: dict[str, dict] = {}
+
+    def replace_one(self, query, doc, upsert=False):
+        self.docs[query["_id"]] = doc
+
+    def update_one(self, query, update):
+        if query["_id"] in self.docs:
+            self.docs[query["_id"]].update(update["$set"])
+
+
+def test_text_grams_normalizes_korean_text() -> None:
+    assert search_index.text_grams("강아지 사료!") == sorted({"강아", "아지", "지사", "사료"})
+    assert search_index.text_grams("A") == ["a"]
+    assert search_index.text_grams(None) == []
+
+
+def test_shape_document_builds_snippet_with_highlights() -> None:
+    projection = search_results.build_projection("위고비", ["content"])
+    assert projection["content"] == 1
+    assert projection["__score"]["$toInt"]["$add"]
+
+    doc = {"__snippetStart": 5, "__contentLength": 100, "__snippet": "Wow 위고비 후기, 위고비 가격"}
+    shaped = search_results.shape_document(doc, "위고비")
+
+    assert shaped["__snippet"] == "…Wow 위고비 후기, 위고비 가격…"
+    assert [shaped["__snippet"][a:b] for a, b in shaped["__highlights"]] == ["위고비", "위고비"]
+    assert "__snippetStart" not in shaped
+
+
+def test_parse_fields_rejects_paths_that_collide_in_projection() -> None:
+    assert search_results.parse_fields("content, meta.source,content") == ["content", "meta.source"]
+
+    for fields in ("keyword.x", "content.y", "meta,meta.source", "meta.source,meta"):
+        with pytest.raises(ValueError):
+            search_results.parse_fields(fields)
+
+
+def test_manuscript_events_update_index_incrementally(monkeypatch) -> None:
+    collection = FakeIndexCollection()
+    monkeypatch.setattr(search_index, "_index_collection", lambda: collection)
+    monkeypatch.setattr(search_index, "_indexes_ensured", True)
+    monkeypatch.setattr(manuscript_events, "_handlers", [])
+    search_index.register_search_index()
+
+    manuscript_id = ObjectId()
+    document = {"_id": manuscript_id, "keyword": "치과", "content": "임플란트 후기"}
+    manuscript_events.emit(ManuscriptEvent("insert", "dental", str(manuscript_id), document))
+
+    entry = collection.docs[f"dental:{manuscript_id}"]
+    assert entry["manuscriptId"] == str(manuscript_id)
+    assert {"치과", "임플", "후기"} <= set(entry["grams"])
+    assert entry["deleted"] is False
+
+    updated = {**document, "content": "교정 후기"}
+    manuscript_events.emit(ManuscriptEvent("update", "dental", str(manuscript_id), updated))
+    assert "임플" not in collection.docs[f"dental:{manuscript_id}"]["grams"]
+
+    manuscript_events.emit(ManuscriptEvent("delete", "dental", str(manuscript_id)))
+    assert collection.docs[f"dental:{manuscript_id}"]["deleted"] is True
+
+
+class FakeSearchCollection:
+    """find/sort/hint/limit/count_documents 만 흉내낸 색인 컬렉션"""
+
+    def __init__(self, entries) -> None:
+        self.entries = entries
+        self.count_calls = []
+
+    @staticmethod
+    def _matches(entry, query) -> bool:
+        if "$and" in query:
+            return all(FakeSearchCollection._matches(entry, part) for part in query["$and"])
+        if "$or" in query:
+            return any(FakeSearchCollection._matches(entry, part) for part in query["$or"])
+        for field, condition in query.items():
+            value = entry.get(field)
+            if field == "grams":
+                grams = condition["$all"] if isinstance(condition, dict) else [condition]
+                if not set(grams) <= set(value):
+                    return False
+            elif isinstance(condition, dict):
+                if not value < condition["$lt"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def count_documents(self, query, limit=0, hint=None):
+        self.count_calls.append(query)
+        count = sum(1 for entry in self.entries if self._matches(entry, query))
+        return min(count, limit) if limit else count
+
+    def find(self, query, projection=None):
+        found = [entry for entry in self.entries if self._matches(entry, query)]
+
+        class Cursor:
+            def __init__(self) -> None:
+                self.items = found
+
+            def sort(self, keys):
+                self.items = sorted(self.items, key=lambda e: (e["createdAt"], e["_id"]), reverse=True)
+                return self
+
+            def hint(self, name):
+                return self
+
+            def limit(self, n):
+                self.items = self.items[:n]
+                return self
+
+            def __iter__(self):
+                return iter(self.items)
+
+        return Cursor()
+
+
+def test_search_fills_pages_after_false_positives_and_caps_total(monkeypatch) -> None:
+    from datetime import datetime, timedelta
+
+    base = datetime(2026, 1, 1)
+    entries = []
+    for index in range(30):
+        manuscript_id = str(ObjectId())
+        entries.append({
+            "_id": f"diet:{manuscript_id}",
+            "category": "diet",
+            "manuscriptId": manuscript_id,
+            # "위고비" bigram 은 모두 있지만 홀수 번째는 원문에 검색어가 없음 (bigram 오탐)
+            "grams": ["위고", "고비"] + (["고고"] if index % 3 == 0 else []),
+            "createdAt": base - timedelta(minutes=index),
+            "deleted": False,
+            "index": index,
+        })
+    collection = FakeSearchCollection(entries)
+    monkeypatch.setattr(search_index, "_index_collection", lambda: collection)
+    monkeypatch.setattr(search_index, "_gram_frequency", search_index.TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setattr(search_index, "SEARCH_INDEX_COUNT_LIMIT", 20)
+    monkeypatch.setattr(
+        search_index,
+        "_fetch_manuscripts",
+        lambda batch, projection: {
+            entry["_id"]: {"_id": entry["manuscriptId"], "__score": 1 - entry["index"] % 2, "index": entry["index"]}
+            for entry in batch
+        },
+    )
+    monkeypatch.setattr(search_index, "shape_document", lambda doc, query: doc)
+
+    first = search_index.search_manuscripts("위고비", limit=5)
+    assert [doc["index"] for doc in first["documents"]] == [0, 2, 4, 6, 8]
+    assert first["total"] == 20 and first["totalCapped"] is True
+
+    second = search_index.search_manuscripts("위고비", limit=5, cursor=first["nextCursor"])
+    assert [doc["index"] for doc in second["documents"]] == [10, 12, 14, 16, 18]
+
+    skipped = search_index.search_manuscripts("위고비", limit=5, skip=12)
+    assert [doc["index"] for doc in skipped["documents"]] == [24, 26, 28]
+    assert skipped["nextCursor"] is None
+
+    # 드문 bigram 을 $all 첫 원소로 (고고 10건 < 위고/고비 30건)
+    assert search_index.rarest_first(collection, ["고비", "고고", "위고"])[0] == "고고"
@@ -0,0 +1,67 @@
+import asyncio
+
+from utils.sse import HEARTBEAT_COMMENT, relay_sse
+
+
+class _FakeRequest:
+    def __init__(self, disconnected: bool = False) -> None:
+        self.disconnected = disconnected
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+def test_relay_sends_heartbeat_while_upstream_is_idle() -> None:
+    async def slow_upstream():
+        await asyncio.sleep(0.05)
+        yield "data: 첫 토큰\n\n"
+        yield "data: [DONE]\n\n"
+
+    async def collect() -> list[str]:
+        return [
+            chunk
+            async for chunk in relay_sse(
+                slow_upstream(), request=_FakeRequest(), heartbeat_interval=0.01
+            )
+        ]
+
+    chunks = asyncio.run(collect())
+
+    assert chunks[0] == HEARTBEAT_COMMENT
+    assert chunks[-2:] == ["data: 첫 토큰\n\n", "data: [DONE]\n\n"]
+
+
+def test_relay_cancels_upstream_when_client_disconnects() -> None:
+    state = {"closed": False}
+
+    async def endless_upstream():
+        try:
+            while True:
+                await asyncio.sleep(1)
+                yield "data: x\n\n"
+        finally:
+            state["closed"] = True
+
+    async def collect() -> list[str]:
+        return [
+            chunk
+            async for chunk in relay_sse(
+                endless_upstream(),
+                request=_FakeRequest(disconnected=True),
+                heartbeat_interval=0.01,
+            )
+        ]
+
+    assert asyncio.run(collect()) == []
+    assert state["closed"] is True
+
+
+def test_relay_reports_upstream_error_as_sse_event() -> None:
+    async def failing_upstream():
+        yield "data: 부분\n\n"
+        raise RuntimeError("boom")
+
+    async def collect() -> list[str]:
+        return [chunk async for chunk in relay_sse(failing_upstream())]
+
+    assert asyncio.run(collect()) == ["data: 부분\n\n", "event: error\ndata: boom\n\n"]
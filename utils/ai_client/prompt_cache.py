@@ -0,0 +1,265 @@
+"""
+프로바이더 측 프롬프트 프리픽스 캐싱
+
+- Anthropic: 시스템 프롬프트 블록에 cache_control(ephemeral) 부착
+- Gemini: 호출자가 prompt_cache=True 로 고른 고정 시스템 프롬프트만 cached content로 만들어 재사용
+  (모델+프롬프트 해시당 1개, 키워드/카테고리가 들어간 프롬프트는 매번 새 캐시가 되므로 제외)
+  동시에 같은 키를 놓치면 한 호출만 생성하고 나머지는 그 결과를 기다림
+- OpenAI: 자동 프리픽스 캐싱 + 시스템 프롬프트 해시를 prompt_cache_key로 전달해 라우팅 적중률 향상
+- 응답 usage의 캐시 적중/쓰기 토큰을 누적 기록
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional, Union
+
+from google.genai import types
+
+from utils.logger import log
+from utils.ttl_cache import TTLCache
+
+PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE_ENABLED", "1") == "1"
+# 프로바이더 최소 캐시 단위(약 1,024 토큰)에 못 미치는 짧은 프롬프트는 제외
+PROMPT_CACHE_MIN_CHARS = int(os.getenv("PROMPT_CACHE_MIN_CHARS", "2000"))
+GEMINI_CACHE_TTL_SECONDS = int(os.getenv("GEMINI_CACHE_TTL_SECONDS", "3600"))
+# 캐시로 만들 수 없는 (모델, 프롬프트)를 다시 시도하지 않는 시간
+GEMINI_UNCACHEABLE_TTL_SECONDS = int(os.getenv("GEMINI_UNCACHEABLE_TTL_SECONDS", "3600"))
+GEMINI_CACHE_MAX_ENTRIES = int(os.getenv("GEMINI_CACHE_MAX_ENTRIES", "256"))
+# 만료 직전 캐시는 쓰지 않고 새로 생성
+_GEMINI_CACHE_EXPIRY_MARGIN = 60.0
+# 재시도해도 같은 결과인 캐시 생성 실패 (토큰 수 미달, 모델 미지원)
+_PERMANENT_CREATE_ERRORS = ("too few tokens", "min_total_token_count", "minimum", "not supported")
+_CACHE_REFERENCE_MARKERS = ("cachedcontent", "cached content", "cached_content")
+_CACHE_MISSING_MARKERS = ("not found", "not_found", "expired", "permission denied", "permission_denied")
+
+# (모델, 프롬프트 해시) → cached content 이름 (만료 직전까지만 보관)
+_gemini_caches: TTLCache[str] = TTLCache(
+    maxsize=GEMINI_CACHE_MAX_ENTRIES,
+    ttl=max(GEMINI_CACHE_TTL_SECONDS - _GEMINI_CACHE_EXPIRY_MARGIN, 0.0),
+)
+# 캐시로 만들 수 없는 (모델, 프롬프트 해시) → TTL 동안 다시 시도하지 않음
+_gemini_uncacheable: TTLCache[bool] = TTLCache(
+    maxsize=GEMINI_CACHE_MAX_ENTRIES, ttl=GEMINI_UNCACHEABLE_TTL_SECONDS
+)
+# 생성 중인 키 → 생성 결과 (캐시 이름 또는 None), 같은 키의 다른 호출은 이것을 기다림
+_gemini_creating: dict[tuple[str, str], "Future[Optional[str]]"] = {}
+_gemini_lock = threading.Lock()
+
+_cache_stats = {
+    "calls": 0,
+    "hit_calls": 0,
+    "cached_tokens": 0,
+    "cache_write_tokens": 0,
+    "uncached_tokens": 0,
+}
+_stats_lock = threading.Lock()
+
+
+def prompt_fingerprint(text: str) -> str:
+    """프롬프트 내용 해시 (캐시 키용)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def should_cache_prompt(system_prompt: str) -> bool:
+    return PROMPT_CACHE_ENABLED and len(system_prompt or "") >= PROMPT_CACHE_MIN_CHARS
+
+
+# ---------- Anthropic ----------
+def build_anthropic_system(system_prompt: str) -> Union[str, list[dict[str, Any]]]:
+    """캐시 대상이면 cache_control 블록으로, 아니면 문자열 그대로 반환"""
+    if not should_cache_prompt(system_prompt):
+        return system_prompt
+    return [
+        {
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+# ---------- OpenAI ----------
+def openai_prompt_cache_key(system_prompt: str) -> Optional[str]:
+    """같은 시스템 프롬프트 요청이 같은 캐시 노드로 가도록 하는 키"""
+    if not should_cache_prompt(system_prompt):
+        return None
+    return f"sys-{prompt_fingerprint(system_prompt)}"
+
+
+# ---------- Gemini ----------
+def _gemini_cache_key(model_name: str, system_prompt: str) -> tuple[str, str]:
+    return model_name, prompt_fingerprint(system_prompt)
+
+
+def _lookup_gemini_cache(
+    key: tuple[str, str],
+) -> tuple[Optional[str], Optional["Future[Optional[str]]"], bool]:
+    """
+    (캐시 이름, 기다릴 생성 결과, 직접 생성할지) 반환
+
+    직접 생성하게 된 호출은 끝나면 반드시 _finish_gemini_create() 를 불러야 한다.
+    """
+    with _gemini_lock:
+        if key in _gemini_uncacheable:
+            return None, None, False
+        name = _gemini_caches.get(key)
+        if name:
+            return name, None, False
+        pending = _gemini_creating.get(key)
+        if pending is not None:
+            return None, pending, False
+        _gemini_creating[key] = Future()
+    return None, None, True
+
+
+def _finish_gemini_create(key: tuple[str, str], name: Optional[str]) -> None:
+    """생성 결과 기록 후 기다리던 호출 깨우기"""
+    with _gemini_lock:
+        if name:
+            _gemini_caches.set(key, name)
+        pending = _gemini_creating.pop(key, None)
+    if pending is not None and not pending.done():
+        pending.set_result(name)
+
+
+def _gemini_create_failed(key: tuple[str, str], error: Exception) -> None:
+    """캐시 생성 실패 기록 (영구 오류만 TTL 동안, 일시 오류는 다음 호출 때 다시 시도)"""
+    message = str(error).lower()
+    permanent = any(marker in message for marker in _PERMANENT_CREATE_ERRORS)
+    log.warning(f"Gemini 캐시 생성 실패 → 일반 호출: {error}", permanent=permanent)
+    if permanent:
+        _gemini_uncacheable.set(key, True)
+
+
+def is_gemini_cache_missing_error(error: Exception) -> bool:
+    """cached content 가 만료/삭제되어 생긴 오류인지 (429/5xx 등 일반 오류는 False)"""
+    message = str(error).lower()
+    return any(marker in message for marker in _CACHE_REFERENCE_MARKERS) and any(
+        marker in message for marker in _CACHE_MISSING_MARKERS
+    )
+
+
+def _gemini_cache_config(system_prompt: str) -> types.CreateCachedContentConfig:
+    return types.CreateCachedContentConfig(
+        system_instruction=system_prompt,
+        ttl=f"{GEMINI_CACHE_TTL_SECONDS}s",
+        display_name=f"sys-{prompt_fingerprint(system_prompt)}",
+    )
+
+
+def get_gemini_cached_content(client: Any, model_name: str, system_prompt: str) -> Optional[str]:
+    """
+    시스템 프롬프트용 Gemini cached content 이름 반환 (없으면 생성)
+
+    키워드/카테고리 없이 매번 같은 시스템 프롬프트에만 쓴다 (호출자가 prompt_cache=True 로 선택).
+
+    Returns:
+        cached content 이름 (캐시 불가/실패 시 None → system_instruction 사용)
+    """
+    if not should_cache_prompt(system_prompt):
+        return None
+
+    key = _gemini_cache_key(model_name, system_prompt)
+    name, pending, should_create = _lookup_gemini_cache(key)
+    if pending is not None:
+        return pending.result()
+    if not should_create:
+        return name
+
+    try:
+        cached = client.caches.create(model=model_name, config=_gemini_cache_config(system_prompt))
+        name = getattr(cached, "name", None)
+    except Exception as e:
+        _gemini_create_failed(key, e)
+    finally:
+        _finish_gemini_create(key, name)
+    return name
+
+
+async def aget_gemini_cached_content(
+    client: Any, model_name: str, system_prompt: str
+) -> Optional[str]:
+    """get_gemini_cached_content의 async 버전"""
+    if not should_cache_prompt(system_prompt):
+        return None
+
+    key = _gemini_cache_key(model_name, system_prompt)
+    name, pending, should_create = _lookup_gemini_cache(key)
+    if pending is not None:
+        # 기다리던 호출이 취소돼도 생성 결과(Future)는 취소하지 않음
+        return await asyncio.shield(asyncio.wrap_future(pending))
+    if not should_create:
+        return name
+
+    try:
+        cached = await client.aio.caches.create(
+            model=model_name, config=_gemini_cache_config(system_prompt)
+        )
+        name = getattr(cached, "name", None)
+    except Exception as e:
+        _gemini_create_failed(key, e)
+    finally:
+        # 취소되어도 기다리는 호출이 남지 않도록 항상 결과를 알림
+        _finish_gemini_create(key, name)
+    return name
+
+
+def forget_gemini_cached_content(model_name: str, system_prompt: str) -> None:
+    """만료/삭제된 cached content 항목 제거 (다음 호출 때 재생성)"""
+    _gemini_caches.pop(_gemini_cache_key(model_name, system_prompt))
+
+
+# ---------- 사용량 기록 ----------
+def record_cache_usage(cached_tokens: int, cache_write_tokens: int, uncached_tokens: int) -> None:
+    """응답 usage의 캐시 적중/쓰기/미적중 입력 토큰 누적"""
+    cached_tokens = cached_tokens or 0
+    cache_write_tokens = cache_write_tokens or 0
+    uncached_tokens = max(uncached_tokens or 0, 0)
+
+    with _stats_lock:
+        _cache_stats["calls"] += 1
+        _cache_stats["cached_tokens"] += cached_tokens
+        _cache_stats["cache_write_tokens"] += cache_write_tokens
+        _cache_stats["uncached_tokens"] += uncached_tokens
+        if cached_tokens:
+            _cache_stats["hit_calls"] += 1
+
+    if cached_tokens or cache_write_tokens:
+        log.info(
+            f"프롬프트 캐시 hit={cached_tokens:,} write={cache_write_tokens:,} miss={uncached_tokens:,}"
+        )
+
+
+def get_prompt_cache_stats() -> dict[str, int]:
+    with _stats_lock:
+        return dict(_cache_stats)
+
+
+def usage_value(obj: Any, *path: str) -> int:
+    """응답 usage 객체에서 중첩 속성 토큰 수 조회 (없으면 0)"""
+    for name in path:
+        obj = getattr(obj, name, None)
+        if obj is None:
+            return 0
+    return obj if isinstance(obj, int) else 0
+
+
+__all__ = [
+    "PROMPT_CACHE_ENABLED",
+    "aget_gemini_cached_content",
+    "build_anthropic_system",
+    "forget_gemini_cached_content",
+    "get_gemini_cached_content",
+    "get_prompt_cache_stats",
+    "is_gemini_cache_missing_error",
+    "openai_prompt_cache_key",
+    "prompt_fingerprint",
+    "record_cache_usage",
+    "should_cache_prompt",
+    "usage_value",
+]
@@ -0,0 +1,250 @@
+"""
+LLM 응답 캐시 (완전 일치)
+
+같은 (모델, 시스템 프롬프트, 유저 프롬프트, temperature, max_tokens) 요청은
+저장된 응답을 그대로 반환해 토큰 비용 없이 즉시 응답한다.
+분석기/줄바꿈처럼 입력이 같으면 결과도 같아야 하는 호출에서만 cache=True로 사용한다.
+
+저장소 (LLM_RESPONSE_CACHE_BACKEND):
+- memory: 프로세스 메모리 TTL+LRU (기본값)
+- disk: 로컬 디렉터리에 키별 JSON 파일 (CLI 재실행 간 공유)
+- mongo: MongoDB 컬렉션 + TTL 인덱스 (여러 워커 간 공유)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from utils.logger import log
+from utils.ttl_cache import TTLCache
+
+LLM_RESPONSE_CACHE_BACKEND = os.getenv("LLM_RESPONSE_CACHE_BACKEND", "memory").lower()
+LLM_RESPONSE_CACHE_TTL = float(os.getenv("LLM_RESPONSE_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_RESPONSE_CACHE_SIZE = int(os.getenv("LLM_RESPONSE_CACHE_SIZE", "2048"))
+LLM_RESPONSE_CACHE_DIR = os.getenv("LLM_RESPONSE_CACHE_DIR", ".cache/llm_responses")
+LLM_RESPONSE_CACHE_COLLECTION = "llm_response_cache"
+
+
+def response_cache_key(
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """요청 내용 기반 캐시 키 (sha256)"""
+    payload = json.dumps(
+        [model_name, system_prompt, user_prompt, temperature, max_tokens],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """응답 캐시 저장소 인터페이스"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, text: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryResponseCache(ResponseCache):
+    def __init__(self, maxsize: int = LLM_RESPONSE_CACHE_SIZE, ttl: float = LLM_RESPONSE_CACHE_TTL):
+        self._cache: TTLCache[str] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, text: str) -> None:
+        self._cache.set(key, text)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    키별 JSON 파일 저장. 개수가 maxsize를 넘으면 오래된 파일부터 삭제
+
+    파일 수는 메모리에서 세고(첫 저장 때 한 번만 디렉터리를 훑음), 넘쳤을 때만 디렉터리를 훑어
+    maxsize의 90%까지 줄인다 → 저장마다 glob 하지 않음
+    """
+
+    def __init__(
+        self,
+        directory: str = LLM_RESPONSE_CACHE_DIR,
+        maxsize: int = LLM_RESPONSE_CACHE_SIZE,
+        ttl: float = LLM_RESPONSE_CACHE_TTL,
+    ):
+        self.directory = Path(directory)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._count: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("expires_at", 0) <= time.time():
+            self._remove(path)
+            return None
+        return entry.get("text")
+
+    def set(self, key: str, text: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"expires_at": time.time() + self.ttl, "text": text}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        with self._lock:
+            if self._count is None:
+                self._count = len(list(self.directory.glob("*/*.json")))
+            if not path.exists():
+                self._count += 1
+            tmp_path.replace(path)
+            if self._count > self.maxsize:
+                self._evict()
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            if path.exists():
+                path.unlink(missing_ok=True)
+                if self._count is not None:
+                    self._count = max(0, self._count - 1)
+
+    def _evict(self) -> None:
+        """오래된 파일부터 지워 maxsize의 90%로 줄임 (다른 프로세스가 만든 파일까지 다시 셈)"""
+        files = list(self.directory.glob("*/*.json"))
+        target = max(1, self.maxsize - self.maxsize // 10)
+        overflow = len(files) - target
+        if overflow > 0:
+            files.sort(key=lambda p: p.stat().st_mtime)
+            for path in files[:overflow]:
+                path.unlink(missing_ok=True)
+        self._count = len(files) - max(overflow, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+            self._count = 0
+
+
+class MongoResponseCache(ResponseCache):
+    """MongoDB 컬렉션 저장. expiresAt TTL 인덱스로 만료 문서 자동 삭제"""
+
+    def __init__(self, ttl: float = LLM_RESPONSE_CACHE_TTL):
+        from mongodb_service import MongoDBService
+
+        self.ttl = ttl
+        self.collection = MongoDBService().db[LLM_RESPONSE_CACHE_COLLECTION]
+        try:
+            self.collection.create_index("expiresAt", expireAfterSeconds=0)
+        except Exception as e:
+            log.warning(f"응답 캐시 TTL 인덱스 생성 실패: {e}")
+
+    def get(self, key: str) -> Optional[str]:
+        doc = self.collection.find_one({"_id": key, "expiresAt": {"$gt": datetime.now()}})
+        return (doc or {}).get("text")
+
+    def set(self, key: str, text: str) -> None:
+        self.collection.update_one(
+            {"_id": key},
+            {"$set": {"text": text, "expiresAt": datetime.now() + timedelta(seconds=self.ttl)}},
+            upsert=True,
+        )
+
+    def clear(self) -> None:
+        self.collection.delete_many({})
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def _build_response_cache(backend: str) -> ResponseCache:
+    if backend == "disk":
+        return DiskResponseCache()
+    if backend == "mongo":
+        try:
+            return MongoResponseCache()
+        except Exception as e:
+            log.warning(f"Mongo 응답 캐시 사용 불가 → 메모리 캐시: {e}")
+    return MemoryResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """설정된 응답 캐시 저장소 반환 (최초 호출 시 생성)"""
+    global _response_cache
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = _build_response_cache(LLM_RESPONSE_CACHE_BACKEND)
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """응답 캐시 저장소 교체 (None이면 다음 호출 때 설정값으로 재생성)"""
+    global _response_cache
+
+    with _response_cache_lock:
+        _response_cache = cache
+
+
+def lookup_cached_response(key: str) -> Optional[str]:
+    """캐시 조회. 저장소 오류는 미적중으로 처리"""
+    try:
+        text = get_response_cache().get(key)
+    except Exception as e:
+        log.warning(f"응답 캐시 조회 실패: {e}")
+        return None
+    if text is not None:
+        log.info("응답 캐시 적중", key=key[:12])
+    return text
+
+
+def store_cached_response(key: str, text: str) -> None:
+    """캐시 저장. 저장소 오류는 호출 결과에 영향 주지 않음"""
+    try:
+        get_response_cache().set(key, text)
+    except Exception as e:
+        log.warning(f"응답 캐시 저장 실패: {e}")
+
+
+__all__ = [
+    "DiskResponseCache",
+    "MemoryResponseCache",
+    "MongoResponseCache",
+    "ResponseCache",
+    "get_response_cache",
+    "lookup_cached_response",
+    "response_cache_key",
+    "set_response_cache",
+    "store_cached_response",
+]
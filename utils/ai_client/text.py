@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from typing import Generator, Optional
+import asyncio
+from typing import AsyncGenerator, Generator, Optional
 
+from utils.ai_client.response_cache import (
+    lookup_cached_response,
+    response_cache_key,
+    store_cached_response,
+)
 from utils.ai_client.text_providers import (
     call_anthropic_text,
     call_chat_completion_text,
@@ -14,9 +20,22 @@ from utils.ai_client.text_providers import (
     stream_grok_text,
     stream_openai_text,
 )
+from utils.ai_client.text_providers_async import (
+    acall_anthropic_text,
+    acall_chat_completion_text,
+    acall_gemini_text,
+    acall_grok_text,
+    acall_openai_text,
+    astream_anthropic_text,
+    astream_chat_completion_text,
+    astream_gemini_text,
+    astream_grok_text,
+    astream_openai_text,
+)
 from utils.ai_client.text_registry import (
     MODEL_PRICING as MODEL_PRICING,
     get_ai_client,
+    get_async_ai_client,
     get_ai_service_type,
     get_model_pricing,
     print_token_cost,
@@ -43,12 +62,30 @@ def get_deepseek_request_options(model_name: str) -> dict[str, object]:
     return {}
 
 
+def _finalize_text_result(
+    model_name: str,
+    text: str,
+    input_tokens: int,
+    output_tokens: int,
+) -> str:
+    text = text.strip()
+    if not text:
+        raise RuntimeError("빈 응답을 받았습니다.")
+
+    if input_tokens > 0 or output_tokens > 0:
+        print_token_cost(model_name, input_tokens, output_tokens)
+
+    return text
+
+
 def call_ai(
     model_name: str,
     system_prompt: str,
     user_prompt: str,
     max_tokens: int = 4096,
     temperature: Optional[float] = None,
+    cache: bool = False,
+    prompt_cache: bool = False,
 ) -> str:
     """
     통합 AI 호출 함수 - 모델명에 따라 적절한 AI 서비스 호출
@@ -58,6 +95,9 @@ def call_ai(
         system_prompt: 시스템 프롬프트
         user_prompt: 유저 프롬프트
         max_tokens: 최대 토큰 수 (기본값: 4096)
+        cache: True면 동일 요청의 응답을 캐시에서 재사용 (결정적 분석 호출용)
+        prompt_cache: True면 Gemini 시스템 프롬프트를 cached content로 재사용
+            (키워드/카테고리가 들어가지 않는 고정 시스템 프롬프트에만 사용)
 
     Returns:
         AI 응답 텍스트
@@ -66,6 +106,15 @@ def call_ai(
         ValueError: API 키가 없거나 클라이언트를 찾을 수 없는 경우
         RuntimeError: 빈 응답을 받은 경우
     """
+    cache_key = None
+    if cache:
+        cache_key = response_cache_key(
+            model_name, system_prompt, user_prompt, temperature, max_tokens
+        )
+        cached_text = lookup_cached_response(cache_key)
+        if cached_text is not None:
+            return cached_text
+
     ai_service_type = get_ai_service_type(model_name)
     validate_api_key(ai_service_type)
 
@@ -83,6 +132,7 @@ def call_ai(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             temperature=temperature,
+            prompt_cache=prompt_cache,
         )
 
     elif ai_service_type == "claude":
@@ -93,6 +143,7 @@ def call_ai(
             user_prompt=user_prompt,
             max_tokens=max_tokens,
             temperature=temperature,
+            prompt_cache=True,
         )
 
     elif ai_service_type == "minimax":
@@ -160,14 +211,149 @@ def call_ai(
     else:
         raise ValueError(f"지원하지 않는 AI 서비스 타입: {ai_service_type}")
 
-    text = text.strip()
-    if not text:
-        raise RuntimeError("빈 응답을 받았습니다.")
+    result = _finalize_text_result(model_name, text, input_tokens, output_tokens)
+    if cache_key is not None:
+        store_cached_response(cache_key, result)
+    return result
 
-    if input_tokens > 0 or output_tokens > 0:
-        print_token_cost(model_name, input_tokens, output_tokens)
 
-    return text
+async def acall_ai(
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 4096,
+    temperature: Optional[float] = None,
+    cache: bool = False,
+    prompt_cache: bool = False,
+) -> str:
+    """
+    통합 AI 호출 함수 (asyncio 네이티브) - call_ai와 동일한 규약
+
+    각 SDK의 async 클라이언트를 사용하므로 스레드풀 워커를 점유하지 않는다.
+
+    Args:
+        model_name: 사용할 모델 이름
+        system_prompt: 시스템 프롬프트
+        user_prompt: 유저 프롬프트
+        max_tokens: 최대 토큰 수 (기본값: 4096)
+        cache: True면 동일 요청의 응답을 캐시에서 재사용 (결정적 분석 호출용)
+        prompt_cache: True면 Gemini 시스템 프롬프트를 cached content로 재사용
+            (키워드/카테고리가 들어가지 않는 고정 시스템 프롬프트에만 사용)
+
+    Returns:
+        AI 응답 텍스트
+
+    Raises:
+        ValueError: API 키가 없거나 클라이언트를 찾을 수 없는 경우
+        RuntimeError: 빈 응답을 받은 경우
+    """
+    cache_key = None
+    if cache:
+        cache_key = response_cache_key(
+            model_name, system_prompt, user_prompt, temperature, max_tokens
+        )
+        # 디스크/Mongo 저장소는 블로킹이므로 스레드에서 조회
+        cached_text = await asyncio.to_thread(lookup_cached_response, cache_key)
+        if cached_text is not None:
+            return cached_text
+
+    ai_service_type = get_ai_service_type(model_name)
+    validate_api_key(ai_service_type)
+
+    client = get_async_ai_client(ai_service_type)
+    if not client:
+        raise ValueError(f"AI 클라이언트를 찾을 수 없습니다. (service_type: {ai_service_type})")
+
+    if ai_service_type == "gemini":
+        text, input_tokens, output_tokens = await acall_gemini_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            prompt_cache=prompt_cache,
+        )
+
+    elif ai_service_type == "claude":
+        text, input_tokens, output_tokens = await acall_anthropic_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            prompt_cache=True,
+        )
+
+    elif ai_service_type == "minimax":
+        text, input_tokens, output_tokens = await acall_anthropic_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+        )
+
+    elif ai_service_type == "openai":
+        text, input_tokens, output_tokens = await acall_openai_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+        )
+
+    elif ai_service_type == "solar":
+        text, input_tokens, output_tokens = await acall_chat_completion_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt + system_prompt,
+            provider_name="SOLAR",
+            reasoning_effort="high",
+        )
+
+    elif ai_service_type == "grok":
+        text, input_tokens, output_tokens = await acall_grok_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    elif ai_service_type == "deepseek":
+        deepseek_options = get_deepseek_request_options(model_name)
+        reasoning_effort = deepseek_options.get("reasoning_effort")
+        extra_body = deepseek_options.get("extra_body")
+        text, input_tokens, output_tokens = await acall_chat_completion_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            provider_name="DeepSeek",
+            max_tokens=max_tokens,
+            reasoning_effort=(
+                reasoning_effort if isinstance(reasoning_effort, str) else None
+            ),
+            extra_body=extra_body if isinstance(extra_body, dict) else None,
+        )
+
+    elif ai_service_type == "kimi":
+        text, input_tokens, output_tokens = await acall_chat_completion_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            provider_name="Kimi",
+        )
+
+    else:
+        raise ValueError(f"지원하지 않는 AI 서비스 타입: {ai_service_type}")
+
+    result = _finalize_text_result(model_name, text, input_tokens, output_tokens)
+    if cache_key is not None:
+        await asyncio.to_thread(store_cached_response, cache_key, result)
+    return result
 
 
 def call_ai_stream(
@@ -211,6 +397,7 @@ def call_ai_stream(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             max_tokens=max_tokens,
+            prompt_cache=True,
         )
 
     elif ai_service_type == "minimax":
@@ -274,10 +461,116 @@ def call_ai_stream(
         raise ValueError(f"지원하지 않는 AI 서비스 타입: {ai_service_type}")
 
 
+async def acall_ai_stream(
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 4096,
+) -> AsyncGenerator[str, None]:
+    """
+    스트리밍 AI 호출 함수 (asyncio 네이티브) - call_ai_stream과 동일한 SSE 청크
+
+    Args:
+        model_name: 사용할 모델 이름
+        system_prompt: 시스템 프롬프트
+        user_prompt: 유저 프롬프트
+        max_tokens: 최대 토큰 수
+
+    Yields:
+        str: 텍스트 청크 (SSE data 형식)
+    """
+    ai_service_type = get_ai_service_type(model_name)
+    validate_api_key(ai_service_type)
+
+    client = get_async_ai_client(ai_service_type)
+    if not client:
+        raise ValueError(f"AI 클라이언트를 찾을 수 없습니다. (service_type: {ai_service_type})")
+
+    if ai_service_type == "openai":
+        stream = astream_openai_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+        )
+
+    elif ai_service_type in ("claude", "minimax"):
+        stream = astream_anthropic_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            prompt_cache=ai_service_type == "claude",
+        )
+
+    elif ai_service_type == "gemini":
+        stream = astream_gemini_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    elif ai_service_type == "deepseek":
+        deepseek_options = get_deepseek_request_options(model_name)
+        reasoning_effort = deepseek_options.get("reasoning_effort")
+        extra_body = deepseek_options.get("extra_body")
+        stream = astream_chat_completion_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            reasoning_effort=(
+                reasoning_effort if isinstance(reasoning_effort, str) else None
+            ),
+            extra_body=extra_body if isinstance(extra_body, dict) else None,
+        )
+
+    elif ai_service_type == "kimi":
+        stream = astream_chat_completion_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    elif ai_service_type == "solar":
+        stream = astream_chat_completion_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt + system_prompt,
+        )
+
+    elif ai_service_type == "grok":
+        stream = astream_grok_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    else:
+        raise ValueError(f"지원하지 않는 AI 서비스 타입: {ai_service_type}")
+
+    # 클라이언트가 끊기면 이 생성기가 닫히므로 안쪽 스트림(업스트림 연결)도 함께 닫음
+    try:
+        async for chunk in stream:
+            yield chunk
+    finally:
+        await stream.aclose()
+
+
 __all__ = [
+    "acall_ai",
+    "acall_ai_stream",
     "call_ai",
     "call_ai_stream",
     "get_ai_client",
+    "get_async_ai_client",
     "get_deepseek_request_options",
     "get_ai_service_type",
     "get_model_pricing",
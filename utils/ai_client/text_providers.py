@@ -6,6 +6,16 @@ from google.genai import types
 from xai_sdk.chat import system as grok_system_message
 from xai_sdk.chat import user as grok_user_message
 
+from utils.ai_client.prompt_cache import (
+    build_anthropic_system,
+    forget_gemini_cached_content,
+    get_gemini_cached_content,
+    is_gemini_cache_missing_error,
+    openai_prompt_cache_key,
+    record_cache_usage,
+    usage_value,
+)
+
 
 TextCallResult = tuple[str, int, int]
 
@@ -16,15 +26,20 @@ def _build_anthropic_request(
     user_prompt: str,
     max_tokens: int,
     temperature: Optional[float] = None,
+    prompt_cache: bool = False,
 ) -> dict[str, Any]:
-    request = {
+    request: dict[str, Any] = {
         "model": model_name,
         "messages": [{"role": "user", "content": user_prompt}],
         "max_tokens": max_tokens,
     }
     normalized_system_prompt = system_prompt.strip()
     if normalized_system_prompt:
-        request["system"] = normalized_system_prompt
+        request["system"] = (
+            build_anthropic_system(normalized_system_prompt)
+            if prompt_cache
+            else normalized_system_prompt
+        )
     if temperature is not None:
         request["temperature"] = temperature
     return request
@@ -33,8 +48,14 @@ def _build_anthropic_request(
 def _build_gemini_config(
     system_prompt: str,
     temperature: Optional[float] = None,
+    cached_content: Optional[str] = None,
 ) -> types.GenerateContentConfig:
-    config_kwargs: dict[str, Any] = {"system_instruction": system_prompt}
+    # cached content에 시스템 프롬프트가 들어 있으면 system_instruction은 생략
+    config_kwargs: dict[str, Any] = (
+        {"cached_content": cached_content}
+        if cached_content
+        else {"system_instruction": system_prompt}
+    )
     if temperature is not None:
         config_kwargs["temperature"] = temperature
     return types.GenerateContentConfig(**config_kwargs)
@@ -53,6 +74,12 @@ def _extract_anthropic_result(response: Any) -> TextCallResult:
     usage = getattr(response, "usage", None)
     input_tokens = getattr(usage, "input_tokens", 0) or 0
     output_tokens = getattr(usage, "output_tokens", 0) or 0
+    # Anthropic input_tokens는 캐시 미적중 부분만 포함
+    record_cache_usage(
+        cached_tokens=usage_value(usage, "cache_read_input_tokens"),
+        cache_write_tokens=usage_value(usage, "cache_creation_input_tokens"),
+        uncached_tokens=input_tokens,
+    )
     return text, input_tokens, output_tokens
 
 
@@ -64,13 +91,102 @@ def _extract_chat_completion_result(response: Any, provider_name: str) -> TextCa
     usage = getattr(response, "usage", None)
     input_tokens = getattr(usage, "prompt_tokens", 0) or 0
     output_tokens = getattr(usage, "completion_tokens", 0) or 0
+    # OpenAI 호환: prompt_tokens_details.cached_tokens / DeepSeek: prompt_cache_hit_tokens
+    cached_tokens = usage_value(usage, "prompt_tokens_details", "cached_tokens") or usage_value(
+        usage, "prompt_cache_hit_tokens"
+    )
+    record_cache_usage(cached_tokens, 0, input_tokens - cached_tokens)
     return text, input_tokens, output_tokens
 
 
-def _yield_text_chunks(text: str, chunk_size: int = 20) -> Generator[str, None, None]:
-    for index in range(0, len(text), chunk_size):
-        yield f"data: {text[index:index + chunk_size]}\n\n"
-    yield "data: [DONE]\n\n"
+def _extract_gemini_result(response: Any) -> TextCallResult:
+    text = getattr(response, "text", "") or ""
+    usage = getattr(response, "usage_metadata", None)
+    input_tokens = getattr(usage, "prompt_token_count", 0) or 0
+    output_tokens = getattr(usage, "candidates_token_count", 0) or 0
+    cached_tokens = usage_value(usage, "cached_content_token_count")
+    record_cache_usage(cached_tokens, 0, input_tokens - cached_tokens)
+    return text, input_tokens, output_tokens
+
+
+def _extract_grok_result(response: Any) -> TextCallResult:
+    text = getattr(response, "content", "") or ""
+    usage = getattr(response, "usage", None)
+    input_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    output_tokens = getattr(usage, "completion_tokens", 0) or 0
+    cached_tokens = usage_value(usage, "cached_prompt_text_tokens")
+    record_cache_usage(cached_tokens, 0, input_tokens - cached_tokens)
+    return text, input_tokens, output_tokens
+
+
+def _extract_responses_result(response: Any) -> TextCallResult:
+    text = getattr(response, "output_text", "") or ""
+    usage = getattr(response, "usage", None)
+    input_tokens = getattr(usage, "input_tokens", 0) or 0
+    output_tokens = getattr(usage, "output_tokens", 0) or 0
+    cached_tokens = usage_value(usage, "input_tokens_details", "cached_tokens")
+    record_cache_usage(cached_tokens, 0, input_tokens - cached_tokens)
+    return text, input_tokens, output_tokens
+
+
+def _build_chat_completion_request(
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: Optional[int] = None,
+    reasoning_effort: Optional[str] = None,
+    extra_body: Optional[dict[str, Any]] = None,
+    stream: bool = False,
+    prompt_cache_key: Optional[str] = None,
+) -> dict[str, Any]:
+    # 정적인 시스템 프롬프트를 항상 맨 앞에 두어 프리픽스 캐시가 적중하도록 유지
+    request: dict[str, Any] = {
+        "model": model_name,
+        "messages": _build_chat_messages(system_prompt=system_prompt, user_prompt=user_prompt),
+    }
+    if prompt_cache_key is not None:
+        request["prompt_cache_key"] = prompt_cache_key
+    if stream:
+        request["stream"] = True
+    if max_tokens is not None:
+        request["max_tokens"] = max_tokens
+    if reasoning_effort is not None:
+        request["reasoning_effort"] = reasoning_effort
+    if extra_body is not None:
+        request["extra_body"] = extra_body
+    return request
+
+
+def _build_responses_request(
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    stream: bool = False,
+    prompt_cache_key: Optional[str] = None,
+) -> dict[str, Any]:
+    request: dict[str, Any] = {
+        "model": model_name,
+        "instructions": system_prompt,
+        "input": user_prompt,
+        "reasoning": {"effort": "medium"},
+        "text": {"verbosity": "medium"},
+    }
+    if prompt_cache_key is not None:
+        request["prompt_cache_key"] = prompt_cache_key
+    if stream:
+        request["stream"] = True
+    return request
+
+
+def _uses_responses_api(model_name: str) -> bool:
+    return model_name.startswith("gpt-5") and "chat" not in model_name
+
+
+def _responses_stream_delta(event: Any) -> str:
+    """Responses API 스트림 이벤트 중 본문 텍스트 델타만 추출"""
+    if getattr(event, "type", "") == "response.output_text.delta":
+        return getattr(event, "delta", "") or ""
+    return ""
 
 
 def call_anthropic_text(
@@ -80,6 +196,7 @@ def call_anthropic_text(
     user_prompt: str,
     max_tokens: int,
     temperature: Optional[float] = None,
+    prompt_cache: bool = False,
 ) -> TextCallResult:
     response = client.messages.create(
         **_build_anthropic_request(
@@ -88,6 +205,7 @@ def call_anthropic_text(
             user_prompt=user_prompt,
             max_tokens=max_tokens,
             temperature=temperature,
+            prompt_cache=prompt_cache,
         )
     )
     return _extract_anthropic_result(response)
@@ -99,17 +217,31 @@ def call_gemini_text(
     system_prompt: str,
     user_prompt: str,
     temperature: Optional[float] = None,
+    prompt_cache: bool = False,
 ) -> TextCallResult:
-    response = client.models.generate_content(
-        model=model_name,
-        config=_build_gemini_config(system_prompt=system_prompt, temperature=temperature),
-        contents=user_prompt,
-    )
-    text = getattr(response, "text", "") or ""
-    usage = getattr(response, "usage_metadata", None)
-    input_tokens = getattr(usage, "prompt_token_count", 0) or 0
-    output_tokens = getattr(usage, "candidates_token_count", 0) or 0
-    return text, input_tokens, output_tokens
+    # 고정 시스템 프롬프트로 opt-in 한 호출만 cached content 사용
+    cached_content = get_gemini_cached_content(client, model_name, system_prompt) if prompt_cache else None
+    try:
+        response = client.models.generate_content(
+            model=model_name,
+            config=_build_gemini_config(
+                system_prompt=system_prompt,
+                temperature=temperature,
+                cached_content=cached_content,
+            ),
+            contents=user_prompt,
+        )
+    except Exception as error:
+        if not cached_content or not is_gemini_cache_missing_error(error):
+            raise
+        # 캐시가 만료/삭제된 경우에만 system_instruction으로 한 번 더 시도
+        forget_gemini_cached_content(model_name, system_prompt)
+        response = client.models.generate_content(
+            model=model_name,
+            config=_build_gemini_config(system_prompt=system_prompt, temperature=temperature),
+            contents=user_prompt,
+        )
+    return _extract_gemini_result(response)
 
 
 def call_chat_completion_text(
@@ -121,17 +253,17 @@ def call_chat_completion_text(
     max_tokens: Optional[int] = None,
     reasoning_effort: Optional[str] = None,
     extra_body: Optional[dict[str, Any]] = None,
+    prompt_cache_key: Optional[str] = None,
 ) -> TextCallResult:
-    request: dict[str, Any] = {
-        "model": model_name,
-        "messages": _build_chat_messages(system_prompt=system_prompt, user_prompt=user_prompt),
-    }
-    if max_tokens is not None:
-        request["max_tokens"] = max_tokens
-    if reasoning_effort is not None:
-        request["reasoning_effort"] = reasoning_effort
-    if extra_body is not None:
-        request["extra_body"] = extra_body
+    request = _build_chat_completion_request(
+        model_name=model_name,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        max_tokens=max_tokens,
+        reasoning_effort=reasoning_effort,
+        extra_body=extra_body,
+        prompt_cache_key=prompt_cache_key,
+    )
 
     response = client.chat.completions.create(**request)
     return _extract_chat_completion_result(response, provider_name)
@@ -147,11 +279,7 @@ def call_grok_text(
     chat_session.append(grok_system_message(system_prompt))
     chat_session.append(grok_user_message(user_prompt))
     response = chat_session.sample()
-    text = getattr(response, "content", "") or ""
-    usage = getattr(response, "usage", None)
-    input_tokens = getattr(usage, "prompt_tokens", 0) or 0
-    output_tokens = getattr(usage, "completion_tokens", 0) or 0
-    return text, input_tokens, output_tokens
+    return _extract_grok_result(response)
 
 
 def call_openai_text(
@@ -161,19 +289,17 @@ def call_openai_text(
     user_prompt: str,
     max_tokens: int,
 ) -> TextCallResult:
-    if model_name.startswith("gpt-5") and "chat" not in model_name:
+    prompt_cache_key = openai_prompt_cache_key(system_prompt)
+    if _uses_responses_api(model_name):
         response = client.responses.create(
-            model=model_name,
-            instructions=system_prompt,
-            input=user_prompt,
-            reasoning={"effort": "medium"},
-            text={"verbosity": "medium"},
+            **_build_responses_request(
+                model_name=model_name,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                prompt_cache_key=prompt_cache_key,
+            )
         )
-        text = getattr(response, "output_text", "") or ""
-        usage = getattr(response, "usage", None)
-        input_tokens = getattr(usage, "input_tokens", 0) or 0
-        output_tokens = getattr(usage, "output_tokens", 0) or 0
-        return text, input_tokens, output_tokens
+        return _extract_responses_result(response)
 
     return call_chat_completion_text(
         client=client,
@@ -182,6 +308,7 @@ def call_openai_text(
         user_prompt=user_prompt,
         provider_name="GPT-4",
         max_tokens=max_tokens,
+        prompt_cache_key=prompt_cache_key,
     )
 
 
@@ -191,6 +318,7 @@ def stream_anthropic_text(
     system_prompt: str,
     user_prompt: str,
     max_tokens: int,
+    prompt_cache: bool = False,
 ) -> Generator[str, None, None]:
     with client.messages.stream(
         **_build_anthropic_request(
@@ -198,6 +326,7 @@ def stream_anthropic_text(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             max_tokens=max_tokens,
+            prompt_cache=prompt_cache,
         )
     ) as stream:
         for text in stream.text_stream:
@@ -213,18 +342,18 @@ def stream_chat_completion_text(
     max_tokens: Optional[int] = None,
     reasoning_effort: Optional[str] = None,
     extra_body: Optional[dict[str, Any]] = None,
+    prompt_cache_key: Optional[str] = None,
 ) -> Generator[str, None, None]:
-    request: dict[str, Any] = {
-        "model": model_name,
-        "messages": _build_chat_messages(system_prompt=system_prompt, user_prompt=user_prompt),
-        "stream": True,
-    }
-    if max_tokens is not None:
-        request["max_tokens"] = max_tokens
-    if reasoning_effort is not None:
-        request["reasoning_effort"] = reasoning_effort
-    if extra_body is not None:
-        request["extra_body"] = extra_body
+    request = _build_chat_completion_request(
+        model_name=model_name,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        max_tokens=max_tokens,
+        reasoning_effort=reasoning_effort,
+        extra_body=extra_body,
+        stream=True,
+        prompt_cache_key=prompt_cache_key,
+    )
 
     stream = client.chat.completions.create(**request)
     for chunk in stream:
@@ -259,9 +388,10 @@ def stream_grok_text(
     chat_session = client.chat.create(model=model_name)
     chat_session.append(grok_system_message(system_prompt))
     chat_session.append(grok_user_message(user_prompt))
-    response = chat_session.sample()
-    text = getattr(response, "content", "") or ""
-    yield from _yield_text_chunks(text)
+    for _response, chunk in chat_session.stream():
+        if chunk.content:
+            yield f"data: {chunk.content}\n\n"
+    yield "data: [DONE]\n\n"
 
 
 def stream_openai_text(
@@ -271,25 +401,32 @@ def stream_openai_text(
     user_prompt: str,
     max_tokens: int,
 ) -> Generator[str, None, None]:
-    if not model_name.startswith("gpt-5") or "chat" in model_name:
+    prompt_cache_key = openai_prompt_cache_key(system_prompt)
+    if not _uses_responses_api(model_name):
         yield from stream_chat_completion_text(
             client=client,
             model_name=model_name,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             max_tokens=max_tokens,
+            prompt_cache_key=prompt_cache_key,
         )
         return
 
-    response = client.responses.create(
-        model=model_name,
-        instructions=system_prompt,
-        input=user_prompt,
-        reasoning={"effort": "medium"},
-        text={"verbosity": "medium"},
+    stream = client.responses.create(
+        **_build_responses_request(
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            stream=True,
+            prompt_cache_key=prompt_cache_key,
+        )
     )
-    text = getattr(response, "output_text", "") or ""
-    yield from _yield_text_chunks(text)
+    for event in stream:
+        delta = _responses_stream_delta(event)
+        if delta:
+            yield f"data: {delta}\n\n"
+    yield "data: [DONE]\n\n"
 
 
 __all__ = [
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import inspect
+from typing import Any, AsyncGenerator, Optional
+
+from xai_sdk.chat import system as grok_system_message
+from xai_sdk.chat import user as grok_user_message
+
+from utils.ai_client.prompt_cache import (
+    aget_gemini_cached_content,
+    forget_gemini_cached_content,
+    is_gemini_cache_missing_error,
+    openai_prompt_cache_key,
+)
+from utils.ai_client.text_providers import (
+    TextCallResult,
+    _build_anthropic_request,
+    _build_chat_completion_request,
+    _build_gemini_config,
+    _build_responses_request,
+    _extract_anthropic_result,
+    _extract_chat_completion_result,
+    _extract_gemini_result,
+    _extract_grok_result,
+    _extract_responses_result,
+    _responses_stream_delta,
+    _uses_responses_api,
+)
+
+
+async def acall_anthropic_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    temperature: Optional[float] = None,
+    prompt_cache: bool = False,
+) -> TextCallResult:
+    response = await client.messages.create(
+        **_build_anthropic_request(
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            prompt_cache=prompt_cache,
+        )
+    )
+    return _extract_anthropic_result(response)
+
+
+async def acall_gemini_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: Optional[float] = None,
+    prompt_cache: bool = False,
+) -> TextCallResult:
+    # 고정 시스템 프롬프트로 opt-in 한 호출만 cached content 사용
+    cached_content = await aget_gemini_cached_content(client, model_name, system_prompt) if prompt_cache else None
+    try:
+        response = await client.aio.models.generate_content(
+            model=model_name,
+            config=_build_gemini_config(
+                system_prompt=system_prompt,
+                temperature=temperature,
+                cached_content=cached_content,
+            ),
+            contents=user_prompt,
+        )
+    except Exception as error:
+        if not cached_content or not is_gemini_cache_missing_error(error):
+            raise
+        # 캐시가 만료/삭제된 경우에만 system_instruction으로 한 번 더 시도
+        forget_gemini_cached_content(model_name, system_prompt)
+        response = await client.aio.models.generate_content(
+            model=model_name,
+            config=_build_gemini_config(system_prompt=system_prompt, temperature=temperature),
+            contents=user_prompt,
+        )
+    return _extract_gemini_result(response)
+
+
+async def acall_chat_completion_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    provider_name: str,
+    max_tokens: Optional[int] = None,
+    reasoning_effort: Optional[str] = None,
+    extra_body: Optional[dict[str, Any]] = None,
+    prompt_cache_key: Optional[str] = None,
+) -> TextCallResult:
+    request = _build_chat_completion_request(
+        model_name=model_name,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        max_tokens=max_tokens,
+        reasoning_effort=reasoning_effort,
+        extra_body=extra_body,
+        prompt_cache_key=prompt_cache_key,
+    )
+
+    response = await client.chat.completions.create(**request)
+    return _extract_chat_completion_result(response, provider_name)
+
+
+async def acall_grok_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+) -> TextCallResult:
+    chat_session = client.chat.create(model=model_name)
+    chat_session.append(grok_system_message(system_prompt))
+    chat_session.append(grok_user_message(user_prompt))
+    response = await chat_session.sample()
+    return _extract_grok_result(response)
+
+
+async def acall_openai_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+) -> TextCallResult:
+    prompt_cache_key = openai_prompt_cache_key(system_prompt)
+    if _uses_responses_api(model_name):
+        response = await client.responses.create(
+            **_build_responses_request(
+                model_name=model_name,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                prompt_cache_key=prompt_cache_key,
+            )
+        )
+        return _extract_responses_result(response)
+
+    return await acall_chat_completion_text(
+        client=client,
+        model_name=model_name,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        provider_name="GPT-4",
+        max_tokens=max_tokens,
+        prompt_cache_key=prompt_cache_key,
+    )
+
+
+async def _aclose_stream(stream: Any) -> None:
+    """
+    업스트림 스트림 정리 (클라이언트가 중간에 끊어도 HTTP 연결/생성기를 닫음)
+
+    OpenAI AsyncStream.close(), 비동기 생성기 aclose() 모두 처리한다.
+    """
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def astream_anthropic_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    prompt_cache: bool = False,
+) -> AsyncGenerator[str, None]:
+    async with client.messages.stream(
+        **_build_anthropic_request(
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            prompt_cache=prompt_cache,
+        )
+    ) as stream:
+        async for text in stream.text_stream:
+            yield f"data: {text}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+async def astream_chat_completion_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: Optional[int] = None,
+    reasoning_effort: Optional[str] = None,
+    extra_body: Optional[dict[str, Any]] = None,
+    prompt_cache_key: Optional[str] = None,
+) -> AsyncGenerator[str, None]:
+    request = _build_chat_completion_request(
+        model_name=model_name,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        max_tokens=max_tokens,
+        reasoning_effort=reasoning_effort,
+        extra_body=extra_body,
+        stream=True,
+        prompt_cache_key=prompt_cache_key,
+    )
+
+    stream = await client.chat.completions.create(**request)
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield f"data: {chunk.choices[0].delta.content}\n\n"
+    finally:
+        await _aclose_stream(stream)
+    yield "data: [DONE]\n\n"
+
+
+async def astream_gemini_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+) -> AsyncGenerator[str, None]:
+    response = await client.aio.models.generate_content_stream(
+        model=model_name,
+        config=_build_gemini_config(system_prompt=system_prompt),
+        contents=user_prompt,
+    )
+    try:
+        async for chunk in response:
+            if hasattr(chunk, "text") and chunk.text:
+                yield f"data: {chunk.text}\n\n"
+    finally:
+        await _aclose_stream(response)
+    yield "data: [DONE]\n\n"
+
+
+async def astream_grok_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+) -> AsyncGenerator[str, None]:
+    chat_session = client.chat.create(model=model_name)
+    chat_session.append(grok_system_message(system_prompt))
+    chat_session.append(grok_user_message(user_prompt))
+    stream = chat_session.stream()
+    try:
+        async for _response, chunk in stream:
+            if chunk.content:
+                yield f"data: {chunk.content}\n\n"
+    finally:
+        await _aclose_stream(stream)
+    yield "data: [DONE]\n\n"
+
+
+async def astream_openai_text(
+    client: Any,
+    model_name: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+) -> AsyncGenerator[str, None]:
+    prompt_cache_key = openai_prompt_cache_key(system_prompt)
+    if not _uses_responses_api(model_name):
+        chunks = astream_chat_completion_text(
+            client=client,
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            prompt_cache_key=prompt_cache_key,
+        )
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+        return
+
+    stream = await client.responses.create(
+        **_build_responses_request(
+            model_name=model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            stream=True,
+            prompt_cache_key=prompt_cache_key,
+        )
+    )
+    try:
+        async for event in stream:
+            delta = _responses_stream_delta(event)
+            if delta:
+                yield f"data: {delta}\n\n"
+    finally:
+        await _aclose_stream(stream)
+    yield "data: [DONE]\n\n"
+
+
+__all__ = [
+    "acall_anthropic_text",
+    "acall_chat_completion_text",
+    "acall_gemini_text",
+    "acall_grok_text",
+    "acall_openai_text",
+    "astream_anthropic_text",
+    "astream_chat_completion_text",
+    "astream_gemini_text",
+    "astream_grok_text",
+    "astream_openai_text",
+]
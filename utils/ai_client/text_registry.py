@@ -1,25 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import inspect
+import os
+import threading
+import weakref
 from typing import Any, Optional, Tuple
 
-from anthropic import Anthropic
+import httpx
+from anthropic import Anthropic, AsyncAnthropic
 from google import genai
-from openai import OpenAI
+from google.genai import types as genai_types
+from openai import AsyncOpenAI, OpenAI
+from xai_sdk import AsyncClient as AsyncGrokClient
+from xai_sdk import Client as GrokClient
 
 from config import (
     CLAUDE_API_KEY,
     DEEPSEEK_API_KEY,
+    DEEPSEEK_BASE_URL,
     GEMINI_API_KEY,
     GROK_API_KEY,
     MINIMAX_API_KEY,
+    MINIMAX_BASE_URL,
     MOONSHOT_API_KEY,
+    MOONSHOT_BASE_URL,
     OPENAI_API_KEY,
+    SOLAR_BASE_URL,
     UPSTAGE_API_KEY,
-    deepseek_client,
-    grok_client,
-    minimax_client,
-    moonshot_client,
-    solar_client,
 )
 from utils.logger import log
 
@@ -76,33 +85,250 @@ def get_ai_service_type(model_name: str) -> str:
         return "openai"
 
 
+# 프로바이더 클라이언트 풀 설정
+# - 클라이언트는 (provider, base_url, timeout) 조합당 프로세스에서 하나만 생성
+# - httpx 커넥션 풀을 재사용해 호출마다 TLS 핸드셰이크가 반복되지 않게 함
+LLM_POOL_SIZE = max(1, int(os.getenv("LLM_POOL_SIZE", "20")))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "120"))
+LLM_HTTP2_ENABLED = (
+    os.getenv("LLM_HTTP2", "1") != "0" and importlib.util.find_spec("h2") is not None
+)
+
+ClientKey = Tuple[str, str, float]
+
+# service_type -> (base_url, timeout)
+PROVIDER_ENDPOINTS: dict[str, Tuple[str, float]] = {
+    "openai": ("", 600.0),
+    "gemini": ("", 600.0),
+    "claude": ("", 600.0),
+    "minimax": (MINIMAX_BASE_URL, 600.0),
+    "solar": (SOLAR_BASE_URL, 600.0),
+    "grok": ("", 3600.0),
+    "deepseek": (DEEPSEEK_BASE_URL, 600.0),
+    "kimi": (MOONSHOT_BASE_URL, 600.0),
+}
+
+PROVIDER_API_KEYS: dict[str, Optional[str]] = {
+    "openai": OPENAI_API_KEY,
+    "gemini": GEMINI_API_KEY,
+    "claude": CLAUDE_API_KEY,
+    "minimax": MINIMAX_API_KEY,
+    "solar": UPSTAGE_API_KEY,
+    "grok": GROK_API_KEY,
+    "deepseek": DEEPSEEK_API_KEY,
+    "kimi": MOONSHOT_API_KEY,
+}
+
+_sync_clients: dict[ClientKey, Any] = {}
+# async 클라이언트는 이벤트 루프에 묶이므로 루프별로 분리 보관
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[ClientKey, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def get_pool_size(ai_service_type: str) -> int:
+    """프로바이더별 커넥션 풀 크기 (LLM_POOL_SIZE_<PROVIDER> > LLM_POOL_SIZE)"""
+    override = os.getenv(f"LLM_POOL_SIZE_{ai_service_type.upper()}")
+    if override:
+        return max(1, int(override))
+    return LLM_POOL_SIZE
+
+
+def get_client_pool_sizes() -> dict[str, int]:
+    """전체 프로바이더의 커넥션 풀 크기"""
+    return {service_type: get_pool_size(service_type) for service_type in PROVIDER_ENDPOINTS}
+
+
+def _get_client_key(ai_service_type: str) -> Optional[ClientKey]:
+    endpoint = PROVIDER_ENDPOINTS.get(ai_service_type)
+    if not endpoint or not PROVIDER_API_KEYS.get(ai_service_type):
+        return None
+    base_url, timeout = endpoint
+    return (ai_service_type, base_url, timeout)
+
+
+def _build_httpx_kwargs(ai_service_type: str, timeout: float) -> dict[str, Any]:
+    pool_size = get_pool_size(ai_service_type)
+    return {
+        "http2": LLM_HTTP2_ENABLED,
+        "timeout": timeout,
+        "limits": httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        ),
+    }
+
+
+def _build_grok_channel_options() -> list[tuple[str, Any]]:
+    # gRPC 채널은 HTTP/2 단일 커넥션을 멀티플렉싱하므로 keepalive만 설정
+    return [
+        ("grpc.keepalive_time_ms", int(LLM_KEEPALIVE_EXPIRY * 1000)),
+        ("grpc.keepalive_permit_without_calls", 1),
+    ]
+
+
+def _build_sync_client(key: ClientKey) -> Any:
+    ai_service_type, base_url, timeout = key
+    api_key = PROVIDER_API_KEYS[ai_service_type]
+
+    if ai_service_type == "gemini":
+        return genai.Client(
+            api_key=api_key,
+            http_options=genai_types.HttpOptions(
+                client_args=_build_httpx_kwargs(ai_service_type, timeout),
+            ),
+        )
+    if ai_service_type == "grok":
+        return GrokClient(
+            api_key=api_key,
+            timeout=timeout,
+            channel_options=_build_grok_channel_options(),
+        )
+
+    http_client = httpx.Client(**_build_httpx_kwargs(ai_service_type, timeout))
+    if ai_service_type in ("claude", "minimax"):
+        return Anthropic(
+            api_key=api_key,
+            base_url=base_url or None,
+            timeout=timeout,
+            http_client=http_client,
+        )
+
+    default_headers = (
+        {"Authorization": f"Bearer {api_key}"} if ai_service_type == "solar" else None
+    )
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url or None,
+        timeout=timeout,
+        default_headers=default_headers,
+        http_client=http_client,
+    )
+
+
+def _build_async_client(key: ClientKey) -> Any:
+    ai_service_type, base_url, timeout = key
+    api_key = PROVIDER_API_KEYS[ai_service_type]
+
+    if ai_service_type == "gemini":
+        return genai.Client(
+            api_key=api_key,
+            http_options=genai_types.HttpOptions(
+                async_client_args=_build_httpx_kwargs(ai_service_type, timeout),
+            ),
+        )
+    if ai_service_type == "grok":
+        return AsyncGrokClient(
+            api_key=api_key,
+            timeout=timeout,
+            channel_options=_build_grok_channel_options(),
+        )
+
+    http_client = httpx.AsyncClient(**_build_httpx_kwargs(ai_service_type, timeout))
+    if ai_service_type in ("claude", "minimax"):
+        return AsyncAnthropic(
+            api_key=api_key,
+            base_url=base_url or None,
+            timeout=timeout,
+            http_client=http_client,
+        )
+
+    default_headers = (
+        {"Authorization": f"Bearer {api_key}"} if ai_service_type == "solar" else None
+    )
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url or None,
+        timeout=timeout,
+        default_headers=default_headers,
+        http_client=http_client,
+    )
+
+
 def get_ai_client(ai_service_type: str) -> Optional[Any]:
     """
-    AI 서비스 타입에 맞는 클라이언트를 반환
+    AI 서비스 타입에 맞는 클라이언트를 반환 (프로세스 전역 재사용)
 
     Args:
         ai_service_type: AI 서비스 타입
 
     Returns:
-        해당 AI 서비스 클라이언트
+        해당 AI 서비스 클라이언트 (API 키가 없으면 None)
     """
-    if ai_service_type == "openai":
-        return OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
-    elif ai_service_type == "gemini":
-        return genai.Client(api_key=GEMINI_API_KEY) if GEMINI_API_KEY else None
-    elif ai_service_type == "claude":
-        return Anthropic(api_key=CLAUDE_API_KEY, timeout=600.0) if CLAUDE_API_KEY else None
-    elif ai_service_type == "minimax":
-        return minimax_client
-    elif ai_service_type == "solar":
-        return solar_client
-    elif ai_service_type == "grok":
-        return grok_client
-    elif ai_service_type == "deepseek":
-        return deepseek_client
-    elif ai_service_type == "kimi":
-        return moonshot_client
-    return None
+    key = _get_client_key(ai_service_type)
+    if key is None:
+        return None
+
+    with _clients_lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            client = _build_sync_client(key)
+            _sync_clients[key] = client
+    return client
+
+
+def get_async_ai_client(ai_service_type: str) -> Optional[Any]:
+    """
+    AI 서비스 타입에 맞는 asyncio 네이티브 클라이언트를 반환 (이벤트 루프별 재사용)
+
+    Gemini는 genai.Client를 반환한다. (호출부에서 client.aio.models 사용)
+
+    Args:
+        ai_service_type: AI 서비스 타입
+
+    Returns:
+        해당 AI 서비스 async 클라이언트 (API 키가 없으면 None)
+    """
+    key = _get_client_key(ai_service_type)
+    if key is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None:
+            client = _build_async_client(key)
+            loop_clients[key] = client
+    return client
+
+
+def close_ai_clients() -> None:
+    """캐시된 sync 클라이언트의 커넥션 풀 정리"""
+    with _clients_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass
+
+
+async def aclose_ai_clients() -> None:
+    """현재 이벤트 루프에 캐시된 async 클라이언트의 커넥션 풀 정리"""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+
+    for client in clients:
+        if isinstance(client, genai.Client):
+            close = getattr(client.aio, "aclose", None)
+        else:
+            close = getattr(client, "close", None)
+        if not callable(close):
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            pass
 
 
 def validate_api_key(ai_service_type: str) -> None:
@@ -165,7 +391,13 @@ def print_token_cost(model_name: str, input_tokens: int, output_tokens: int) ->
 
 __all__ = [
     "MODEL_PRICING",
+    "PROVIDER_ENDPOINTS",
+    "aclose_ai_clients",
+    "close_ai_clients",
     "get_ai_client",
+    "get_async_ai_client",
+    "get_client_pool_sizes",
+    "get_pool_size",
     "get_ai_service_type",
     "get_model_pricing",
     "print_token_cost",
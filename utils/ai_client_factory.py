@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from utils.ai_client.image import call_image_ai, get_image_service_type
+from utils.ai_client.prompt_cache import get_prompt_cache_stats
 from utils.ai_client.text import (
     MODEL_PRICING,
+    acall_ai,
+    acall_ai_stream,
     call_ai,
     call_ai_stream,
     get_ai_client,
+    get_async_ai_client,
     get_deepseek_request_options,
     get_ai_service_type,
     get_model_pricing,
@@ -14,14 +18,18 @@ from utils.ai_client.text import (
 )
 
 __all__ = [
+    "acall_ai",
+    "acall_ai_stream",
     "call_ai",
     "call_ai_stream",
     "call_image_ai",
     "get_ai_client",
+    "get_async_ai_client",
     "get_deepseek_request_options",
     "get_ai_service_type",
     "get_image_service_type",
     "get_model_pricing",
+    "get_prompt_cache_stats",
     "print_token_cost",
     "validate_api_key",
     "MODEL_PRICING",
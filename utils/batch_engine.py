@@ -0,0 +1,265 @@
+"""
+배치 작업 실행기 (동시 실행 수 제한 + 프로바이더별 RPM/TPM 제한 + 항목별 재시도)
+
+키워드 배치를 한 건씩 순서대로 돌리고 고정 sleep을 넣던 방식 대신,
+N건을 동시에 돌리면서 실제 호출 한도는 프로바이더별 제한기로 지킨다.
+
+- 배치 동시 실행 수: BATCH_CONCURRENCY (요청마다 concurrency로 조정 가능)
+- 프로바이더 제한 (ProviderLimiter): 동시 호출 수 + 분당 요청 수(RPM) + 분당 토큰 수(TPM)
+  - 기본값: PROVIDER_CONCURRENCY / PROVIDER_RPM / PROVIDER_TPM (0이면 무제한)
+  - 프로바이더별: PROVIDER_<이름>_CONCURRENCY / _RPM / _TPM (예: PROVIDER_GEMINI_RPM)
+- 항목별 재시도: 한 항목이 실패해도 다른 항목과 무관하게 지수 백오프로 BATCH_RETRIES번 재시도
+  (백오프 동안에는 동시 실행 슬롯을 반납)
+- run_batch는 끝난 순서대로 결과를 내고, gather_batch는 입력 순서대로 정렬해 돌려준다
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from utils.logger import log
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BATCH_CONCURRENCY = max(1, int(os.getenv("BATCH_CONCURRENCY", "8")))
+BATCH_RETRIES = max(0, int(os.getenv("BATCH_RETRIES", "2")))
+BATCH_RETRY_BASE_DELAY = float(os.getenv("BATCH_RETRY_BASE_DELAY", "2"))
+
+PROVIDER_CONCURRENCY = max(1, int(os.getenv("PROVIDER_CONCURRENCY", "4")))
+PROVIDER_RPM = int(os.getenv("PROVIDER_RPM", "60"))
+PROVIDER_TPM = int(os.getenv("PROVIDER_TPM", "0"))
+
+RATE_WINDOW_SECONDS = 60.0
+
+
+class ProviderLimiter:
+    """프로바이더 한 곳의 동시 호출 수 + 슬라이딩 1분 창 RPM/TPM 제한"""
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int = PROVIDER_CONCURRENCY,
+        rpm: int = PROVIDER_RPM,
+        tpm: int = PROVIDER_TPM,
+        window: float = RATE_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window
+        self._clock = clock
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._budget_lock = asyncio.Lock()
+        # (시각, 요청 수, 토큰 수)
+        self._usage: Deque[Tuple[float, int, int]] = deque()
+
+    def _fits(self, requests: int, tokens: int) -> bool:
+        if not self._usage:
+            # 창이 비었으면 한도보다 큰 요청도 통과 (영원히 대기하지 않도록)
+            return True
+        used_requests = sum(entry[1] for entry in self._usage)
+        used_tokens = sum(entry[2] for entry in self._usage)
+        if self.rpm and used_requests + requests > self.rpm:
+            return False
+        if self.tpm and used_tokens + tokens > self.tpm:
+            return False
+        return True
+
+    async def _reserve(self, requests: int, tokens: int) -> None:
+        # 잠금 안에서 기다려 먼저 온 호출이 먼저 예산을 받음
+        async with self._budget_lock:
+            while True:
+                now = self._clock()
+                while self._usage and self._usage[0][0] <= now - self.window:
+                    self._usage.popleft()
+                if self._fits(requests, tokens):
+                    self._usage.append((now, requests, tokens))
+                    return
+                wait = self._usage[0][0] + self.window - now
+                await asyncio.sleep(max(wait, 0.05))
+
+    @asynccontextmanager
+    async def limit(self, requests: int = 1, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        호출 한 번(또는 묶음)에 대한 슬롯 + RPM/TPM 예산 확보
+
+        Args:
+            requests: 이번에 보낼 요청 수 (예: 이미지 5장이면 5)
+            tokens: 예상 토큰 수 (TPM 제한용, 모르면 0)
+        """
+        async with self._semaphore:
+            await self._reserve(requests, tokens)
+            yield
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+
+
+def _provider_setting(name: str, key: str, default: int) -> int:
+    env_name = name.upper().replace("-", "_")
+    return int(os.getenv(f"PROVIDER_{env_name}_{key}", str(default)))
+
+
+def get_provider_limiter(name: str) -> ProviderLimiter:
+    """프로바이더 이름(openai, gemini, gemini-flash-image 등) → 프로세스 공유 제한기"""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = ProviderLimiter(
+            name,
+            concurrency=max(1, _provider_setting(name, "CONCURRENCY", PROVIDER_CONCURRENCY)),
+            rpm=_provider_setting(name, "RPM", PROVIDER_RPM),
+            tpm=_provider_setting(name, "TPM", PROVIDER_TPM),
+        )
+        _limiters[name] = limiter
+    return limiter
+
+
+@dataclass
+class BatchItemResult(Generic[T, R]):
+    """배치 항목 하나의 실행 결과"""
+
+    index: int
+    item: T
+    ok: bool
+    value: Optional[R] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+
+
+class EmptyResultError(Exception):
+    """작업 함수가 None을 돌려준 경우 (실패로 보고 재시도)"""
+
+
+async def _run_item(
+    index: int,
+    item: T,
+    worker: Callable[[int, T], Awaitable[Optional[R]]],
+    semaphore: asyncio.Semaphore,
+    retries: int,
+    retry_delay: float,
+) -> BatchItemResult[T, R]:
+    started = time.monotonic()
+    error: Optional[BaseException] = None
+
+    for attempt in range(1, retries + 2):
+        try:
+            async with semaphore:
+                value = await worker(index, item)
+            if value is None:
+                raise EmptyResultError("결과 없음")
+            return BatchItemResult(
+                index, item, True, value, attempts=attempt, elapsed=time.monotonic() - started
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+            if attempt <= retries:
+                delay = retry_delay * (2 ** (attempt - 1))
+                log.warning(
+                    f"배치 항목 재시도 ({attempt}/{retries})",
+                    index=index,
+                    error=str(e),
+                    delay=delay,
+                )
+                await asyncio.sleep(delay)
+
+    return BatchItemResult(
+        index,
+        item,
+        False,
+        error=str(error),
+        attempts=retries + 1,
+        elapsed=time.monotonic() - started,
+    )
+
+
+async def run_batch(
+    items: Sequence[T],
+    worker: Callable[[int, T], Awaitable[Optional[R]]],
+    concurrency: Optional[int] = None,
+    retries: int = BATCH_RETRIES,
+    retry_delay: float = BATCH_RETRY_BASE_DELAY,
+) -> AsyncIterator[BatchItemResult[T, R]]:
+    """
+    항목을 동시에 처리하고 끝나는 순서대로 결과 반환
+
+    Args:
+        items: 처리할 항목
+        worker: (입력 순번, 항목) → 결과 코루틴 (예외/None이면 실패 → 재시도)
+        concurrency: 동시 처리 수 (None이면 BATCH_CONCURRENCY)
+        retries: 항목별 재시도 횟수
+        retry_delay: 첫 재시도 대기(초), 이후 2배씩
+
+    Yields:
+        BatchItemResult (완료 순서)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency or BATCH_CONCURRENCY))
+    tasks = [
+        asyncio.create_task(_run_item(index, item, worker, semaphore, retries, retry_delay))
+        for index, item in enumerate(items)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 소비자가 중간에 멈추면(클라이언트 연결 끊김 등) 남은 항목 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def gather_batch(
+    items: Sequence[T],
+    worker: Callable[[int, T], Awaitable[Optional[R]]],
+    concurrency: Optional[int] = None,
+    retries: int = BATCH_RETRIES,
+    retry_delay: float = BATCH_RETRY_BASE_DELAY,
+    on_result: Optional[Callable[[BatchItemResult[T, R]], None]] = None,
+) -> List[BatchItemResult[T, R]]:
+    """
+    run_batch 결과를 모두 모아 입력 순서대로 반환
+
+    Args:
+        on_result: 항목이 끝날 때마다 호출 (완료 순서)
+    """
+    results: List[BatchItemResult[T, R]] = []
+    async for result in run_batch(items, worker, concurrency, retries, retry_delay):
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    return sorted(results, key=lambda result: result.index)
+
+
+__all__ = [
+    "BATCH_CONCURRENCY",
+    "BatchItemResult",
+    "EmptyResultError",
+    "ProviderLimiter",
+    "gather_batch",
+    "get_provider_limiter",
+    "run_batch",
+]
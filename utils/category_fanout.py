@@ -0,0 +1,121 @@
+"""
+카테고리 DB 병렬 조회(fan-out) 실행기
+
+카테고리(~58개) DB를 하나씩 돌면 지연이 카테고리 수에 비례하므로,
+공유 스레드풀에서 동시에 조회하고 느린/실패한 카테고리는 부분 결과로 보고한다.
+
+- 동시 실행 수: CATEGORY_FANOUT_WORKERS (프로세스 공유 풀 → 요청이 몰려도 Mongo 풀 보호)
+- 카테고리별 타임아웃: CATEGORY_FANOUT_TIMEOUT_MS (쿼리에 maxTimeMS로 전달 + 전체 대기 상한)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from _constants.categories import CATEGORIES
+from utils.logger import log
+
+T = TypeVar("T")
+
+CATEGORY_FANOUT_WORKERS = int(os.getenv("CATEGORY_FANOUT_WORKERS", "16"))
+CATEGORY_FANOUT_TIMEOUT_MS = int(os.getenv("CATEGORY_FANOUT_TIMEOUT_MS", "3000"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=CATEGORY_FANOUT_WORKERS,
+                    thread_name_prefix="category-fanout",
+                )
+    return _executor
+
+
+@dataclass
+class FanoutResult(Generic[T]):
+    """카테고리별 조회 결과 (성공/실패/시간초과 분리)"""
+
+    results: Dict[str, T] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.failed or self.timed_out)
+
+    def report(self) -> Dict[str, object]:
+        """응답에 포함할 부분 결과 요약"""
+        return {
+            "partial": self.partial,
+            "failedCategories": sorted([*self.failed, *self.timed_out]),
+        }
+
+
+def fan_out_categories(
+    fn: Callable[[str], T],
+    categories: Iterable[str] = CATEGORIES,
+    timeout_ms: int = CATEGORY_FANOUT_TIMEOUT_MS,
+) -> FanoutResult[T]:
+    """
+    모든 카테고리에 fn(category)를 병렬 실행
+
+    Args:
+        fn: 카테고리 하나를 조회하는 함수 (쿼리에 maxTimeMS=timeout_ms 적용 권장)
+        categories: 대상 카테고리 목록
+        timeout_ms: 카테고리별 타임아웃(ms). 이 시간 안에 못 끝난 카테고리는 timed_out으로 보고
+
+    Returns:
+        FanoutResult
+    """
+    executor = _get_executor()
+    outcome: FanoutResult[T] = FanoutResult()
+    futures: Dict[Future, str] = {
+        executor.submit(fn, category): category for category in categories
+    }
+
+    # 큐 대기 시간을 감안해 전체 상한은 (배치 수 × 타임아웃)
+    batches = max(1, -(-len(futures) // CATEGORY_FANOUT_WORKERS))
+    deadline = time.monotonic() + batches * timeout_ms / 1000
+
+    pending = set(futures)
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            category = futures[future]
+            try:
+                outcome.results[category] = future.result()
+            except Exception as error:
+                outcome.failed[category] = str(error)
+
+    for future in pending:
+        future.cancel()
+        outcome.timed_out.append(futures[future])
+
+    if outcome.partial:
+        log.warning(
+            "카테고리 병렬 조회 일부 실패",
+            failed=len(outcome.failed),
+            timeout=len(outcome.timed_out),
+        )
+    return outcome
+
+
+__all__ = [
+    "CATEGORY_FANOUT_TIMEOUT_MS",
+    "FanoutResult",
+    "fan_out_categories",
+]
@@ -0,0 +1,70 @@
+"""
+카테고리 분류와 원고 생성을 겹쳐 실행하는 파이프라인
+
+분류 LLM 왕복을 기다리는 동안 카테고리와 무관한 준비(쿼리 파싱, 시스템 프롬프트 조립 등)를
+스레드에서 먼저 끝내 두고, 카테고리가 나오면 나머지 프롬프트만 채워 생성한다.
+카테고리가 프롬프트에 들어가지 않는 생성기(category_agnostic=True)는 분류를 기다리지 않고
+생성을 바로 시작하고, 카테고리는 DB 저장/이미지 생성처럼 실제로 필요한 시점에 합류시킨다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Tuple, TypeVar
+
+from utils.get_category_db_name import get_category_db_name, peek_category
+from utils.logger import log
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+@dataclass
+class CategoryGenerator(Generic[P, T]):
+    """카테고리를 받아 원고를 만드는 생성기 (준비 단계와 생성 단계 분리)"""
+
+    # 카테고리와 무관한 준비 (동기 함수, 분류와 동시에 스레드에서 실행)
+    prepare: Callable[[], P]
+    # 준비 결과 + 카테고리 → 생성 코루틴
+    generate: Callable[[P, str], Awaitable[T]]
+    # True면 카테고리가 프롬프트에 쓰이지 않음 → 분류를 기다리지 않고 빈 카테고리로 생성 시작
+    category_agnostic: bool = False
+
+
+async def generate_with_category(
+    classify_text: str,
+    generator: CategoryGenerator[P, T],
+) -> Tuple[T, str]:
+    """
+    카테고리 분류와 생성 호출 실행
+
+    Args:
+        classify_text: 분류용 텍스트 (보통 keyword + ref)
+        generator: 준비/생성 단계와 카테고리 의존 여부를 담은 생성기
+
+    Returns:
+        (생성 결과, 카테고리)
+    """
+    known = peek_category(classify_text)
+    if known:
+        return await generator.generate(generator.prepare(), known), known
+
+    classify_task = asyncio.create_task(get_category_db_name(keyword=classify_text))
+    try:
+        prepared = await asyncio.to_thread(generator.prepare)
+        if generator.category_agnostic:
+            result = await generator.generate(prepared, "")
+            category = await classify_task
+        else:
+            category = await classify_task
+            result = await generator.generate(prepared, category)
+    except BaseException:
+        classify_task.cancel()
+        raise
+
+    log.info("카테고리 병렬 분류", category=category)
+    return result, category
+
+
+__all__ = ["CategoryGenerator", "generate_with_category"]
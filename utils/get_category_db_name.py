@@ -1,6 +1,14 @@
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
 from _constants.Model import Model
 from _constants.categories import CATEGORIES
-from utils.ai_client_factory import call_ai
+from async_mongodb_service import AsyncMongoDBService
+from utils.ai_client_factory import acall_ai
+from utils.logger import log
+from utils.ttl_cache import TTLCache
 
 CATEGORY_SYSTEM_PROMPT = """
 <system_instruction>
@@ -77,18 +85,204 @@ def build_category_prompt(keyword: str) -> str:
 """
 
 
-async def get_category_db_name(keyword: str) -> str:
+# ---------- 로컬 사전 분류 ----------
+# 키워드 전체 또는 띄어쓰기 단위 토큰(연속 토큰 포함)이 카테고리명/분류 가이드의 대표 시술·제품명과
+# 정확히 일치하면 LLM 없이 바로 결정 (부분 문자열 매칭은 "불안과" → 안과 같은 오분류를 만듦)
+CATEGORY_ALIASES: Dict[str, str] = {
+    # 안과 (disambiguation_guide 기준)
+    "라식": "안과",
+    "라섹": "안과",
+    "투데이라섹": "안과",
+    "스마일라식": "안과",
+    "렌즈삽입술": "안과",
+    "icl": "안과",
+    "백내장": "안과",
+    "노안교정": "안과",
+    "드림렌즈": "안과",
+    "안구건조증": "안과",
+    "시력교정": "안과",
+    "각막": "안과",
+    "망막": "안과",
+    "안압": "안과",
+    # 치과 (라미네이트 카테고리로 수렴)
+    "치아미백": "라미네이트",
+    "치아교정": "라미네이트",
+    "임플란트": "라미네이트",
+    "충치치료": "라미네이트",
+    "신경치료": "라미네이트",
+    "잇몸치료": "라미네이트",
+    "스케일링": "라미네이트",
+    # 카테고리명 변형
+    "결정사": "결혼정보회사_결정사",
+    "결혼정보회사": "결혼정보회사_결정사",
+    "김포공항": "공항_김포공항",
+    "인천공항": "공항_인천공항",
+    "마운자로": "외고비_마운자로",
+}
+
+# "기타"는 일반 단어(악기 기타 등)와 겹치므로 로컬 매칭 대상에서 제외
+_FALLBACK_CATEGORY = "기타"
+
+# 참조원고가 붙은 긴 입력은 본문 단어에 끌려갈 수 있으므로 LLM에 맡김
+PRECLASSIFY_MAX_LEN = 40
+
+CATEGORY_CACHE_TTL = float(os.getenv("CATEGORY_CACHE_TTL", str(7 * 24 * 3600)))
+CATEGORY_CACHE_SIZE = int(os.getenv("CATEGORY_CACHE_SIZE", "4096"))
+CATEGORY_CACHE_PERSIST = os.getenv("CATEGORY_CACHE_PERSIST", "0") == "1"
+CATEGORY_CACHE_COLLECTION = "category_cache"
+
+_category_cache: TTLCache[str] = TTLCache(
+    maxsize=CATEGORY_CACHE_SIZE, ttl=CATEGORY_CACHE_TTL
+)
+
+
+def normalize_keyword(keyword: str) -> str:
+    """캐시 키/매칭용 정규화 (소문자, 공백/밑줄 제거)"""
+    return re.sub(r"[\s_]+", "", (keyword or "").lower())
+
+
+def _build_match_terms() -> Dict[str, str]:
+    terms: Dict[str, str] = {
+        normalize_keyword(cat): cat for cat in CATEGORIES if cat != _FALLBACK_CATEGORY
+    }
+    for alias, cat in CATEGORY_ALIASES.items():
+        terms.setdefault(normalize_keyword(alias), cat)
+    return terms
+
+
+_MATCH_TERMS = _build_match_terms()
+
+
+def _token_spans(keyword: str) -> List[str]:
+    """띄어쓰기/밑줄 토큰의 모든 연속 구간을 정규화해 긴 것부터 ("스키장 셔틀" → 스키장셔틀, 스키장, 셔틀)"""
+    tokens = [token for token in re.split(r"[\s_]+", (keyword or "").lower()) if token]
+    spans = {
+        "".join(tokens[start:end])
+        for start in range(len(tokens))
+        for end in range(start + 1, len(tokens) + 1)
+    }
+    return sorted(spans, key=len, reverse=True)
+
+
+def preclassify_category(keyword: str) -> Optional[str]:
     """
-    키워드를 분석하여 가장 적합한 카테고리 반환
+    LLM 없이 결정 가능한 카테고리 반환
+
+    Args:
+        keyword: 원본 키워드
+
+    Returns:
+        카테고리명 (애매하면 None → LLM 분류)
     """
+    normalized = normalize_keyword(keyword)
+    if not normalized or len(normalized) > PRECLASSIFY_MAX_LEN:
+        return None
+
+    matched: List[str] = []
+    candidates = set()
+    for span in _token_spans(keyword):
+        cat = _MATCH_TERMS.get(span)
+        if cat is None:
+            continue
+        # 이미 잡힌 더 긴 구간의 일부면 무시 (스키장 셔틀 > 스키장)
+        if any(span in longer for longer in matched):
+            continue
+        matched.append(span)
+        candidates.add(cat)
+
+    if len(candidates) == 1:
+        return candidates.pop()
+    return None
+
+
+# ---------- 영속 캐시 (선택) ----------
+async def _load_persisted_category(normalized: str) -> Optional[str]:
+    if not CATEGORY_CACHE_PERSIST:
+        return None
+    try:
+        doc = await AsyncMongoDBService().find_one(
+            CATEGORY_CACHE_COLLECTION, {"keyword": normalized}, {"category": 1}
+        )
+    except Exception as e:
+        log.warning(f"카테고리 캐시 조회 실패: {e}")
+        return None
+    category = (doc or {}).get("category")
+    return category if category in CATEGORIES else None
+
+
+async def _save_persisted_category(normalized: str, category: str) -> None:
+    if not CATEGORY_CACHE_PERSIST:
+        return
     try:
-        category = call_ai(
-            model_name=Model.GROK_4_1_NON_RES,
-            system_prompt=CATEGORY_SYSTEM_PROMPT,
-            user_prompt=build_category_prompt(keyword),
+        await AsyncMongoDBService().db[CATEGORY_CACHE_COLLECTION].update_one(
+            {"keyword": normalized},
+            {"$set": {"category": category, "updatedAt": datetime.now()}},
+            upsert=True,
         )
+    except Exception as e:
+        log.warning(f"카테고리 캐시 저장 실패: {e}")
+
+
+async def _classify_with_llm(keyword: str) -> str:
+    category = await acall_ai(
+        model_name=Model.GROK_4_1_NON_RES,
+        system_prompt=CATEGORY_SYSTEM_PROMPT,
+        user_prompt=build_category_prompt(keyword),
+    )
+    category = (category or "").strip()
+    return category if category in CATEGORIES else _FALLBACK_CATEGORY
+
+
+def peek_category(keyword: str) -> Optional[str]:
+    """
+    I/O 없이 바로 알 수 있는 카테고리 반환 (사전 분류 또는 메모리 캐시)
+
+    Returns:
+        카테고리명 (LLM/DB 조회가 필요하면 None)
+    """
+    return preclassify_category(keyword) or _category_cache.get(normalize_keyword(keyword))
+
+
+async def get_category_db_name(keyword: str) -> str:
+    """
+    키워드를 분석하여 가장 적합한 카테고리 반환
+
+    순서: 로컬 사전 분류 → 메모리 캐시 → (선택) Mongo 캐시 → LLM 분류
+    """
+    known = peek_category(keyword)
+    if known:
+        return known
+
+    normalized = normalize_keyword(keyword)
 
-        return category if category in CATEGORIES else "기타"
+    persisted = await _load_persisted_category(normalized)
+    if persisted:
+        _category_cache.set(normalized, persisted)
+        return persisted
 
+    try:
+        category = await _classify_with_llm(keyword)
     except Exception:
-        return "기타"
+        # 일시적 오류는 캐시하지 않음
+        return _FALLBACK_CATEGORY
+
+    _category_cache.set(normalized, category)
+    await _save_persisted_category(normalized, category)
+    return category
+
+
+def clear_category_cache() -> None:
+    """메모리 카테고리 캐시 비우기 (테스트/운영 재분류용)"""
+    _category_cache.clear()
+
+
+__all__ = [
+    "CATEGORY_ALIASES",
+    "CATEGORY_SYSTEM_PROMPT",
+    "build_category_prompt",
+    "clear_category_cache",
+    "get_category_db_name",
+    "normalize_keyword",
+    "peek_category",
+    "preclassify_category",
+]
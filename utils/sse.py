@@ -0,0 +1,106 @@
+"""
+SSE(Server-Sent Events) 중계 유틸
+
+- 업스트림 async generator를 별도 태스크로 읽어 bounded 큐에 담음
+  (클라이언트가 느리면 큐가 차서 업스트림 읽기도 멈춤 = 백프레셔)
+- 청크가 한동안 없으면 하트비트 주석(": keep-alive")을 보내 프록시 타임아웃 방지
+- 클라이언트 연결이 끊기면 업스트림 태스크를 취소해 남은 토큰 생성을 중단
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import AsyncGenerator, AsyncIterator, Optional
+
+from starlette.requests import Request
+
+from utils.logger import log
+
+SSE_HEARTBEAT_INTERVAL = float(os.getenv("SSE_HEARTBEAT_INTERVAL", "15"))
+SSE_MAX_BUFFER = int(os.getenv("SSE_MAX_BUFFER", "32"))
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
+}
+
+HEARTBEAT_COMMENT = ": keep-alive\n\n"
+
+_END = object()
+
+
+class _UpstreamError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+async def _pump(upstream: AsyncIterator[str], queue: "asyncio.Queue[object]") -> None:
+    try:
+        async for chunk in upstream:
+            await queue.put(chunk)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        await queue.put(_UpstreamError(e))
+        return
+    finally:
+        aclose = getattr(upstream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    await queue.put(_END)
+
+
+async def relay_sse(
+    upstream: AsyncIterator[str],
+    request: Optional[Request] = None,
+    heartbeat_interval: float = SSE_HEARTBEAT_INTERVAL,
+    max_buffer: int = SSE_MAX_BUFFER,
+) -> AsyncGenerator[str, None]:
+    """
+    업스트림 SSE 청크를 클라이언트로 중계
+
+    Args:
+        upstream: "data: ...\\n\\n" 형식 청크를 내는 async iterator
+        request: 연결 끊김 감지용 요청 객체 (None이면 감지 생략)
+        heartbeat_interval: 하트비트 간격(초)
+        max_buffer: 클라이언트로 못 보낸 청크 최대 보관 수
+
+    Yields:
+        str: SSE 청크 또는 하트비트 주석
+    """
+    queue: "asyncio.Queue[object]" = asyncio.Queue(maxsize=max_buffer)
+    producer = asyncio.create_task(_pump(upstream, queue))
+
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=heartbeat_interval)
+            except asyncio.TimeoutError:
+                if request is not None and await request.is_disconnected():
+                    log.warning("SSE 클라이언트 연결 끊김 → 업스트림 취소")
+                    return
+                yield HEARTBEAT_COMMENT
+                continue
+
+            if item is _END:
+                return
+            if isinstance(item, _UpstreamError):
+                log.error(f"SSE 업스트림 오류: {item.error}")
+                yield f"event: error\ndata: {item.error}\n\n"
+                return
+            yield item  # type: ignore[misc]
+    finally:
+        # 정상 종료/연결 끊김/응답 취소 모두 여기서 업스트림 정리
+        if not producer.done():
+            producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            pass
+
+
+__all__ = ["HEARTBEAT_COMMENT", "SSE_HEADERS", "relay_sse"]